@@ -0,0 +1,20 @@
+"""Summary statistics shared by the benchmark scripts."""
+
+import statistics
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the nearest-rank ``fraction`` percentile of ``values``."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(timings: list[float]) -> dict[str, float]:
+    """Summarize per-call wall-clock timings in seconds as milliseconds."""
+    return {
+        "calls": len(timings),
+        "mean_ms": statistics.fmean(timings) * 1e3,
+        "p50_ms": percentile(timings, 0.5) * 1e3,
+        "p99_ms": percentile(timings, 0.99) * 1e3,
+        "max_ms": max(timings) * 1e3,
+    }
@@ -0,0 +1,91 @@
+"""Time overlap-group simplification on contour-heavy CJK and icon glyphs.
+
+Run from the repository root after ``mise run data-sync``::
+
+    python -m benchmarks.remove_overlaps --limit 2000
+
+Corpora whose checkout is missing are skipped. Results are printed as JSON.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+import torch
+
+from benchmarks._timing import summarize
+from torchfont import ElementType
+from torchfont.datasets import GlyphDataset
+from torchfont.transforms import functional as _functional
+
+CORPORA = {
+    "source_han_code_jp": ("data/adobe/source-han-code-jp", ("OTC/*.ttc",)),
+    "font_awesome": ("data/fortawesome/font-awesome", ("otfs/*.otf",)),
+    "material_design_icons": (
+        "data/google/material_design_icons",
+        ("font/*.ttf", "font/*.otf"),
+    ),
+}
+
+
+def bench_corpus(
+    root: str,
+    patterns: tuple[str, ...],
+    *,
+    limit: int,
+    min_subpaths: int,
+    repeat: int,
+) -> dict[str, float]:
+    dataset = GlyphDataset(root=root, patterns=patterns)
+    step = max(1, len(dataset) // limit)
+    timings: list[float] = []
+    subpath_counts: list[int] = []
+    for idx in range(0, len(dataset), step)[:limit]:
+        outline = _functional.load_glyph(dataset[idx].ref)
+        subpaths = int((outline.types == ElementType.MOVE_TO.value).sum())
+        if subpaths < min_subpaths:
+            continue
+        # Selecting every group makes each call simplify all overlap groups.
+        values = torch.zeros(outline.num_elements)
+        _functional.remove_overlap_groups(outline, values)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            _functional.remove_overlap_groups(outline, values)
+        timings.append((time.perf_counter() - start) / repeat)
+        subpath_counts.append(subpaths)
+    if not timings:
+        return {"glyphs": 0}
+    summary = summarize(timings)
+    return {
+        "glyphs": summary.pop("calls"),
+        "mean_subpaths": statistics.fmean(subpath_counts),
+        "max_subpaths": max(subpath_counts),
+        **summary,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--min-subpaths", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    for name, (root, patterns) in CORPORA.items():
+        if not Path(root).is_dir():
+            continue
+        results[name] = bench_corpus(
+            root,
+            patterns,
+            limit=args.limit,
+            min_subpaths=args.min_subpaths,
+            repeat=args.repeat,
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
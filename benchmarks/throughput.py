@@ -0,0 +1,261 @@
+"""Time data loading and transform throughput on the bundled test fonts.
+
+Run from the repository root::
+
+    python -m benchmarks.throughput --workers 0 2 4 --output throughput.json
+
+Each section reports per-call wall-clock statistics in milliseconds, except
+``dataloader``, which reports end-to-end samples per second. ``font_io`` loads
+glyphs in shuffled order under each ``torchfont.set_font_io`` configuration and
+adds the page faults taken; run it on a cold page cache to see the effect of
+the access hints. The JSON document also records the library and interpreter
+versions so that runs from different commits or machines can be compared.
+Results are printed unless ``--output`` is given.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterator
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import torch
+from torch.utils.data import DataLoader
+
+import torchfont
+from benchmarks._timing import summarize
+from torchfont import GlyphData, Outline, pad_outlines
+from torchfont import _torchfont as _native
+from torchfont.datasets import GlyphDataset
+from torchfont.transforms import LoadGlyph, RenderBitmap
+from torchfont.transforms import functional as _functional
+
+ROOT = "tests/fonts"
+CODEPOINTS = range(0x20, 0x7F)
+BITMAP_SIZES = (32, 64, 128, 256)
+PAD_BATCH_SIZES = (32, 256)
+FONT_IO_DEFAULTS: dict[str, Any] = {
+    "access": "normal",
+    "will_need_outlines": False,
+    "eager_read_max_bytes": 0,
+}
+FONT_IO: dict[str, dict[str, Any]] = {
+    "mapped": {},
+    "random": {"access": "random"},
+    "random_will_need": {"access": "random", "will_need_outlines": True},
+    "eager_read": {"eager_read_max_bytes": 1 << 26},
+}
+
+
+def _time_calls(fn: Callable[..., object], *args: object, repeat: int) -> list[float]:
+    fn(*args)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _collate(batch: list[GlyphData[Outline]]) -> Outline:
+    return pad_outlines([sample.data for sample in batch])
+
+
+def bench_index_build(root: str, *, repeat: int) -> dict[str, float]:
+    codepoints = list(CODEPOINTS)
+    return summarize(
+        _time_calls(_native.GlyphIndex.from_root, root, codepoints, None, repeat=repeat)
+    )
+
+
+def bench_getitem(dataset: GlyphDataset, *, limit: int) -> dict[str, float]:
+    step = max(1, len(dataset) // limit)
+    timings = []
+    for idx in range(0, len(dataset), step)[:limit]:
+        start = time.perf_counter()
+        dataset[idx]
+        timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def bench_font_io(dataset: GlyphDataset, *, limit: int) -> dict[str, dict]:
+    generator = torch.Generator().manual_seed(0)
+    order = torch.randperm(len(dataset), generator=generator)[:limit].tolist()
+    previous = torchfont.font_io()
+    results = {}
+    try:
+        for name, options in FONT_IO.items():
+            torchfont.set_font_io(**{**FONT_IO_DEFAULTS, **options})
+            torchfont.reset_stats()
+            timings = []
+            for idx in order:
+                start = time.perf_counter()
+                dataset[idx]
+                timings.append(time.perf_counter() - start)
+            stats = torchfont.stats()
+            results[name] = {
+                **summarize(timings),
+                "minor_page_faults": stats["minor_page_faults"],
+                "major_page_faults": stats["major_page_faults"],
+            }
+    finally:
+        torchfont.set_font_io(**previous)
+    return results
+
+
+def _kernels() -> dict[str, Callable[[Outline, torch.Tensor], object]]:
+    return {
+        "quad_to_cubic": lambda o, _: _functional.quad_to_cubic(o),
+        "cubic_to_quad": lambda o, _: _functional.cubic_to_quad(o),
+        "merge_curves": lambda o, _: _functional.merge_curves(o),
+        "split_segments": lambda o, v: _functional.split_segments(
+            o, v, v, split_probability=0.2, split_range=(0.2, 0.8)
+        ),
+        "remove_overlaps": lambda o, _: _functional.remove_overlaps(o),
+        "remove_overlap_groups": _functional.remove_overlap_groups,
+        "normalize_subpath_start_points": lambda o, _: (
+            _functional.normalize_subpath_start_points(o)
+        ),
+        "set_subpath_start_points": _functional.set_subpath_start_points,
+        "reorder_subpaths": _functional.reorder_subpaths,
+        "horizontal_flip": lambda o, _: _functional.horizontal_flip(o),
+        "affine": lambda o, _: _functional.affine(o, angle=15.0, scale=0.9),
+    }
+
+
+def bench_kernels(outlines: list[Outline], *, repeat: int) -> dict[str, dict]:
+    generator = torch.Generator().manual_seed(0)
+    values = [torch.rand(o.num_elements, generator=generator) for o in outlines]
+    results = {}
+    for name, kernel in _kernels().items():
+        timings = []
+        for outline, outline_values in zip(outlines, values, strict=True):
+            timings.extend(_time_calls(kernel, outline, outline_values, repeat=repeat))
+        results[name] = summarize(timings)
+    return results
+
+
+def bench_render_bitmap(outlines: list[Outline], *, repeat: int) -> dict[str, dict]:
+    results = {}
+    for size in BITMAP_SIZES:
+        render = RenderBitmap(size=size)
+        timings = []
+        for outline in outlines:
+            timings.extend(_time_calls(render, outline, repeat=repeat))
+        results[str(size)] = summarize(timings)
+    return results
+
+
+def bench_pad_outlines(outlines: list[Outline], *, repeat: int) -> dict[str, dict]:
+    results = {}
+    for batch_size in PAD_BATCH_SIZES:
+        batch = [outlines[idx % len(outlines)] for idx in range(batch_size)]
+        results[str(batch_size)] = summarize(
+            _time_calls(pad_outlines, batch, repeat=repeat)
+        )
+    return results
+
+
+def _cycle(loader: DataLoader) -> Iterator[Outline]:
+    while True:
+        yield from loader
+
+
+def bench_dataloader(
+    dataset: GlyphDataset, *, workers: int, batch_size: int, batches: int
+) -> dict[str, float]:
+    loader = DataLoader(
+        dataset,
+        batch_size=batch_size,
+        shuffle=True,
+        num_workers=workers,
+        collate_fn=_collate,
+        generator=torch.Generator().manual_seed(0),
+        persistent_workers=workers > 0,
+    )
+    batches_seen = _cycle(loader)
+    # The first batch pays for worker start-up, so timing starts after it.
+    next(batches_seen)
+    samples = 0
+    start = time.perf_counter()
+    for batch in itertools.islice(batches_seen, batches):
+        samples += batch.types.shape[0]
+    elapsed = time.perf_counter() - start
+    return {
+        "samples": samples,
+        "seconds": elapsed,
+        "samples_per_s": samples / elapsed,
+    }
+
+
+def _metadata() -> dict[str, object]:
+    try:
+        version = metadata.version("torchfont")
+    except metadata.PackageNotFoundError:
+        version = None
+    return {
+        "torchfont": version,
+        "torch": torch.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "torch_threads": torch.get_num_threads(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--root", default=ROOT)
+    parser.add_argument("--glyphs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--batches", type=int, default=50)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    dataset = GlyphDataset(args.root, codepoints=CODEPOINTS, transform=LoadGlyph())
+    step = max(1, len(dataset) // args.glyphs)
+    outlines = [
+        dataset[idx].data for idx in range(0, len(dataset), step)[: args.glyphs]
+    ]
+
+    results = {
+        "metadata": _metadata(),
+        "corpus": {
+            "root": args.root,
+            "samples": len(dataset),
+            "glyphs": len(outlines),
+            "mean_elements": statistics.fmean(o.num_elements for o in outlines),
+        },
+        "index_build": bench_index_build(args.root, repeat=args.repeat),
+        "getitem": bench_getitem(dataset, limit=args.glyphs),
+        "font_io": bench_font_io(dataset, limit=args.glyphs),
+        "kernels": bench_kernels(outlines, repeat=args.repeat),
+        "render_bitmap": bench_render_bitmap(outlines, repeat=args.repeat),
+        "pad_outlines": bench_pad_outlines(outlines, repeat=args.repeat),
+        "dataloader": {
+            str(workers): bench_dataloader(
+                dataset,
+                workers=workers,
+                batch_size=args.batch_size,
+                batches=args.batches,
+            )
+            for workers in args.workers
+        },
+    }
+    document = json.dumps(results, indent=2)
+    if args.output is None:
+        print(document)
+    else:
+        args.output.write_text(document + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -103,6 +103,7 @@ export default defineConfig({
                 { text: 'Glyphsets', link: '/en/reference/glyphsets' },
                 { text: 'Transforms', link: '/en/reference/transforms' },
                 { text: 'Neural Networks', link: '/en/reference/nn' },
+                { text: 'Profiling', link: '/en/reference/profiling' },
                 { text: 'Core Types', link: '/en/reference/core-types' },
               ],
             },
@@ -182,6 +183,7 @@ export default defineConfig({
                 { text: 'グリフセット', link: '/ja/reference/glyphsets' },
                 { text: 'トランスフォーム', link: '/ja/reference/transforms' },
                 { text: 'ニューラルネットワーク', link: '/ja/reference/nn' },
+                { text: 'プロファイリング', link: '/ja/reference/profiling' },
                 { text: '基本型', link: '/ja/reference/core-types' },
               ],
             },
@@ -1,19 +1,18 @@
-from torch import Tensor
-from torch.nn.utils.rnn import pad_sequence
 from torch.utils.data import DataLoader
 
-from torchfont import GlyphData, Outline
+from torchfont import GlyphData, Outline, pad_outlines
 from torchfont.datasets import GlyphDataset
-from torchfont.transforms import LoadGlyph
+from torchfont.transforms import LoadGlyph, TruncateOutline
 
 
 def collate_fn(
     batch: list[GlyphData[Outline]],
-) -> tuple[Tensor, Tensor, list[dict[str, float]]]:
-    types = pad_sequence([data.data.types[:512] for data in batch], batch_first=True)
-    coords = pad_sequence([data.data.coords[:512] for data in batch], batch_first=True)
+) -> tuple[Outline, list[dict[str, float]]]:
+    # Truncate the padded batch in one pass, at subpath boundaries, so every
+    # row stays a valid encoding ending with END.
+    outlines = TruncateOutline(512)(pad_outlines([data.data for data in batch]))
     locations = [dict(data.location) for data in batch]
-    return types, coords, locations
+    return outlines, locations
 
 
 def main() -> None:
@@ -35,13 +34,13 @@ def main() -> None:
         collate_fn=collate_fn,
     )
 
-    types_t, coords_t, locations = next(iter(dataloader))
+    outlines, locations = next(iter(dataloader))
 
     print(f"{len(dataset)=}")
     print(f"{len(dataset.font_classes)=}")
     print(f"{len(dataset.character_classes)=}")
-    print(f"{types_t.shape=}")
-    print(f"{coords_t.shape=}")
+    print(f"{outlines.types.shape=}")
+    print(f"{outlines.coords.shape=}")
     print(f"{locations=}")
 
 
@@ -1,9 +1,15 @@
 use std::collections::BTreeSet;
 
-pub(super) fn character_index<T>(fonts: &[T], codepoints: impl Fn(&T) -> &[u32]) -> Vec<u32> {
+use super::UNENCODED;
+
+pub(super) fn character_index<'a, T, I>(fonts: &'a [T], codepoints: impl Fn(&'a T) -> I) -> Vec<u32>
+where
+    I: Iterator<Item = u32>,
+{
     fonts
         .iter()
-        .flat_map(|font| codepoints(font).iter().copied())
+        .flat_map(codepoints)
+        .filter(|&codepoint| codepoint != UNENCODED)
         .collect::<BTreeSet<_>>()
         .into_iter()
         .collect()
@@ -1,7 +1,8 @@
 use std::path::{Path, PathBuf};
 
-use skrifa::{MetadataProvider, raw::FileRef};
+use skrifa::{GlyphId, MetadataProvider, raw::FileRef, raw::TableProvider};
 
+use super::UNENCODED;
 use crate::error::Error;
 use crate::font::map_font;
 
@@ -9,10 +10,31 @@ pub(crate) struct DiscoveredFont {
     path: PathBuf,
     ttc_index: u32,
     codepoints: Vec<u32>,
+    glyph_ids: Vec<u32>,
 }
 
 impl DiscoveredFont {
     pub(crate) fn from_file(path: &Path, filter: Option<&[u32]>) -> Result<Vec<Self>, Error> {
+        Self::each_face(path, |ttc_index, font| {
+            Ok(Self::from_font(path, ttc_index, font, filter))
+        })
+    }
+
+    /// One entry per face listing every outline glyph by glyph id, including
+    /// glyphs the character map does not reach. Each glyph keeps its smallest
+    /// codepoint, or [`UNENCODED`]. With `encoded` false, glyphs the character
+    /// map reaches are left out, so the result does not overlap a codepoint
+    /// index of the same faces.
+    pub(crate) fn glyphs_from_file(path: &Path, encoded: bool) -> Result<Vec<Self>, Error> {
+        Self::each_face(path, |ttc_index, font| {
+            Self::glyphs_from_font(path, ttc_index, font, encoded)
+        })
+    }
+
+    fn each_face(
+        path: &Path,
+        build: impl Fn(u32, &skrifa::FontRef<'_>) -> Result<Self, Error>,
+    ) -> Result<Vec<Self>, Error> {
         let mapped = map_font(path)?;
         let parsed = FileRef::new(&mapped[..])
             .map_err(|err| Error::Parse(format!("failed to parse '{}': {err}", path.display())))?;
@@ -26,7 +48,7 @@ impl DiscoveredFont {
                         path.display()
                     ))
                 })?;
-                Ok(Self::from_font(path, ttc_index as u32, &font, filter))
+                build(ttc_index as u32, &font)
             })
             .collect::<Result<Vec<_>, Error>>()?;
         if entries.is_empty() {
@@ -50,10 +72,55 @@ impl DiscoveredFont {
         &self.codepoints
     }
 
+    /// Glyph id of each codepoint, as mapped by the character map.
+    pub(crate) fn glyph_ids(&self) -> &[u32] {
+        &self.glyph_ids
+    }
+
     pub(crate) fn codepoint_count(&self) -> usize {
         self.codepoints.len()
     }
 
+    fn glyphs_from_font(
+        path: &Path,
+        ttc_index: u32,
+        font: &skrifa::FontRef<'_>,
+        encoded: bool,
+    ) -> Result<Self, Error> {
+        let glyph_count = font
+            .maxp()
+            .map_err(|err| {
+                Error::Parse(format!(
+                    "font '{}' (ttc_index {ttc_index}) 'maxp' table error: {err}",
+                    path.display()
+                ))
+            })?
+            .num_glyphs();
+        let mut codepoints = vec![UNENCODED; usize::from(glyph_count)];
+        for (codepoint, glyph_id) in font.charmap().mappings() {
+            if let Some(slot) = usize::try_from(glyph_id.to_u32())
+                .ok()
+                .and_then(|glyph_id| codepoints.get_mut(glyph_id))
+            {
+                *slot = (*slot).min(codepoint);
+            }
+        }
+        let outline_glyphs = font.outline_glyphs();
+        // Glyph 0 is .notdef, the placeholder drawn for missing characters.
+        let (codepoints, glyph_ids) = (1..u32::from(glyph_count))
+            .zip(codepoints.into_iter().skip(1))
+            .filter(|&(_, codepoint)| encoded || codepoint == UNENCODED)
+            .filter(|&(glyph_id, _)| outline_glyphs.get(GlyphId::new(glyph_id)).is_some())
+            .map(|(glyph_id, codepoint)| (codepoint, glyph_id))
+            .unzip();
+        Ok(Self {
+            path: path.to_path_buf(),
+            ttc_index,
+            codepoints,
+            glyph_ids,
+        })
+    }
+
     fn from_font(
         path: &Path,
         ttc_index: u32,
@@ -70,13 +137,15 @@ impl DiscoveredFont {
             .filter(|(_, glyph_id)| outline_glyphs.get(*glyph_id).is_some())
             .collect();
         mappings.sort_unstable_by_key(|entry| entry.0);
+        let (codepoints, glyph_ids) = mappings
+            .into_iter()
+            .map(|(codepoint, glyph_id)| (codepoint, glyph_id.to_u32()))
+            .unzip();
         Self {
             path: path.to_path_buf(),
             ttc_index,
-            codepoints: mappings
-                .into_iter()
-                .map(|(codepoint, _)| codepoint)
-                .collect(),
+            codepoints,
+            glyph_ids,
         }
     }
 }
@@ -1,11 +1,45 @@
+use std::collections::{BTreeSet, HashSet};
 use std::path::{Path, PathBuf};
+use std::sync::{Arc, OnceLock};
 
-use super::{IndexOverflow, classes::character_index};
+use super::{IndexOverflow, Runs, classes::character_index};
+use crate::error::Error;
+use crate::parallel::{available_threads, map_ordered};
+use crate::transform::load::default_outlines;
 
+/// Codepoint of a sample whose glyph no character maps to. Such samples have
+/// no character class.
+pub(crate) const UNENCODED: u32 = u32::MAX;
+
+#[derive(Clone)]
 pub(crate) struct FontEntry {
     pub(crate) path: PathBuf,
     pub(crate) ttc_index: u32,
-    pub(crate) codepoints: Vec<u32>,
+    /// Codepoint of each sample, or [`UNENCODED`] in a glyph-id index.
+    pub(crate) codepoints: Arc<Runs>,
+    /// Glyph id of each codepoint, resolved once at discovery so loading does
+    /// not search the character map again.
+    pub(crate) glyph_ids: Arc<Runs>,
+    /// Summaries of the outlines at the default location, drawn on first use.
+    /// Clones share them, so an updated index keeps those of reused entries.
+    default_outlines: Arc<OnceLock<DefaultOutlines>>,
+}
+
+impl FontEntry {
+    pub(crate) fn new(
+        path: PathBuf,
+        ttc_index: u32,
+        codepoints: &[u32],
+        glyph_ids: &[u32],
+    ) -> Self {
+        Self {
+            path,
+            ttc_index,
+            codepoints: Arc::new(Runs::from_values(codepoints)),
+            glyph_ids: Arc::new(Runs::from_values(glyph_ids)),
+            default_outlines: Arc::default(),
+        }
+    }
 }
 
 pub(crate) struct GlyphIndex {
@@ -13,18 +47,40 @@ pub(crate) struct GlyphIndex {
     sample_starts: Vec<usize>,
     sample_count: usize,
     character_codepoints: Vec<u32>,
+    // (codepoint, class) sorted by codepoint. Classes are in codepoint order
+    // unless a stable update appended new ones.
+    character_lookup: Vec<(u32, usize)>,
+}
+
+/// Per-sample summaries of the outlines at the default location, in sample
+/// order.
+pub(crate) struct DefaultOutlines {
+    pub(crate) element_counts: Vec<u32>,
+    pub(crate) hashes: Vec<u64>,
 }
 
 pub(crate) struct GlyphSample<'a> {
     pub(crate) path: &'a Path,
     pub(crate) ttc_index: u32,
     pub(crate) font_idx: usize,
-    pub(crate) codepoint: u32,
-    pub(crate) character_idx: usize,
+    pub(crate) codepoint: Option<u32>,
+    pub(crate) glyph_id: u32,
+    pub(crate) character_idx: Option<usize>,
 }
 
 impl GlyphIndex {
     pub(crate) fn new(fonts: Vec<FontEntry>) -> Result<Self, IndexOverflow> {
+        Self::with_character_codepoints(fonts, Vec::new())
+    }
+
+    /// Builds an index whose character classes start with `classes`, in that
+    /// order. Codepoints of `fonts` missing from `classes` get new classes
+    /// after them, in codepoint order.
+    pub(crate) fn with_character_codepoints(
+        mut fonts: Vec<FontEntry>,
+        mut classes: Vec<u32>,
+    ) -> Result<Self, IndexOverflow> {
+        share_runs(&mut fonts);
         let mut sample_starts = Vec::with_capacity(fonts.len());
         let mut sample_count = 0usize;
         for font in &fonts {
@@ -33,15 +89,83 @@ impl GlyphIndex {
                 .checked_add(font.codepoints.len())
                 .ok_or(IndexOverflow::SampleCount)?;
         }
-        let character_codepoints = character_index(&fonts, |font| &font.codepoints);
+        let known: BTreeSet<u32> = classes.iter().copied().collect();
+        classes.extend(
+            character_index(&fonts, |font| font.codepoints.iter())
+                .into_iter()
+                .filter(|codepoint| !known.contains(codepoint)),
+        );
+        let mut character_lookup: Vec<_> = classes
+            .iter()
+            .enumerate()
+            .map(|(class, &codepoint)| (codepoint, class))
+            .collect();
+        character_lookup.sort_unstable();
         Ok(Self {
             fonts,
             sample_starts,
             sample_count,
-            character_codepoints,
+            character_codepoints: classes,
+            character_lookup,
         })
     }
 
+    /// A new index without the fonts of the `changed` files and with the
+    /// `added` entries, reusing every other entry as is.
+    ///
+    /// By default the fonts end up sorted and the classes are renumbered, as
+    /// if the index were rebuilt from scratch. With `stable`, every font and
+    /// character keeps its class: fonts of changed files stay in place,
+    /// emptied unless an added entry refills them, new fonts and characters
+    /// get classes after the existing ones, and removed characters keep theirs.
+    pub(crate) fn update(
+        &self,
+        changed: &[PathBuf],
+        added: Vec<FontEntry>,
+        stable: bool,
+    ) -> Result<Self, IndexOverflow> {
+        let changed: BTreeSet<&Path> = changed.iter().map(PathBuf::as_path).collect();
+        if !stable {
+            let mut fonts: Vec<_> = self
+                .fonts
+                .iter()
+                .filter(|font| {
+                    !font.codepoints.is_empty() && !changed.contains(font.path.as_path())
+                })
+                .cloned()
+                .chain(added)
+                .collect();
+            fonts.sort_by(|a, b| (&a.path, a.ttc_index).cmp(&(&b.path, b.ttc_index)));
+            return Self::new(fonts);
+        }
+        let mut fonts: Vec<_> = self
+            .fonts
+            .iter()
+            .map(|font| {
+                if changed.contains(font.path.as_path()) {
+                    FontEntry {
+                        codepoints: Arc::default(),
+                        glyph_ids: Arc::default(),
+                        default_outlines: Arc::default(),
+                        ..font.clone()
+                    }
+                } else {
+                    font.clone()
+                }
+            })
+            .collect();
+        for entry in added {
+            match fonts
+                .iter_mut()
+                .find(|font| font.path == entry.path && font.ttc_index == entry.ttc_index)
+            {
+                Some(slot) => *slot = entry,
+                None => fonts.push(entry),
+            }
+        }
+        Self::with_character_codepoints(fonts, self.character_codepoints.clone())
+    }
+
     pub(crate) fn fonts(&self) -> &[FontEntry] {
         &self.fonts
     }
@@ -60,13 +184,16 @@ impl GlyphIndex {
         }
         let font_idx = self.sample_starts.partition_point(|&start| start <= idx) - 1;
         let font = &self.fonts[font_idx];
-        let codepoint = font.codepoints[idx - self.sample_starts[font_idx]];
+        let offset = idx - self.sample_starts[font_idx];
+        let codepoint = font.codepoints.get(offset)?;
+        let codepoint = (codepoint != UNENCODED).then_some(codepoint);
         Some(GlyphSample {
             path: &font.path,
             ttc_index: font.ttc_index,
             font_idx,
             codepoint,
-            character_idx: self.character_index(codepoint),
+            glyph_id: font.glyph_ids.get(offset)?,
+            character_idx: codepoint.map(|codepoint| self.character_index(codepoint)),
         })
     }
 
@@ -78,47 +205,271 @@ impl GlyphIndex {
         out
     }
 
+    /// Character class of every sample, or -1 for unencoded glyphs.
     pub(crate) fn character_targets(&self) -> Vec<i64> {
         self.fonts
             .iter()
             .flat_map(|font| font.codepoints.iter())
-            .map(|&codepoint| self.character_index(codepoint) as i64)
+            .map(|codepoint| {
+                if codepoint == UNENCODED {
+                    -1
+                } else {
+                    self.character_index(codepoint) as i64
+                }
+            })
             .collect()
     }
 
+    /// Encoded outline length and outline hash of every sample at the default
+    /// location. Outlines are drawn once per font entry, one font per worker,
+    /// and cached on the entry, so an updated index draws only the fonts it
+    /// scanned.
+    pub(crate) fn default_outlines(&self) -> Result<DefaultOutlines, Error> {
+        let missing: Vec<&FontEntry> = self
+            .fonts
+            .iter()
+            .filter(|font| font.default_outlines.get().is_none())
+            .collect();
+        let drawn = map_ordered(&missing, available_threads(), |font| {
+            if font.codepoints.is_empty() {
+                return Ok(Vec::new());
+            }
+            default_outlines(&font.path, font.ttc_index, font.glyph_ids.iter())
+        });
+        for (font, font_outlines) in missing.into_iter().zip(drawn) {
+            let (element_counts, hashes) = font_outlines?.into_iter().unzip();
+            let _ = font.default_outlines.set(DefaultOutlines {
+                element_counts,
+                hashes,
+            });
+        }
+        Ok(self
+            .cached_default_outlines()
+            .expect("every font entry has its outlines"))
+    }
+
+    /// The cached summaries, if every font entry has them.
+    pub(crate) fn cached_default_outlines(&self) -> Option<DefaultOutlines> {
+        let mut outlines = DefaultOutlines {
+            element_counts: Vec::with_capacity(self.sample_count),
+            hashes: Vec::with_capacity(self.sample_count),
+        };
+        for font in &self.fonts {
+            let font_outlines = font.default_outlines.get()?;
+            outlines
+                .element_counts
+                .extend_from_slice(&font_outlines.element_counts);
+            outlines.hashes.extend_from_slice(&font_outlines.hashes);
+        }
+        Some(outlines)
+    }
+
+    /// Restores summaries saved from an index over the same fonts, so they are
+    /// not drawn again. Returns false when their length does not match.
+    pub(crate) fn restore_default_outlines(&self, outlines: DefaultOutlines) -> bool {
+        if outlines.element_counts.len() != self.sample_count
+            || outlines.hashes.len() != self.sample_count
+        {
+            return false;
+        }
+        for (font, &start) in self.fonts.iter().zip(&self.sample_starts) {
+            let samples = start..start + font.codepoints.len();
+            let _ = font.default_outlines.set(DefaultOutlines {
+                element_counts: outlines.element_counts[samples.clone()].to_vec(),
+                hashes: outlines.hashes[samples].to_vec(),
+            });
+        }
+        true
+    }
+
     fn character_index(&self, codepoint: u32) -> usize {
-        self.character_codepoints
-            .binary_search(&codepoint)
-            .expect("character index was built from all codepoints")
+        let position = self
+            .character_lookup
+            .binary_search_by_key(&codepoint, |&(codepoint, _)| codepoint)
+            .expect("character index was built from all codepoints");
+        self.character_lookup[position].1
+    }
+}
+
+/// Points equal codepoint and glyph id runs of different fonts at one
+/// allocation. Families with many static instances, and the many families
+/// covering the same glyph set, then store each coverage once.
+fn share_runs(fonts: &mut [FontEntry]) {
+    let mut shared: HashSet<Arc<Runs>> = HashSet::new();
+    let mut share = |runs: &mut Arc<Runs>| match shared.get(&*runs) {
+        Some(existing) => *runs = Arc::clone(existing),
+        None => {
+            shared.insert(Arc::clone(runs));
+        }
+    };
+    for font in fonts {
+        share(&mut font.codepoints);
+        share(&mut font.glyph_ids);
     }
 }
 
 #[cfg(test)]
 mod tests {
     use std::path::PathBuf;
+    use std::sync::Arc;
 
-    use super::{FontEntry, GlyphIndex};
+    use super::{DefaultOutlines, FontEntry, GlyphIndex, UNENCODED};
 
     #[test]
     fn indexes_each_face_codepoint_once() {
         let index = GlyphIndex::new(vec![
-            FontEntry {
-                path: PathBuf::from("a.ttf"),
-                ttc_index: 0,
-                codepoints: vec![65, 67],
-            },
-            FontEntry {
-                path: PathBuf::from("b.ttf"),
-                ttc_index: 1,
-                codepoints: vec![66],
-            },
+            FontEntry::new(PathBuf::from("a.ttf"), 0, &[65, 67], &[1, 3]),
+            FontEntry::new(PathBuf::from("b.ttf"), 1, &[66], &[2]),
         ])
         .unwrap();
         assert_eq!(index.sample_count(), 3);
         assert_eq!(index.character_codepoints(), &[65, 66, 67]);
         assert_eq!(index.font_targets(), vec![0, 0, 1]);
         assert_eq!(index.character_targets(), vec![0, 2, 1]);
-        assert_eq!(index.locate(2).unwrap().codepoint, 66);
+        assert_eq!(index.locate(2).unwrap().codepoint, Some(66));
+        assert_eq!(index.locate(1).unwrap().glyph_id, 3);
         assert!(index.locate(3).is_none());
     }
+
+    #[test]
+    fn unencoded_glyphs_have_no_character_class() {
+        let index = GlyphIndex::new(vec![FontEntry::new(
+            PathBuf::from("a.ttf"),
+            0,
+            &[65, UNENCODED],
+            &[1, 7],
+        )])
+        .unwrap();
+        assert_eq!(index.character_codepoints(), &[65]);
+        assert_eq!(index.character_targets(), vec![0, -1]);
+        let sample = index.locate(1).unwrap();
+        assert_eq!((sample.codepoint, sample.glyph_id), (None, 7));
+        assert!(sample.character_idx.is_none());
+    }
+
+    #[test]
+    fn restores_default_outlines_of_matching_length() {
+        let index = GlyphIndex::new(vec![FontEntry::new(
+            PathBuf::from("a.ttf"),
+            0,
+            &[65, 66],
+            &[1, 2],
+        )])
+        .unwrap();
+        let outlines = |len: usize| DefaultOutlines {
+            element_counts: vec![4; len],
+            hashes: vec![9; len],
+        };
+        assert!(!index.restore_default_outlines(outlines(3)));
+        assert!(index.cached_default_outlines().is_none());
+        assert!(index.restore_default_outlines(outlines(2)));
+        assert_eq!(index.default_outlines().unwrap().hashes, vec![9, 9]);
+    }
+
+    #[test]
+    fn updates_keep_default_outlines_of_reused_entries() {
+        let index = GlyphIndex::new(vec![
+            entry("a.ttf", &[65, 66]),
+            entry("b.ttf", &[67]),
+            entry("c.ttf", &[68]),
+        ])
+        .unwrap();
+        assert!(index.restore_default_outlines(DefaultOutlines {
+            element_counts: vec![1, 2, 3, 4],
+            hashes: vec![5, 6, 7, 8],
+        }));
+
+        let updated = index
+            .update(&[PathBuf::from("b.ttf")], Vec::new(), false)
+            .unwrap();
+        let outlines = updated.cached_default_outlines().unwrap();
+        assert_eq!(outlines.element_counts, vec![1, 2, 4]);
+        assert_eq!(outlines.hashes, vec![5, 6, 8]);
+
+        // The emptied entry needs no drawing, but the rescanned one does.
+        let stable = index
+            .update(&[PathBuf::from("b.ttf")], Vec::new(), true)
+            .unwrap();
+        assert_eq!(
+            stable.default_outlines().unwrap().element_counts,
+            vec![1, 2, 4]
+        );
+        let rescanned = index
+            .update(&[PathBuf::from("b.ttf")], vec![entry("b.ttf", &[67])], true)
+            .unwrap();
+        assert!(rescanned.cached_default_outlines().is_none());
+    }
+
+    fn entry(path: &str, codepoints: &[u32]) -> FontEntry {
+        FontEntry::new(PathBuf::from(path), 0, codepoints, codepoints)
+    }
+
+    #[test]
+    fn equal_runs_share_one_allocation() {
+        let index = GlyphIndex::new(vec![
+            entry("a.ttf", &[65, 66, 67]),
+            entry("b.ttf", &[65, 66, 67]),
+            entry("c.ttf", &[65, 67]),
+        ])
+        .unwrap();
+
+        let fonts = index.fonts();
+        assert!(Arc::ptr_eq(&fonts[0].codepoints, &fonts[1].codepoints));
+        assert!(Arc::ptr_eq(&fonts[0].codepoints, &fonts[1].glyph_ids));
+        assert!(!Arc::ptr_eq(&fonts[0].codepoints, &fonts[2].codepoints));
+        assert_eq!(index.locate(4).unwrap().codepoint, Some(66));
+        assert_eq!(index.character_targets(), vec![0, 1, 2, 0, 1, 2, 0, 2]);
+    }
+
+    #[test]
+    fn update_matches_a_rebuild() {
+        let index =
+            GlyphIndex::new(vec![entry("a.ttf", &[65, 66]), entry("c.ttf", &[67])]).unwrap();
+
+        let updated = index
+            .update(
+                &[PathBuf::from("a.ttf")],
+                vec![entry("b.ttf", &[68, 69])],
+                false,
+            )
+            .unwrap();
+
+        let paths: Vec<_> = updated
+            .fonts()
+            .iter()
+            .map(|font| font.path.clone())
+            .collect();
+        assert_eq!(paths, [PathBuf::from("b.ttf"), PathBuf::from("c.ttf")]);
+        assert_eq!(updated.character_codepoints(), &[67, 68, 69]);
+        assert_eq!(updated.font_targets(), vec![0, 0, 1]);
+        assert_eq!(updated.character_targets(), vec![1, 2, 0]);
+    }
+
+    #[test]
+    fn stable_update_keeps_font_and_character_classes() {
+        let index =
+            GlyphIndex::new(vec![entry("b.ttf", &[66, 67]), entry("c.ttf", &[67])]).unwrap();
+
+        let updated = index
+            .update(
+                &[PathBuf::from("b.ttf")],
+                vec![entry("a.ttf", &[65, 67])],
+                true,
+            )
+            .unwrap();
+
+        assert_eq!(updated.fonts().len(), 3);
+        assert!(updated.fonts()[0].codepoints.is_empty());
+        assert_eq!(updated.character_codepoints(), &[66, 67, 65]);
+        assert_eq!(updated.font_targets(), vec![1, 2, 2]);
+        assert_eq!(updated.character_targets(), vec![1, 2, 1]);
+        let sample = updated.locate(0).unwrap();
+        assert_eq!((sample.font_idx, sample.character_idx), (1, Some(1)));
+
+        let refilled = updated
+            .update(&[], vec![entry("b.ttf", &[66])], true)
+            .unwrap();
+        assert_eq!(refilled.font_targets(), vec![0, 1, 2, 2]);
+        assert_eq!(refilled.character_targets(), vec![0, 1, 2, 1]);
+    }
 }
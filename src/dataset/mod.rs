@@ -4,10 +4,12 @@ mod classes;
 mod discovered_font;
 mod discovery;
 mod glyph;
+mod runs;
 
 pub(crate) use discovered_font::DiscoveredFont;
 pub(crate) use discovery::{canonicalize_root, discover_font_files};
-pub(crate) use glyph::{FontEntry, GlyphIndex};
+pub(crate) use glyph::{DefaultOutlines, FontEntry, GlyphIndex, UNENCODED};
+pub(crate) use runs::Runs;
 
 #[derive(Clone, Copy, Debug, Eq, PartialEq)]
 pub(crate) enum IndexOverflow {
@@ -0,0 +1,184 @@
+use super::UNENCODED;
+
+/// A sequence of `u32` stored either as runs of consecutive values or as is.
+///
+/// Codepoint coverage is mostly contiguous blocks, so a font's codepoints take
+/// a few runs instead of one word each. Glyph ids follow the character map
+/// far less often, and a run costs two words, so a sequence is kept as runs
+/// only when that takes less memory than the plain values. A run is either
+/// `first, first + 1, ...` or a repeat of [`UNENCODED`]. Element `i` of runs is
+/// found by binary search over the run ends.
+#[derive(Debug, Hash, PartialEq, Eq)]
+pub(crate) enum Runs {
+    /// The values themselves.
+    Plain(Box<[u32]>),
+    /// Runs of consecutive values.
+    Ranges {
+        /// First value of each run.
+        firsts: Box<[u32]>,
+        /// Number of values up to and including each run.
+        ends: Box<[u32]>,
+    },
+}
+
+impl Default for Runs {
+    fn default() -> Self {
+        Self::Plain(Box::default())
+    }
+}
+
+impl Runs {
+    pub(crate) fn from_values(values: &[u32]) -> Self {
+        let mut firsts = Vec::new();
+        let mut ends: Vec<u32> = Vec::new();
+        for (position, &value) in values.iter().enumerate() {
+            let end = u32::try_from(position + 1).expect("font sample lists fit in u32");
+            let continues = position > 0 && value == successor(values[position - 1]);
+            match ends.last_mut() {
+                Some(last) if continues => *last = end,
+                _ => {
+                    firsts.push(value);
+                    ends.push(end);
+                }
+            }
+        }
+        if firsts.len() * 2 >= values.len() {
+            return Self::Plain(values.into());
+        }
+        Self::Ranges {
+            firsts: firsts.into(),
+            ends: ends.into(),
+        }
+    }
+
+    pub(crate) fn len(&self) -> usize {
+        match self {
+            Self::Plain(values) => values.len(),
+            Self::Ranges { ends, .. } => ends.last().map_or(0, |&end| end as usize),
+        }
+    }
+
+    pub(crate) fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    /// Bytes the values take on the heap.
+    pub(crate) fn heap_bytes(&self) -> usize {
+        let words = match self {
+            Self::Plain(values) => values.len(),
+            Self::Ranges { firsts, ends } => firsts.len() + ends.len(),
+        };
+        words * size_of::<u32>()
+    }
+
+    /// Value at `position`, found in `O(log runs)`.
+    pub(crate) fn get(&self, position: usize) -> Option<u32> {
+        match self {
+            Self::Plain(values) => values.get(position).copied(),
+            Self::Ranges { firsts, ends } => {
+                let run = ends.partition_point(|&end| end as usize <= position);
+                let first = *firsts.get(run)?;
+                let start = run.checked_sub(1).map_or(0, |previous| ends[previous]);
+                Some(value_at(first, position - start as usize))
+            }
+        }
+    }
+
+    pub(crate) fn iter(&self) -> Box<dyn Iterator<Item = u32> + '_> {
+        match self {
+            Self::Plain(values) => Box::new(values.iter().copied()),
+            Self::Ranges { firsts, ends } => {
+                let mut start = 0;
+                Box::new(
+                    firsts
+                        .iter()
+                        .zip(ends.iter())
+                        .flat_map(move |(&first, &end)| {
+                            let run = (0..(end - start) as usize)
+                                .map(move |offset| value_at(first, offset));
+                            start = end;
+                            run
+                        }),
+                )
+            }
+        }
+    }
+}
+
+fn successor(value: u32) -> u32 {
+    if value == UNENCODED {
+        UNENCODED
+    } else {
+        value + 1
+    }
+}
+
+fn value_at(first: u32, offset: usize) -> u32 {
+    if first == UNENCODED {
+        UNENCODED
+    } else {
+        first + offset as u32
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::path::PathBuf;
+
+    use super::{Runs, UNENCODED};
+    use crate::dataset::DiscoveredFont;
+
+    #[test]
+    fn round_trips_and_selects_values() {
+        let values = [
+            65, 66, 67, 68, 69, 97, UNENCODED, UNENCODED, 98, 99, 100, 12,
+        ];
+        let runs = Runs::from_values(&values);
+
+        assert!(matches!(&runs, Runs::Ranges { firsts, .. } if firsts.len() == 5));
+        assert_eq!(runs.len(), values.len());
+        assert_eq!(runs.iter().collect::<Vec<_>>(), values);
+        for (position, &value) in values.iter().enumerate() {
+            assert_eq!(runs.get(position), Some(value));
+        }
+        assert_eq!(runs.get(values.len()), None);
+    }
+
+    #[test]
+    fn keeps_scattered_values_plain() {
+        let values = [65, 66, 67, 97, UNENCODED, UNENCODED, 98, 99, 12];
+        let runs = Runs::from_values(&values);
+
+        assert_eq!(runs, Runs::Plain(values.into()));
+        assert_eq!(runs.heap_bytes(), values.len() * 4);
+        assert_eq!(runs.iter().collect::<Vec<_>>(), values);
+        assert_eq!(runs.get(3), Some(97));
+    }
+
+    #[test]
+    fn empty_runs_have_no_values() {
+        let runs = Runs::from_values(&[]);
+
+        assert!(runs.is_empty());
+        assert_eq!(runs.len(), 0);
+        assert_eq!(runs.get(0), None);
+        assert_eq!(runs, Runs::default());
+    }
+
+    #[test]
+    fn bundled_fonts_never_take_more_than_plain_values() {
+        // SourceSans3 maps about 1600 codepoints in about 250 runs, while its
+        // glyph ids form about 1000 runs and so stay plain.
+        let path = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+            .join("tests/fonts/source-sans/SourceSans3-Regular.ttf");
+        let font = DiscoveredFont::from_file(&path, None).unwrap().remove(0);
+        let codepoints = Runs::from_values(font.codepoints());
+        let glyph_ids = Runs::from_values(font.glyph_ids());
+        let plain = font.codepoints().len() * 4;
+
+        assert!(codepoints.heap_bytes() * 2 <= plain);
+        assert_eq!(glyph_ids.heap_bytes(), plain);
+        assert_eq!(codepoints.iter().collect::<Vec<_>>(), font.codepoints());
+        assert_eq!(glyph_ids.iter().collect::<Vec<_>>(), font.glyph_ids());
+    }
+}
@@ -1,25 +1,284 @@
-use std::{fs, path::Path};
+use std::{
+    fs,
+    io::Read as _,
+    ops::Deref,
+    path::{Path, PathBuf},
+    sync::{
+        Arc, Mutex, MutexGuard, PoisonError,
+        atomic::{AtomicBool, AtomicU8, AtomicU64, Ordering},
+    },
+    time::SystemTime,
+};
 
 use memmap2::Mmap;
 
-use crate::error::Error;
+use crate::{error::Error, stats::COUNTERS};
 
-pub(crate) fn map_font(path: &Path) -> Result<Mmap, Error> {
-    let file = fs::File::open(path).map_err(|err| {
+/// Expected access pattern of a font mapping, passed to the kernel as
+/// `madvise` advice on Unix and ignored elsewhere.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub(crate) enum Access {
+    Normal,
+    Random,
+    Sequential,
+}
+
+impl Access {
+    pub(crate) fn parse(name: &str) -> Option<Self> {
+        match name {
+            "normal" => Some(Self::Normal),
+            "random" => Some(Self::Random),
+            "sequential" => Some(Self::Sequential),
+            _ => None,
+        }
+    }
+
+    pub(crate) fn name(self) -> &'static str {
+        match self {
+            Self::Normal => "normal",
+            Self::Random => "random",
+            Self::Sequential => "sequential",
+        }
+    }
+}
+
+/// Process-wide I/O options applied to every font opened afterwards.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub(crate) struct IoOptions {
+    pub(crate) access: Access,
+    pub(crate) will_need_outlines: bool,
+    pub(crate) eager_read_max_bytes: u64,
+}
+
+static ACCESS: AtomicU8 = AtomicU8::new(0);
+static WILL_NEED_OUTLINES: AtomicBool = AtomicBool::new(false);
+static EAGER_READ_MAX_BYTES: AtomicU64 = AtomicU64::new(0);
+
+pub(crate) fn io_options() -> IoOptions {
+    IoOptions {
+        access: match ACCESS.load(Ordering::Relaxed) {
+            1 => Access::Random,
+            2 => Access::Sequential,
+            _ => Access::Normal,
+        },
+        will_need_outlines: WILL_NEED_OUTLINES.load(Ordering::Relaxed),
+        eager_read_max_bytes: EAGER_READ_MAX_BYTES.load(Ordering::Relaxed),
+    }
+}
+
+/// Replaces the I/O options. Fonts kept open under other options are closed,
+/// since no later load would use them.
+pub(crate) fn set_io_options(options: IoOptions) {
+    let changed = io_options() != options;
+    ACCESS.store(options.access as u8, Ordering::Relaxed);
+    WILL_NEED_OUTLINES.store(options.will_need_outlines, Ordering::Relaxed);
+    EAGER_READ_MAX_BYTES.store(options.eager_read_max_bytes, Ordering::Relaxed);
+    if changed {
+        open_outline_fonts().clear();
+    }
+}
+
+/// Bytes of one font file, either memory-mapped or read onto the heap.
+pub(crate) enum FontData {
+    Mapped(Mmap),
+    Read(Vec<u8>),
+}
+
+impl Deref for FontData {
+    type Target = [u8];
+
+    fn deref(&self) -> &[u8] {
+        match self {
+            Self::Mapped(mmap) => mmap,
+            Self::Read(bytes) => bytes,
+        }
+    }
+}
+
+/// Opens a font for metadata reads such as discovery and axis queries. Files
+/// no larger than the eager-read limit are read onto the heap; others are
+/// mapped with the configured access advice.
+pub(crate) fn map_font(path: &Path) -> Result<FontData, Error> {
+    open_font(path, &io_options(), false)
+}
+
+/// Fonts kept open for outline loads.
+const OPEN_FONTS: usize = 8;
+
+/// Heap copies kept open for outline loads, in bytes, unless one file at the
+/// eager-read limit is larger.
+const OPEN_FONT_READ_BYTES: u64 = 16 << 20;
+
+/// A font opened for outline loads, with the options it was opened with and
+/// the size and modification time its file had then.
+struct OpenFont {
+    path: PathBuf,
+    options: IoOptions,
+    version: FileVersion,
+    data: Arc<FontData>,
+}
+
+type FileVersion = (u64, Option<SystemTime>);
+
+/// Open fonts, least recently used first.
+static OPEN_OUTLINE_FONTS: Mutex<Vec<OpenFont>> = Mutex::new(Vec::new());
+
+fn open_outline_fonts() -> MutexGuard<'static, Vec<OpenFont>> {
+    OPEN_OUTLINE_FONTS
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+}
+
+/// Opens a font whose glyph outlines are about to be drawn. Beyond
+/// [`map_font`], this can ask the kernel to read the outline tables ahead.
+///
+/// The last few fonts stay open, so consecutive loads from one font open,
+/// read, and advise its file once. A font is reopened when the I/O options
+/// changed or its file's size or modification time no longer match.
+pub(crate) fn map_font_for_outlines(path: &Path) -> Result<Arc<FontData>, Error> {
+    let options = io_options();
+    let version = fs::metadata(path)
+        .ok()
+        .map(|metadata| (metadata.len(), metadata.modified().ok()));
+    {
+        let mut fonts = open_outline_fonts();
+        if let Some(position) = fonts.iter().position(|font| {
+            font.path == path && font.options == options && Some(font.version) == version
+        }) {
+            let font = fonts.remove(position);
+            let data = Arc::clone(&font.data);
+            fonts.push(font);
+            COUNTERS.record_cache_hit();
+            return Ok(data);
+        }
+    }
+    COUNTERS.record_cache_miss();
+    let data = Arc::new(open_font(path, &options, true)?);
+    if let Some(version) = version {
+        keep_open(
+            &mut open_outline_fonts(),
+            OpenFont {
+                path: path.to_path_buf(),
+                options,
+                version,
+                data: Arc::clone(&data),
+            },
+        );
+    }
+    Ok(data)
+}
+
+/// Adds `font` as the most recently used, replacing other versions of its
+/// file and fonts opened under other options, then closes the least recently
+/// used fonts beyond the count and heap-copy limits.
+fn keep_open(fonts: &mut Vec<OpenFont>, font: OpenFont) {
+    fonts.retain(|open| open.path != font.path && open.options == font.options);
+    let read_budget = OPEN_FONT_READ_BYTES.max(font.options.eager_read_max_bytes);
+    fonts.push(font);
+    let read_bytes = |fonts: &[OpenFont]| -> u64 {
+        fonts
+            .iter()
+            .map(|open| match &*open.data {
+                FontData::Read(bytes) => bytes.len() as u64,
+                FontData::Mapped(_) => 0,
+            })
+            .sum()
+    };
+    while fonts.len() > OPEN_FONTS || (fonts.len() > 1 && read_bytes(fonts) > read_budget) {
+        fonts.remove(0);
+    }
+}
+
+fn open_font(path: &Path, options: &IoOptions, outlines: bool) -> Result<FontData, Error> {
+    let opened = open_file(path, options);
+    match &opened {
+        Ok(FontData::Mapped(mmap)) => {
+            COUNTERS.record_map(mmap.len());
+            advise(mmap, options, outlines);
+        }
+        Ok(FontData::Read(bytes)) => COUNTERS.record_read(bytes.len()),
+        Err(_) => COUNTERS.record_map_failure(),
+    }
+    opened
+}
+
+fn open_file(path: &Path, options: &IoOptions) -> Result<FontData, Error> {
+    let io_error = |action: &str, err: std::io::Error| {
         Error::Io(std::io::Error::new(
             err.kind(),
-            format!("failed to open '{}': {err}", path.display()),
+            format!("failed to {action} '{}': {err}", path.display()),
         ))
-    })?;
+    };
+    let mut file = fs::File::open(path).map_err(|err| io_error("open", err))?;
+    if options.eager_read_max_bytes > 0 {
+        let len = file.metadata().map_err(|err| io_error("open", err))?.len();
+        if len <= options.eager_read_max_bytes {
+            let mut bytes = Vec::with_capacity(usize::try_from(len).unwrap_or(0));
+            file.read_to_end(&mut bytes)
+                .map_err(|err| io_error("read", err))?;
+            return Ok(FontData::Read(bytes));
+        }
+    }
     // SAFETY: callers only access the map while parsing and TorchFont documents
     // modification of indexed font files during use as unsupported.
-    let mmap = unsafe { Mmap::map(&file) }.map_err(|err| {
-        Error::Io(std::io::Error::new(
-            err.kind(),
-            format!("failed to map '{}': {err}", path.display()),
-        ))
-    })?;
-    Ok(mmap)
+    let mmap = unsafe { Mmap::map(&file) }.map_err(|err| io_error("map", err))?;
+    Ok(FontData::Mapped(mmap))
+}
+
+// Tables read while drawing outlines: TrueType glyphs and their offsets, CFF
+// charstrings, and TrueType variation deltas.
+const OUTLINE_TABLES: [&[u8; 4]; 5] = [b"glyf", b"loca", b"CFF ", b"CFF2", b"gvar"];
+
+#[cfg(unix)]
+fn advise(mmap: &Mmap, options: &IoOptions, outlines: bool) {
+    use memmap2::Advice;
+
+    // Advice is only a hint, so a kernel that rejects it changes nothing.
+    let advice = match options.access {
+        Access::Normal => None,
+        Access::Random => Some(Advice::Random),
+        Access::Sequential => Some(Advice::Sequential),
+    };
+    if let Some(advice) = advice {
+        let _ = mmap.advise(advice);
+    }
+    if outlines && options.will_need_outlines {
+        for (offset, len) in outline_table_ranges(mmap) {
+            let _ = mmap.advise_range(Advice::WillNeed, offset, len);
+        }
+    }
+}
+
+#[cfg(not(unix))]
+fn advise(_mmap: &Mmap, _options: &IoOptions, _outlines: bool) {}
+
+/// Byte ranges of the outline tables of every face in a font file, clamped to
+/// the file. A file that does not parse yields no ranges; the caller reports
+/// the parse error when it reads the font.
+fn outline_table_ranges(data: &[u8]) -> Vec<(usize, usize)> {
+    let Ok(file) = skrifa::raw::FileRef::new(data) else {
+        return Vec::new();
+    };
+    let mut ranges: Vec<(usize, usize)> = file
+        .fonts()
+        .flatten()
+        .flat_map(|font| {
+            font.table_directory
+                .table_records()
+                .iter()
+                .filter(|record| OUTLINE_TABLES.contains(&&record.tag().into_bytes()))
+                .map(|record| (record.offset() as usize, record.length() as usize))
+                .collect::<Vec<_>>()
+        })
+        .filter_map(|(offset, len)| {
+            let len = len.min(data.len().checked_sub(offset)?);
+            (len > 0).then_some((offset, len))
+        })
+        .collect();
+    // Faces of a collection usually share their outline tables.
+    ranges.sort_unstable();
+    ranges.dedup();
+    ranges
 }
 
 pub(crate) fn parse_font_ref<'a>(
@@ -34,3 +293,124 @@ pub(crate) fn parse_font_ref<'a>(
         ))
     })
 }
+
+#[cfg(test)]
+mod tests {
+    use std::{path::PathBuf, sync::Arc};
+
+    use super::{
+        Access, FontData, IoOptions, OPEN_FONT_READ_BYTES, OPEN_FONTS, OpenFont, keep_open,
+        map_font_for_outlines, open_file, outline_table_ranges,
+    };
+
+    fn test_font(name: &str) -> PathBuf {
+        PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+            .join("tests/fonts")
+            .join(name)
+    }
+
+    #[test]
+    fn parses_access_names() {
+        for access in [Access::Normal, Access::Random, Access::Sequential] {
+            assert_eq!(Access::parse(access.name()), Some(access));
+        }
+        assert_eq!(Access::parse("willneed"), None);
+    }
+
+    #[test]
+    fn reads_small_files_onto_the_heap() {
+        let path = test_font("source-sans/SourceSans3-Regular.ttf");
+        let len = std::fs::metadata(&path).unwrap().len();
+        let options = |eager_read_max_bytes| IoOptions {
+            access: Access::Normal,
+            will_need_outlines: false,
+            eager_read_max_bytes,
+        };
+
+        let read = open_file(&path, &options(len)).unwrap();
+        let mapped = open_file(&path, &options(len - 1)).unwrap();
+
+        assert!(matches!(read, FontData::Read(_)));
+        assert!(matches!(mapped, FontData::Mapped(_)));
+        assert_eq!(&read[..], &mapped[..]);
+    }
+
+    #[test]
+    fn finds_outline_tables() {
+        let data = std::fs::read(test_font("source-sans/SourceSans3-Regular.ttf")).unwrap();
+        let ranges = outline_table_ranges(&data);
+
+        // glyf and loca, each inside the file.
+        assert_eq!(ranges.len(), 2);
+        assert!(
+            ranges
+                .iter()
+                .all(|&(offset, len)| offset + len <= data.len())
+        );
+        assert!(outline_table_ranges(b"not a font").is_empty());
+    }
+
+    #[test]
+    fn keeps_outline_fonts_open_until_their_file_changes() {
+        let dir = std::env::temp_dir().join(format!("torchfont-open-fonts-{}", std::process::id()));
+        std::fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("font.ttf");
+        let mut bytes = std::fs::read(test_font("source-sans/SourceSans3-Regular.ttf")).unwrap();
+        std::fs::write(&path, &bytes).unwrap();
+
+        let first = map_font_for_outlines(&path).unwrap();
+        let second = map_font_for_outlines(&path).unwrap();
+        bytes.extend_from_slice(&[0; 4]);
+        std::fs::write(&path, &bytes).unwrap();
+        let third = map_font_for_outlines(&path).unwrap();
+        std::fs::remove_dir_all(&dir).unwrap();
+
+        assert!(Arc::ptr_eq(&first, &second));
+        assert!(!Arc::ptr_eq(&second, &third));
+        assert_eq!(third.len(), bytes.len());
+    }
+
+    fn entry(name: &str, eager_read_max_bytes: u64, data: FontData) -> OpenFont {
+        OpenFont {
+            path: PathBuf::from(name),
+            options: IoOptions {
+                access: Access::Normal,
+                will_need_outlines: false,
+                eager_read_max_bytes,
+            },
+            version: (0, None),
+            data: Arc::new(data),
+        }
+    }
+
+    fn paths(fonts: &[OpenFont]) -> Vec<&str> {
+        fonts
+            .iter()
+            .map(|font| font.path.to_str().unwrap())
+            .collect()
+    }
+
+    #[test]
+    fn closes_least_recently_used_fonts_beyond_the_limits() {
+        let mut fonts = Vec::new();
+        for index in 0..=OPEN_FONTS {
+            keep_open(
+                &mut fonts,
+                entry(&index.to_string(), 0, FontData::Read(Vec::new())),
+            );
+        }
+        assert_eq!(fonts.len(), OPEN_FONTS);
+        assert_eq!(fonts[0].path, PathBuf::from("1"));
+
+        let half = vec![0; (OPEN_FONT_READ_BYTES / 2) as usize];
+        keep_open(&mut fonts, entry("a", 0, FontData::Read(half.clone())));
+        keep_open(&mut fonts, entry("b", 0, FontData::Read(half.clone())));
+        keep_open(&mut fonts, entry("c", 0, FontData::Read(half)));
+        assert_eq!(paths(&fonts), ["b", "c"]);
+
+        let large = vec![0; OPEN_FONT_READ_BYTES as usize + 1];
+        let limit = large.len() as u64;
+        keep_open(&mut fonts, entry("d", limit, FontData::Read(large)));
+        assert_eq!(paths(&fonts), ["d"]);
+    }
+}
@@ -3,7 +3,9 @@ mod extract;
 mod location;
 mod registered_axes;
 
-pub(crate) use data::{map_font, parse_font_ref};
+pub(crate) use data::{
+    Access, IoOptions, io_options, map_font, map_font_for_outlines, parse_font_ref, set_io_options,
+};
 pub(crate) use extract::extract_glyph_outline;
 pub(crate) use location::{Location, axis_info, canonicalize_location};
 pub(crate) use registered_axes::registered_axis_values;
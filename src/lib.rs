@@ -2,7 +2,10 @@ mod dataset;
 mod error;
 mod font;
 mod outline;
+mod parallel;
+mod prefetch;
 mod py;
+mod stats;
 mod transform;
 
 use pyo3::{Bound, prelude::*, types::PyModule};
@@ -1,4 +1,5 @@
 use super::BezPath;
+use super::float16::{bf16_to_f32, f16_to_f32, f32_to_bf16, f32_to_f16};
 use kurbo::{PathEl, Point};
 
 #[derive(Debug)]
@@ -9,42 +10,59 @@ pub(crate) enum DecodeError {
     NonPaddingAfterEnd { index: usize, value: i64 },
 }
 
-pub(crate) fn decode(types: &[i64], coords: &[f32]) -> Result<BezPath, DecodeError> {
+// Validates and builds the path in one pass over `types`. Error precedence
+// matches a multi-pass check: an invalid element type anywhere before END wins
+// over a structural error, which wins over non-padding after END.
+pub(crate) fn decode<T: ElementCode, C: CoordValue>(
+    types: &[T],
+    coords: &[C],
+) -> Result<BezPath, DecodeError> {
     if coords.len() != types.len() * 6 {
         return Err(DecodeError::CoordsLen);
     }
-    let len = types
-        .iter()
-        .position(|&v| v == ElementType::End as i64)
-        .map_or(types.len(), |i| i + 1);
-    if let Some((index, value)) = types[..len]
-        .iter()
-        .copied()
-        .enumerate()
-        .find(|&(_, v)| !(1..=ElementType::End as i64).contains(&v))
-    {
-        return Err(DecodeError::InvalidElementType { index, value });
-    }
+    let mut elements = Vec::with_capacity(types.len());
+    let mut structural = None;
     let mut inside = false;
-    for (index, &value) in types[..len].iter().enumerate() {
-        match ElementType::try_from(value) {
-            Ok(ElementType::MoveTo) => inside = true,
-            Ok(ElementType::LineTo | ElementType::QuadTo | ElementType::CurveTo) if !inside => {
-                return Err(DecodeError::ElementOutsideSubpath { index, value });
+    let mut len = types.len();
+    for (index, (&ty, v)) in types.iter().zip(coords.chunks_exact(6)).enumerate() {
+        let value = ty.into();
+        let Ok(element_type) = ElementType::try_from(value) else {
+            return Err(DecodeError::InvalidElementType { index, value });
+        };
+        if let ElementType::End = element_type {
+            len = index + 1;
+            break;
+        }
+        if structural.is_some() {
+            continue;
+        }
+        let element = match element_type {
+            ElementType::MoveTo => {
+                inside = true;
+                PathEl::MoveTo(point(v[4], v[5]))
+            }
+            _ if !inside => {
+                structural = Some(DecodeError::ElementOutsideSubpath { index, value });
+                continue;
+            }
+            ElementType::LineTo => PathEl::LineTo(point(v[4], v[5])),
+            ElementType::QuadTo => PathEl::QuadTo(point(v[0], v[1]), point(v[4], v[5])),
+            ElementType::CurveTo => {
+                PathEl::CurveTo(point(v[0], v[1]), point(v[2], v[3]), point(v[4], v[5]))
             }
-            Ok(ElementType::Close) => {
-                if !inside {
-                    return Err(DecodeError::ElementOutsideSubpath { index, value });
-                }
+            ElementType::Close | ElementType::End => {
                 inside = false;
+                PathEl::ClosePath
             }
-            Ok(ElementType::End) => break,
-            Ok(_) | Err(_) => {}
-        }
+        };
+        elements.push(element);
+    }
+    if let Some(error) = structural {
+        return Err(error);
     }
     if let Some((offset, value)) = types[len..]
         .iter()
-        .copied()
+        .map(|&v| v.into())
         .enumerate()
         .find(|&(_, v)| v != 0)
     {
@@ -53,53 +71,122 @@ pub(crate) fn decode(types: &[i64], coords: &[f32]) -> Result<BezPath, DecodeErr
             value,
         });
     }
-    let mut path = BezPath::new();
-    for (&ty, v) in types[..len].iter().zip(coords[..len * 6].chunks_exact(6)) {
-        match ElementType::try_from(ty) {
-            Ok(ElementType::MoveTo) => path.move_to(point(v[4], v[5])),
-            Ok(ElementType::LineTo) => path.line_to(point(v[4], v[5])),
-            Ok(ElementType::QuadTo) => path.quad_to(point(v[0], v[1]), point(v[4], v[5])),
-            Ok(ElementType::CurveTo) => {
-                path.curve_to(point(v[0], v[1]), point(v[2], v[3]), point(v[4], v[5]))
-            }
-            Ok(ElementType::Close) => path.close_path(),
-            Ok(ElementType::End) | Err(_) => break,
+    Ok(BezPath::from_vec(elements))
+}
+
+// Number of rows `encode_into` writes for `path`, including the END row.
+pub(crate) fn encoded_len(path: &BezPath) -> usize {
+    path.elements().len() + 1
+}
+
+// Writes `path` into caller-owned buffers and returns the number of rows used.
+// Rows past the END row are filled with PAD. Returns `None` without writing
+// when `types` holds fewer than `encoded_len(path)` rows or `coords` is not
+// exactly six values per type row.
+pub(crate) fn encode_into<T: ElementCode, C: CoordValue>(
+    path: &BezPath,
+    types: &mut [T],
+    coords: &mut [C],
+) -> Option<usize> {
+    let len = encoded_len(path);
+    if types.len() < len || coords.len() != types.len() * 6 {
+        return None;
+    }
+    let mut rows = types.iter_mut().zip(coords.chunks_exact_mut(6)).enumerate();
+    // Zip elements first so the row after the last element is not consumed.
+    for (element, (_, (ty, row))) in path.elements().iter().zip(rows.by_ref()) {
+        let (element_type, values) = element_row(*element);
+        *ty = T::from_element(element_type);
+        for (coord, value) in row.iter_mut().zip(values) {
+            *coord = C::from_f64(value);
         }
     }
-    Ok(path)
+    for (index, (ty, row)) in rows {
+        *ty = if index + 1 == len {
+            T::from_element(ElementType::End)
+        } else {
+            T::PAD
+        };
+        row.fill(C::ZERO);
+    }
+    Some(len)
 }
 
+#[cfg(test)]
 pub(crate) fn encode(path: &BezPath) -> (Vec<i64>, Vec<f32>) {
-    let mut types = Vec::with_capacity(path.elements().len() + 1);
-    let mut coords = Vec::with_capacity((path.elements().len() + 1) * 6);
-    for element in path.elements() {
-        match *element {
-            PathEl::MoveTo(p) => push_endpoint(&mut types, &mut coords, ElementType::MoveTo, p),
-            PathEl::LineTo(p) => push_endpoint(&mut types, &mut coords, ElementType::LineTo, p),
-            PathEl::QuadTo(c, p) => push(
-                &mut types,
-                &mut coords,
-                ElementType::QuadTo,
-                [c.x as f32, c.y as f32, 0.0, 0.0, p.x as f32, p.y as f32],
-            ),
-            PathEl::CurveTo(c0, c1, p) => push(
-                &mut types,
-                &mut coords,
-                ElementType::CurveTo,
-                [
-                    c0.x as f32,
-                    c0.y as f32,
-                    c1.x as f32,
-                    c1.y as f32,
-                    p.x as f32,
-                    p.y as f32,
-                ],
-            ),
-            PathEl::ClosePath => push(&mut types, &mut coords, ElementType::Close, [0.0; 6]),
+    let len = encoded_len(path);
+    let mut types = vec![0; len];
+    let mut coords = vec![0.0; len * 6];
+    encode_into(path, &mut types, &mut coords);
+    (types, coords)
+}
+
+// Integer element type codes accepted by `decode` and written by `encode_into`.
+pub(crate) trait ElementCode: Copy + Into<i64> {
+    const PAD: Self;
+    fn from_element(element_type: ElementType) -> Self;
+}
+
+macro_rules! element_code {
+    ($($ty:ty),*) => {$(
+        impl ElementCode for $ty {
+            const PAD: Self = 0;
+            fn from_element(element_type: ElementType) -> Self {
+                element_type as Self
+            }
         }
+    )*};
+}
+element_code!(u8, i8, i16, i64);
+
+// Coordinate storage accepted by `decode` and written by `encode_into`. `i16`
+// and `u16` carry float16 and bfloat16 bit patterns respectively, since NumPy
+// has no bfloat16 dtype; conversion happens here rather than in extra tensor
+// copies.
+pub(crate) trait CoordValue: Copy {
+    const ZERO: Self;
+    fn to_f64(self) -> f64;
+    fn from_f64(value: f64) -> Self;
+}
+
+impl CoordValue for f32 {
+    const ZERO: Self = 0.0;
+    fn to_f64(self) -> f64 {
+        self.into()
+    }
+    fn from_f64(value: f64) -> Self {
+        value as f32
+    }
+}
+
+impl CoordValue for f64 {
+    const ZERO: Self = 0.0;
+    fn to_f64(self) -> f64 {
+        self
+    }
+    fn from_f64(value: f64) -> Self {
+        value
+    }
+}
+
+impl CoordValue for i16 {
+    const ZERO: Self = 0;
+    fn to_f64(self) -> f64 {
+        f16_to_f32(self as u16).into()
+    }
+    fn from_f64(value: f64) -> Self {
+        f32_to_f16(value as f32) as i16
+    }
+}
+
+impl CoordValue for u16 {
+    const ZERO: Self = 0;
+    fn to_f64(self) -> f64 {
+        bf16_to_f32(self).into()
+    }
+    fn from_f64(value: f64) -> Self {
+        f32_to_bf16(value as f32)
     }
-    push(&mut types, &mut coords, ElementType::End, [0.0; 6]);
-    (types, coords)
 }
 
 #[derive(Clone, Copy)]
@@ -126,20 +213,22 @@ impl TryFrom<i64> for ElementType {
         })
     }
 }
-fn point(x: f32, y: f32) -> Point {
-    Point::new(x.into(), y.into())
+fn point<C: CoordValue>(x: C, y: C) -> Point {
+    Point::new(x.to_f64(), y.to_f64())
 }
-fn push_endpoint(types: &mut Vec<i64>, coords: &mut Vec<f32>, ty: ElementType, p: Point) {
-    push(
-        types,
-        coords,
-        ty,
-        [0.0, 0.0, 0.0, 0.0, p.x as f32, p.y as f32],
-    );
+// Element type and the six coordinates of the row that encodes `element`.
+pub(crate) fn element_row(element: PathEl) -> (ElementType, [f64; 6]) {
+    match element {
+        PathEl::MoveTo(p) => (ElementType::MoveTo, endpoint(p)),
+        PathEl::LineTo(p) => (ElementType::LineTo, endpoint(p)),
+        PathEl::QuadTo(c, p) => (ElementType::QuadTo, [c.x, c.y, 0.0, 0.0, p.x, p.y]),
+        PathEl::CurveTo(c0, c1, p) => (ElementType::CurveTo, [c0.x, c0.y, c1.x, c1.y, p.x, p.y]),
+        PathEl::ClosePath => (ElementType::Close, [0.0; 6]),
+    }
 }
-fn push(types: &mut Vec<i64>, coords: &mut Vec<f32>, ty: ElementType, values: [f32; 6]) {
-    types.push(ty as i64);
-    coords.extend_from_slice(&values);
+
+fn endpoint(p: Point) -> [f64; 6] {
+    [0.0, 0.0, 0.0, 0.0, p.x, p.y]
 }
 
 #[cfg(test)]
@@ -182,4 +271,73 @@ mod tests {
             Err(DecodeError::ElementOutsideSubpath { .. })
         ));
     }
+
+    #[test]
+    fn decodes_narrow_element_types() {
+        let coords = [
+            0.0, 0.0, 0.0, 0.0, 1.0, 2.0, //
+            3.0, 4.0, 0.0, 0.0, 5.0, 6.0, //
+            0.0, 0.0, 0.0, 0.0, 0.0, 0.0, //
+            0.0, 0.0, 0.0, 0.0, 0.0, 0.0, //
+            0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+        ];
+        let wide = decode(&[1_i64, 3, 5, 6, 0], &coords).unwrap();
+        assert_eq!(decode(&[1_u8, 3, 5, 6, 0], &coords).unwrap(), wide);
+        assert_eq!(decode(&[1_i8, 3, 5, 6, 0], &coords).unwrap(), wide);
+        assert_eq!(decode(&[1_i16, 3, 5, 6, 0], &coords).unwrap(), wide);
+    }
+
+    #[test]
+    fn invalid_type_takes_precedence_over_structure() {
+        assert!(matches!(
+            decode(&[2, 0, 6], &[0.0; 18]),
+            Err(DecodeError::InvalidElementType { index: 1, value: 0 })
+        ));
+        assert!(matches!(
+            decode(&[2, 6, 1], &[0.0; 18]),
+            Err(DecodeError::ElementOutsideSubpath { index: 0, value: 2 })
+        ));
+    }
+
+    #[test]
+    fn encode_into_pads_caller_buffer() {
+        let outline = decode(&[1, 2, 5, 6], &[1.0; 24]).unwrap();
+        let mut types = [9_i8; 6];
+        let mut coords = [9.0; 36];
+
+        assert_eq!(encode_into(&outline, &mut types, &mut coords), Some(4));
+        assert_eq!(types, [1, 2, 5, 6, 0, 0]);
+        assert!(coords[24..].iter().all(|&v| v == 0.0));
+        assert_eq!(&coords[..6], &[0.0, 0.0, 0.0, 0.0, 1.0, 1.0]);
+    }
+
+    #[test]
+    fn encode_into_rejects_short_buffer() {
+        let outline = decode(&[1, 2, 5, 6], &[0.0; 24]).unwrap();
+        let mut types = [0_i16; 3];
+        let mut coords = [0.0; 18];
+
+        assert_eq!(encode_into(&outline, &mut types, &mut coords), None);
+        assert_eq!(types, [0; 3]);
+    }
+
+    #[test]
+    fn half_precision_coords_round_trip() {
+        let types = [1_i64, 4, 5, 6];
+        let mut coords = [0.0_f32; 24];
+        coords[4..6].copy_from_slice(&[1.5, -2.0]);
+        coords[6..12].copy_from_slice(&[0.25, 0.5, 3.0, 4.0, 5.0, 6.0]);
+        let outline = decode(&types, &coords).unwrap();
+
+        let mut half_types = [0_i64; 4];
+        let mut half = [0_i16; 24];
+        encode_into(&outline, &mut half_types, &mut half).unwrap();
+        let mut brain = [0_u16; 24];
+        encode_into(&outline, &mut half_types, &mut brain).unwrap();
+
+        assert_eq!(half[4..6], [0x3e00_u16 as i16, 0xc000_u16 as i16]);
+        assert_eq!(brain[4..6], [0x3fc0, 0xc000]);
+        assert_eq!(decode(&types, &half).unwrap(), outline);
+        assert_eq!(decode(&types, &brain).unwrap(), outline);
+    }
 }
@@ -0,0 +1,113 @@
+// Conversions between f32 and the two 16-bit float formats used for compact
+// coordinate storage. Values are carried as raw bit patterns because NumPy has
+// no bfloat16 dtype. Narrowing rounds to nearest, ties to even, and keeps NaN
+// quiet.
+
+pub(crate) fn f16_to_f32(bits: u16) -> f32 {
+    let exponent = u32::from((bits >> 10) & 0x1f);
+    let mantissa = u32::from(bits & 0x03ff);
+    let magnitude = match exponent {
+        // Subnormal: mantissa * 2^-24.
+        0 => mantissa as f32 * f32::from_bits(0x3380_0000),
+        0x1f if mantissa == 0 => f32::INFINITY,
+        0x1f => f32::NAN,
+        _ => f32::from_bits(((exponent + 112) << 23) | (mantissa << 13)),
+    };
+    if bits & 0x8000 == 0 {
+        magnitude
+    } else {
+        -magnitude
+    }
+}
+
+pub(crate) fn f32_to_f16(value: f32) -> u16 {
+    let bits = value.to_bits();
+    let sign = ((bits >> 16) & 0x8000) as u16;
+    let exponent = ((bits >> 23) & 0xff) as i32;
+    let mantissa = bits & 0x007f_ffff;
+    if exponent == 0xff {
+        let nan = if mantissa == 0 { 0 } else { 0x0200 };
+        return sign | 0x7c00 | nan;
+    }
+    let half_exponent = exponent - 127 + 15;
+    if half_exponent >= 0x1f {
+        return sign | 0x7c00;
+    }
+    if half_exponent <= 0 {
+        if half_exponent < -10 {
+            return sign;
+        }
+        // Restore the implicit bit and shift into the subnormal range.
+        let shift = (14 - half_exponent) as u32;
+        let rounded = round_shifted(mantissa | 0x0080_0000, shift);
+        return sign | rounded as u16;
+    }
+    // A carry out of the mantissa correctly bumps the exponent, up to infinity.
+    let rounded = round_shifted((half_exponent as u32) << 23 | mantissa, 13);
+    sign | rounded as u16
+}
+
+pub(crate) fn bf16_to_f32(bits: u16) -> f32 {
+    f32::from_bits(u32::from(bits) << 16)
+}
+
+pub(crate) fn f32_to_bf16(value: f32) -> u16 {
+    let bits = value.to_bits();
+    if value.is_nan() {
+        return (bits >> 16) as u16 | 0x0040;
+    }
+    round_shifted(bits, 16) as u16
+}
+
+fn round_shifted(value: u32, shift: u32) -> u32 {
+    let truncated = value >> shift;
+    let remainder = value & ((1 << shift) - 1);
+    let halfway = 1 << (shift - 1);
+    if remainder > halfway || (remainder == halfway && truncated & 1 == 1) {
+        truncated + 1
+    } else {
+        truncated
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn f16_round_trips_every_finite_value() {
+        for bits in 0..=u16::MAX {
+            let value = f16_to_f32(bits);
+            if value.is_nan() {
+                assert!(f16_to_f32(f32_to_f16(value)).is_nan());
+            } else {
+                assert_eq!(f32_to_f16(value), bits, "bits {bits:#06x}");
+            }
+        }
+    }
+
+    #[test]
+    fn f16_rounds_to_nearest_even() {
+        assert_eq!(f32_to_f16(1.0), 0x3c00);
+        assert_eq!(f32_to_f16(65504.0), 0x7bff);
+        assert_eq!(f32_to_f16(65520.0), 0x7c00);
+        assert_eq!(f32_to_f16(1.0 + 2.0_f32.powi(-11)), 0x3c00);
+        assert_eq!(f32_to_f16(1.0 + 3.0 * 2.0_f32.powi(-11)), 0x3c02);
+        assert_eq!(f32_to_f16(2.0_f32.powi(-25)), 0x0000);
+        assert_eq!(f32_to_f16(1.5 * 2.0_f32.powi(-25)), 0x0001);
+        assert_eq!(f32_to_f16(-0.0), 0x8000);
+    }
+
+    #[test]
+    fn bf16_round_trips_and_rounds_to_nearest_even() {
+        for bits in 0..=u16::MAX {
+            let value = bf16_to_f32(bits);
+            if !value.is_nan() {
+                assert_eq!(f32_to_bf16(value), bits, "bits {bits:#06x}");
+            }
+        }
+        assert_eq!(f32_to_bf16(f32::from_bits(0x3f80_8000)), 0x3f80);
+        assert_eq!(f32_to_bf16(f32::from_bits(0x3f81_8000)), 0x3f82);
+        assert!(bf16_to_f32(f32_to_bf16(f32::NAN)).is_nan());
+    }
+}
@@ -0,0 +1,66 @@
+//! Canonical content hash of an encoded outline.
+//!
+//! The hash covers exactly what `encode_into` writes as `int64`/`float32`
+//! rows, so two glyphs hash equal when their loaded tensors are equal. It uses
+//! 64-bit FNV-1a rather than `std`'s hasher, whose output may change between
+//! Rust releases, so hashes stay comparable across builds and pickled indexes.
+
+use super::BezPath;
+use super::encoding::{ElementType, element_row};
+
+const OFFSET_BASIS: u64 = 0xcbf2_9ce4_8422_2325;
+const PRIME: u64 = 0x0000_0100_0000_01b3;
+
+struct Fnv1a(u64);
+
+impl Fnv1a {
+    fn write(&mut self, bytes: &[u8]) {
+        for &byte in bytes {
+            self.0 = (self.0 ^ u64::from(byte)).wrapping_mul(PRIME);
+        }
+    }
+}
+
+pub(crate) fn outline_hash(path: &BezPath) -> u64 {
+    let mut hasher = Fnv1a(OFFSET_BASIS);
+    for &element in path.elements() {
+        let (element_type, values) = element_row(element);
+        hasher.write(&[element_type as u8]);
+        for value in values {
+            // Coordinates are hashed as the float32 values a load returns,
+            // with -0.0 folded into 0.0 so mirrored zeros compare equal.
+            let value = value as f32 + 0.0;
+            hasher.write(&value.to_bits().to_le_bytes());
+        }
+    }
+    hasher.write(&[ElementType::End as u8]);
+    hasher.0
+}
+
+#[cfg(test)]
+mod tests {
+    use kurbo::{BezPath, Point};
+
+    use super::outline_hash;
+
+    fn triangle(x: f64) -> BezPath {
+        let mut path = BezPath::new();
+        path.move_to(Point::new(x, 0.0));
+        path.line_to(Point::new(1.0, 0.0));
+        path.quad_to(Point::new(1.0, 1.0), Point::new(0.0, 1.0));
+        path.close_path();
+        path
+    }
+
+    #[test]
+    fn equal_outlines_hash_equal() {
+        assert_eq!(outline_hash(&triangle(0.0)), outline_hash(&triangle(-0.0)));
+        assert_ne!(outline_hash(&triangle(0.0)), outline_hash(&triangle(0.5)));
+        assert_ne!(outline_hash(&BezPath::new()), outline_hash(&triangle(0.0)));
+    }
+
+    #[test]
+    fn hash_is_stable() {
+        assert_eq!(outline_hash(&BezPath::new()), 0xaf63_bb4c_8601_b479);
+    }
+}
@@ -1,9 +1,16 @@
 mod bounds;
 mod encoding;
+mod float16;
+mod hash;
 mod path;
 
 pub(crate) use bounds::{Bounds, bounds_from_outline, bounds_from_subpath};
-pub(crate) use encoding::{DecodeError, ElementType, decode, encode};
+#[cfg(test)]
+pub(crate) use encoding::encode;
+pub(crate) use encoding::{
+    CoordValue, DecodeError, ElementCode, ElementType, decode, encode_into, encoded_len,
+};
+pub(crate) use hash::outline_hash;
 pub(crate) use kurbo::{BezPath, PathEl, Point, Vec2};
 #[cfg(test)]
 pub(crate) use path::outline_from_subpaths;
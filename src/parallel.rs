@@ -0,0 +1,70 @@
+//! Scoped worker threads shared by the native kernels.
+//!
+//! Threads are spawned per call instead of kept in a global pool, which would
+//! not survive the fork that starts DataLoader workers.
+
+use std::sync::OnceLock;
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+pub(crate) fn available_threads() -> usize {
+    static THREADS: OnceLock<usize> = OnceLock::new();
+    *THREADS.get_or_init(|| std::thread::available_parallelism().map_or(1, usize::from))
+}
+
+/// Applies `f` to every item on up to `threads` workers and returns the
+/// results in item order. Items are claimed one at a time, so uneven costs
+/// balance across workers.
+pub(crate) fn map_ordered<T, R, F>(items: &[T], threads: usize, f: F) -> Vec<R>
+where
+    T: Sync,
+    R: Send,
+    F: Fn(&T) -> R + Sync,
+{
+    let threads = threads.min(items.len());
+    if threads < 2 {
+        return items.iter().map(f).collect();
+    }
+
+    let next = AtomicUsize::new(0);
+    let mut results: Vec<Option<R>> = std::iter::repeat_with(|| None).take(items.len()).collect();
+    std::thread::scope(|scope| {
+        let workers: Vec<_> = (0..threads)
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut done = Vec::new();
+                    loop {
+                        let index = next.fetch_add(1, Ordering::Relaxed);
+                        let Some(item) = items.get(index) else {
+                            break done;
+                        };
+                        done.push((index, f(item)));
+                    }
+                })
+            })
+            .collect();
+        for worker in workers {
+            for (index, result) in worker.join().expect("parallel worker panicked") {
+                results[index] = Some(result);
+            }
+        }
+    });
+    results
+        .into_iter()
+        .map(|result| result.expect("every item was claimed"))
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::map_ordered;
+
+    #[test]
+    fn keeps_item_order_across_workers() {
+        let items: Vec<usize> = (0..100).collect();
+        assert_eq!(
+            map_ordered(&items, 4, |item| item * 2),
+            (0..100).map(|item| item * 2).collect::<Vec<_>>()
+        );
+        assert!(map_ordered(&[] as &[usize], 4, |item| *item).is_empty());
+    }
+}
@@ -0,0 +1,259 @@
+//! Background warming of font files that a sampler is about to load.
+//!
+//! A single thread maps each submitted file and touches every page, so the
+//! page faults of cold storage happen off the loader's critical path. Files
+//! are numbered in submission order. The consumer reports its position with
+//! [`Prefetcher::advance`], and the thread stops while the files it warmed
+//! beyond that position exceed the byte budget. A file larger than the whole
+//! budget is still warmed once nothing else is ahead, so the thread never
+//! stalls for good.
+//!
+//! The thread starts with the prefetcher and is joined when it is dropped. It
+//! is not carried into forked children; create prefetchers in the process that
+//! drives the sampler.
+
+use std::collections::VecDeque;
+use std::fs;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Condvar, Mutex, MutexGuard, PoisonError};
+use std::thread::JoinHandle;
+
+use memmap2::Mmap;
+
+use crate::stats::COUNTERS;
+
+// Touching one byte per page faults the whole file in. Smaller pages than the
+// real ones only cost extra reads of resident memory.
+const PAGE_SIZE: usize = 4096;
+
+struct Warmed {
+    seq: u64,
+    path: PathBuf,
+    bytes: u64,
+}
+
+#[derive(Default)]
+struct State {
+    queue: VecDeque<(u64, PathBuf)>,
+    submitted: u64,
+    consumed: u64,
+    ahead: VecDeque<Warmed>,
+    ahead_bytes: u64,
+    closed: bool,
+}
+
+impl State {
+    fn release_consumed(&mut self) {
+        while self
+            .ahead
+            .front()
+            .is_some_and(|warmed| warmed.seq < self.consumed)
+        {
+            if let Some(warmed) = self.ahead.pop_front() {
+                self.ahead_bytes -= warmed.bytes;
+            }
+        }
+    }
+}
+
+struct Shared {
+    budget: u64,
+    state: Mutex<State>,
+    wake: Condvar,
+}
+
+impl Shared {
+    fn lock(&self) -> MutexGuard<'_, State> {
+        self.state.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    fn wait<'a>(&self, state: MutexGuard<'a, State>) -> MutexGuard<'a, State> {
+        self.wake
+            .wait(state)
+            .unwrap_or_else(PoisonError::into_inner)
+    }
+}
+
+pub(crate) struct Prefetcher {
+    shared: Arc<Shared>,
+    thread: Mutex<Option<JoinHandle<()>>>,
+}
+
+impl Prefetcher {
+    pub(crate) fn new(budget: u64) -> std::io::Result<Self> {
+        let shared = Arc::new(Shared {
+            budget,
+            state: Mutex::new(State::default()),
+            wake: Condvar::new(),
+        });
+        let worker = Arc::clone(&shared);
+        let thread = std::thread::Builder::new()
+            .name("torchfont-prefetch".into())
+            .spawn(move || run(&worker))?;
+        Ok(Self {
+            shared,
+            thread: Mutex::new(Some(thread)),
+        })
+    }
+
+    /// Queues files in the order they will be loaded and returns the sequence
+    /// number that follows the last one.
+    pub(crate) fn submit(&self, paths: impl IntoIterator<Item = PathBuf>) -> u64 {
+        let mut state = self.shared.lock();
+        for path in paths {
+            let seq = state.submitted;
+            state.queue.push_back((seq, path));
+            state.submitted += 1;
+        }
+        self.shared.wake.notify_all();
+        state.submitted
+    }
+
+    /// Marks every file numbered below `seq` as loaded, freeing its share of
+    /// the budget. Queued files that are already behind are skipped.
+    pub(crate) fn advance(&self, seq: u64) {
+        let mut state = self.shared.lock();
+        if seq > state.consumed {
+            state.consumed = seq;
+            state.release_consumed();
+            self.shared.wake.notify_all();
+        }
+    }
+
+    /// Bytes warmed ahead of the consumer.
+    pub(crate) fn ahead_bytes(&self) -> u64 {
+        self.shared.lock().ahead_bytes
+    }
+
+    /// Files submitted but not yet warmed or skipped.
+    pub(crate) fn pending(&self) -> usize {
+        self.shared.lock().queue.len()
+    }
+
+    /// Stops the thread after the file it is warming and waits for it.
+    pub(crate) fn close(&self) {
+        self.shared.lock().closed = true;
+        self.shared.wake.notify_all();
+        let thread = self
+            .thread
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .take();
+        if let Some(thread) = thread {
+            let _ = thread.join();
+        }
+    }
+}
+
+impl Drop for Prefetcher {
+    fn drop(&mut self) {
+        self.close();
+    }
+}
+
+fn run(shared: &Shared) {
+    let mut state = shared.lock();
+    loop {
+        if state.closed {
+            return;
+        }
+        let Some((seq, path)) = state.queue.pop_front() else {
+            state = shared.wait(state);
+            continue;
+        };
+        if seq < state.consumed || state.ahead.iter().any(|warmed| warmed.path == path) {
+            continue;
+        }
+        drop(state);
+        let bytes = fs::metadata(&path).map_or(0, |metadata| metadata.len());
+        state = shared.lock();
+        if !state.ahead.is_empty() && state.ahead_bytes + bytes > shared.budget {
+            // Over budget: put the file back and wait for the consumer.
+            state.queue.push_front((seq, path));
+            state = shared.wait(state);
+            continue;
+        }
+        state.ahead.push_back(Warmed {
+            seq,
+            path: path.clone(),
+            bytes,
+        });
+        state.ahead_bytes += bytes;
+        drop(state);
+        warm(&path);
+        state = shared.lock();
+        // The consumer may have passed this file while it was being warmed.
+        state.release_consumed();
+    }
+}
+
+fn warm(path: &Path) {
+    // Prefetching is best effort: a file that cannot be read fails again, with
+    // a proper error, when the loader opens it.
+    let Ok(file) = fs::File::open(path) else {
+        return;
+    };
+    // SAFETY: the map is only read here, and TorchFont documents modification
+    // of indexed font files during use as unsupported.
+    let Ok(mmap) = (unsafe { Mmap::map(&file) }) else {
+        return;
+    };
+    #[cfg(unix)]
+    let _ = mmap.advise(memmap2::Advice::WillNeed);
+    let mut checksum = 0u8;
+    for offset in (0..mmap.len()).step_by(PAGE_SIZE) {
+        checksum ^= mmap[offset];
+    }
+    std::hint::black_box(checksum);
+    COUNTERS.record_prefetch(mmap.len());
+}
+
+#[cfg(test)]
+mod tests {
+    use std::path::PathBuf;
+    use std::time::{Duration, Instant};
+
+    use super::Prefetcher;
+
+    fn font(name: &str) -> PathBuf {
+        PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+            .join("tests/fonts")
+            .join(name)
+    }
+
+    fn wait_until(mut done: impl FnMut() -> bool) {
+        let deadline = Instant::now() + Duration::from_secs(10);
+        while !done() {
+            assert!(Instant::now() < deadline, "prefetcher made no progress");
+            std::thread::sleep(Duration::from_millis(1));
+        }
+    }
+
+    #[test]
+    fn stops_at_the_budget_until_the_consumer_advances() {
+        let sans = font("source-sans/SourceSans3-Regular.ttf");
+        let serif = font("source-serif/SourceSerif4Variable-Roman.ttf");
+        let size = std::fs::metadata(&sans).unwrap().len();
+        let prefetcher = Prefetcher::new(size).unwrap();
+
+        let end = prefetcher.submit([sans.clone(), serif.clone(), sans]);
+        wait_until(|| prefetcher.pending() == 2);
+        std::thread::sleep(Duration::from_millis(20));
+        assert_eq!(prefetcher.pending(), 2);
+        assert_eq!(prefetcher.ahead_bytes(), size);
+
+        prefetcher.advance(1);
+        wait_until(|| prefetcher.pending() == 0);
+        prefetcher.advance(end);
+        wait_until(|| prefetcher.ahead_bytes() == 0);
+    }
+
+    #[test]
+    fn skips_missing_files_and_closes() {
+        let prefetcher = Prefetcher::new(1 << 20).unwrap();
+        prefetcher.submit([font("missing.ttf")]);
+        wait_until(|| prefetcher.pending() == 0);
+        prefetcher.close();
+        prefetcher.close();
+    }
+}
@@ -1,40 +1,119 @@
+use std::collections::BTreeSet;
+use std::path::{Path, PathBuf};
+
 use pyo3::PyResult;
 
 use crate::dataset::{DiscoveredFont, FontEntry, canonicalize_root, discover_font_files};
+use crate::parallel::{available_threads, map_ordered};
+
+/// What each font file contributes to an index.
+#[derive(Clone)]
+pub(super) enum Scan {
+    /// Mapped codepoints, optionally limited to a sorted, deduplicated set.
+    Codepoints(Option<Vec<u32>>),
+    /// Every outline glyph by glyph id, optionally without encoded glyphs.
+    Glyphs { encoded: bool },
+}
+
+impl Scan {
+    pub(super) fn codepoints(codepoints: Option<Vec<u32>>) -> Self {
+        Self::Codepoints(codepoints.map(|mut values| {
+            values.sort_unstable();
+            values.dedup();
+            values
+        }))
+    }
+
+    /// Entries for the faces of `files` that have samples. Files are parsed in
+    /// parallel, and the result keeps their order.
+    pub(super) fn entries(&self, files: &[PathBuf]) -> PyResult<Vec<FontEntry>> {
+        let mut entries = Vec::new();
+        for faces in map_ordered(files, available_threads(), |path| match self {
+            Self::Codepoints(filter) => DiscoveredFont::from_file(path, filter.as_deref()),
+            Self::Glyphs { encoded } => DiscoveredFont::glyphs_from_file(path, *encoded),
+        }) {
+            entries.extend(
+                faces?
+                    .into_iter()
+                    .filter(|entry| entry.codepoint_count() > 0)
+                    .map(font_entry),
+            );
+        }
+        Ok(entries)
+    }
+}
 
-pub(super) fn build_entries(
-    root: &str,
-    codepoints: Option<Vec<u32>>,
-    patterns: Option<Vec<String>>,
-) -> PyResult<Vec<FontEntry>> {
-    Ok(discover_fonts(root, codepoints, patterns)?
-        .into_iter()
-        .map(|font| FontEntry {
-            path: font.path().to_path_buf(),
-            ttc_index: font.ttc_index(),
-            codepoints: font.codepoints().to_vec(),
-        })
-        .collect())
+/// How an index was built, kept so it can be updated without a full rescan.
+#[derive(Clone)]
+pub(super) struct Source {
+    pub(super) root: PathBuf,
+    pub(super) patterns: Option<Vec<String>>,
+    pub(super) scan: Scan,
+    /// Every font file scanned, including files without samples, sorted.
+    pub(super) files: Vec<PathBuf>,
 }
 
-fn discover_fonts(
-    root: &str,
-    codepoints: Option<Vec<u32>>,
-    patterns: Option<Vec<String>>,
-) -> PyResult<Vec<DiscoveredFont>> {
-    let filter = codepoints.map(|mut values| {
-        values.sort_unstable();
-        values.dedup();
-        values
-    });
-    let root = canonicalize_root(root)?;
-    let mut entries = Vec::new();
-    for path in discover_font_files(&root, patterns.as_deref())? {
-        entries.extend(
-            DiscoveredFont::from_file(&path, filter.as_deref())?
-                .into_iter()
-                .filter(|entry| entry.codepoint_count() > 0),
-        );
+impl Source {
+    pub(super) fn discover(
+        root: &str,
+        patterns: Option<Vec<String>>,
+        scan: Scan,
+    ) -> PyResult<(Self, Vec<FontEntry>)> {
+        let root = canonicalize_root(root)?;
+        let files = discover_font_files(&root, patterns.as_deref())?;
+        let entries = scan.entries(&files)?;
+        Ok((
+            Self {
+                root,
+                patterns,
+                scan,
+                files,
+            },
+            entries,
+        ))
+    }
+
+    /// Files added to and removed from the root since the last scan.
+    pub(super) fn changes(&self) -> PyResult<(Vec<PathBuf>, Vec<PathBuf>)> {
+        let current = discover_font_files(&self.root, self.patterns.as_deref())?;
+        let known: BTreeSet<&Path> = self.files.iter().map(PathBuf::as_path).collect();
+        let found: BTreeSet<&Path> = current.iter().map(PathBuf::as_path).collect();
+        Ok((
+            current
+                .iter()
+                .filter(|path| !known.contains(path.as_path()))
+                .cloned()
+                .collect(),
+            self.files
+                .iter()
+                .filter(|path| !found.contains(path.as_path()))
+                .cloned()
+                .collect(),
+        ))
     }
-    Ok(entries)
+
+    /// The same source after `added` were scanned and `removed` dropped.
+    pub(super) fn with_changes(&self, added: &[PathBuf], removed: &[PathBuf]) -> Self {
+        let removed: BTreeSet<&PathBuf> = removed.iter().collect();
+        let files: BTreeSet<PathBuf> = self
+            .files
+            .iter()
+            .filter(|path| !removed.contains(path))
+            .chain(added)
+            .cloned()
+            .collect();
+        Self {
+            files: files.into_iter().collect(),
+            ..self.clone()
+        }
+    }
+}
+
+fn font_entry(font: DiscoveredFont) -> FontEntry {
+    FontEntry::new(
+        font.path().to_path_buf(),
+        font.ttc_index(),
+        font.codepoints(),
+        font.glyph_ids(),
+    )
 }
@@ -1,25 +1,49 @@
 use std::path::PathBuf;
 
-use numpy::{IntoPyArray as _, PyArray1};
+use numpy::{IntoPyArray as _, PyArray1, PyReadonlyArray1};
 use pyo3::{Bound, prelude::*, types::PyType};
 
-use crate::dataset::{FontEntry, GlyphIndex as CoreGlyphIndex};
+use crate::dataset::{DefaultOutlines, FontEntry, GlyphIndex as CoreGlyphIndex};
 
-use super::{build, index_error, overflow_error};
+use super::build::{Scan, Source};
+use super::{index_error, overflow_error};
 
-type FontArg = (PathBuf, u32, Vec<u32>);
-type LocationArg = (PathBuf, u32, usize, u32, usize);
+type FontArg = (PathBuf, u32, Vec<u32>, Vec<u32>);
+type SourceArg = (
+    PathBuf,
+    Option<Vec<String>>,
+    Option<Vec<u32>>,
+    Option<bool>,
+    Vec<PathBuf>,
+);
+type LocationArg = (PathBuf, u32, usize, Option<u32>, Option<usize>, u32);
+type OutlinesState = (Py<PyArray1<u32>>, Py<PyArray1<u64>>);
 
 #[pyclass(frozen, module = "torchfont._torchfont")]
 pub(super) struct GlyphIndex {
     inner: CoreGlyphIndex,
+    source: Option<Source>,
 }
 
 #[pymethods]
 impl GlyphIndex {
     #[new]
-    fn new(fonts: Vec<FontArg>) -> PyResult<Self> {
-        Self::from_entries(fonts.into_iter().map(font_entry).collect())
+    #[pyo3(signature = (fonts, source=None, character_codepoints=None))]
+    fn new(
+        fonts: Vec<FontArg>,
+        source: Option<SourceArg>,
+        character_codepoints: Option<Vec<u32>>,
+    ) -> PyResult<Self> {
+        let fonts = fonts.into_iter().map(font_entry).collect::<PyResult<_>>()?;
+        let inner = CoreGlyphIndex::with_character_codepoints(
+            fonts,
+            character_codepoints.unwrap_or_default(),
+        )
+        .map_err(overflow_error)?;
+        Ok(Self {
+            inner,
+            source: source.map(source_from_arg),
+        })
     }
 
     #[classmethod]
@@ -30,8 +54,44 @@ impl GlyphIndex {
         codepoints: Option<Vec<u32>>,
         patterns: Option<Vec<String>>,
     ) -> PyResult<Self> {
-        let entries = py.detach(|| build::build_entries(&root, codepoints, patterns))?;
-        Self::from_entries(entries)
+        let (source, entries) =
+            py.detach(|| Source::discover(&root, patterns, Scan::codepoints(codepoints)))?;
+        Self::from_entries(entries, source)
+    }
+
+    #[classmethod]
+    fn from_root_glyphs(
+        _cls: &Bound<'_, PyType>,
+        py: Python<'_>,
+        root: String,
+        patterns: Option<Vec<String>>,
+        encoded: bool,
+    ) -> PyResult<Self> {
+        let (source, entries) =
+            py.detach(|| Source::discover(&root, patterns, Scan::Glyphs { encoded }))?;
+        Self::from_entries(entries, source)
+    }
+
+    /// A new index with `added` files scanned and `removed` files dropped.
+    /// Passing a file in `added` that the index already covers rescans it.
+    fn update(
+        &self,
+        py: Python<'_>,
+        added: Vec<PathBuf>,
+        removed: Vec<PathBuf>,
+        stable: bool,
+    ) -> PyResult<Self> {
+        let source = self.source()?;
+        py.detach(|| self.apply(source, &added, &removed, stable))
+    }
+
+    /// A new index matching the files currently under the root.
+    fn refresh(&self, py: Python<'_>, stable: bool) -> PyResult<Self> {
+        let source = self.source()?;
+        py.detach(|| {
+            let (added, removed) = source.changes()?;
+            self.apply(source, &added, &removed, stable)
+        })
     }
 
     #[getter]
@@ -62,6 +122,7 @@ impl GlyphIndex {
             sample.font_idx,
             sample.codepoint,
             sample.character_idx,
+            sample.glyph_id,
         ))
     }
 
@@ -73,28 +134,147 @@ impl GlyphIndex {
         self.inner.character_targets().into_pyarray(py).unbind()
     }
 
-    fn __getnewargs__(&self) -> (Vec<FontArg>,) {
-        (self
+    fn element_counts(&self, py: Python<'_>) -> PyResult<Py<PyArray1<i64>>> {
+        let outlines = py.detach(|| self.inner.default_outlines())?;
+        Ok(outlines
+            .element_counts
+            .iter()
+            .map(|&count| i64::from(count))
+            .collect::<Vec<_>>()
+            .into_pyarray(py)
+            .unbind())
+    }
+
+    /// Hash of every sample's outline at the default location, with the 64
+    /// bits reinterpreted as signed integers.
+    fn outline_hashes(&self, py: Python<'_>) -> PyResult<Py<PyArray1<i64>>> {
+        let outlines = py.detach(|| self.inner.default_outlines())?;
+        Ok(outlines
+            .hashes
+            .iter()
+            .map(|&hash| hash as i64)
+            .collect::<Vec<_>>()
+            .into_pyarray(py)
+            .unbind())
+    }
+
+    // Computed outline summaries travel with a pickled index, so DataLoader
+    // workers and reloaded datasets do not draw every outline again.
+    fn __getstate__(&self, py: Python<'_>) -> Option<OutlinesState> {
+        self.inner.cached_default_outlines().map(|outlines| {
+            (
+                outlines.element_counts.into_pyarray(py).unbind(),
+                outlines.hashes.into_pyarray(py).unbind(),
+            )
+        })
+    }
+
+    fn __setstate__(
+        &self,
+        (element_counts, hashes): (PyReadonlyArray1<'_, u32>, PyReadonlyArray1<'_, u64>),
+    ) -> PyResult<()> {
+        let outlines = DefaultOutlines {
+            element_counts: element_counts.as_slice()?.to_vec(),
+            hashes: hashes.as_slice()?.to_vec(),
+        };
+        if self.inner.restore_default_outlines(outlines) {
+            Ok(())
+        } else {
+            Err(pyo3::exceptions::PyValueError::new_err(
+                "outline state does not match the index sample count",
+            ))
+        }
+    }
+
+    fn __getnewargs__(&self) -> (Vec<FontArg>, Option<SourceArg>, Vec<u32>) {
+        let fonts = self
             .inner
             .fonts()
             .iter()
-            .map(|font| (font.path.clone(), font.ttc_index, font.codepoints.clone()))
-            .collect(),)
+            .map(|font| {
+                (
+                    font.path.clone(),
+                    font.ttc_index,
+                    font.codepoints.iter().collect(),
+                    font.glyph_ids.iter().collect(),
+                )
+            })
+            .collect();
+        (
+            fonts,
+            self.source.as_ref().map(source_arg),
+            self.inner.character_codepoints().to_vec(),
+        )
     }
 }
 
 impl GlyphIndex {
-    fn from_entries(fonts: Vec<FontEntry>) -> PyResult<Self> {
+    fn from_entries(fonts: Vec<FontEntry>, source: Source) -> PyResult<Self> {
         Ok(Self {
             inner: CoreGlyphIndex::new(fonts).map_err(overflow_error)?,
+            source: Some(source),
+        })
+    }
+
+    fn source(&self) -> PyResult<&Source> {
+        self.source.as_ref().ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err("index was not built from a font root")
+        })
+    }
+
+    fn apply(
+        &self,
+        source: &Source,
+        added: &[PathBuf],
+        removed: &[PathBuf],
+        stable: bool,
+    ) -> PyResult<Self> {
+        let entries = source.scan.entries(added)?;
+        let changed: Vec<PathBuf> = added.iter().chain(removed).cloned().collect();
+        Ok(Self {
+            inner: self
+                .inner
+                .update(&changed, entries, stable)
+                .map_err(overflow_error)?,
+            source: Some(source.with_changes(added, removed)),
         })
     }
 }
 
-fn font_entry((path, ttc_index, codepoints): FontArg) -> FontEntry {
-    FontEntry {
-        path,
-        ttc_index,
+fn source_arg(source: &Source) -> SourceArg {
+    let (codepoints, encoded) = match &source.scan {
+        Scan::Codepoints(codepoints) => (codepoints.clone(), None),
+        Scan::Glyphs { encoded } => (None, Some(*encoded)),
+    };
+    (
+        source.root.clone(),
+        source.patterns.clone(),
         codepoints,
+        encoded,
+        source.files.clone(),
+    )
+}
+
+fn source_from_arg((root, patterns, codepoints, encoded, files): SourceArg) -> Source {
+    Source {
+        root,
+        patterns,
+        scan: encoded.map_or_else(
+            || Scan::codepoints(codepoints),
+            |encoded| Scan::Glyphs { encoded },
+        ),
+        files,
+    }
+}
+
+fn font_entry((path, ttc_index, codepoints, glyph_ids): FontArg) -> PyResult<FontEntry> {
+    if glyph_ids.len() != codepoints.len() {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "font '{}' has {} codepoints but {} glyph ids",
+            path.display(),
+            codepoints.len(),
+            glyph_ids.len()
+        )));
     }
+    Ok(FontEntry::new(path, ttc_index, &codepoints, &glyph_ids))
 }
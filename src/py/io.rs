@@ -0,0 +1,118 @@
+use std::collections::BTreeMap;
+use std::path::PathBuf;
+
+use pyo3::prelude::*;
+
+use crate::font::{Access, IoOptions, io_options, set_io_options};
+use crate::prefetch::Prefetcher;
+use crate::stats::{COUNTERS, Snapshot};
+
+fn to_dict(snapshot: Snapshot) -> BTreeMap<&'static str, u64> {
+    BTreeMap::from([
+        ("files_mapped", snapshot.files_mapped),
+        ("bytes_mapped", snapshot.bytes_mapped),
+        ("files_read", snapshot.files_read),
+        ("bytes_read", snapshot.bytes_read),
+        ("map_failures", snapshot.map_failures),
+        ("cache_hits", snapshot.cache_hits),
+        ("cache_misses", snapshot.cache_misses),
+        ("files_prefetched", snapshot.files_prefetched),
+        ("bytes_prefetched", snapshot.bytes_prefetched),
+        ("glyph_draws", snapshot.glyph_draws),
+        ("glyph_draw_nanos", snapshot.glyph_draw_nanos),
+    ])
+}
+
+/// Returns the process-wide font I/O counters.
+#[pyfunction]
+fn io_stats() -> BTreeMap<&'static str, u64> {
+    to_dict(COUNTERS.snapshot())
+}
+
+/// Zeroes the process-wide font I/O counters and returns their last values.
+#[pyfunction]
+fn reset_io_stats() -> BTreeMap<&'static str, u64> {
+    to_dict(COUNTERS.reset())
+}
+
+type FontIoOptions = (&'static str, bool, u64);
+
+/// Returns the access advice, outline read-ahead flag, and eager-read limit
+/// applied to fonts opened from now on.
+#[pyfunction]
+fn font_io_options() -> FontIoOptions {
+    let options = io_options();
+    (
+        options.access.name(),
+        options.will_need_outlines,
+        options.eager_read_max_bytes,
+    )
+}
+
+/// Replaces the font I/O options and returns the previous ones.
+#[pyfunction]
+fn set_font_io_options(
+    access: &str,
+    will_need_outlines: bool,
+    eager_read_max_bytes: u64,
+) -> PyResult<FontIoOptions> {
+    let access = Access::parse(access).ok_or_else(|| {
+        pyo3::exceptions::PyValueError::new_err(
+            "access must be one of 'normal', 'random', or 'sequential'",
+        )
+    })?;
+    let previous = font_io_options();
+    set_io_options(IoOptions {
+        access,
+        will_need_outlines,
+        eager_read_max_bytes,
+    });
+    Ok(previous)
+}
+
+/// Warms font files on a background thread ahead of the loader.
+#[pyclass(frozen, module = "torchfont._torchfont")]
+struct FontPrefetcher {
+    inner: Prefetcher,
+}
+
+#[pymethods]
+impl FontPrefetcher {
+    #[new]
+    fn new(budget_bytes: u64) -> PyResult<Self> {
+        Ok(Self {
+            inner: Prefetcher::new(budget_bytes)?,
+        })
+    }
+
+    fn submit(&self, paths: Vec<PathBuf>) -> u64 {
+        self.inner.submit(paths)
+    }
+
+    fn advance(&self, seq: u64) {
+        self.inner.advance(seq);
+    }
+
+    #[getter]
+    fn ahead_bytes(&self) -> u64 {
+        self.inner.ahead_bytes()
+    }
+
+    #[getter]
+    fn pending(&self) -> usize {
+        self.inner.pending()
+    }
+
+    fn close(&self, py: Python<'_>) {
+        py.detach(|| self.inner.close());
+    }
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(io_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(reset_io_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(font_io_options, m)?)?;
+    m.add_function(wrap_pyfunction!(set_font_io_options, m)?)?;
+    m.add_class::<FontPrefetcher>()?;
+    Ok(())
+}
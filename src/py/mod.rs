@@ -1,6 +1,7 @@
 pub(crate) mod dataset;
 mod error;
 pub(crate) mod glyphsets;
+mod io;
 pub(crate) mod transform;
 
 use pyo3::{Bound, PyResult, types::PyModule};
@@ -8,6 +9,7 @@ use pyo3::{Bound, PyResult, types::PyModule};
 pub(crate) fn register_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     dataset::register(m)?;
     glyphsets::register(m)?;
+    io::register(m)?;
     transform::register(m)?;
     Ok(())
 }
@@ -1,11 +1,11 @@
 use pyo3::prelude::*;
 use std::collections::BTreeMap;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 
 use crate::font::{
     axis_info, canonicalize_location, map_font, parse_font_ref, registered_axis_values,
 };
-use crate::transform::load::load_glyph_outline;
+use crate::transform::load::{Glyph, load_glyph_outline};
 
 #[pyfunction]
 pub(crate) fn variation_axes(
@@ -48,14 +48,63 @@ pub(crate) fn glyph_targets(
 }
 
 #[pyfunction]
+#[pyo3(signature = (
+    path, ttc_index, codepoint, location=None, types_dtype="int64", coords_dtype="float32"
+))]
 pub(crate) fn load_glyph<'py>(
     py: Python<'py>,
     path: PathBuf,
     ttc_index: u32,
     codepoint: u32,
     location: Option<BTreeMap<String, f32>>,
+    types_dtype: &str,
+    coords_dtype: &str,
 ) -> PyResult<super::OutlineArrays<'py>> {
-    let outline =
-        py.detach(|| load_glyph_outline(&path, ttc_index, codepoint, location.as_ref()))?;
-    Ok(super::encode(py, &outline))
+    load(
+        py,
+        &path,
+        ttc_index,
+        Glyph::Codepoint(codepoint),
+        location.as_ref(),
+        (types_dtype, coords_dtype),
+    )
+}
+
+/// Like `load_glyph`, but draws a glyph id without consulting the character
+/// map.
+#[pyfunction]
+#[pyo3(signature = (
+    path, ttc_index, glyph_id, location=None, types_dtype="int64", coords_dtype="float32"
+))]
+pub(crate) fn load_glyph_id<'py>(
+    py: Python<'py>,
+    path: PathBuf,
+    ttc_index: u32,
+    glyph_id: u32,
+    location: Option<BTreeMap<String, f32>>,
+    types_dtype: &str,
+    coords_dtype: &str,
+) -> PyResult<super::OutlineArrays<'py>> {
+    load(
+        py,
+        &path,
+        ttc_index,
+        Glyph::Id(glyph_id),
+        location.as_ref(),
+        (types_dtype, coords_dtype),
+    )
+}
+
+fn load<'py>(
+    py: Python<'py>,
+    path: &Path,
+    ttc_index: u32,
+    glyph: Glyph,
+    location: Option<&BTreeMap<String, f32>>,
+    (types_dtype, coords_dtype): (&str, &str),
+) -> PyResult<super::OutlineArrays<'py>> {
+    let types_dtype = super::TypesDtype::parse(types_dtype)?;
+    let coords_dtype = super::CoordsDtype::parse(coords_dtype)?;
+    let outline = py.detach(|| load_glyph_outline(path, ttc_index, glyph, location))?;
+    Ok(super::encode(py, &outline, types_dtype, coords_dtype))
 }
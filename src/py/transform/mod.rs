@@ -1,16 +1,134 @@
-use numpy::{IntoPyArray as _, PyArray1, PyReadonlyArray1};
+use std::borrow::Cow;
+
+use numpy::{Element, IntoPyArray as _, PyArray1, PyArrayMethods as _, PyReadonlyArray1};
 use pyo3::{Bound, prelude::*, types::PyModule};
 use tiny_skia::FillRule;
 
-use crate::outline::{BezPath, DecodeError};
+use crate::outline::{BezPath, CoordValue, DecodeError, ElementCode};
 use crate::transform::render_bitmap::RenderMode;
 use crate::transform::{curves, subpath};
 
 mod load;
 
-type OutlineArrays<'py> = (Bound<'py, PyArray1<i64>>, Bound<'py, PyArray1<f32>>);
+type OutlineArrays<'py> = (Bound<'py, PyAny>, Bound<'py, PyAny>);
+
+// Element type arrays accepted by every outline kernel. Outputs are encoded
+// with the same dtype as the input types.
+#[derive(FromPyObject)]
+pub(crate) enum TypesArray<'py> {
+    I64(PyReadonlyArray1<'py, i64>),
+    U8(PyReadonlyArray1<'py, u8>),
+    I8(PyReadonlyArray1<'py, i8>),
+}
+
+#[derive(Clone, Copy)]
+pub(crate) enum TypesDtype {
+    I64,
+    U8,
+    I8,
+}
+
+impl TypesDtype {
+    fn parse(name: &str) -> PyResult<Self> {
+        match name {
+            "int64" => Ok(Self::I64),
+            "uint8" => Ok(Self::U8),
+            "int8" => Ok(Self::I8),
+            _ => Err(pyo3::exceptions::PyValueError::new_err(
+                "types_dtype must be one of 'int64', 'uint8', or 'int8'",
+            )),
+        }
+    }
+}
+
+impl TypesArray<'_> {
+    fn dtype(&self) -> TypesDtype {
+        match self {
+            Self::I64(_) => TypesDtype::I64,
+            Self::U8(_) => TypesDtype::U8,
+            Self::I8(_) => TypesDtype::I8,
+        }
+    }
+
+    fn len(&self) -> usize {
+        match self {
+            Self::I64(types) => types.len(),
+            Self::U8(types) => types.len(),
+            Self::I8(types) => types.len(),
+        }
+    }
+
+    // Element codes widened to i64; only narrow dtypes allocate.
+    fn codes(&self) -> PyResult<Cow<'_, [i64]>> {
+        Ok(match self {
+            Self::I64(types) => Cow::Borrowed(types.as_slice()?),
+            Self::U8(types) => Cow::Owned(widen(types.as_slice()?)),
+            Self::I8(types) => Cow::Owned(widen(types.as_slice()?)),
+        })
+    }
+
+    fn decode(&self, coords: &CoordsArray<'_>) -> PyResult<BezPath> {
+        match self {
+            Self::I64(types) => coords.decode(types.as_slice()?),
+            Self::U8(types) => coords.decode(types.as_slice()?),
+            Self::I8(types) => coords.decode(types.as_slice()?),
+        }
+    }
+}
+
+// Coordinate arrays accepted by every outline kernel. Float16 and bfloat16
+// coordinates arrive as int16 and uint16 bit patterns, because NumPy has no
+// bfloat16 dtype, and are converted while decoding.
+#[derive(FromPyObject)]
+pub(crate) enum CoordsArray<'py> {
+    F32(PyReadonlyArray1<'py, f32>),
+    F16(PyReadonlyArray1<'py, i16>),
+    BF16(PyReadonlyArray1<'py, u16>),
+}
+
+#[derive(Clone, Copy)]
+pub(crate) enum CoordsDtype {
+    F32,
+    F16,
+    BF16,
+}
+
+impl CoordsDtype {
+    fn parse(name: &str) -> PyResult<Self> {
+        match name {
+            "float32" => Ok(Self::F32),
+            "float16" => Ok(Self::F16),
+            "bfloat16" => Ok(Self::BF16),
+            _ => Err(pyo3::exceptions::PyValueError::new_err(
+                "coords_dtype must be one of 'float32', 'float16', or 'bfloat16'",
+            )),
+        }
+    }
+}
+
+impl CoordsArray<'_> {
+    fn dtype(&self) -> CoordsDtype {
+        match self {
+            Self::F32(_) => CoordsDtype::F32,
+            Self::F16(_) => CoordsDtype::F16,
+            Self::BF16(_) => CoordsDtype::BF16,
+        }
+    }
+
+    fn decode<T: ElementCode>(&self, types: &[T]) -> PyResult<BezPath> {
+        match self {
+            Self::F32(coords) => decode(types, coords.as_slice()?),
+            Self::F16(coords) => decode(types, coords.as_slice()?),
+            Self::BF16(coords) => decode(types, coords.as_slice()?),
+        }
+    }
+}
+
+fn widen<T: ElementCode>(types: &[T]) -> Vec<i64> {
+    types.iter().map(|&ty| ty.into()).collect()
+}
 
-fn decode(types: &[i64], coords: &[f32]) -> PyResult<BezPath> {
+fn decode<T: ElementCode, C: CoordValue>(types: &[T], coords: &[C]) -> PyResult<BezPath> {
     crate::outline::decode(types, coords).map_err(|e| match e {
         DecodeError::CoordsLen => {
             pyo3::exceptions::PyValueError::new_err("coords length must equal types length times 6")
@@ -33,19 +151,58 @@ fn decode(types: &[i64], coords: &[f32]) -> PyResult<BezPath> {
     })
 }
 
-fn encode<'py>(py: Python<'py>, outline: &BezPath) -> OutlineArrays<'py> {
-    let (types, coords) = crate::outline::encode(outline);
-    (types.into_pyarray(py), coords.into_pyarray(py))
+fn encode<'py>(
+    py: Python<'py>,
+    outline: &BezPath,
+    types_dtype: TypesDtype,
+    coords_dtype: CoordsDtype,
+) -> OutlineArrays<'py> {
+    match types_dtype {
+        TypesDtype::I64 => encode_types::<i64>(py, outline, coords_dtype),
+        TypesDtype::U8 => encode_types::<u8>(py, outline, coords_dtype),
+        TypesDtype::I8 => encode_types::<i8>(py, outline, coords_dtype),
+    }
+}
+
+fn encode_types<'py, T: Element + ElementCode>(
+    py: Python<'py>,
+    outline: &BezPath,
+    coords_dtype: CoordsDtype,
+) -> OutlineArrays<'py> {
+    match coords_dtype {
+        CoordsDtype::F32 => encode_as::<T, f32>(py, outline),
+        CoordsDtype::F16 => encode_as::<T, i16>(py, outline),
+        CoordsDtype::BF16 => encode_as::<T, u16>(py, outline),
+    }
+}
+
+fn encode_as<'py, T: Element + ElementCode, C: Element + CoordValue>(
+    py: Python<'py>,
+    outline: &BezPath,
+) -> OutlineArrays<'py> {
+    let len = crate::outline::encoded_len(outline);
+    let types = PyArray1::<T>::zeros(py, len, false);
+    let coords = PyArray1::<C>::zeros(py, len * 6, false);
+    // SAFETY: both arrays were allocated above as contiguous 1-D arrays and
+    // have not been shared with Python yet, so no other view can alias them.
+    let (types_out, coords_out) = unsafe { (types.as_slice_mut(), coords.as_slice_mut()) };
+    crate::outline::encode_into(
+        outline,
+        types_out.expect("new arrays are contiguous"),
+        coords_out.expect("new arrays are contiguous"),
+    )
+    .expect("buffers are sized by encoded_len");
+    (types.into_any(), coords.into_any())
 }
 
 #[pyfunction]
 pub(crate) fn quad_to_cubic<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
     merge_curves: bool,
 ) -> PyResult<OutlineArrays<'py>> {
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     let result = py.detach(|| {
         let result = curves::quad_to_cubic::quad_to_cubic(&outline);
         if merge_curves {
@@ -54,18 +211,18 @@ pub(crate) fn quad_to_cubic<'py>(
             result
         }
     });
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn cubic_to_quad<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
 ) -> PyResult<OutlineArrays<'py>> {
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     py.detach(|| curves::cubic_to_quad::cubic_to_quad(&outline))
-        .map(|outline| encode(py, &outline))
+        .map(|outline| encode(py, &outline, types.dtype(), coords.dtype()))
         .map_err(|_| {
             pyo3::exceptions::PyValueError::new_err(
                 "cubic_to_quad could not approximate a curve within tolerance",
@@ -76,19 +233,19 @@ pub(crate) fn cubic_to_quad<'py>(
 #[pyfunction]
 pub(crate) fn merge_curves<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
 ) -> PyResult<OutlineArrays<'py>> {
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     let result = py.detach(|| curves::merge_curves::merge_curves(&outline));
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn random_split_segments<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
     selection_values: PyReadonlyArray1<'_, f32>,
     position_values: PyReadonlyArray1<'_, f32>,
     split_probability: f32,
@@ -105,11 +262,11 @@ pub(crate) fn random_split_segments<'py>(
             "split_range must satisfy 0 < min <= max < 1",
         ));
     }
-    let types = types.as_slice()?;
-    let outline = decode(types, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
+    let codes = types.codes()?;
     let selection_values = selection_values.as_slice()?;
     let position_values = position_values.as_slice()?;
-    if selection_values.len() < types.len() || position_values.len() < types.len() {
+    if selection_values.len() < codes.len() || position_values.len() < codes.len() {
         return Err(pyo3::exceptions::PyValueError::new_err(
             "selection_values and position_values lengths must be at least types length",
         ));
@@ -117,7 +274,7 @@ pub(crate) fn random_split_segments<'py>(
     let mut segment_selection_values = Vec::new();
     let mut segment_position_values = Vec::new();
     for ((&element_type, &selection), &position) in
-        types.iter().zip(selection_values).zip(position_values)
+        codes.iter().zip(selection_values).zip(position_values)
     {
         if element_type == ElementType::LineTo as i64
             || element_type == ElementType::QuadTo as i64
@@ -136,31 +293,31 @@ pub(crate) fn random_split_segments<'py>(
             split_range,
         )
     });
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn normalize_subpath_start_points<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
 ) -> PyResult<OutlineArrays<'py>> {
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     let result = py.detach(|| subpath::normalize_subpath_start_points(&outline));
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn randomize_subpath_start_points<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
     random_values: PyReadonlyArray1<'_, f32>,
 ) -> PyResult<OutlineArrays<'py>> {
     use crate::outline::ElementType;
-    let t = types.as_slice()?;
+    let t = types.codes()?;
     let r = random_values.as_slice()?;
-    let outline = decode(t, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     if r.len() < t.len() {
         return Err(pyo3::exceptions::PyValueError::new_err(
             "random_values length must be at least types length",
@@ -173,20 +330,20 @@ pub(crate) fn randomize_subpath_start_points<'py>(
         .collect();
     let result =
         py.detach(|| subpath::randomize_subpath_start_points(&outline, &subpath_random_values));
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn randomize_subpath_order<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
     random_values: PyReadonlyArray1<'_, f32>,
 ) -> PyResult<OutlineArrays<'py>> {
     use crate::outline::ElementType;
-    let t = types.as_slice()?;
+    let t = types.codes()?;
     let r = random_values.as_slice()?;
-    let outline = decode(t, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     if r.len() < t.len() {
         return Err(pyo3::exceptions::PyValueError::new_err(
             "random_values length must be at least types length",
@@ -198,40 +355,43 @@ pub(crate) fn randomize_subpath_order<'py>(
         .filter_map(|(&ty, &rv)| (ty == ElementType::MoveTo as i64).then_some(rv))
         .collect();
     let result = py.detach(|| subpath::randomize_subpath_order(&outline, &subpath_random_values));
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn reverse_closed_subpaths<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
 ) -> PyResult<OutlineArrays<'py>> {
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     let result = py.detach(|| subpath::reverse_closed_subpaths(&outline));
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn remove_overlaps<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
+    parallel_threshold: usize,
 ) -> PyResult<OutlineArrays<'py>> {
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
-    let result = py.detach(|| crate::transform::remove_overlaps::remove_overlaps(&outline));
-    Ok(encode(py, &result))
+    let outline = types.decode(&coords)?;
+    let result = py.detach(|| {
+        crate::transform::remove_overlaps::remove_overlaps(&outline, parallel_threshold)
+    });
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn random_remove_overlaps<'py>(
     py: Python<'py>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
     random_values: PyReadonlyArray1<'_, f32>,
+    parallel_threshold: usize,
 ) -> PyResult<OutlineArrays<'py>> {
-    let types = types.as_slice()?;
-    let outline = decode(types, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     let random_values = random_values.as_slice()?;
     if random_values.len() < types.len() {
         return Err(pyo3::exceptions::PyValueError::new_err(
@@ -240,18 +400,22 @@ pub(crate) fn random_remove_overlaps<'py>(
     }
     let random_values = random_values.to_vec();
     let result = py.detach(|| {
-        crate::transform::remove_overlaps::random_remove_overlaps(&outline, &random_values)
+        crate::transform::remove_overlaps::random_remove_overlaps(
+            &outline,
+            &random_values,
+            parallel_threshold,
+        )
     });
-    Ok(encode(py, &result))
+    Ok(encode(py, &result, types.dtype(), coords.dtype()))
 }
 
 #[pyfunction]
 pub(crate) fn tight_bbox(
     py: Python<'_>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
 ) -> PyResult<Option<(f32, f32, f32, f32)>> {
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     Ok(py
         .detach(|| crate::outline::bounds_from_outline(&outline))
         .map(|b| (b.x_min, b.y_min, b.x_max, b.y_max)))
@@ -260,8 +424,8 @@ pub(crate) fn tight_bbox(
 #[pyfunction]
 pub(crate) fn render_bitmap(
     py: Python<'_>,
-    types: PyReadonlyArray1<'_, i64>,
-    coords: PyReadonlyArray1<'_, f32>,
+    types: TypesArray<'_>,
+    coords: CoordsArray<'_>,
     size: u32,
     mode: &str,
     fill_rule: &str,
@@ -291,7 +455,7 @@ pub(crate) fn render_bitmap(
             ));
         }
     };
-    let outline = decode(types.as_slice()?, coords.as_slice()?)?;
+    let outline = types.decode(&coords)?;
     let rendered = py
         .detach(|| {
             crate::transform::render_bitmap::render_bitmap(
@@ -312,6 +476,7 @@ pub(crate) fn render_bitmap(
 
 pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(load::load_glyph, m)?)?;
+    m.add_function(wrap_pyfunction!(load::load_glyph_id, m)?)?;
     m.add_function(wrap_pyfunction!(load::variation_axes, m)?)?;
     m.add_function(wrap_pyfunction!(load::glyph_targets, m)?)?;
     m.add_function(wrap_pyfunction!(quad_to_cubic, m)?)?;
@@ -0,0 +1,171 @@
+//! Process-wide counters for font-file I/O and glyph drawing.
+//!
+//! Every counter is a relaxed atomic, so recording costs one uncontended add
+//! and never takes a lock on the loading path. A forked DataLoader worker
+//! inherits the parent's values; the Python side resets them in the child so
+//! each worker counts only its own I/O.
+
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::Duration;
+
+pub(crate) struct Counters {
+    files_mapped: AtomicU64,
+    bytes_mapped: AtomicU64,
+    files_read: AtomicU64,
+    bytes_read: AtomicU64,
+    map_failures: AtomicU64,
+    cache_hits: AtomicU64,
+    cache_misses: AtomicU64,
+    files_prefetched: AtomicU64,
+    bytes_prefetched: AtomicU64,
+    glyph_draws: AtomicU64,
+    glyph_draw_nanos: AtomicU64,
+}
+
+/// A consistent-enough copy of the counters: each value is read atomically,
+/// but values recorded concurrently may land on either side of the snapshot.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub(crate) struct Snapshot {
+    pub(crate) files_mapped: u64,
+    pub(crate) bytes_mapped: u64,
+    pub(crate) files_read: u64,
+    pub(crate) bytes_read: u64,
+    pub(crate) map_failures: u64,
+    pub(crate) cache_hits: u64,
+    pub(crate) cache_misses: u64,
+    pub(crate) files_prefetched: u64,
+    pub(crate) bytes_prefetched: u64,
+    pub(crate) glyph_draws: u64,
+    pub(crate) glyph_draw_nanos: u64,
+}
+
+impl Counters {
+    const fn new() -> Self {
+        Self {
+            files_mapped: AtomicU64::new(0),
+            bytes_mapped: AtomicU64::new(0),
+            files_read: AtomicU64::new(0),
+            bytes_read: AtomicU64::new(0),
+            map_failures: AtomicU64::new(0),
+            cache_hits: AtomicU64::new(0),
+            cache_misses: AtomicU64::new(0),
+            files_prefetched: AtomicU64::new(0),
+            bytes_prefetched: AtomicU64::new(0),
+            glyph_draws: AtomicU64::new(0),
+            glyph_draw_nanos: AtomicU64::new(0),
+        }
+    }
+
+    pub(crate) fn record_map(&self, bytes: usize) {
+        self.files_mapped.fetch_add(1, Ordering::Relaxed);
+        self.bytes_mapped
+            .fetch_add(u64::try_from(bytes).unwrap_or(u64::MAX), Ordering::Relaxed);
+    }
+
+    pub(crate) fn record_read(&self, bytes: usize) {
+        self.files_read.fetch_add(1, Ordering::Relaxed);
+        self.bytes_read
+            .fetch_add(u64::try_from(bytes).unwrap_or(u64::MAX), Ordering::Relaxed);
+    }
+
+    pub(crate) fn record_map_failure(&self) {
+        self.map_failures.fetch_add(1, Ordering::Relaxed);
+    }
+
+    /// Counts an outline load served by a font that was still open.
+    pub(crate) fn record_cache_hit(&self) {
+        self.cache_hits.fetch_add(1, Ordering::Relaxed);
+    }
+
+    /// Counts an outline load that had to open its font.
+    pub(crate) fn record_cache_miss(&self) {
+        self.cache_misses.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub(crate) fn record_prefetch(&self, bytes: usize) {
+        self.files_prefetched.fetch_add(1, Ordering::Relaxed);
+        self.bytes_prefetched
+            .fetch_add(u64::try_from(bytes).unwrap_or(u64::MAX), Ordering::Relaxed);
+    }
+
+    pub(crate) fn record_draw(&self, elapsed: Duration) {
+        self.glyph_draws.fetch_add(1, Ordering::Relaxed);
+        self.glyph_draw_nanos.fetch_add(
+            u64::try_from(elapsed.as_nanos()).unwrap_or(u64::MAX),
+            Ordering::Relaxed,
+        );
+    }
+
+    pub(crate) fn snapshot(&self) -> Snapshot {
+        Snapshot {
+            files_mapped: self.files_mapped.load(Ordering::Relaxed),
+            bytes_mapped: self.bytes_mapped.load(Ordering::Relaxed),
+            files_read: self.files_read.load(Ordering::Relaxed),
+            bytes_read: self.bytes_read.load(Ordering::Relaxed),
+            map_failures: self.map_failures.load(Ordering::Relaxed),
+            cache_hits: self.cache_hits.load(Ordering::Relaxed),
+            cache_misses: self.cache_misses.load(Ordering::Relaxed),
+            files_prefetched: self.files_prefetched.load(Ordering::Relaxed),
+            bytes_prefetched: self.bytes_prefetched.load(Ordering::Relaxed),
+            glyph_draws: self.glyph_draws.load(Ordering::Relaxed),
+            glyph_draw_nanos: self.glyph_draw_nanos.load(Ordering::Relaxed),
+        }
+    }
+
+    /// Zeroes every counter and returns the values it held.
+    pub(crate) fn reset(&self) -> Snapshot {
+        Snapshot {
+            files_mapped: self.files_mapped.swap(0, Ordering::Relaxed),
+            bytes_mapped: self.bytes_mapped.swap(0, Ordering::Relaxed),
+            files_read: self.files_read.swap(0, Ordering::Relaxed),
+            bytes_read: self.bytes_read.swap(0, Ordering::Relaxed),
+            map_failures: self.map_failures.swap(0, Ordering::Relaxed),
+            cache_hits: self.cache_hits.swap(0, Ordering::Relaxed),
+            cache_misses: self.cache_misses.swap(0, Ordering::Relaxed),
+            files_prefetched: self.files_prefetched.swap(0, Ordering::Relaxed),
+            bytes_prefetched: self.bytes_prefetched.swap(0, Ordering::Relaxed),
+            glyph_draws: self.glyph_draws.swap(0, Ordering::Relaxed),
+            glyph_draw_nanos: self.glyph_draw_nanos.swap(0, Ordering::Relaxed),
+        }
+    }
+}
+
+pub(crate) static COUNTERS: Counters = Counters::new();
+
+#[cfg(test)]
+mod tests {
+    use std::time::Duration;
+
+    use super::{Counters, Snapshot};
+
+    #[test]
+    fn records_and_resets() {
+        let counters = Counters::new();
+        counters.record_map(100);
+        counters.record_map(20);
+        counters.record_read(7);
+        counters.record_map_failure();
+        counters.record_cache_miss();
+        counters.record_cache_hit();
+        counters.record_cache_hit();
+        counters.record_prefetch(50);
+        counters.record_draw(Duration::from_micros(3));
+
+        let expected = Snapshot {
+            files_mapped: 2,
+            bytes_mapped: 120,
+            files_read: 1,
+            bytes_read: 7,
+            map_failures: 1,
+            cache_hits: 2,
+            cache_misses: 1,
+            files_prefetched: 1,
+            bytes_prefetched: 50,
+            glyph_draws: 1,
+            glyph_draw_nanos: 3_000,
+        };
+        assert_eq!(counters.snapshot(), expected);
+        assert_eq!(counters.reset(), expected);
+        assert_eq!(counters.snapshot(), Snapshot::default());
+    }
+}
@@ -1,7 +1,7 @@
-use std::{collections::BTreeMap, path::Path};
+use std::{collections::BTreeMap, path::Path, time::Instant};
 
 use skrifa::{
-    MetadataProvider,
+    FontRef, GlyphId, MetadataProvider,
     instance::{LocationRef, Size},
     outline::DrawSettings,
     raw::TableProvider,
@@ -9,18 +9,75 @@ use skrifa::{
 
 use crate::{
     error::Error,
-    font::{canonicalize_location, extract_glyph_outline, map_font, parse_font_ref},
-    outline::BezPath,
+    font::{canonicalize_location, extract_glyph_outline, map_font_for_outlines, parse_font_ref},
+    outline::{BezPath, encoded_len, outline_hash},
+    stats::COUNTERS,
 };
 
+/// The glyph to draw: a codepoint looked up in the character map, or a glyph
+/// id resolved earlier, for example by the dataset index.
+#[derive(Clone, Copy, Debug)]
+pub(crate) enum Glyph {
+    Codepoint(u32),
+    Id(u32),
+}
+
 pub(crate) fn load_glyph_outline(
     path: &Path,
     ttc_index: u32,
-    codepoint: u32,
+    glyph: Glyph,
     location: Option<&BTreeMap<String, f32>>,
 ) -> Result<BezPath, Error> {
-    let data = map_font(path)?;
+    let data = map_font_for_outlines(path)?;
+    let font = parse_font_ref(&data[..], path, ttc_index)?;
+    let units_per_em = units_per_em(&font, path, ttc_index)?;
+    let user_location = canonicalize_location(&font, path, ttc_index, location)?;
+    let location = font.axes().location(
+        user_location
+            .iter()
+            .map(|(tag, value)| (tag.as_str(), *value)),
+    );
+    let glyph_id = match glyph {
+        Glyph::Codepoint(codepoint) => map_codepoint(&font, path, codepoint)?,
+        Glyph::Id(glyph_id) => GlyphId::new(glyph_id),
+    };
+    draw_glyph(
+        &font,
+        path,
+        glyph_id,
+        LocationRef::from(&location),
+        units_per_em,
+    )
+}
+
+/// Encoded outline length, END row included, and outline hash of each glyph
+/// at the default location. The font is mapped and parsed once for all glyphs.
+pub(crate) fn default_outlines(
+    path: &Path,
+    ttc_index: u32,
+    glyph_ids: impl Iterator<Item = u32>,
+) -> Result<Vec<(u32, u64)>, Error> {
+    let data = map_font_for_outlines(path)?;
     let font = parse_font_ref(&data[..], path, ttc_index)?;
+    let units_per_em = units_per_em(&font, path, ttc_index)?;
+    glyph_ids
+        .map(|glyph_id| {
+            let outline = draw_glyph(
+                &font,
+                path,
+                GlyphId::new(glyph_id),
+                LocationRef::default(),
+                units_per_em,
+            )?;
+            Ok((
+                u32::try_from(encoded_len(&outline)).unwrap_or(u32::MAX),
+                outline_hash(&outline),
+            ))
+        })
+        .collect()
+}
+
+fn units_per_em(font: &FontRef<'_>, path: &Path, ttc_index: u32) -> Result<f32, Error> {
     let units_per_em = font
         .head()
         .map_err(|err| {
@@ -36,31 +93,40 @@ pub(crate) fn load_glyph_outline(
             path.display()
         )));
     }
-    let glyph_id = font.charmap().map(codepoint).ok_or_else(|| {
+    Ok(f32::from(units_per_em))
+}
+
+fn map_codepoint(font: &FontRef<'_>, path: &Path, codepoint: u32) -> Result<GlyphId, Error> {
+    font.charmap().map(codepoint).ok_or_else(|| {
         Error::OutOfRange(format!(
             "codepoint U+{codepoint:04X} missing from '{}'",
             path.display()
         ))
-    })?;
-    let user_location = canonicalize_location(&font, path, ttc_index, location)?;
+    })
+}
+
+fn draw_glyph(
+    font: &FontRef<'_>,
+    path: &Path,
+    glyph_id: GlyphId,
+    location: LocationRef<'_>,
+    units_per_em: f32,
+) -> Result<BezPath, Error> {
     let glyph = font.outline_glyphs().get(glyph_id).ok_or_else(|| {
-        Error::Parse(format!(
+        Error::OutOfRange(format!(
             "glyph id {} missing from '{}'",
             glyph_id.to_u32(),
             path.display()
         ))
     })?;
-    let location = font.axes().location(
-        user_location
-            .iter()
-            .map(|(tag, value)| (tag.as_str(), *value)),
-    );
-    extract_glyph_outline(
+    let start = Instant::now();
+    let outline = extract_glyph_outline(
         &glyph,
-        DrawSettings::unhinted(Size::unscaled(), LocationRef::from(&location)),
-        units_per_em as f32,
-    )
-    .map_err(|err| Error::Parse(format!("failed to draw glyph: {err}")))
+        DrawSettings::unhinted(Size::unscaled(), location),
+        units_per_em,
+    );
+    COUNTERS.record_draw(start.elapsed());
+    outline.map_err(|err| Error::Parse(format!("failed to draw glyph: {err}")))
 }
 
 #[cfg(test)]
@@ -69,7 +135,17 @@ mod tests {
 
     use crate::error::Error;
 
-    use super::load_glyph_outline;
+    use crate::outline::outline_hash;
+
+    use super::{Glyph, default_outlines, load_glyph_outline};
+
+    // Glyph ids of 'A' and 'o' in the test font's character map.
+    fn glyph_ids() -> [u32; 2] {
+        let data = std::fs::read(test_font()).unwrap();
+        let font = skrifa::FontRef::new(&data).unwrap();
+        let charmap = skrifa::MetadataProvider::charmap(&font);
+        ['A', 'o'].map(|char| charmap.map(char).unwrap().to_u32())
+    }
 
     fn test_font() -> PathBuf {
         PathBuf::from(env!("CARGO_MANIFEST_DIR"))
@@ -78,13 +154,37 @@ mod tests {
 
     #[test]
     fn loads_outline_without_python() {
-        let outline = load_glyph_outline(&test_font(), 0, 'A' as u32, None).unwrap();
+        let outline =
+            load_glyph_outline(&test_font(), 0, Glyph::Codepoint('A' as u32), None).unwrap();
         assert!(outline.subpaths().next().is_some());
     }
 
+    #[test]
+    fn glyph_id_draws_the_same_outline_as_the_codepoint() {
+        let by_codepoint =
+            load_glyph_outline(&test_font(), 0, Glyph::Codepoint('o' as u32), None).unwrap();
+        let by_id = load_glyph_outline(&test_font(), 0, Glyph::Id(glyph_ids()[1]), None).unwrap();
+        assert_eq!(by_id.elements(), by_codepoint.elements());
+    }
+
+    #[test]
+    fn counts_encoded_rows_at_the_default_location() {
+        let outlines = default_outlines(&test_font(), 0, glyph_ids().into_iter()).unwrap();
+        let outline =
+            load_glyph_outline(&test_font(), 0, Glyph::Codepoint('o' as u32), None).unwrap();
+        assert_eq!(outlines.len(), 2);
+        assert_eq!(outlines[1].0 as usize, outline.elements().len() + 1);
+        assert_eq!(outlines[1].1, outline_hash(&outline));
+        assert_ne!(outlines[0].1, outlines[1].1);
+    }
+
     #[test]
     fn reports_missing_codepoint_as_out_of_range() {
-        let error = load_glyph_outline(&test_font(), 0, 0x10ffff, None).unwrap_err();
+        let error =
+            load_glyph_outline(&test_font(), 0, Glyph::Codepoint(0x10ffff), None).unwrap_err();
+        assert!(matches!(error, Error::OutOfRange(_)));
+        let error =
+            load_glyph_outline(&test_font(), 0, Glyph::Id(u32::from(u16::MAX)), None).unwrap_err();
         assert!(matches!(error, Error::OutOfRange(_)));
     }
 }
@@ -2,47 +2,45 @@ use skia_safe::{Path, PathBuilder, PathFillType, PathVerb};
 
 use super::subpath::reverse_subpath;
 use crate::outline::{BezPath, Bounds, PathEl, Point, bounds_from_subpath, subpath_is_closed};
+use crate::parallel::{available_threads, map_ordered};
 use kurbo::Shape;
 
 // TorchFont outlines are normalized to roughly em-sized coordinates. PathOps is
 // more reliable at conventional font-unit magnitudes, so simplify a scaled copy.
 const PATHOPS_SCALE: f32 = 131_072.0;
 
-pub(crate) fn remove_overlaps(outline: &BezPath) -> BezPath {
-    simplify(outline).unwrap_or_else(|| outline.clone())
-}
-
-pub(crate) fn random_remove_overlaps(outline: &BezPath, random_values: &[f32]) -> BezPath {
+pub(crate) fn remove_overlaps(outline: &BezPath, parallel_threshold: usize) -> BezPath {
+    // PathOps fills open contours too, so every subpath takes part. Touching
+    // bounds are grouped as well, because PathOps merges contours that share
+    // an edge.
     let source: Vec<_> = outline.subpaths().collect();
-    let bounds: Vec<_> = source
+    let components: Vec<_> = overlap_components(&source, |_| true, true)
         .iter()
-        .map(|subpath| bounds_from_subpath(subpath))
+        .map(|group| component(&source, group))
         .collect();
-    let mut parent: Vec<_> = (0..source.len()).collect();
-
-    for left in 0..source.len() {
-        if !subpath_is_closed(source[left]) {
-            continue;
-        }
-        for right in left + 1..source.len() {
-            if subpath_is_closed(source[right]) && bounds_overlap(bounds[left], bounds[right]) {
-                union(&mut parent, left, right);
-            }
-        }
-    }
-    for index in 0..parent.len() {
-        parent[index] = find(&mut parent, index);
+    let Some(simplified) = simplify_components(&components, parallel_threshold, simplify_winding)
+        .into_iter()
+        .collect::<Option<Vec<_>>>()
+    else {
+        return outline.clone();
+    };
+    let mut result = BezPath::new();
+    for part in simplified {
+        result.extend(part.elements().iter().copied());
     }
-
-    let mut members = vec![Vec::new(); source.len()];
-    for (index, &root) in parent.iter().enumerate() {
-        members[root].push(index);
+    if result.elements().is_empty() {
+        return outline.clone();
     }
-    let groups: Vec<Vec<_>> = members
-        .into_iter()
-        .filter(|group: &Vec<_>| group.len() > 1)
-        .collect();
+    result
+}
 
+pub(crate) fn random_remove_overlaps(
+    outline: &BezPath,
+    random_values: &[f32],
+    parallel_threshold: usize,
+) -> BezPath {
+    let source: Vec<_> = outline.subpaths().collect();
+    let groups = overlap_groups(&source);
     if groups.is_empty() {
         return outline.clone();
     }
@@ -62,6 +60,20 @@ pub(crate) fn random_remove_overlaps(outline: &BezPath, random_values: &[f32]) -
         selected[index] = true;
     }
 
+    let selected_groups: Vec<_> = groups
+        .iter()
+        .zip(&selected)
+        .filter(|&(_, &is_selected)| is_selected)
+        .map(|(group, _)| group)
+        .collect();
+    let components: Vec<_> = selected_groups
+        .iter()
+        .map(|group| component(&source, group))
+        .collect();
+    let mut simplified_groups = simplify_components(&components, parallel_threshold, simplify)
+        .into_iter()
+        .zip(components);
+
     let mut group_of = vec![None; source.len()];
     for (group_index, group) in groups.iter().enumerate() {
         for &index in group {
@@ -80,11 +92,12 @@ pub(crate) fn random_remove_overlaps(outline: &BezPath, random_values: &[f32]) -
             continue;
         }
         if selected[group_index] {
-            let mut component = BezPath::new();
-            for &other in group {
-                component.extend(source[other].iter().copied());
-            }
-            let simplified = simplify(&component).unwrap_or(component);
+            // Selected groups were simplified in group order, which is also
+            // the order their first subpaths appear in.
+            let (simplified, original) = simplified_groups
+                .next()
+                .expect("every selected group has a simplified component");
+            let simplified = simplified.unwrap_or(original);
             result.extend(simplified.elements().iter().copied());
         } else {
             for &other in group {
@@ -95,10 +108,81 @@ pub(crate) fn random_remove_overlaps(outline: &BezPath, random_values: &[f32]) -
     result
 }
 
+fn overlap_groups(source: &[&[PathEl]]) -> Vec<Vec<usize>> {
+    overlap_components(source, subpath_is_closed, false)
+        .into_iter()
+        .filter(|group| group.len() > 1)
+        .collect()
+}
+
+fn overlap_components(
+    source: &[&[PathEl]],
+    candidate: impl Fn(&[PathEl]) -> bool,
+    touching: bool,
+) -> Vec<Vec<usize>> {
+    let bounds: Vec<_> = source
+        .iter()
+        .map(|subpath| bounds_from_subpath(subpath))
+        .collect();
+    let mut parent: Vec<_> = (0..source.len()).collect();
+
+    // Sweep candidate subpaths in x_min order. A subpath whose x extent ends
+    // before the sweep line cannot overlap this or any later subpath, so only
+    // the active ones are compared. CJK and icon glyphs with hundreds of
+    // contours keep the active set small, making the grouping near-linear.
+    let mut order: Vec<_> = (0..source.len())
+        .filter(|&index| candidate(source[index]))
+        .collect();
+    order.sort_by(|&a, &b| bounds[a].x_min.total_cmp(&bounds[b].x_min));
+    let mut active: Vec<usize> = Vec::new();
+    for &index in &order {
+        let x_min = bounds[index].x_min;
+        active.retain(|&other| {
+            let x_max = bounds[other].x_max;
+            x_max > x_min || (touching && x_max == x_min)
+        });
+        for &other in &active {
+            let overlap = if touching {
+                bounds_touch(bounds[index], bounds[other])
+            } else {
+                bounds_overlap(bounds[index], bounds[other])
+            };
+            if overlap {
+                union(&mut parent, index, other);
+            }
+        }
+        active.push(index);
+    }
+    for index in 0..parent.len() {
+        parent[index] = find(&mut parent, index);
+    }
+
+    // Roots are the smallest member index, so components stay in subpath
+    // order regardless of the order in which the sweep merged them.
+    let mut members = vec![Vec::new(); source.len()];
+    for (index, &root) in parent.iter().enumerate() {
+        members[root].push(index);
+    }
+    members.retain(|group| !group.is_empty());
+    members
+}
+
+fn component(source: &[&[PathEl]], group: &[usize]) -> BezPath {
+    let mut component = BezPath::new();
+    for &index in group {
+        component.extend(source[index].iter().copied());
+    }
+    component
+}
+
 fn bounds_overlap(a: Bounds, b: Bounds) -> bool {
     a.x_min < b.x_max && b.x_min < a.x_max && a.y_min < b.y_max && b.y_min < a.y_max
 }
 
+fn bounds_touch(a: Bounds, b: Bounds) -> bool {
+    a.x_min <= b.x_max && b.x_min <= a.x_max && a.y_min <= b.y_max && b.y_min <= a.y_max
+}
+
 fn find(parent: &mut [usize], index: usize) -> usize {
     if parent[index] != index {
         parent[index] = find(parent, parent[index]);
@@ -115,7 +199,32 @@ fn union(parent: &mut [usize], left: usize, right: usize) {
     }
 }
 
+// Components are disjoint, so each PathOps call is independent. Once the
+// components hold at least parallel_threshold elements, they are simplified
+// concurrently and their results returned in component order.
+fn simplify_components(
+    components: &[BezPath],
+    parallel_threshold: usize,
+    simplify_component: fn(&BezPath) -> Option<BezPath>,
+) -> Vec<Option<BezPath>> {
+    let elements: usize = components.iter().map(|c| c.elements().len()).sum();
+    let threads = if elements < parallel_threshold {
+        1
+    } else {
+        available_threads()
+    };
+    map_ordered(components, threads, simplify_component)
+}
+
+// None when every contour cancels out, so random_remove_overlaps keeps such a
+// group's original contours just as it keeps a group PathOps fails on.
 fn simplify(outline: &BezPath) -> Option<BezPath> {
+    simplify_winding(outline).filter(|simplified| !simplified.elements().is_empty())
+}
+
+// Unlike simplify, an outline whose contours all cancel out yields an empty
+// path; None is reserved for PathOps failures.
+fn simplify_winding(outline: &BezPath) -> Option<BezPath> {
     let path = build_skia_path(outline)?;
     let scaled = path.try_make_scale((PATHOPS_SCALE, PATHOPS_SCALE))?;
     let simplified = scaled.simplify()?;
@@ -202,7 +311,7 @@ fn outline_from_path(path: &Path) -> Option<BezPath> {
     }
     commit_subpath(&mut outline, &mut start, &mut elements, false);
 
-    (!outline.elements().is_empty()).then_some(outline)
+    Some(outline)
 }
 
 fn commit_subpath(
@@ -313,12 +422,189 @@ mod tests {
     use kurbo::{BezPath, Rect, Shape};
     use skia_safe::{PathBuilder, PathFillType};
 
-    use super::{outline_from_path, path_is_inside};
+    use super::{
+        bounds_from_subpath, bounds_overlap, find, outline_from_path, overlap_groups,
+        path_is_inside, random_remove_overlaps, remove_overlaps, reverse_subpath,
+        subpath_is_closed, union,
+    };
 
     fn rectangle(rect: Rect) -> BezPath {
         rect.to_path(0.1)
     }
 
+    fn pairwise_overlap_groups(outline: &BezPath) -> Vec<Vec<usize>> {
+        let source: Vec<_> = outline.subpaths().collect();
+        let mut parent: Vec<_> = (0..source.len()).collect();
+        for left in 0..source.len() {
+            for right in left + 1..source.len() {
+                if subpath_is_closed(source[left])
+                    && subpath_is_closed(source[right])
+                    && bounds_overlap(
+                        bounds_from_subpath(source[left]),
+                        bounds_from_subpath(source[right]),
+                    )
+                {
+                    union(&mut parent, left, right);
+                }
+            }
+        }
+        let mut members = vec![Vec::new(); source.len()];
+        for index in 0..source.len() {
+            let root = find(&mut parent, index);
+            members[root].push(index);
+        }
+        members.retain(|group| group.len() > 1);
+        members
+    }
+
+    #[test]
+    fn sweep_groups_chained_overlaps() {
+        let mut outline = BezPath::new();
+        for rect in [
+            Rect::new(4.0, 0.0, 6.0, 2.0),
+            Rect::new(0.0, 0.0, 2.0, 2.0),
+            Rect::new(20.0, 0.0, 22.0, 2.0),
+            Rect::new(1.0, 1.0, 5.0, 1.5),
+        ] {
+            outline.extend(rectangle(rect).elements().iter().copied());
+        }
+        let source: Vec<_> = outline.subpaths().collect();
+
+        assert_eq!(overlap_groups(&source), vec![vec![0, 1, 3]]);
+    }
+
+    #[test]
+    fn sweep_matches_pairwise_grouping() {
+        // A fixed linear congruential sequence keeps the layout deterministic
+        // while mixing nested, touching, disjoint, and open contours.
+        let mut state = 0x2545_f491_u32;
+        let mut next = || {
+            state = state.wrapping_mul(1_664_525).wrapping_add(1_013_904_223);
+            f64::from(state >> 8) / f64::from(1_u32 << 24)
+        };
+        let mut outline = BezPath::new();
+        for index in 0..300 {
+            let x = (next() * 40.0).floor();
+            let y = (next() * 40.0).floor();
+            let width = 0.5 + (next() * 4.0).floor();
+            let height = 0.5 + (next() * 4.0).floor();
+            let subpath = rectangle(Rect::new(x, y, x + width, y + height));
+            let elements = subpath.elements();
+            let end = elements.len() - usize::from(index % 7 == 0);
+            outline.extend(elements[..end].iter().copied());
+        }
+        let source: Vec<_> = outline.subpaths().collect();
+
+        assert_eq!(overlap_groups(&source), pairwise_overlap_groups(&outline));
+    }
+
+    fn staggered_pairs() -> BezPath {
+        let mut outline = BezPath::new();
+        for x in [0.0, 10.0, 20.0, 30.0] {
+            for rect in [
+                Rect::new(x, 0.0, x + 2.0, 2.0),
+                Rect::new(x + 1.0, 1.0, x + 3.0, 3.0),
+            ] {
+                outline.extend(rectangle(rect).elements().iter().copied());
+            }
+        }
+        outline
+    }
+
+    #[test]
+    fn parallel_simplification_matches_sequential() {
+        let outline = staggered_pairs();
+        let values = [0.0_f32; 64];
+
+        assert_eq!(
+            remove_overlaps(&outline, 0),
+            remove_overlaps(&outline, usize::MAX)
+        );
+        assert_eq!(
+            random_remove_overlaps(&outline, &values, 0),
+            random_remove_overlaps(&outline, &values, usize::MAX)
+        );
+    }
+
+    #[test]
+    fn remove_overlaps_keeps_group_order() {
+        let result = remove_overlaps(&staggered_pairs(), 0);
+        let starts: Vec<_> = result
+            .subpaths()
+            .map(|subpath| subpath.bounding_box().x0)
+            .collect();
+
+        assert_eq!(starts, [0.0, 10.0, 20.0, 30.0]);
+    }
+
+    #[test]
+    fn remove_overlaps_merges_touching_contours() {
+        let mut outline = rectangle(Rect::new(0.0, 0.0, 1.0, 1.0));
+        outline.extend(
+            rectangle(Rect::new(1.0, 0.0, 2.0, 1.0))
+                .elements()
+                .iter()
+                .copied(),
+        );
+
+        assert_eq!(remove_overlaps(&outline, usize::MAX).subpaths().count(), 1);
+    }
+
+    // A rectangle and its reverse, whose windings cancel out everywhere.
+    fn cancelling_pair(rect: Rect) -> BezPath {
+        let mut outline = rectangle(rect);
+        let reversed = reverse_subpath(outline.elements());
+        outline.extend(reversed.elements().iter().copied());
+        outline
+    }
+
+    #[test]
+    fn remove_overlaps_keeps_an_outline_that_cancels_out() {
+        let outline = cancelling_pair(Rect::new(0.0, 0.0, 2.0, 2.0));
+
+        assert_eq!(remove_overlaps(&outline, 0), outline);
+        assert_eq!(remove_overlaps(&outline, usize::MAX), outline);
+    }
+
+    #[test]
+    fn remove_overlaps_drops_a_group_that_cancels_out() {
+        let mut outline = cancelling_pair(Rect::new(0.0, 0.0, 2.0, 2.0));
+        outline.extend(
+            rectangle(Rect::new(10.0, 0.0, 12.0, 2.0))
+                .elements()
+                .iter()
+                .copied(),
+        );
+
+        let result = remove_overlaps(&outline, usize::MAX);
+
+        assert_eq!(result.subpaths().count(), 1);
+        assert!(result.bounding_box().x0 >= 10.0 - 1e-6);
+    }
+
+    #[test]
+    fn random_remove_overlaps_keeps_a_selected_group_that_cancels_out() {
+        let mut outline = cancelling_pair(Rect::new(0.0, 0.0, 2.0, 2.0));
+        for rect in [
+            Rect::new(10.0, 0.0, 12.0, 2.0),
+            Rect::new(11.0, 1.0, 13.0, 3.0),
+        ] {
+            outline.extend(rectangle(rect).elements().iter().copied());
+        }
+        let values = [0.0_f32; 2];
+
+        let result = random_remove_overlaps(&outline, &values, usize::MAX);
+        let subpaths: Vec<_> = result.subpaths().collect();
+
+        assert_eq!(subpaths.len(), 3);
+        let cancelling = cancelling_pair(Rect::new(0.0, 0.0, 2.0, 2.0));
+        let kept: Vec<_> = subpaths[..2]
+            .iter()
+            .flat_map(|s| s.iter().copied())
+            .collect();
+        assert_eq!(kept, cancelling.elements());
+    }
+
     #[test]
     fn close_subpath_treats_open_subpath_as_implicitly_closed_for_area() {
         // Offset from the origin: kurbo's raw (unclosed) area only matches
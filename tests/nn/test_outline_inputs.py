@@ -5,7 +5,14 @@ from __future__ import annotations
 import pytest
 import torch
 
-from torchfont import COORD_DIM, TYPE_DIM, ElementType, Outline, pad_outlines
+from torchfont import (
+    COORD_DIM,
+    TYPE_DIM,
+    ElementType,
+    Outline,
+    RaggedOutline,
+    pad_outlines,
+)
 from torchfont.nn import OutlineEmbedding, OutlineLoss
 from torchfont.nn import functional as F  # noqa: N812
 
@@ -61,3 +68,58 @@ def test_loss_ignores_padding_introduced_by_pad_outlines() -> None:
     )
 
     assert torch.allclose(padded_loss, unpadded_loss)
+
+
+@pytest.mark.parametrize("dtype", [torch.uint8, torch.int8])
+def test_embedding_matches_long_types_for_compact_types(
+    batch: Outline, dtype: torch.dtype
+) -> None:
+    embedding = OutlineEmbedding(8)
+
+    expected = embedding(batch)
+    actual = embedding(batch.to(types_dtype=dtype))
+
+    assert torch.equal(actual, expected)
+
+
+@pytest.mark.parametrize("dtype", [torch.uint8, torch.int8])
+def test_losses_match_long_types_for_compact_types(
+    batch: Outline, dtype: torch.dtype
+) -> None:
+    logits = torch.randn(*batch.shape, TYPE_DIM)
+    prediction = torch.randn(*batch.shape, COORD_DIM)
+    compact = batch.to(types_dtype=dtype)
+
+    assert torch.equal(
+        OutlineLoss()(logits, prediction, compact),
+        OutlineLoss()(logits, prediction, batch),
+    )
+    assert torch.equal(
+        F.coordinate_loss(prediction, compact), F.coordinate_loss(prediction, batch)
+    )
+
+
+def test_embedding_of_a_ragged_batch_matches_padded_tokens(batch: Outline) -> None:
+    embedding = OutlineEmbedding(8)
+    ragged = RaggedOutline.from_padded(batch)
+
+    tokens = embedding(ragged)
+
+    assert tokens.shape == (ragged.values.num_elements, 8)
+    assert torch.allclose(tokens, embedding(batch)[~batch.padding_mask])
+
+
+def test_losses_of_a_ragged_batch_match_padded_losses(batch: Outline) -> None:
+    ragged = RaggedOutline.from_padded(batch)
+    keep = ~batch.padding_mask
+    logits = torch.randn(*batch.shape, TYPE_DIM)
+    prediction = torch.randn(*batch.shape, COORD_DIM)
+
+    assert torch.allclose(
+        F.coordinate_loss(prediction[keep], ragged),
+        F.coordinate_loss(prediction, batch),
+    )
+    assert torch.allclose(
+        OutlineLoss()(logits[keep], prediction[keep], ragged),
+        OutlineLoss()(logits, prediction, batch),
+    )
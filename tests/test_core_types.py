@@ -83,6 +83,18 @@ def test_outline_rejects_mismatched_devices() -> None:
         )
 
 
+@pytest.mark.parametrize("dtype", [torch.long, torch.uint8, torch.int8])
+def test_outline_accepts_compact_types_dtypes(dtype: torch.dtype) -> None:
+    outline = Outline(torch.zeros(1, dtype=dtype), torch.zeros((1, 6)))
+
+    assert outline.types.dtype is dtype
+
+
+def test_outline_rejects_other_integer_types_dtypes() -> None:
+    with pytest.raises(TypeError, match=r"torch\.uint8, or torch\.int8"):
+        Outline(torch.zeros(1, dtype=torch.int32), torch.zeros((1, 6)))
+
+
 @pytest.mark.parametrize(
     "dtype", [torch.float16, torch.bfloat16, torch.float32, torch.float64]
 )
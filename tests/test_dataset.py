@@ -106,6 +106,30 @@ def test_load_glyph_returns_outline_tensors() -> None:
     assert not (outline.types == ElementType.CURVE_TO.value).any().item()
 
 
+def test_samples_carry_the_indexed_glyph_id() -> None:
+    dataset = GlyphDataset(
+        "tests/fonts",
+        patterns="static-collection/Metropolis.ttc",
+        codepoints=[ord("g"), ord("o")],
+    )
+
+    samples = [dataset[idx] for idx in range(len(dataset))]
+    for sample in samples:
+        assert sample.glyph_id is not None
+        by_id = _functional.load_glyph(sample.ref, glyph_id=sample.glyph_id)
+        by_codepoint = _functional.load_glyph(sample.ref)
+        torch.testing.assert_close(by_id.types, by_codepoint.types)
+        torch.testing.assert_close(by_id.coords, by_codepoint.coords)
+    assert len({sample.glyph_id for sample in samples}) > 1
+
+
+def test_load_glyph_rejects_missing_glyph_id() -> None:
+    ref = GlyphRef(FontRef("tests/fonts/source-sans/SourceSans3-Regular.ttf", 0), 0x41)
+
+    with pytest.raises(IndexError, match="glyph id 65535 missing"):
+        _functional.load_glyph(ref, glyph_id=0xFFFF)
+
+
 def test_dataset_reports_corrupt_font(tmp_path: Path) -> None:
     (tmp_path / "broken.ttf").write_bytes(b"not a font")
 
@@ -415,3 +439,151 @@ def test_codepoints_are_normalized_and_deduplicated() -> None:
         codepoints=codepoints,
     )
     assert [dataset[i].ref.codepoint for i in range(len(dataset))] == [0x41, 0x42]
+
+
+def test_dataset_element_counts_match_default_outlines() -> None:
+    dataset = GlyphDataset(
+        "tests/fonts",
+        patterns="source-serif/SourceSerif4Variable-Roman.ttf",
+        codepoints=[ord("A"), ord("o"), ord(".")],
+    )
+
+    counts = dataset.element_counts
+
+    assert counts.dtype == torch.long
+    assert counts.tolist() == [
+        LoadGlyph()(dataset[idx]).data.types.numel() for idx in range(len(dataset))
+    ]
+
+
+def _duplicated_fonts(tmp_path: Path) -> GlyphDataset:
+    for name in ("a", "b"):
+        shutil.copy(
+            "tests/fonts/source-sans/SourceSans3-Regular.ttf", tmp_path / f"{name}.ttf"
+        )
+    shutil.copy("tests/fonts/source-sans/SourceSans3-Regular.otf", tmp_path / "c.otf")
+    return GlyphDataset(tmp_path, codepoints=[ord("A"), ord("B"), ord("o")])
+
+
+def test_outline_hashes_identify_identical_outlines(tmp_path: Path) -> None:
+    dataset = _duplicated_fonts(tmp_path)
+
+    hashes = dataset.outline_hashes.view(3, 3)
+
+    assert hashes.dtype == torch.long
+    assert torch.equal(hashes[0], hashes[1])
+    assert not (hashes[0] == hashes[2]).any()
+    assert hashes[0].unique().numel() == 3
+
+
+def test_unique_mask_and_duplicate_weights(tmp_path: Path) -> None:
+    dataset = _duplicated_fonts(tmp_path)
+
+    mask = dataset.unique_mask()
+    weights = dataset.duplicate_weights()
+
+    assert mask.tolist() == [True] * 3 + [False] * 3 + [True] * 3
+    assert weights.tolist() == [0.5] * 6 + [1.0] * 3
+    assert weights.sum().item() == mask.sum().item()
+
+
+def test_outline_hashes_survive_pickling(tmp_path: Path) -> None:
+    dataset = _duplicated_fonts(tmp_path)
+    hashes = dataset.outline_hashes
+    (tmp_path / "a.ttf").unlink()
+
+    restored = cast(
+        "GlyphDataset[GlyphSample]",
+        pickle.loads(pickle.dumps(dataset)),  # noqa: S301
+    )
+
+    assert torch.equal(restored.outline_hashes, hashes)
+    assert torch.equal(restored.element_counts, dataset.element_counts)
+
+
+def _sans_fonts(tmp_path: Path, *names: str) -> None:
+    for name in names:
+        shutil.copy(
+            "tests/fonts/source-sans/SourceSans3-Regular.ttf", tmp_path / f"{name}.ttf"
+        )
+
+
+def test_update_matches_a_rebuilt_dataset(tmp_path: Path) -> None:
+    _sans_fonts(tmp_path, "b", "c")
+    dataset = GlyphDataset(tmp_path, codepoints=[ord("A"), ord("B")])
+    _sans_fonts(tmp_path, "a")
+    (tmp_path / "c.ttf").unlink()
+
+    dataset.update(added=["a.ttf"], removed=[tmp_path / "c.ttf"])
+    rebuilt = GlyphDataset(tmp_path, codepoints=[ord("A"), ord("B")])
+
+    assert dataset.font_classes == rebuilt.font_classes
+    assert torch.equal(dataset.font_targets, rebuilt.font_targets)
+    assert torch.equal(dataset.character_targets, rebuilt.character_targets)
+    assert dataset[3].ref == rebuilt[3].ref
+
+
+def test_stable_update_keeps_class_indices(tmp_path: Path) -> None:
+    _sans_fonts(tmp_path, "b", "c")
+    dataset = GlyphDataset(tmp_path, codepoints=[ord("A"), ord("B")])
+    _sans_fonts(tmp_path, "a")
+    (tmp_path / "b.ttf").unlink()
+
+    dataset.update(added=["a.ttf"], removed=["b.ttf"], stable=True)
+
+    assert [Path(font.path).name for font in dataset.font_classes] == [
+        "b.ttf",
+        "c.ttf",
+        "a.ttf",
+    ]
+    assert dataset.font_targets.tolist() == [1, 1, 2, 2]
+    assert dataset.character_classes == ["A", "B"]
+
+
+def test_update_draws_only_added_fonts(tmp_path: Path) -> None:
+    _sans_fonts(tmp_path, "b", "c")
+    dataset = GlyphDataset(tmp_path, codepoints=[ord("A"), ord("B")])
+    counts = dataset.element_counts
+    _sans_fonts(tmp_path, "a")
+
+    dataset.update(added=["a.ttf"])
+    torchfont.reset_stats()
+    updated = dataset.element_counts
+
+    assert torchfont.stats()["glyph_draws"] == 2
+    assert torch.equal(updated, torch.cat((counts[:2], counts)))
+
+
+def test_refresh_picks_up_added_and_removed_files(tmp_path: Path) -> None:
+    _sans_fonts(tmp_path, "a")
+    dataset = GlyphDataset(tmp_path, codepoints=[ord("A")])
+    _sans_fonts(tmp_path, "b")
+
+    dataset.refresh()
+    assert len(dataset) == 2
+
+    (tmp_path / "a.ttf").unlink()
+    (tmp_path / "b.ttf").unlink()
+    dataset.refresh()
+    assert len(dataset) == 0
+    assert dataset.font_classes == []
+
+
+def test_updated_dataset_survives_pickling(tmp_path: Path) -> None:
+    _sans_fonts(tmp_path, "b")
+    dataset = GlyphDataset(tmp_path, codepoints=[ord("A")])
+    _sans_fonts(tmp_path, "a")
+    dataset.update(added=["a.ttf"], stable=True)
+
+    restored = cast(
+        "GlyphDataset[GlyphSample]",
+        pickle.loads(pickle.dumps(dataset)),  # noqa: S301
+    )
+    _sans_fonts(tmp_path, "c")
+    restored.refresh(stable=True)
+
+    assert [Path(font.path).name for font in restored.font_classes] == [
+        "b.ttf",
+        "a.ttf",
+        "c.ttf",
+    ]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+import torch
+
+import torchfont
+from torchfont import FontRef, GlyphRef
+from torchfont.transforms import functional as _functional
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+FONT = Path("tests/fonts/source-sans/SourceSans3-Regular.ttf")
+COLLECTION = Path("tests/fonts/static-collection/Metropolis.ttc")
+
+
+@pytest.fixture(autouse=True)
+def _restore_font_io() -> Iterator[None]:
+    previous = torchfont.font_io()
+    yield
+    torchfont.set_font_io(**previous)
+
+
+def test_default_font_io_maps_every_file() -> None:
+    assert torchfont.font_io() == {
+        "access": "normal",
+        "will_need_outlines": False,
+        "eager_read_max_bytes": 0,
+    }
+
+
+def test_set_font_io_returns_previous_and_keeps_unset_options() -> None:
+    previous = torchfont.set_font_io(access="random", eager_read_max_bytes=1 << 20)
+    updated = torchfont.set_font_io(will_need_outlines=True)
+
+    assert previous["access"] == "normal"
+    assert updated == {
+        "access": "random",
+        "will_need_outlines": False,
+        "eager_read_max_bytes": 1 << 20,
+    }
+    assert torchfont.font_io()["will_need_outlines"] is True
+
+
+def test_set_font_io_rejects_invalid_options() -> None:
+    with pytest.raises(ValueError, match="access must be one of"):
+        torchfont.set_font_io(access="willneed")  # ty: ignore[invalid-argument-type]
+    with pytest.raises(ValueError, match="eager_read_max_bytes must be non-negative"):
+        torchfont.set_font_io(eager_read_max_bytes=-1)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"access": "random"},
+        {"access": "sequential", "will_need_outlines": True},
+        {"eager_read_max_bytes": 1 << 30},
+    ],
+)
+@pytest.mark.parametrize("path", [FONT, COLLECTION])
+def test_font_io_options_do_not_change_outlines(
+    options: dict[str, object], path: Path
+) -> None:
+    ref = GlyphRef(FontRef(path, 0), ord("g"))
+    expected = _functional.load_glyph(ref)
+
+    torchfont.set_font_io(**options)  # ty: ignore[invalid-argument-type]
+    outline = _functional.load_glyph(ref)
+
+    torch.testing.assert_close(outline.types, expected.types)
+    torch.testing.assert_close(outline.coords, expected.coords)
+
+
+def test_eager_read_limit_selects_heap_reads() -> None:
+    size = FONT.stat().st_size
+    ref = GlyphRef(FontRef(FONT, 0), ord("A"))
+
+    torchfont.set_font_io(eager_read_max_bytes=size)
+    torchfont.reset_stats()
+    _functional.load_glyph(ref)
+    read = torchfont.stats()
+    torchfont.set_font_io(eager_read_max_bytes=size - 1)
+    torchfont.reset_stats()
+    _functional.load_glyph(ref)
+    mapped = torchfont.stats()
+
+    assert (read["files_read"], read["bytes_read"], read["files_mapped"]) == (
+        1,
+        size,
+        0,
+    )
+    assert (mapped["files_read"], mapped["files_mapped"]) == (0, 1)
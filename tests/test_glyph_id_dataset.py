@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+import torch
+
+from torchfont import FontRef, GlyphData, GlyphRef, GlyphSample
+from torchfont.datasets import GlyphDataset, GlyphIdDataset
+from torchfont.transforms import LoadGlyph
+from torchfont.transforms import functional as _functional
+
+PATTERN = "source-sans/SourceSans3-Regular.ttf"
+
+
+def test_glyph_id_dataset_includes_unencoded_glyphs() -> None:
+    encoded = GlyphDataset("tests/fonts", patterns=PATTERN)
+    dataset = GlyphIdDataset("tests/fonts", patterns=PATTERN)
+
+    samples = [dataset[idx] for idx in range(len(dataset))]
+    glyph_ids = [sample.glyph_id for sample in samples if sample.glyph_id is not None]
+
+    assert len(dataset) > len(encoded)
+    assert len(glyph_ids) == len(samples)
+    assert glyph_ids == sorted(glyph_ids)
+    assert 0 not in glyph_ids
+    assert {encoded[idx].glyph_id for idx in range(len(encoded))} <= set(glyph_ids)
+    assert any(sample.ref.codepoint == -1 for sample in samples)
+
+
+def test_unencoded_glyphs_have_no_character_class() -> None:
+    dataset = GlyphIdDataset("tests/fonts", patterns=PATTERN)
+    targets = dataset.character_targets
+
+    for idx in range(len(dataset)):
+        sample = dataset[idx]
+        assert isinstance(sample, GlyphSample)
+        assert sample.character_idx == targets[idx].item()
+        if sample.ref.codepoint == -1:
+            assert sample.character_idx == -1
+        else:
+            assert dataset.character_classes[sample.character_idx] == chr(
+                sample.ref.codepoint
+            )
+
+
+def test_encoded_false_complements_the_codepoint_dataset() -> None:
+    encoded = GlyphDataset("tests/fonts", patterns=PATTERN)
+    full = GlyphIdDataset("tests/fonts", patterns=PATTERN)
+    unencoded = GlyphIdDataset("tests/fonts", patterns=PATTERN, encoded=False)
+
+    samples = [unencoded[idx] for idx in range(len(unencoded))]
+
+    assert all(sample.ref.codepoint == -1 for sample in samples)
+    assert unencoded.character_classes == []
+    assert (unencoded.character_targets == -1).all()
+    encoded_ids = {encoded[idx].glyph_id for idx in range(len(encoded))}
+    assert encoded_ids.isdisjoint(sample.glyph_id for sample in samples)
+    assert len(unencoded) == len(full) - len(encoded_ids)
+
+
+def test_load_glyph_draws_unencoded_glyphs_by_id() -> None:
+    dataset = GlyphIdDataset("tests/fonts", patterns=PATTERN, encoded=False)
+    sample = dataset[0]
+
+    data = LoadGlyph()(sample)
+
+    assert isinstance(data, GlyphData)
+    assert data.character_idx == -1
+    torch.testing.assert_close(
+        data.data.types,
+        _functional.load_glyph(sample.ref, glyph_id=sample.glyph_id).types,
+    )
+
+
+def test_load_glyph_rejects_unencoded_refs_without_a_glyph_id() -> None:
+    ref = GlyphRef(FontRef(f"tests/fonts/{PATTERN}", 0), -1)
+
+    with pytest.raises(ValueError, match="has no codepoint; pass the glyph_id"):
+        _functional.load_glyph(ref)
+
+
+def test_glyph_id_dataset_spans_collection_faces_and_pickles() -> None:
+    dataset = GlyphIdDataset("tests/fonts", patterns="static-collection/*.ttc")
+
+    restored = pickle.loads(pickle.dumps(dataset))  # noqa: S301
+
+    assert len(dataset.font_classes) > 1
+    assert torch.equal(dataset.font_targets, dataset.font_targets.sort().values)
+    assert len(restored) == len(dataset)
+    assert restored[len(dataset) - 1] == dataset[len(dataset) - 1]
+    assert torch.equal(restored.element_counts, dataset.element_counts)
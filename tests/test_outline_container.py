@@ -57,6 +57,19 @@ def test_to_rejects_a_non_floating_dtype(triangle: Outline) -> None:
         triangle.to(torch.int32)
 
 
+def test_to_casts_types_with_types_dtype(triangle: Outline) -> None:
+    compact = triangle.to(types_dtype=torch.uint8)
+
+    assert compact.types.dtype is torch.uint8
+    assert compact.dtype is torch.float32
+    assert torch.equal(compact.types.long(), triangle.types)
+
+
+def test_to_rejects_an_unsupported_types_dtype(triangle: Outline) -> None:
+    with pytest.raises(TypeError, match="types_dtype must have dtype"):
+        triangle.to(types_dtype=torch.int32)
+
+
 def test_to_rejects_a_duplicated_dtype(triangle: Outline) -> None:
     with pytest.raises(TypeError, match="both positionally and by keyword"):
         triangle.to(torch.float64, torch.float64)
@@ -141,6 +154,53 @@ def test_pad_outlines_then_unpad_round_trips(triangle: Outline) -> None:
         assert torch.equal(actual.coords, expected.coords)
 
 
+def test_pad_outlines_returns_lengths(triangle: Outline) -> None:
+    batch, lengths = pad_outlines(
+        [triangle, triangle[:2], triangle[:4]], return_lengths=True
+    )
+
+    assert lengths.dtype is torch.long
+    assert lengths.tolist() == [5, 2, 4]
+    assert torch.equal(batch.padding_mask.logical_not().sum(-1), lengths)
+
+
+def test_pad_outlines_places_each_outline_at_the_start_of_its_row(
+    triangle: Outline,
+) -> None:
+    shifted = Outline(triangle.types, triangle.coords + 1.0)
+
+    batch = pad_outlines([triangle[:2], shifted])
+
+    assert torch.equal(batch.coords[0, :2], triangle.coords[:2])
+    assert torch.equal(batch.coords[0, 2:], torch.zeros(3, 6))
+    assert torch.equal(batch.coords[1], shifted.coords)
+
+
+def test_unpad_outlines_uses_given_lengths(triangle: Outline) -> None:
+    batch, lengths = pad_outlines([triangle, triangle[:2]], return_lengths=True)
+
+    from_tensor = unpad_outlines(batch, lengths)
+    from_list = unpad_outlines(batch, [3, 1])
+
+    assert [part.shape for part in from_tensor] == [(5,), (2,)]
+    assert [part.shape for part in from_list] == [(3,), (1,)]
+
+
+def test_unpad_outlines_returns_views(triangle: Outline) -> None:
+    batch = pad_outlines([triangle, triangle[:2]])
+
+    first, _ = unpad_outlines(batch)
+
+    assert first.coords.data_ptr() == batch.coords.data_ptr()
+
+
+def test_unpad_outlines_rejects_mismatched_lengths(triangle: Outline) -> None:
+    batch = pad_outlines([triangle, triangle[:2]])
+
+    with pytest.raises(ValueError, match="one entry per outline"):
+        unpad_outlines(batch, [5])
+
+
 def test_unbind_preserves_padding(triangle: Outline) -> None:
     batch = pad_outlines([triangle, triangle[:2]])
 
@@ -197,6 +257,32 @@ def test_pad_outlines_rejects_mixed_dtypes(triangle: Outline) -> None:
         pad_outlines([triangle, triangle.to(torch.float64)])
 
 
+def test_pad_outlines_keeps_compact_types(triangle: Outline) -> None:
+    compact = triangle.to(types_dtype=torch.uint8)
+
+    batch = pad_outlines([compact, compact[:3]])
+
+    assert batch.types.dtype is torch.uint8
+    assert batch.types[1, 3] == ElementType.PAD
+
+
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+def test_pad_outlines_keeps_reduced_precision_coords(
+    triangle: Outline, dtype: torch.dtype
+) -> None:
+    reduced = triangle.to(dtype)
+
+    batch = pad_outlines([reduced, reduced[:3]])
+
+    assert batch.dtype is dtype
+    assert torch.equal(batch.coords[0], reduced.coords)
+
+
+def test_pad_outlines_rejects_mixed_types_dtypes(triangle: Outline) -> None:
+    with pytest.raises(ValueError, match="share one types dtype"):
+        pad_outlines([triangle, triangle.to(types_dtype=torch.int8)])
+
+
 def test_outline_aliases_its_tensors(triangle: Outline) -> None:
     """``frozen=True`` blocks rebinding attributes, not mutating the tensors."""
     triangle.coords[0, 4] = 5.0
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, RandomSampler, SequentialSampler
+
+import torchfont
+from torchfont.datasets import (
+    BucketBySequenceLengthSampler,
+    ClassVocabulary,
+    FontPrefetchSampler,
+    GlyphDataset,
+)
+
+ROOT = Path("tests/fonts")
+
+
+@pytest.fixture
+def dataset() -> GlyphDataset:
+    return GlyphDataset(ROOT, codepoints=range(ord("A"), ord("Z") + 1))
+
+
+def test_prefetch_sampler_yields_the_wrapped_order(dataset: GlyphDataset) -> None:
+    sampler = RandomSampler(dataset, generator=torch.Generator().manual_seed(0))
+    expected = list(RandomSampler(dataset, generator=torch.Generator().manual_seed(0)))
+
+    prefetching = FontPrefetchSampler(sampler, dataset, lookahead=4)
+
+    assert list(prefetching) == expected
+    assert len(prefetching) == len(dataset)
+
+
+def test_prefetch_sampler_wraps_batch_samplers(dataset: GlyphDataset) -> None:
+    batches = BucketBySequenceLengthSampler(
+        [1] * len(dataset), batch_size=8, shuffle=False
+    )
+
+    prefetching = FontPrefetchSampler(batches, dataset)
+
+    assert list(prefetching) == list(batches)
+    assert len(prefetching) == len(batches)
+
+
+def test_prefetch_sampler_warms_each_file_once(dataset: GlyphDataset) -> None:
+    files = {font.path for font in dataset.font_classes}
+    torchfont.reset_stats()
+
+    list(FontPrefetchSampler(SequentialSampler(dataset), dataset))
+
+    stats = torchfont.stats()
+    assert stats["files_prefetched"] == len(files)
+    assert stats["bytes_prefetched"] == sum(Path(path).stat().st_size for path in files)
+
+
+def test_prefetch_sampler_feeds_a_dataloader(dataset: GlyphDataset) -> None:
+    loader = DataLoader(
+        dataset,
+        batch_size=5,
+        sampler=FontPrefetchSampler(SequentialSampler(dataset), dataset),
+        collate_fn=list,
+    )
+
+    samples = [sample for batch in loader for sample in batch]
+
+    assert [sample.ref.codepoint for sample in samples] == [
+        dataset[idx].ref.codepoint for idx in range(len(dataset))
+    ]
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"budget_bytes": 0}, "budget_bytes must be positive"),
+        ({"lookahead": 0}, "lookahead must be positive"),
+    ],
+)
+def test_prefetch_sampler_rejects_invalid_options(
+    dataset: GlyphDataset, options: dict[str, int], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        FontPrefetchSampler(SequentialSampler(dataset), dataset, **options)
+
+
+def test_prefetch_sampler_uses_local_fonts_with_a_vocabulary() -> None:
+    vocabulary = ClassVocabulary(fonts=["missing/Font.ttf"])
+    dataset = GlyphDataset(ROOT, codepoints=[ord("A")], vocabulary=vocabulary)
+    files = {os.fspath(path) for path, _ in dataset._index.font_refs()}  # noqa: SLF001
+    assert set(dataset.font_targets.tolist()) == {vocabulary.unknown_font_idx}
+    torchfont.reset_stats()
+
+    sampler = SequentialSampler(dataset)
+    assert list(FontPrefetchSampler(sampler, dataset)) == list(sampler)
+
+    assert torchfont.stats()["files_prefetched"] == len(files)
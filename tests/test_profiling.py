@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from typing import TYPE_CHECKING
+
+import pytest
+import torch
+
+from torchfont import ElementType, FontRef, GlyphRef, Outline, pad_outlines
+from torchfont.profiling import ENV_VAR, Profile, StageStats, profile
+from torchfont.transforms import Compose, HorizontalFlip, QuadToCubic
+from torchfont.transforms import functional as F  # noqa: N812
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _outline() -> Outline:
+    types = torch.tensor(
+        [
+            ElementType.MOVE_TO.value,
+            ElementType.LINE_TO.value,
+            ElementType.QUAD_TO.value,
+            ElementType.CLOSE.value,
+            ElementType.END.value,
+        ]
+    )
+    coords = torch.tensor(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0, 1.0, 0.0, 1.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        ]
+    )
+    return Outline(types, coords)
+
+
+def test_profile_records_stages_and_native_kernels() -> None:
+    pipeline = Compose([HorizontalFlip(), QuadToCubic()])
+
+    with profile() as prof:
+        pipeline(_outline())
+        pipeline(_outline())
+
+    assert set(prof.stages) == {"pytree", "HorizontalFlip", "QuadToCubic"}
+    flip = prof.stages["HorizontalFlip"]
+    assert flip.calls == 2
+    assert flip.elements_in == flip.elements_out == 10
+    assert flip.seconds > 0.0
+    kernel = prof.kernels["quad_to_cubic"]
+    assert kernel.calls == 2
+    assert kernel.to_numpy_seconds > 0.0
+    assert kernel.compute_seconds > 0.0
+    assert kernel.to_tensor_seconds > 0.0
+
+
+def test_profile_records_every_load_glyph_phase() -> None:
+    ref = GlyphRef(FontRef("tests/fonts/source-sans/SourceSans3-Regular.ttf", 0), 0x41)
+
+    with profile() as prof:
+        F.load_glyph(ref)
+
+    kernel = prof.kernels["load_glyph"]
+    assert kernel.calls == 1
+    assert kernel.compute_seconds > 0.0
+    assert kernel.to_tensor_seconds > 0.0
+
+
+def test_profile_records_nothing_outside_the_block() -> None:
+    pipeline = Compose([HorizontalFlip()])
+    with profile() as prof:
+        pass
+
+    pipeline(_outline())
+
+    assert prof.stages == {}
+    assert prof.kernels == {}
+
+
+def test_nested_profiles_all_record() -> None:
+    pipeline = Compose([HorizontalFlip()])
+
+    with profile() as outer:
+        pipeline(_outline())
+        with profile() as inner:
+            pipeline(_outline())
+
+    assert outer.stages["HorizontalFlip"].calls == 2
+    assert inner.stages["HorizontalFlip"].calls == 1
+
+
+def test_batched_stages_count_every_sample() -> None:
+    pipeline = Compose([HorizontalFlip()])
+    samples = [_outline(), _outline(), _outline()]
+
+    with profile() as prof:
+        pipeline.batched(samples)
+
+    stats = prof.stages["HorizontalFlip"]
+    assert stats.calls == 1
+    assert stats.elements_in == stats.elements_out == 15
+
+
+def test_padded_elements_include_padding_rows() -> None:
+    batch = pad_outlines([_outline(), _outline()[:3]])
+
+    with profile() as prof:
+        Compose([HorizontalFlip()])(batch)
+
+    assert prof.stages["HorizontalFlip"].elements_in == 10
+
+
+def test_record_function_emits_profiler_ranges() -> None:
+    pipeline = Compose([HorizontalFlip(), QuadToCubic()])
+
+    with torch.profiler.profile() as trace, profile(record_function=True):
+        pipeline(_outline())
+
+    names = {event.name for event in trace.events()}
+    assert {"torchfont.HorizontalFlip", "torchfont.pytree"} <= names
+    assert {"torchfont.quad_to_cubic", "torchfont.to_numpy"} <= names
+
+
+def test_profile_round_trips_through_json(tmp_path: Path) -> None:
+    with profile() as prof:
+        Compose([HorizontalFlip(), QuadToCubic()])(_outline())
+    path = tmp_path / "profile.json"
+
+    prof.save(path)
+
+    assert Profile.load(path) == prof
+
+
+def test_merge_adds_counters() -> None:
+    first = Profile(stages={"A": StageStats(1, 0.5, 4, 4)})
+    second = Profile(stages={"A": StageStats(2, 0.25, 6, 8), "B": StageStats(1)})
+
+    merged = Profile().merge(first).merge(second)
+
+    assert merged.stages == {
+        "A": StageStats(3, 0.75, 10, 12),
+        "B": StageStats(1),
+    }
+    assert first.stages["A"] == StageStats(1, 0.5, 4, 4)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="uses fork workers")
+def test_environment_profiles_dataloader_workers(tmp_path: Path) -> None:
+    script = textwrap.dedent(
+        """
+        import torch
+        from torch.utils.data import DataLoader, Dataset
+
+        from torchfont import ElementType, Outline
+        from torchfont.transforms import Compose, HorizontalFlip
+
+        class Samples(Dataset):
+            def __init__(self):
+                self.transform = Compose([HorizontalFlip()])
+
+            def __len__(self):
+                return 12
+
+            def __getitem__(self, idx):
+                types = torch.tensor(
+                    [ElementType.MOVE_TO.value, ElementType.LINE_TO.value]
+                )
+                return self.transform(Outline(types, torch.ones(2, 6) * idx))
+
+        dataset = Samples()
+        dataset[0]
+        loader = DataLoader(
+            dataset,
+            batch_size=4,
+            num_workers=2,
+            collate_fn=list,
+            multiprocessing_context="fork",
+        )
+        assert sum(len(batch) for batch in loader) == 12
+        """
+    )
+    env = {**os.environ, ENV_VAR: str(tmp_path)}
+
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)  # noqa: S603
+
+    assert len(list(tmp_path.glob("torchfont-profile-*.json"))) == 3
+    assert Profile.load(tmp_path).stages["HorizontalFlip"].calls == 13
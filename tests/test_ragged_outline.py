@@ -0,0 +1,97 @@
+"""Variable-length batches stored as :class:`torchfont.RaggedOutline`."""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from torchfont import ElementType, Outline, RaggedOutline, pad_outlines
+
+
+def _outline(length: int, offset: float = 0.0) -> Outline:
+    types = torch.full((length,), ElementType.LINE_TO.value)
+    types[0] = ElementType.MOVE_TO.value
+    types[-1] = ElementType.END.value
+    coords = torch.arange(length * 6, dtype=torch.float32).view(length, 6) + offset
+    return Outline(types, coords)
+
+
+@pytest.fixture
+def parts() -> list[Outline]:
+    return [_outline(6), _outline(2, 100.0), _outline(4, 200.0)]
+
+
+def test_from_outlines_concatenates_without_padding(parts: list[Outline]) -> None:
+    ragged = RaggedOutline.from_outlines(parts)
+
+    assert len(ragged) == 3
+    assert ragged.types.shape == (12,)
+    assert ragged.coords.shape == (12, 6)
+    assert ragged.offsets.tolist() == [0, 6, 8, 12]
+    assert ragged.lengths.tolist() == [6, 2, 4]
+    assert ragged.batch_index.tolist() == [0] * 6 + [1] * 2 + [2] * 4
+
+
+def test_unbind_round_trips_views(parts: list[Outline]) -> None:
+    ragged = RaggedOutline.from_outlines(parts)
+
+    restored = ragged.unbind()
+
+    for actual, expected in zip(restored, parts, strict=True):
+        assert torch.equal(actual.types, expected.types)
+        assert torch.equal(actual.coords, expected.coords)
+    assert restored[0].coords.data_ptr() == ragged.coords.data_ptr()
+
+
+def test_to_padded_matches_pad_outlines(parts: list[Outline]) -> None:
+    padded = RaggedOutline.from_outlines(parts).to_padded()
+    expected = pad_outlines(parts)
+
+    assert torch.equal(padded.types, expected.types)
+    assert torch.equal(padded.coords, expected.coords)
+
+
+def test_from_padded_drops_padding(parts: list[Outline]) -> None:
+    batch, lengths = pad_outlines(parts, return_lengths=True)
+    expected = RaggedOutline.from_outlines(parts)
+
+    for ragged in (
+        RaggedOutline.from_padded(batch),
+        RaggedOutline.from_padded(batch, lengths),
+    ):
+        assert torch.equal(ragged.offsets, expected.offsets)
+        assert torch.equal(ragged.types, expected.types)
+        assert torch.equal(ragged.coords, expected.coords)
+
+
+def test_to_casts_values_and_keeps_offsets(parts: list[Outline]) -> None:
+    ragged = RaggedOutline.from_outlines(parts)
+
+    moved = ragged.to(torch.float16, types_dtype=torch.uint8)
+
+    assert moved.dtype is torch.float16
+    assert moved.types.dtype is torch.uint8
+    assert torch.equal(moved.offsets, ragged.offsets)
+
+
+def test_rejects_batched_values() -> None:
+    batch = pad_outlines([_outline(2), _outline(3)])
+
+    with pytest.raises(ValueError, match="values must be a single outline"):
+        RaggedOutline(batch, torch.tensor([0, 3]))
+
+
+def test_rejects_non_long_offsets() -> None:
+    with pytest.raises(TypeError, match=r"offsets must have dtype torch\.long"):
+        RaggedOutline(_outline(2), torch.tensor([0, 2], dtype=torch.int32))
+
+
+def test_from_outlines_rejects_mixed_dtypes() -> None:
+    with pytest.raises(ValueError, match="share one coords dtype"):
+        RaggedOutline.from_outlines([_outline(2), _outline(2).to(torch.float64)])
+
+
+def test_repr_summarises_the_batch(parts: list[Outline]) -> None:
+    assert repr(RaggedOutline.from_outlines(parts)) == (
+        "RaggedOutline(batch_size=3, num_elements=12, dtype=torch.float32, device=cpu)"
+    )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+import torch
+
+from torchfont.datasets import BucketBySequenceLengthSampler
+
+
+def _padded_tokens(batches: list[list[int]], lengths: list[int]) -> int:
+    return sum(len(batch) * max(lengths[idx] for idx in batch) for batch in batches)
+
+
+def test_sampler_covers_every_index_once() -> None:
+    lengths = torch.randint(1, 200, (97,), generator=torch.Generator().manual_seed(0))
+    sampler = BucketBySequenceLengthSampler(
+        lengths, batch_size=8, generator=torch.Generator().manual_seed(1)
+    )
+
+    batches = list(sampler)
+
+    assert len(batches) == len(sampler) == 13
+    assert sorted(idx for batch in batches for idx in batch) == list(range(97))
+    assert all(len(batch) <= 8 for batch in batches)
+
+
+def test_sampler_groups_similar_lengths() -> None:
+    lengths = [3, 400, 5, 380, 4, 390, 6, 410]
+    sampler = BucketBySequenceLengthSampler(lengths, batch_size=4, shuffle=False)
+
+    batches = list(sampler)
+
+    assert batches == [[0, 4, 2, 6], [3, 5, 1, 7]]
+    assert _padded_tokens(batches, lengths) < len(lengths) * max(lengths)
+
+
+def test_sampler_respects_max_tokens() -> None:
+    lengths = [10, 10, 10, 10, 30, 30, 100]
+    sampler = BucketBySequenceLengthSampler(lengths, max_tokens=60, shuffle=False)
+
+    batches = list(sampler)
+
+    assert batches == [[0, 1, 2, 3], [4, 5], [6]]
+    assert len(sampler) == 3
+
+
+def test_sampler_combines_batch_size_and_max_tokens() -> None:
+    sampler = BucketBySequenceLengthSampler(
+        [1] * 10, batch_size=3, max_tokens=100, shuffle=False
+    )
+
+    assert [len(batch) for batch in sampler] == [3, 3, 3, 1]
+
+
+def test_sampler_shuffle_is_reproducible_and_keeps_batch_sizes() -> None:
+    lengths = torch.randint(1, 50, (64,), generator=torch.Generator().manual_seed(2))
+
+    def draw(seed: int) -> list[list[int]]:
+        return list(
+            BucketBySequenceLengthSampler(
+                lengths, max_tokens=200, generator=torch.Generator().manual_seed(seed)
+            )
+        )
+
+    ordered = list(
+        BucketBySequenceLengthSampler(lengths, max_tokens=200, shuffle=False)
+    )
+
+    assert draw(3) == draw(3)
+    assert draw(3) != draw(4)
+    assert sorted(len(batch) for batch in draw(3)) == sorted(
+        len(batch) for batch in ordered
+    )
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "max_tokens", "match"),
+    [
+        (None, None, "at least one of batch_size and max_tokens"),
+        (0, None, "batch_size must be positive"),
+        (None, -1, "max_tokens must be positive"),
+    ],
+)
+def test_sampler_rejects_invalid_limits(
+    batch_size: int | None, max_tokens: int | None, match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        BucketBySequenceLengthSampler(
+            [1, 2], batch_size=batch_size, max_tokens=max_tokens
+        )
+
+
+def test_sampler_rejects_invalid_lengths() -> None:
+    with pytest.raises(ValueError, match="lengths must be 1-D"):
+        BucketBySequenceLengthSampler(torch.ones(2, 2), batch_size=2)
+    with pytest.raises(ValueError, match="lengths must be non-negative"):
+        BucketBySequenceLengthSampler([1, -1], batch_size=2)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+import torchfont
+from torchfont import FontRef, GlyphRef
+from torchfont.transforms import functional as _functional
+
+FONT = Path("tests/fonts/source-sans/SourceSans3-Regular.ttf")
+
+
+def test_stats_count_mapped_files_and_glyph_draws() -> None:
+    torchfont.reset_stats()
+    ref = GlyphRef(FontRef(FONT, 0), ord("A"))
+
+    for _ in range(3):
+        _functional.load_glyph(ref)
+    stats = torchfont.stats()
+
+    # An earlier test may have left the font open, so the first load may hit.
+    assert stats["cache_hits"] + stats["cache_misses"] == 3
+    assert stats["cache_hits"] >= 2
+    assert stats["files_mapped"] == stats["cache_misses"]
+    assert stats["bytes_mapped"] == stats["files_mapped"] * FONT.stat().st_size
+    assert stats["files_read"] == 0
+    assert stats["map_failures"] == 0
+    assert stats["glyph_draws"] == 3
+    assert stats["glyph_draw_seconds"] > 0.0
+    assert stats["elapsed_seconds"] > 0.0
+
+
+def test_stats_count_map_failures(tmp_path: Path) -> None:
+    torchfont.reset_stats()
+    ref = GlyphRef(FontRef(tmp_path / "missing.ttf", 0), ord("A"))
+
+    with pytest.raises(OSError, match="failed to open"):
+        _functional.load_glyph(ref)
+
+    stats = torchfont.stats()
+    assert stats["map_failures"] == 1
+    assert stats["files_mapped"] == 0
+    assert stats["cache_misses"] == 1
+
+
+def test_set_font_io_closes_open_fonts() -> None:
+    ref = GlyphRef(FontRef(FONT, 0), ord("A"))
+    _functional.load_glyph(ref)
+    previous = torchfont.set_font_io(access="random")
+    try:
+        torchfont.reset_stats()
+        _functional.load_glyph(ref)
+        _functional.load_glyph(ref)
+        stats = torchfont.stats()
+    finally:
+        torchfont.set_font_io(**previous)
+
+    assert (stats["cache_misses"], stats["cache_hits"]) == (1, 1)
+    assert stats["files_mapped"] == 1
+
+
+def test_reset_stats_returns_previous_values_and_zeroes() -> None:
+    torchfont.reset_stats()
+    _functional.load_glyph(GlyphRef(FontRef(FONT, 0), ord("B")))
+
+    previous = torchfont.reset_stats()
+    stats = torchfont.stats()
+
+    assert previous["cache_hits"] + previous["cache_misses"] == 1
+    assert previous["glyph_draws"] == 1
+    assert stats["files_mapped"] == stats["bytes_mapped"] == 0
+    assert stats["cache_hits"] == stats["cache_misses"] == 0
+    assert stats["glyph_draws"] == 0
+    assert stats["glyph_draw_seconds"] == 0.0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="getrusage is POSIX-only")
+def test_stats_report_page_faults_since_reset() -> None:
+    torchfont.reset_stats()
+    torch.ones(1 << 20).sum()
+
+    stats = torchfont.stats()
+
+    assert stats["minor_page_faults"] is not None
+    assert stats["minor_page_faults"] >= 0
+    assert stats["major_page_faults"] is not None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_child_starts_from_zero() -> None:
+    torchfont.reset_stats()
+    _functional.load_glyph(GlyphRef(FontRef(FONT, 0), ord("C")))
+    read, write = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        os.write(write, bytes([torchfont.stats()["glyph_draws"]]))
+        os._exit(0)
+    os.close(write)
+    child_draws = os.read(read, 1)[0]
+    os.close(read)
+    os.waitpid(pid, 0)
+
+    assert child_draws == 0
+    assert torchfont.stats()["glyph_draws"] == 1
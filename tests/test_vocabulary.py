@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pickle
+import shutil
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from torchfont.datasets import ClassVocabulary, GlyphDataset, GlyphIdDataset
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from torchfont import GlyphSample
+
+SANS = "tests/fonts/source-sans/SourceSans3-Regular.ttf"
+
+
+def _fonts(tmp_path: Path, *names: str) -> None:
+    for name in names:
+        shutil.copy(SANS, tmp_path / f"{name}.ttf")
+
+
+def test_vocabulary_round_trips_through_a_file(tmp_path: Path) -> None:
+    vocabulary = ClassVocabulary([0x42, 0x41], ["b.ttf", "c.ttc#1"])
+    vocabulary.save(tmp_path / "vocab.json")
+
+    loaded = ClassVocabulary.load(tmp_path / "vocab.json")
+
+    assert loaded == vocabulary
+    assert loaded.codepoints == (0x42, 0x41)
+    assert (loaded.unknown_character_idx, loaded.unknown_font_idx) == (2, 2)
+
+
+def test_vocabulary_rejects_duplicate_entries() -> None:
+    with pytest.raises(ValueError, match="codepoints must be unique"):
+        ClassVocabulary([0x41, 0x41])
+    with pytest.raises(ValueError, match="fonts must be unique"):
+        ClassVocabulary(fonts=["a.ttf", "a.ttf"])
+
+
+def test_vocabulary_classes_survive_corpus_growth(tmp_path: Path) -> None:
+    _fonts(tmp_path, "b")
+    codepoints = [ord("A"), ord("B")]
+    ClassVocabulary.from_dataset(GlyphDataset(tmp_path, codepoints=codepoints)).save(
+        tmp_path / "vocab.json"
+    )
+    _fonts(tmp_path, "a")
+
+    dataset = GlyphDataset(
+        tmp_path,
+        codepoints=[*codepoints, ord("C")],
+        vocabulary=tmp_path / "vocab.json",
+    )
+
+    assert [font.path for font in dataset.font_classes] == [str(tmp_path / "b.ttf")]
+    assert dataset.character_classes == ["A", "B"]
+    assert dataset.font_targets.tolist() == [1] * 3 + [0] * 3
+    assert dataset.character_targets.tolist() == [0, 1, 2] * 2
+    samples = [dataset[idx] for idx in range(len(dataset))]
+    assert [sample.font_idx for sample in samples] == dataset.font_targets.tolist()
+    assert [
+        sample.character_idx for sample in samples
+    ] == dataset.character_targets.tolist()
+
+
+def test_vocabulary_maps_survive_pickling(tmp_path: Path) -> None:
+    _fonts(tmp_path, "a", "b")
+    dataset = GlyphDataset(
+        tmp_path,
+        codepoints=[ord("A")],
+        vocabulary=ClassVocabulary([ord("A")], ["b.ttf"]),
+    )
+    assert dataset.font_targets.tolist() == [1, 0]
+
+    restored = cast(
+        "GlyphDataset[GlyphSample]",
+        pickle.loads(pickle.dumps(dataset)),  # noqa: S301
+    )
+
+    assert restored.vocabulary == dataset.vocabulary
+    assert restored[0].font_idx == 1
+    assert restored.font_targets.tolist() == [1, 0]
+
+
+def test_unencoded_glyphs_keep_no_character_class(tmp_path: Path) -> None:
+    _fonts(tmp_path, "a")
+    dataset = GlyphIdDataset(tmp_path, vocabulary=ClassVocabulary([ord("A")]))
+
+    targets = dataset.character_targets
+    samples = [dataset[idx] for idx in range(len(dataset))]
+
+    assert set(targets.tolist()) == {-1, 0, 1}
+    assert all(
+        (sample.ref.codepoint == -1) == (sample.character_idx == -1)
+        for sample in samples
+    )
@@ -65,6 +65,71 @@ def test_quad_to_cubic_converts_quadratic_segments() -> None:
     assert torch.allclose(out_coords, expected_coords)
 
 
+@pytest.mark.parametrize("dtype", [torch.uint8, torch.int8])
+def test_quad_to_cubic_keeps_compact_types_dtype(dtype: torch.dtype) -> None:
+    types = torch.tensor(
+        [
+            ElementType.MOVE_TO.value,
+            ElementType.QUAD_TO.value,
+            ElementType.CLOSE.value,
+            ElementType.END.value,
+        ],
+        dtype=torch.long,
+    )
+    coords = torch.tensor(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0, 1.0, 1.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        ],
+        dtype=torch.float32,
+    )
+
+    wide_types, wide_coords = quad_to_cubic(types, coords)
+    out_types, out_coords = quad_to_cubic(types.to(dtype), coords)
+
+    assert out_types.dtype is dtype
+    assert torch.equal(out_types.long(), wide_types)
+    assert torch.equal(out_coords, wide_coords)
+
+
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+def test_quad_to_cubic_keeps_reduced_precision_coords(dtype: torch.dtype) -> None:
+    types = torch.tensor(
+        [
+            ElementType.MOVE_TO.value,
+            ElementType.QUAD_TO.value,
+            ElementType.CLOSE.value,
+            ElementType.END.value,
+        ],
+        dtype=torch.long,
+    )
+    coords = torch.tensor(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 3.0, 0.0, 0.0, 3.0, 3.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        ],
+        dtype=torch.float32,
+    )
+
+    wide_types, wide_coords = quad_to_cubic(types, coords)
+    out_types, out_coords = quad_to_cubic(types, coords.to(dtype))
+
+    assert out_coords.dtype is dtype
+    assert torch.equal(out_types, wide_types)
+    assert torch.equal(out_coords, wide_coords.to(dtype))
+
+
+def test_quad_to_cubic_rejects_unsupported_coords_dtype() -> None:
+    types = torch.tensor([ElementType.END.value], dtype=torch.long)
+
+    with pytest.raises(TypeError, match=r"coords must have dtype torch\.float32"):
+        quad_to_cubic(types, torch.zeros((1, 6), dtype=torch.float64))
+
+
 def test_quad_to_cubic_returns_equal_tensors_when_no_quadratic_segments() -> None:
     types = torch.tensor(
         [ElementType.MOVE_TO.value, ElementType.LINE_TO.value, ElementType.END.value],
@@ -3,8 +3,9 @@ from collections.abc import Callable
 import pytest
 import torch
 
-from torchfont import ElementType
+from torchfont import ElementType, _ops
 from torchfont.transforms.functional._geometry import _affine as affine
+from torchfont.transforms.functional._geometry import _tight_bbox_center
 
 
 def test_affine_identity_leaves_coords_unchanged(
@@ -145,10 +146,53 @@ def test_affine_rejects_non_finite_translate(
 
 
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
-def test_affine_rejects_cuda_input(
+def test_affine_matches_cpu_on_cuda(
     simple_outline: tuple[torch.Tensor, torch.Tensor],
 ) -> None:
-    types, coords = (tensor.cuda() for tensor in simple_outline)
+    types, coords = simple_outline
+
+    _, out = affine(types.cuda(), coords.cuda(), angle=15.0)
+
+    assert out.device.type == "cuda"
+    assert torch.allclose(out.cpu(), affine(types, coords, angle=15.0)[1], atol=1e-5)
+
+
+def test_affine_accepts_per_outline_parameter_tensors(
+    simple_outline: tuple[torch.Tensor, torch.Tensor],
+) -> None:
+    types, coords = simple_outline
+    angles = torch.tensor([0.0, 30.0, 90.0])
+    translate = torch.tensor([[0.0, 0.0], [0.5, 0.0], [0.0, -1.0]])
+
+    _, out = affine(
+        types.expand(3, -1), coords.expand(3, -1, -1), angle=angles, translate=translate
+    )
+
+    for row, angle, offset in zip(out, angles, translate, strict=True):
+        _, expected = affine(
+            types, coords, angle=float(angle), translate=tuple(offset.tolist())
+        )
+        assert torch.allclose(row, expected, atol=1e-6)
 
-    with pytest.raises(NotImplementedError, match="CUDA"):
-        affine(types, coords, angle=15.0)
+
+def test_affine_validates_parameter_tensors(
+    simple_outline: tuple[torch.Tensor, torch.Tensor],
+) -> None:
+    types, coords = simple_outline
+
+    with pytest.raises(ValueError, match="scale must be positive and finite"):
+        affine(
+            types.expand(2, -1),
+            coords.expand(2, -1, -1),
+            scale=torch.tensor([1.0, 0.0]),
+        )
+
+
+def test_tensor_bbox_centre_matches_the_native_tight_bbox(
+    cubic_outline: tuple[torch.Tensor, torch.Tensor],
+    quad_outline: tuple[torch.Tensor, torch.Tensor],
+) -> None:
+    for types, coords in (cubic_outline, quad_outline):
+        assert torch.allclose(
+            _tight_bbox_center(types, coords), _ops.bbox_center(types, coords)
+        )
@@ -3,7 +3,8 @@ from collections.abc import Callable
 import pytest
 import torch
 
-from torchfont import ElementType
+from torchfont import ElementType, Outline, pad_outlines, unpad_outlines
+from torchfont.transforms import functional as F  # noqa: N812
 from torchfont.transforms.functional._geometry import (
     _horizontal_flip as horizontal_flip,
 )
@@ -123,10 +124,33 @@ def test_horizontal_flip_does_not_reverse_open_subpaths(
 
 
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
-def test_horizontal_flip_rejects_cuda_input(
+def test_horizontal_flip_matches_cpu_on_cuda(
     simple_outline: tuple[torch.Tensor, torch.Tensor],
 ) -> None:
-    types, coords = (tensor.cuda() for tensor in simple_outline)
+    types, coords = simple_outline
+    expected_types, expected_coords = horizontal_flip(types, coords)
+
+    out_types, out_coords = horizontal_flip(types.cuda(), coords.cuda())
+
+    assert out_coords.device.type == "cuda"
+    assert torch.equal(out_types.cpu(), expected_types)
+    assert torch.allclose(out_coords.cpu(), expected_coords, atol=1e-5)
+
+
+@pytest.mark.parametrize("preserve_winding", [True, False])
+def test_horizontal_flip_of_a_padded_batch_matches_each_row(
+    simple_outline: tuple[torch.Tensor, torch.Tensor],
+    cubic_outline: tuple[torch.Tensor, torch.Tensor],
+    *,
+    preserve_winding: bool,
+) -> None:
+    outlines = [Outline(*cubic_outline), Outline(*simple_outline)]
+
+    output = F.horizontal_flip(
+        pad_outlines(outlines), preserve_winding=preserve_winding
+    )
 
-    with pytest.raises(NotImplementedError, match="CUDA"):
-        horizontal_flip(types, coords)
+    for row, outline in zip(unpad_outlines(output), outlines, strict=True):
+        expected = F.horizontal_flip(outline, preserve_winding=preserve_winding)
+        assert torch.equal(row.types, expected.types)
+        assert torch.allclose(row.coords, expected.coords, atol=1e-6)
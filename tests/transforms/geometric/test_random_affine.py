@@ -59,10 +59,10 @@ def test_random_affine_rejects_non_pair_ranges(name: str) -> None:
 
 
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
-def test_random_affine_rejects_cuda_input(
+def test_random_affine_preserves_cuda_device(
     simple_outline: tuple[torch.Tensor, torch.Tensor],
 ) -> None:
-    with pytest.raises(NotImplementedError, match="CUDA"):
-        RandomAffine(degrees=45.0)(
-            Outline(*(tensor.cuda() for tensor in simple_outline))
-        )
+    output = RandomAffine(degrees=45.0)(
+        Outline(*(tensor.cuda() for tensor in simple_outline))
+    )
+    assert output.coords.device.type == "cuda"
@@ -72,10 +72,14 @@ def test_vertical_flip_can_leave_reflected_winding(
 
 
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
-def test_vertical_flip_rejects_cuda_input(
+def test_vertical_flip_matches_cpu_on_cuda(
     simple_outline: tuple[torch.Tensor, torch.Tensor],
 ) -> None:
-    types, coords = (tensor.cuda() for tensor in simple_outline)
+    types, coords = simple_outline
+    expected_types, expected_coords = vertical_flip(types, coords)
+
+    out_types, out_coords = vertical_flip(types.cuda(), coords.cuda())
 
-    with pytest.raises(NotImplementedError, match="CUDA"):
-        vertical_flip(types, coords)
+    assert out_coords.device.type == "cuda"
+    assert torch.equal(out_types.cpu(), expected_types)
+    assert torch.allclose(out_coords.cpu(), expected_coords, atol=1e-5)
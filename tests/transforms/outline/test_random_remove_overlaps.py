@@ -118,5 +118,8 @@ def test_random_remove_overlaps_native_rejects_too_few_random_values() -> None:
         ValueError, match="random_values length must be at least types length"
     ):
         _torchfont.random_remove_overlaps(
-            types.numpy(), coords.reshape(-1).numpy(), np.zeros(1, dtype=np.float32)
+            types.numpy(),
+            coords.reshape(-1).numpy(),
+            np.zeros(1, dtype=np.float32),
+            0,
         )
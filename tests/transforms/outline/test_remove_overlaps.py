@@ -1,7 +1,10 @@
+import pytest
 import torch
 
 from tests._pairs import remove_overlaps
-from torchfont import ElementType
+from torchfont import ElementType, Outline
+from torchfont.transforms import RemoveOverlaps
+from torchfont.transforms import functional as F  # noqa: N812
 
 
 def test_remove_overlaps_merges_overlapping_subpaths() -> None:
@@ -53,3 +56,60 @@ def test_remove_overlaps_merges_overlapping_subpaths() -> None:
         ]
     )
     assert torch.allclose(actual, expected)
+
+
+def _separated_pairs() -> Outline:
+    types: list[int] = []
+    coords: list[list[float]] = []
+    for x in (0.0, 10.0, 20.0, 30.0):
+        for x0, y0 in ((x, 0.0), (x + 1.0, 1.0)):
+            types.extend(
+                [
+                    ElementType.MOVE_TO.value,
+                    ElementType.LINE_TO.value,
+                    ElementType.LINE_TO.value,
+                    ElementType.LINE_TO.value,
+                    ElementType.CLOSE.value,
+                ]
+            )
+            coords.extend(
+                [
+                    [0, 0, 0, 0, x0, y0],
+                    [0, 0, 0, 0, x0 + 2.0, y0],
+                    [0, 0, 0, 0, x0 + 2.0, y0 + 2.0],
+                    [0, 0, 0, 0, x0, y0 + 2.0],
+                    [0, 0, 0, 0, 0, 0],
+                ]
+            )
+    types.append(ElementType.END.value)
+    coords.append([0, 0, 0, 0, 0, 0])
+    return Outline(torch.tensor(types), torch.tensor(coords, dtype=torch.float32))
+
+
+def test_remove_overlaps_parallel_threshold_does_not_change_result() -> None:
+    outline = _separated_pairs()
+
+    sequential = F.remove_overlaps(outline, parallel_threshold=1 << 30)
+    parallel = F.remove_overlaps(outline, parallel_threshold=0)
+
+    assert torch.equal(sequential.types, parallel.types)
+    assert torch.equal(sequential.coords, parallel.coords)
+    assert sequential.types.tolist().count(ElementType.MOVE_TO.value) == 4
+
+
+def test_remove_overlaps_keeps_group_order() -> None:
+    output = F.remove_overlaps(_separated_pairs(), parallel_threshold=0)
+    starts = output.coords[output.types == ElementType.MOVE_TO.value, 4]
+
+    assert starts.floor().tolist() == [0.0, 10.0, 20.0, 30.0]
+
+
+def test_remove_overlaps_rejects_negative_parallel_threshold() -> None:
+    outline = _separated_pairs()
+
+    with pytest.raises(ValueError, match="parallel_threshold must be non-negative"):
+        RemoveOverlaps(parallel_threshold=-1)
+    with pytest.raises(ValueError, match="parallel_threshold must be non-negative"):
+        F.remove_overlaps(outline, parallel_threshold=-1)
+    with pytest.raises(ValueError, match="parallel_threshold must be non-negative"):
+        F.remove_overlap_groups(outline, torch.zeros(8), parallel_threshold=-1)
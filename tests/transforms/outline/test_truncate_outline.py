@@ -0,0 +1,148 @@
+import pytest
+import torch
+
+from torchfont import ElementType, Outline, pad_outlines, unpad_outlines
+from torchfont.transforms import ChunkOutline, TruncateOutline
+from torchfont.transforms import functional as F  # noqa: N812
+
+MOVE_TO = ElementType.MOVE_TO.value
+LINE_TO = ElementType.LINE_TO.value
+CLOSE = ElementType.CLOSE.value
+END = ElementType.END.value
+PAD = ElementType.PAD.value
+
+
+def _outline(types: list[int]) -> Outline:
+    coords = torch.arange(len(types) * 6, dtype=torch.float32).view(-1, 6) + 1
+    return Outline(torch.tensor(types), coords)
+
+
+# Two subpaths of four and three elements.
+TWO_SUBPATHS = [MOVE_TO, LINE_TO, LINE_TO, CLOSE, MOVE_TO, LINE_TO, CLOSE, END]
+
+
+def test_truncate_outline_cuts_at_the_last_fitting_subpath() -> None:
+    outline = _outline(TWO_SUBPATHS)
+
+    truncated = F.truncate_outline(outline, 7)
+
+    assert truncated.types.tolist() == [MOVE_TO, LINE_TO, LINE_TO, CLOSE, END]
+    assert torch.equal(truncated.coords[:4], outline.coords[:4])
+    assert not truncated.coords[4].any()
+
+
+def test_truncate_outline_keeps_outlines_that_fit() -> None:
+    outline = _outline(TWO_SUBPATHS)
+
+    truncated = F.truncate_outline(outline, len(TWO_SUBPATHS))
+
+    assert torch.equal(truncated.types, outline.types)
+    assert torch.equal(truncated.coords[:-1], outline.coords[:-1])
+
+
+def test_truncate_outline_leaves_end_when_no_subpath_fits() -> None:
+    truncated = F.truncate_outline(_outline(TWO_SUBPATHS), 3)
+
+    assert truncated.types.tolist() == [END]
+
+
+def test_truncate_outline_handles_padded_batches_in_one_pass() -> None:
+    long = _outline(TWO_SUBPATHS)
+    short = _outline([MOVE_TO, LINE_TO, CLOSE, END])
+
+    truncated, dropped = F.truncate_outline(
+        pad_outlines([long, short]), 6, return_dropped=True
+    )
+
+    assert truncated.batch_shape == (2,)
+    assert truncated.types.tolist() == [
+        [MOVE_TO, LINE_TO, LINE_TO, CLOSE, END, PAD],
+        [MOVE_TO, LINE_TO, CLOSE, END, PAD, PAD],
+    ]
+    assert dropped.tolist() == [3, 0]
+    assert [item.types.tolist() for item in unpad_outlines(truncated)] == [
+        F.truncate_outline(long, 6).types.tolist(),
+        short.types.tolist(),
+    ]
+
+
+def test_truncate_outline_leaves_all_pad_rows_untouched() -> None:
+    batch = pad_outlines([_outline(TWO_SUBPATHS), _outline([PAD, PAD])])
+
+    truncated, dropped = F.truncate_outline(batch, 5, return_dropped=True)
+
+    assert truncated.types[1].tolist() == [PAD] * 5
+    assert not truncated.coords[1].any()
+    assert dropped.tolist() == [3, 0]
+
+
+def test_truncate_outline_preserves_dtypes_and_gradients() -> None:
+    outline = _outline(TWO_SUBPATHS).to(types_dtype=torch.uint8)
+    coords = outline.coords.clone().requires_grad_()
+
+    truncated = F.truncate_outline(Outline(outline.types, coords), 5)
+    truncated.coords.sum().backward()
+
+    assert truncated.types.dtype == torch.uint8
+    assert coords.grad is not None
+    assert coords.grad[:4].eq(1).all()
+    assert not coords.grad[4:].any()
+
+
+def test_chunk_outline_packs_whole_subpaths() -> None:
+    chunks = F.chunk_outline(_outline(TWO_SUBPATHS), 5)
+
+    assert chunks.types.tolist() == [
+        [MOVE_TO, LINE_TO, LINE_TO, CLOSE, END],
+        [MOVE_TO, LINE_TO, CLOSE, END, PAD],
+    ]
+    assert F.chunk_outline(_outline(TWO_SUBPATHS), 8).batch_shape == (1,)
+
+
+def test_chunk_outline_rejects_subpaths_that_cannot_fit() -> None:
+    with pytest.raises(ValueError, match="a subpath of 4 elements does not fit"):
+        F.chunk_outline(_outline(TWO_SUBPATHS), 4)
+
+
+def test_chunk_outline_rejects_batched_outlines() -> None:
+    batch = pad_outlines([_outline(TWO_SUBPATHS)])
+
+    with pytest.raises(ValueError, match="chunk_outline operates on a single"):
+        F.chunk_outline(batch, 5)
+
+
+@pytest.mark.parametrize("transform", [TruncateOutline, ChunkOutline])
+def test_length_transforms_reject_non_positive_max_length(
+    transform: type[TruncateOutline | ChunkOutline],
+) -> None:
+    with pytest.raises(ValueError, match="max_length must be positive"):
+        transform(0)
+
+
+def test_length_transforms_match_functional_kernels() -> None:
+    outline = _outline(TWO_SUBPATHS)
+
+    assert torch.equal(
+        TruncateOutline(5)(outline).types, F.truncate_outline(outline, 5).types
+    )
+    assert torch.equal(
+        ChunkOutline(5)(outline).types, F.chunk_outline(outline, 5).types
+    )
+    assert repr(TruncateOutline(5)) == "TruncateOutline(max_length=5)"
+
+
+def test_truncate_transform_keeps_the_padded_batch_width() -> None:
+    long = _outline(TWO_SUBPATHS[:-1] * 3 + [END])
+    batch = pad_outlines([_outline(TWO_SUBPATHS), long, _outline([END])])
+
+    truncated = TruncateOutline(10)(batch)
+
+    assert truncated.types.shape == (3, 10)
+    assert torch.equal(truncated.types, F.truncate_outline(batch, 10).types)
+
+
+def test_chunk_transform_rejects_padded_batches() -> None:
+    batch = pad_outlines([_outline(TWO_SUBPATHS), _outline([END])])
+
+    with pytest.raises(ValueError, match="ChunkOutline expects a single outline"):
+        ChunkOutline(5)(batch)
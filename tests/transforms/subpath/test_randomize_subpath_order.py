@@ -1,7 +1,7 @@
 import pytest
 import torch
 
-from torchfont import ElementType, Outline
+from torchfont import ElementType, Outline, _ops, pad_outlines, unpad_outlines
 from torchfont.transforms import RandomizeSubpathOrder
 from torchfont.transforms import functional as _functional
 
@@ -83,3 +83,35 @@ def test_randomize_subpath_order_preserves_each_subpath(
     assert output_blocks == input_blocks
     assert out_coords[0, 4:6].tolist() == pytest.approx([0.6, 0.6])
     assert out_types[-1].item() == ElementType.END.value
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [[0.9, 0.1], [0.5, 0.5], [float("nan"), 0.0], [0.0, -0.0], [float("inf"), 1.0]],
+)
+def test_reorder_subpaths_matches_rust(
+    two_squares: tuple[torch.Tensor, torch.Tensor], keys: list[float]
+) -> None:
+    types, coords = two_squares
+    values = torch.zeros(11)
+    values[0], values[5] = keys
+
+    output = _functional.reorder_subpaths(Outline(types, coords), values)
+    expected_types, expected_coords = _ops.reorder_subpaths(types, coords, values)
+
+    assert torch.equal(output.types, expected_types)
+    assert torch.equal(output.coords, expected_coords)
+
+
+def test_reorder_subpaths_sorts_each_row_of_a_padded_batch(
+    two_squares: tuple[torch.Tensor, torch.Tensor],
+) -> None:
+    outline = Outline(*two_squares)
+    batch = pad_outlines([outline, outline])
+    keys = torch.zeros(2, 11)
+    keys[0, 0] = 1.0
+
+    first, second = unpad_outlines(_functional.reorder_subpaths(batch, keys))
+
+    assert torch.equal(first.coords[0], outline.coords[5])
+    assert torch.equal(second.coords, outline.coords)
@@ -1,8 +1,23 @@
 import pytest
 import torch
 
-from torchfont import Outline
+from torchfont import ElementType, Outline, _ops, pad_outlines, unpad_outlines
 from torchfont.transforms import RandomizeSubpathStartPoints
+from torchfont.transforms import functional as F  # noqa: N812
+
+
+def _explicitly_closed_square() -> Outline:
+    """A square whose last LINE_TO returns to the start point."""
+    types = torch.tensor(
+        [ElementType.MOVE_TO]
+        + [ElementType.LINE_TO] * 4
+        + [ElementType.CLOSE, ElementType.END]
+    )
+    coords = torch.zeros(7, 6)
+    coords[:5, 4:] = torch.tensor(
+        [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 2.0], [1.0, 1.0]]
+    )
+    return Outline(types, coords)
 
 
 def test_randomize_subpath_start_points_is_reproducible(
@@ -43,9 +58,58 @@ def test_randomize_subpath_start_points_leaves_open_subpaths_unchanged(
 
 
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
-def test_randomize_subpath_start_points_rejects_cuda_input(
+def test_randomize_subpath_start_points_preserves_cuda_device(
     square: tuple[torch.Tensor, torch.Tensor],
 ) -> None:
     types, coords = (tensor.cuda() for tensor in square)
-    with pytest.raises(NotImplementedError, match="CUDA"):
-        RandomizeSubpathStartPoints()(Outline(types, coords))
+    output = RandomizeSubpathStartPoints()(Outline(types, coords))
+    assert output.types.device.type == "cuda"
+    assert output.coords.device.type == "cuda"
+
+
+@pytest.mark.parametrize("value", [0.0, 0.3, 0.6, 0.99])
+def test_set_subpath_start_points_rotates_explicit_closure_like_rust(
+    value: float,
+) -> None:
+    outline = _explicitly_closed_square()
+    values = torch.full((7,), value)
+
+    output = F.set_subpath_start_points(outline, values)
+    types, coords = _ops.set_subpath_start_points(outline.types, outline.coords, values)
+
+    assert torch.equal(output.types, types)
+    assert torch.equal(output.coords, coords)
+
+
+@pytest.mark.parametrize("value", [0.0, 0.3, 0.6, 0.99])
+def test_set_subpath_start_points_inserts_the_closing_edge_like_rust(
+    square: tuple[torch.Tensor, torch.Tensor], value: float
+) -> None:
+    outline = Outline(*square)
+    values = torch.full((6,), value)
+
+    output = F.set_subpath_start_points(outline, values)
+    types, coords = _ops.set_subpath_start_points(outline.types, outline.coords, values)
+
+    assert torch.equal(output.types, types)
+    assert torch.equal(output.coords, coords)
+
+
+def test_set_subpath_start_points_of_a_padded_batch_matches_each_row(
+    square: tuple[torch.Tensor, torch.Tensor],
+    open_subpath: tuple[torch.Tensor, torch.Tensor],
+) -> None:
+    outlines = [_explicitly_closed_square(), Outline(*square), Outline(*open_subpath)]
+    batch = pad_outlines(outlines)
+    values = torch.rand(3, batch.types.size(-1))
+
+    output = F.set_subpath_start_points(batch, values)
+
+    for row, outline, row_values in zip(
+        unpad_outlines(output), outlines, values, strict=True
+    ):
+        expected = F.set_subpath_start_points(
+            outline, row_values[: outline.types.size(-1)]
+        )
+        assert torch.equal(row.types, expected.types)
+        assert torch.equal(row.coords, expected.coords)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 import torch
+from torch._subclasses.fake_tensor import FakeTensorMode
 from torch.library import CustomOpDef, opcheck
 
 import torchfont._ops as ops
@@ -57,11 +58,14 @@ def _cases() -> list[tuple[str, CustomOpDef, tuple[object, ...]]]:
     pair = (outline.types, outline.coords)
     values = torch.rand(16, generator=torch.Generator().manual_seed(0))
     return [
-        ("remove_overlaps", ops.remove_overlaps, pair),
+        ("remove_overlaps", ops.remove_overlaps, (*pair, 512)),
+        ("remove_overlaps_parallel", ops.remove_overlaps, (*pair, 0)),
         ("cubic_to_quad", ops.cubic_to_quad, pair),
+        ("cubic_to_quad_capacity", ops.cubic_to_quad, (*pair, 64)),
         ("merge_curves", ops.merge_curves, pair),
         ("quad_to_cubic", ops.quad_to_cubic, (*pair, False)),
         ("quad_to_cubic_merged", ops.quad_to_cubic, (*pair, True)),
+        ("quad_to_cubic_capacity", ops.quad_to_cubic, (*pair, True, 64)),
         (
             "normalize_subpath_start_points",
             ops.normalize_subpath_start_points,
@@ -71,7 +75,11 @@ def _cases() -> list[tuple[str, CustomOpDef, tuple[object, ...]]]:
         ("bbox_center", ops.bbox_center, pair),
         ("set_subpath_start_points", ops.set_subpath_start_points, (*pair, values)),
         ("reorder_subpaths", ops.reorder_subpaths, (*pair, values)),
-        ("remove_overlap_groups", ops.remove_overlap_groups, (*pair, values)),
+        (
+            "remove_overlap_groups",
+            ops.remove_overlap_groups,
+            (*pair, values, 512),
+        ),
         (
             "split_segments",
             ops.split_segments,
@@ -165,8 +173,8 @@ def test_bbox_center_of_an_empty_outline_is_the_origin() -> None:
     assert torch.equal(ops.bbox_center(empty.types, empty.coords), torch.zeros(2))
 
 
-def test_native_operators_accept_float32() -> None:
-    dtype = torch.float32
+@pytest.mark.parametrize("dtype", [torch.float32, torch.float16, torch.bfloat16])
+def test_native_operators_accept_native_coords_dtypes(dtype: torch.dtype) -> None:
     outline = _outline().to(dtype)
 
     converted = F.quad_to_cubic(outline)
@@ -178,9 +186,73 @@ def test_native_operators_accept_float32() -> None:
     assert bitmap.dtype is torch.uint8
 
 
-@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16, torch.float64])
-def test_native_operators_reject_unsupported_dtypes(dtype: torch.dtype) -> None:
-    outline = _outline().to(dtype)
+def test_native_operators_reject_unsupported_dtypes() -> None:
+    outline = _outline().to(torch.float64)
 
     with pytest.raises(TypeError, match=r"coords must have dtype torch\.float32"):
         F.quad_to_cubic(outline)
+
+
+@pytest.mark.parametrize(
+    ("op", "args"),
+    [
+        (ops.cubic_to_quad, ()),
+        (ops.merge_curves, ()),
+        (ops.quad_to_cubic, (True,)),
+        (ops.normalize_subpath_start_points, ()),
+        (ops.remove_overlaps, (512,)),
+    ],
+    ids=lambda value: getattr(value, "__name__", None),
+)
+def test_fakes_with_a_capacity_have_static_shapes(
+    op: CustomOpDef, args: tuple[object, ...]
+) -> None:
+    """No unbacked size is allocated, so no ShapeEnv is needed to trace them."""
+    outline = _outline()
+
+    with FakeTensorMode() as mode:
+        types, coords = op(
+            mode.from_tensor(outline.types), mode.from_tensor(outline.coords), *args, 64
+        )
+
+    assert types.shape == (64,)
+    assert coords.shape == (64, 6)
+
+
+def test_capacity_pads_the_result_with_pad_rows() -> None:
+    outline = _outline(9)
+
+    unpadded = F.cubic_to_quad(outline)
+    padded = F.cubic_to_quad(outline, max_elements=128)
+
+    length = unpadded.num_elements
+    assert padded.num_elements == 128
+    assert torch.equal(padded.types[:length], unpadded.types)
+    assert torch.equal(padded.coords[:length], unpadded.coords)
+    assert bool((padded.types[length:] == ElementType.PAD).all())
+    assert int((~padded.padding_mask).sum()) == length
+
+
+def test_capacity_rejects_a_result_that_does_not_fit() -> None:
+    with pytest.raises(ValueError, match="more than max_elements=4"):
+        F.merge_curves(_outline(9), max_elements=4)
+
+
+def test_capacity_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_elements must be positive"):
+        F.cubic_to_quad(_outline(), max_elements=0)
+
+
+def test_compiled_pipeline_with_a_capacity_matches_eager() -> None:
+    def pipeline(types: torch.Tensor, coords: torch.Tensor) -> torch.Tensor:
+        outline = F.cubic_to_quad(Outline(types, coords), max_elements=256)
+        return F.affine(outline, angle=10.0).coords
+
+    torch._dynamo.reset()  # noqa: SLF001
+    compiled = torch.compile(pipeline, fullgraph=True, backend="eager")
+
+    for elements in (5, 9):
+        outline = _outline(elements)
+        result = compiled(outline.types, outline.coords)
+        assert result.shape == (256, 6)
+        assert torch.equal(result, pipeline(outline.types, outline.coords))
@@ -1,8 +1,11 @@
 import pickle
+from typing import cast
 
 import pytest
 import torch
+from torch.utils._pytree import tree_flatten
 
+import torchfont.transforms._transform as transform_module
 from torchfont import (
     ElementType,
     FontRef,
@@ -10,13 +13,23 @@ from torchfont import (
     GlyphRef,
     GlyphSample,
     Outline,
+    pad_outlines,
+    unpad_outlines,
 )
 from torchfont.transforms import (
+    Affine,
     Compose,
+    HorizontalFlip,
     LoadGlyph,
     QuadToCubic,
+    RandomAffine,
     RandomApply,
+    RandomCoordJitter,
+    RandomHorizontalFlip,
+    RandomizeSubpathOrder,
+    RandomizeSubpathStartPoints,
     RandomSplitSegments,
+    RandomVerticalFlip,
     RenderBitmap,
     Transform,
 )
@@ -198,6 +211,172 @@ def test_transform_preserves_module_pre_hook_inputs() -> None:
     assert calls[0][0] is outlines
 
 
+def _glyph_data(outline: Outline) -> GlyphData[Outline]:
+    return GlyphData(
+        data=outline,
+        ref=GlyphRef(FontRef("font.ttf", 0), ord("A")),
+        location={"wght": 500.0},
+        font_idx=1,
+        character_idx=2,
+        weight=500.0,
+        width=None,
+        italic=0.0,
+        slant=None,
+        optical_size=None,
+    )
+
+
+def test_transform_skips_pytree_flatten_for_outline_payloads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*_args: object) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(transform_module, "tree_flatten", fail)
+    data = _glyph_data(_line_outline())
+
+    outline = AddToCoords(1.0)(data.data)
+    output = AddToCoords(1.0)(data)
+
+    assert torch.equal(outline.coords, data.data.coords + 1.0)
+    assert isinstance(output, GlyphData)
+    assert torch.equal(output.data.coords, data.data.coords + 1.0)
+    assert output.ref is data.ref
+    assert output.location is data.location
+    assert (output.font_idx, output.weight, output.width) == (1, 500.0, None)
+    assert IncrementInts()(data).font_idx == 2
+
+
+def test_compose_flattens_once_for_consecutive_transforms(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[object] = []
+
+    def counting_flatten(tree: object) -> object:
+        calls.append(tree)
+        return tree_flatten(tree)
+
+    monkeypatch.setattr(transform_module, "tree_flatten", counting_flatten)
+    transform = Compose([AddToCoords(1.0), AddToCoords(2.0), IncrementInts()])
+
+    outline, count = transform(_line_outline(), 1)
+
+    assert len(calls) == 1
+    assert torch.equal(outline.coords, _line_outline().coords + 3.0)
+    assert count == 2
+
+
+def test_compose_runs_hooked_stages_through_module_call() -> None:
+    hooked = AddToCoords(2.0)
+    calls: list[object] = []
+    hooked.register_forward_hook(lambda _module, _inputs, output: calls.append(output))
+    transform = Compose([AddToCoords(1.0), hooked, AddToCoords(3.0)])
+
+    output = transform(_line_outline())
+
+    assert len(calls) == 1
+    assert isinstance(calls[0], Outline)
+    assert torch.equal(calls[0].coords, _line_outline().coords + 3.0)
+    assert torch.equal(output.coords, _line_outline().coords + 6.0)
+
+
+def test_padded_outline_rows_receive_independent_parameters() -> None:
+    transform = RandomAffine(degrees=45.0)
+    batch = pad_outlines([_line_outline(), _line_outline(3), _line_outline(2)])
+
+    torch.manual_seed(0)
+    output = transform(batch)
+    torch.manual_seed(0)
+    params = transform.make_batch_params([batch], 3)
+
+    assert output.batch_shape == (3,)
+    assert len({float(row_params["angle"]) for row_params in params}) == 3
+    for row, expected, row_params in zip(
+        unpad_outlines(output), unpad_outlines(batch), params, strict=True
+    ):
+        assert torch.allclose(
+            row.coords, transform.transform(expected, row_params).coords
+        )
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [
+        HorizontalFlip(),
+        RandomHorizontalFlip(),
+        RandomVerticalFlip(preserve_winding=False),
+        Affine(angle=30.0, translate=(0.1, -0.2), scale=1.5, shear=10.0),
+        RandomAffine(degrees=45.0, translate=(0.2, 0.1), scale=(0.5, 2.0), shear=15.0),
+        RandomCoordJitter(0.1),
+        RandomizeSubpathOrder(),
+        RandomizeSubpathStartPoints(),
+    ],
+    ids=type,
+)
+def test_vectorized_batches_match_per_row_transform(transform: Transform) -> None:
+    batch = pad_outlines([_line_outline(), _line_outline(4), _line_outline(2)] * 3)
+    params = transform.make_batch_params([batch], 9)
+
+    output = transform.transform_batch(batch, params)
+    expected = Transform.transform_batch(transform, batch, params)
+
+    assert isinstance(output, Outline)
+    assert isinstance(expected, Outline)
+    assert torch.equal(output.types, expected.types)
+    assert torch.allclose(output.coords, expected.coords, atol=1e-5)
+
+
+def test_padded_outlines_in_one_call_share_row_parameters() -> None:
+    batch = pad_outlines([_line_outline(), _line_outline(2)])
+
+    first, second = RandomCoordJitter(0.1)([batch, batch])
+
+    assert torch.equal(first.coords, second.coords)
+
+
+def test_transform_rejects_mixed_single_and_padded_outlines() -> None:
+    batch = pad_outlines([_line_outline(), _line_outline()])
+
+    with pytest.raises(ValueError, match="share one batch dimension"):
+        AddToCoords(1.0)([batch, _line_outline()])
+
+
+def test_batched_draws_parameters_once_per_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*_args: object) -> None:
+        raise AssertionError
+
+    transform = RandomAffine(degrees=45.0)
+    monkeypatch.setattr(transform, "make_params", fail)
+    samples = [_glyph_data(_line_outline()) for _ in range(4)]
+
+    outputs = cast("list[GlyphData[Outline]]", transform.batched(samples))
+
+    assert [type(output) for output in outputs] == [GlyphData] * 4
+    assert all(
+        output.ref is sample.ref
+        for output, sample in zip(outputs, samples, strict=True)
+    )
+    assert len({output.data.coords[1, 4].item() for output in outputs}) == 4
+
+
+def test_compose_and_random_apply_batch_independent_samples() -> None:
+    samples = [_line_outline() for _ in range(3)]
+
+    never = Compose([RandomApply(AddToCoords(1.0), p=0.0)]).batched(samples)
+    always = cast(
+        "list[Outline]",
+        Compose([RandomApply(AddToCoords(1.0), p=1.0)]).batched(samples),
+    )
+
+    assert all(output is sample for output, sample in zip(never, samples, strict=True))
+    assert all(
+        torch.equal(output.coords, sample.coords + 1.0)
+        for output, sample in zip(always, samples, strict=True)
+    )
+
+
 def test_transform_pipeline_is_pickleable() -> None:
     transform = Compose(
         [RandomApply(RandomSplitSegments(split_probability=1.0), p=0.5)]
@@ -226,6 +405,48 @@ def test_load_glyph_repr_contains_location_policy() -> None:
     assert repr(LoadGlyph(location="random")) == "LoadGlyph(location=random)"
 
 
+def test_load_glyph_repr_contains_non_default_types_dtype() -> None:
+    assert repr(LoadGlyph(types_dtype=torch.uint8)) == (
+        "LoadGlyph(location=default, types_dtype=torch.uint8)"
+    )
+
+
+def test_load_glyph_rejects_unsupported_types_dtype() -> None:
+    with pytest.raises(TypeError, match="types_dtype must have dtype"):
+        LoadGlyph(types_dtype=torch.int32)
+
+
+@pytest.mark.parametrize("dtype", [torch.uint8, torch.int8])
+def test_load_glyph_emits_compact_types_natively(dtype: torch.dtype) -> None:
+    sample = _glyph_sample()
+
+    wide = LoadGlyph()(sample.ref)
+    compact = LoadGlyph(types_dtype=dtype)(sample.ref)
+
+    assert compact.types.dtype is dtype
+    assert torch.equal(compact.types.long(), wide.types)
+    assert torch.equal(compact.coords, wide.coords)
+
+
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+def test_load_glyph_emits_reduced_precision_coords_natively(
+    dtype: torch.dtype,
+) -> None:
+    sample = _glyph_sample()
+
+    wide = LoadGlyph()(sample.ref)
+    reduced = LoadGlyph(coords_dtype=dtype)(sample.ref)
+
+    assert reduced.dtype is dtype
+    assert torch.equal(reduced.types, wide.types)
+    assert torch.equal(reduced.coords, wide.coords.to(dtype))
+
+
+def test_load_glyph_rejects_unsupported_coords_dtype() -> None:
+    with pytest.raises(TypeError, match="coords_dtype must have dtype"):
+        LoadGlyph(coords_dtype=torch.float64)
+
+
 def test_load_glyph_rejects_invalid_location_policy() -> None:
     with pytest.raises(ValueError, match="location must be 'default' or 'random'"):
         LoadGlyph(location="invalid")  # ty: ignore[invalid-argument-type]
@@ -25,36 +25,48 @@ References:
 Package Layout:
     Core data types are available directly from ``torchfont``. Other public
     APIs live in submodules such as ``torchfont.datasets``,
-    ``torchfont.glyphsets``, ``torchfont.nn`` and ``torchfont.transforms``.
+    ``torchfont.glyphsets``, ``torchfont.nn``, ``torchfont.profiling`` and
+    ``torchfont.transforms``.
 
 """
 
 from torchfont._font import FontRef
+from torchfont._font_io import FontIO, font_io, set_font_io
 from torchfont._glyph import GlyphData, GlyphRef, GlyphSample
 from torchfont._outline import (
     COORD_DIM,
     TYPE_DIM,
     ElementType,
     Outline,
+    RaggedOutline,
     pad_outlines,
     unpad_outlines,
 )
+from torchfont._stats import IOStats, reset_stats, stats
 
-from . import datasets, glyphsets, nn, transforms
+from . import datasets, glyphsets, nn, profiling, transforms
 
 __all__ = [
     "COORD_DIM",
     "TYPE_DIM",
     "ElementType",
+    "FontIO",
     "FontRef",
     "GlyphData",
     "GlyphRef",
     "GlyphSample",
+    "IOStats",
     "Outline",
+    "RaggedOutline",
     "datasets",
+    "font_io",
     "glyphsets",
     "nn",
     "pad_outlines",
+    "profiling",
+    "reset_stats",
+    "set_font_io",
+    "stats",
     "transforms",
     "unpad_outlines",
 ]
@@ -0,0 +1,81 @@
+"""Process-wide access hints for font files."""
+
+from __future__ import annotations
+
+from typing import Literal, TypedDict
+
+from torchfont import _torchfont
+
+AccessPattern = Literal["normal", "random", "sequential"]
+
+
+class FontIO(TypedDict):
+    """Options applied to every font file opened afterwards in this process."""
+
+    access: AccessPattern
+    will_need_outlines: bool
+    eager_read_max_bytes: int
+
+
+def _font_io(options: tuple[AccessPattern, bool, int]) -> FontIO:
+    access, will_need_outlines, eager_read_max_bytes = options
+    return {
+        "access": access,
+        "will_need_outlines": will_need_outlines,
+        "eager_read_max_bytes": eager_read_max_bytes,
+    }
+
+
+def font_io() -> FontIO:
+    """Return the current font I/O options."""
+    return _font_io(_torchfont.font_io_options())
+
+
+def set_font_io(
+    *,
+    access: AccessPattern | None = None,
+    will_need_outlines: bool | None = None,
+    eager_read_max_bytes: int | None = None,
+) -> FontIO:
+    """Change how font files are opened and return the previous options.
+
+    Options left as ``None`` keep their current value. The options are
+    process-wide. Forked ``DataLoader`` workers inherit them; with the
+    ``spawn`` start method, set them in ``worker_init_fn``.
+
+    Args:
+        access: Expected access pattern of memory-mapped fonts, passed to the
+            kernel as ``madvise`` advice on Unix. ``"random"`` suits shuffled
+            glyph access in large fonts, where read-ahead around each fault
+            mostly loads glyphs that are not needed. Ignored on other
+            platforms.
+        will_need_outlines: Ask the kernel to start reading the outline tables
+            (``glyf``, ``loca``, ``CFF``, ``CFF2``, ``gvar``) as soon as a font
+            is opened for drawing. Unix only.
+        eager_read_max_bytes: Read font files up to this size fully into memory
+            instead of mapping them, which avoids page faults and ``mmap``
+            setup for small fonts. ``0``, the default, maps every file.
+
+    """
+    if eager_read_max_bytes is not None and eager_read_max_bytes < 0:
+        msg = f"eager_read_max_bytes must be non-negative, got {eager_read_max_bytes}"
+        raise ValueError(msg)
+    current = font_io()
+    return _font_io(
+        _torchfont.set_font_io_options(
+            current["access"] if access is None else access,
+            (
+                current["will_need_outlines"]
+                if will_need_outlines is None
+                else will_need_outlines
+            ),
+            (
+                current["eager_read_max_bytes"]
+                if eager_read_max_bytes is None
+                else eager_read_max_bytes
+            ),
+        )
+    )
+
+
+__all__ = ["AccessPattern", "FontIO", "font_io", "set_font_io"]
@@ -46,11 +46,17 @@ class GlyphRef:
 
 @dataclass(frozen=True)
 class GlyphSample:
-    """Dataset-local sample for one font face and codepoint."""
+    """Dataset-local sample for one font face and codepoint.
+
+    ``glyph_id`` is the face's glyph for the codepoint, resolved when the
+    dataset was indexed. ``LoadGlyph`` draws it directly instead of searching
+    the character map again. ``None`` resolves the codepoint at load time.
+    """
 
     ref: GlyphRef
     font_idx: int
     character_idx: int
+    glyph_id: int | None = None
 
 
 @dataclass(frozen=True, eq=False)
@@ -76,7 +82,9 @@ class GlyphData(Generic[T]):
     optical_size: float | None
 
 
-def _flatten_glyph_data(value: GlyphData[Any]) -> tuple[list[Any], object]:
+def _flatten_glyph_data(
+    value: GlyphData[Any],
+) -> tuple[list[Any], tuple[GlyphRef, dict[str, float]]]:
     children = [value.data, *(getattr(value, name) for name in _TARGET_FIELDS)]
     return children, (value.ref, value.location)
 
@@ -11,12 +11,18 @@ Every operator here:
 * takes and returns tensors, never NumPy arrays or Python scalars, so no value
   escapes into the graph as a constant;
 * is registered only for CPU tensors, matching the device of the Rust kernel;
-* accepts the native kernel's actual dtypes: ``torch.long`` element types and
-  ``torch.float32`` coordinates;
+* accepts the native kernel's actual dtypes: ``torch.long``, ``torch.uint8``, or
+  ``torch.int8`` element types and ``torch.float32``, ``torch.float16``, or
+  ``torch.bfloat16`` coordinates, and returns both in the input dtypes;
 * declares a fake implementation so shape propagation works without running the
   kernel. Most of these kernels change the number of path elements, which makes
   the output length data-dependent; those fakes allocate an unbacked dynamic
-  size.
+  size. Those kernels also take an optional ``max_elements`` capacity. With it,
+  the output is padded with ``PAD`` rows to exactly ``max_elements`` and the
+  fake returns that static shape, so a compiled graph specializes once instead
+  of once per output length;
+* reports the time spent decoding its inputs, running Rust, and encoding the
+  result to :mod:`torchfont.profiling` while profiling is on.
 
 None of them register an autograd formula. They reorder or re-encode path
 elements, so no gradient is defined. Callers reject outlines that require grad
@@ -31,7 +37,13 @@ import torch
 from torch import Tensor
 
 from torchfont import _torchfont
-from torchfont._outline import COORD_DIM
+from torchfont._outline import (
+    COORD_DIM,
+    _check_native_coords_dtype,
+    _check_types_dtype,
+    _pad_elements,
+)
+from torchfont.profiling import _kernel_phase, _native_kernel
 
 if TYPE_CHECKING:
     import numpy as np
@@ -39,40 +51,74 @@ if TYPE_CHECKING:
     from torchfont._torchfont import _BitmapMode, _FillRule
 
 
+# NumPy has no bfloat16, so 16-bit coordinates cross into Rust as bit
+# patterns: float16 as int16 and bfloat16 as uint16. The kernel converts them
+# while decoding and writes its output in the same storage.
+_COORDS_STORAGE = {
+    torch.float32: torch.float32,
+    torch.float16: torch.int16,
+    torch.bfloat16: torch.uint16,
+}
+_COORDS_FROM_STORAGE = {storage: dtype for dtype, storage in _COORDS_STORAGE.items()}
+
+
+@_kernel_phase("to_numpy")
 def _arrays(types: Tensor, coords: Tensor) -> tuple[np.ndarray, np.ndarray]:
-    """Return NumPy views accepted by the CPU float32 Rust kernels."""
-    if types.dtype is not torch.long:
-        msg = f"types must have dtype torch.long, got {types.dtype}"
-        raise TypeError(msg)
-    if coords.dtype is not torch.float32:
-        msg = f"coords must have dtype torch.float32, got {coords.dtype}"
-        raise TypeError(msg)
+    """Return NumPy views accepted by the CPU Rust kernels."""
+    _check_types_dtype(types.dtype)
+    _check_native_coords_dtype(coords.dtype)
     return (
         types.detach().contiguous().numpy(),
-        coords.detach().contiguous().reshape(-1).numpy(),
+        coords.detach()
+        .contiguous()
+        .reshape(-1)
+        .view(_COORDS_STORAGE[coords.dtype])
+        .numpy(),
     )
 
 
-def _restore(
+def coords_from_native(raw: np.ndarray) -> Tensor:
+    """Rebuild a ``(N, 6)`` coordinate tensor from native kernel storage."""
+    coords = torch.from_numpy(raw)
+    return coords.view(_COORDS_FROM_STORAGE[coords.dtype]).view(-1, COORD_DIM)
+
+
+@_kernel_phase("to_tensor")
+def tensors_from_native(
     out_types: np.ndarray,
     out_coords: np.ndarray,
+    max_elements: int | None = None,
 ) -> tuple[Tensor, Tensor]:
-    """Rebuild CPU tensors returned by the native kernel."""
-    return (
-        torch.from_numpy(out_types),
-        torch.from_numpy(out_coords).view(-1, COORD_DIM),
-    )
+    """Rebuild CPU tensors returned by the native kernel.
+
+    With ``max_elements``, the outline is padded to that many rows; a result
+    that does not fit raises rather than losing geometry.
+    """
+    types, coords = torch.from_numpy(out_types), coords_from_native(out_coords)
+    if max_elements is None:
+        return types, coords
+    return _pad_elements(types, coords, max_elements)
 
 
-def _dynamic_outline(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
-    """Allocate a fake outline whose element count is data-dependent."""
-    length = torch.library.get_ctx().new_dynamic_size()
+def _dynamic_outline(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
+    """Allocate a fake outline whose element count is data-dependent.
+
+    A ``max_elements`` capacity fixes the element count instead.
+    """
+    length = (
+        torch.library.get_ctx().new_dynamic_size()
+        if max_elements is None
+        else max_elements
+    )
     return (
         types.new_empty(length),
         coords.new_empty(length, COORD_DIM),
     )
 
 
+@_kernel_phase("to_numpy")
 def _selection(values: Tensor) -> np.ndarray:
     if values.dtype is not torch.float32:
         msg = f"selection values must have dtype torch.float32, got {values.dtype}"
@@ -84,44 +130,57 @@ def _selection(values: Tensor) -> np.ndarray:
     "torchfont::quad_to_cubic", mutates_args=(), device_types="cpu"
 )
 def quad_to_cubic(
-    types: Tensor, coords: Tensor, merge_curves: bool
+    types: Tensor, coords: Tensor, merge_curves: bool, max_elements: int | None = None
 ) -> tuple[Tensor, Tensor]:
     """Convert quadratic segments to cubic segments."""
-    out = _torchfont.quad_to_cubic(*_arrays(types, coords), merge_curves)
-    return _restore(*out)
+    with _native_kernel("quad_to_cubic"):
+        out = _torchfont.quad_to_cubic(*_arrays(types, coords), merge_curves)
+        return tensors_from_native(*out, max_elements)
 
 
 @quad_to_cubic.register_fake
-def _(types: Tensor, coords: Tensor, merge_curves: bool) -> tuple[Tensor, Tensor]:
-    if merge_curves:
-        return _dynamic_outline(types, coords)
+def _(
+    types: Tensor, coords: Tensor, merge_curves: bool, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
+    if merge_curves or max_elements is not None:
+        return _dynamic_outline(types, coords, max_elements)
     return types.new_empty(types.shape), coords.new_empty(coords.shape)
 
 
 @torch.library.custom_op(
     "torchfont::cubic_to_quad", mutates_args=(), device_types="cpu"
 )
-def cubic_to_quad(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
+def cubic_to_quad(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
     """Convert cubic segments to sequences of quadratic segments."""
-    out = _torchfont.cubic_to_quad(*_arrays(types, coords))
-    return _restore(*out)
+    with _native_kernel("cubic_to_quad"):
+        out = _torchfont.cubic_to_quad(*_arrays(types, coords))
+        return tensors_from_native(*out, max_elements)
 
 
 @cubic_to_quad.register_fake
-def _(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
-    return _dynamic_outline(types, coords)
+def _(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op("torchfont::merge_curves", mutates_args=(), device_types="cpu")
-def merge_curves(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
+def merge_curves(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
     """Merge adjacent pieces of the same parent curve or line."""
-    out = _torchfont.merge_curves(*_arrays(types, coords))
-    return _restore(*out)
+    with _native_kernel("merge_curves"):
+        out = _torchfont.merge_curves(*_arrays(types, coords))
+        return tensors_from_native(*out, max_elements)
 
 
 @merge_curves.register_fake
-def _(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
-    return _dynamic_outline(types, coords)
+def _(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op(
@@ -130,8 +189,8 @@ def _(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
     device_types="cpu",
     schema=(
         "(Tensor types, Tensor coords, Tensor selection_values, "
-        "Tensor position_values, float split_probability, float[] split_range) "
-        "-> (Tensor, Tensor)"
+        "Tensor position_values, float split_probability, float[] split_range, "
+        "SymInt? max_elements=None) -> (Tensor, Tensor)"
     ),
 )
 def split_segments(
@@ -141,21 +200,23 @@ def split_segments(
     position_values: Tensor,
     split_probability: float,
     split_range: list[float],
+    max_elements: int | None = None,
 ) -> tuple[Tensor, Tensor]:
     """Split segments according to explicit selection and position values.
 
     ``split_range`` is a list rather than a tuple because operator schemas do not
     support tuple arguments.
     """
-    low, high = split_range
-    out = _torchfont.random_split_segments(
-        *_arrays(types, coords),
-        _selection(selection_values),
-        _selection(position_values),
-        split_probability,
-        (low, high),
-    )
-    return _restore(*out)
+    with _native_kernel("split_segments"):
+        low, high = split_range
+        out = _torchfont.random_split_segments(
+            *_arrays(types, coords),
+            _selection(selection_values),
+            _selection(position_values),
+            split_probability,
+            (low, high),
+        )
+        return tensors_from_native(*out, max_elements)
 
 
 @split_segments.register_fake
@@ -166,42 +227,66 @@ def _(
     position_values: Tensor,
     split_probability: float,
     split_range: list[float],
+    max_elements: int | None = None,
 ) -> tuple[Tensor, Tensor]:
     del selection_values, position_values, split_probability, split_range
-    return _dynamic_outline(types, coords)
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op(
     "torchfont::remove_overlaps", mutates_args=(), device_types="cpu"
 )
-def remove_overlaps(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
+def remove_overlaps(
+    types: Tensor,
+    coords: Tensor,
+    parallel_threshold: int,
+    max_elements: int | None = None,
+) -> tuple[Tensor, Tensor]:
     """Merge overlapping subpaths with Skia PathOps winding simplification."""
-    out = _torchfont.remove_overlaps(*_arrays(types, coords))
-    return _restore(*out)
+    with _native_kernel("remove_overlaps"):
+        out = _torchfont.remove_overlaps(*_arrays(types, coords), parallel_threshold)
+        return tensors_from_native(*out, max_elements)
 
 
 @remove_overlaps.register_fake
-def _(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
-    return _dynamic_outline(types, coords)
+def _(
+    types: Tensor,
+    coords: Tensor,
+    parallel_threshold: int,
+    max_elements: int | None = None,
+) -> tuple[Tensor, Tensor]:
+    del parallel_threshold
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op(
     "torchfont::remove_overlap_groups", mutates_args=(), device_types="cpu"
 )
 def remove_overlap_groups(
-    types: Tensor, coords: Tensor, selection_values: Tensor
+    types: Tensor,
+    coords: Tensor,
+    selection_values: Tensor,
+    parallel_threshold: int,
+    max_elements: int | None = None,
 ) -> tuple[Tensor, Tensor]:
     """Simplify overlap groups according to explicit selection values."""
-    out = _torchfont.random_remove_overlaps(
-        *_arrays(types, coords), _selection(selection_values)
-    )
-    return _restore(*out)
+    with _native_kernel("remove_overlap_groups"):
+        out = _torchfont.random_remove_overlaps(
+            *_arrays(types, coords), _selection(selection_values), parallel_threshold
+        )
+        return tensors_from_native(*out, max_elements)
 
 
 @remove_overlap_groups.register_fake
-def _(types: Tensor, coords: Tensor, selection_values: Tensor) -> tuple[Tensor, Tensor]:
-    del selection_values
-    return _dynamic_outline(types, coords)
+def _(
+    types: Tensor,
+    coords: Tensor,
+    selection_values: Tensor,
+    parallel_threshold: int,
+    max_elements: int | None = None,
+) -> tuple[Tensor, Tensor]:
+    del selection_values, parallel_threshold
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op(
@@ -210,66 +295,88 @@ def _(types: Tensor, coords: Tensor, selection_values: Tensor) -> tuple[Tensor,
     device_types="cpu",
 )
 def normalize_subpath_start_points(
-    types: Tensor, coords: Tensor
+    types: Tensor, coords: Tensor, max_elements: int | None = None
 ) -> tuple[Tensor, Tensor]:
     """Choose a deterministic start point for each closed subpath."""
-    out = _torchfont.normalize_subpath_start_points(*_arrays(types, coords))
-    return _restore(*out)
+    with _native_kernel("normalize_subpath_start_points"):
+        out = _torchfont.normalize_subpath_start_points(*_arrays(types, coords))
+        return tensors_from_native(*out, max_elements)
 
 
 @normalize_subpath_start_points.register_fake
-def _(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
-    return _dynamic_outline(types, coords)
+def _(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op(
     "torchfont::set_subpath_start_points", mutates_args=(), device_types="cpu"
 )
 def set_subpath_start_points(
-    types: Tensor, coords: Tensor, selection_values: Tensor
+    types: Tensor,
+    coords: Tensor,
+    selection_values: Tensor,
+    max_elements: int | None = None,
 ) -> tuple[Tensor, Tensor]:
     """Set closed-subpath start points from explicit unit-interval values."""
-    out = _torchfont.randomize_subpath_start_points(
-        *_arrays(types, coords), _selection(selection_values)
-    )
-    return _restore(*out)
+    with _native_kernel("set_subpath_start_points"):
+        out = _torchfont.randomize_subpath_start_points(
+            *_arrays(types, coords), _selection(selection_values)
+        )
+        return tensors_from_native(*out, max_elements)
 
 
 @set_subpath_start_points.register_fake
-def _(types: Tensor, coords: Tensor, selection_values: Tensor) -> tuple[Tensor, Tensor]:
+def _(
+    types: Tensor,
+    coords: Tensor,
+    selection_values: Tensor,
+    max_elements: int | None = None,
+) -> tuple[Tensor, Tensor]:
     del selection_values
-    return _dynamic_outline(types, coords)
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op(
     "torchfont::reorder_subpaths", mutates_args=(), device_types="cpu"
 )
 def reorder_subpaths(
-    types: Tensor, coords: Tensor, keys: Tensor
+    types: Tensor, coords: Tensor, keys: Tensor, max_elements: int | None = None
 ) -> tuple[Tensor, Tensor]:
     """Order subpaths by explicit sort keys."""
-    out = _torchfont.randomize_subpath_order(*_arrays(types, coords), _selection(keys))
-    return _restore(*out)
+    with _native_kernel("reorder_subpaths"):
+        out = _torchfont.randomize_subpath_order(
+            *_arrays(types, coords), _selection(keys)
+        )
+        return tensors_from_native(*out, max_elements)
 
 
 @reorder_subpaths.register_fake
-def _(types: Tensor, coords: Tensor, keys: Tensor) -> tuple[Tensor, Tensor]:
+def _(
+    types: Tensor, coords: Tensor, keys: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
     del keys
-    return _dynamic_outline(types, coords)
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op(
     "torchfont::reverse_closed_subpaths", mutates_args=(), device_types="cpu"
 )
-def reverse_closed_subpaths(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
+def reverse_closed_subpaths(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
     """Reverse the winding direction of every closed subpath."""
-    out = _torchfont.reverse_closed_subpaths(*_arrays(types, coords))
-    return _restore(*out)
+    with _native_kernel("reverse_closed_subpaths"):
+        out = _torchfont.reverse_closed_subpaths(*_arrays(types, coords))
+        return tensors_from_native(*out, max_elements)
 
 
 @reverse_closed_subpaths.register_fake
-def _(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
-    return _dynamic_outline(types, coords)
+def _(
+    types: Tensor, coords: Tensor, max_elements: int | None = None
+) -> tuple[Tensor, Tensor]:
+    return _dynamic_outline(types, coords, max_elements)
 
 
 @torch.library.custom_op("torchfont::bbox_center", mutates_args=(), device_types="cpu")
@@ -279,11 +386,12 @@ def bbox_center(types: Tensor, coords: Tensor) -> Tensor:
     Empty outlines have no bounding box and yield the origin, matching the
     reference frame an affine transform would use for them.
     """
-    result = _torchfont.tight_bbox(*_arrays(types, coords))
-    if result is None:
-        return coords.new_zeros(2)
-    x_min, y_min, x_max, y_max = result
-    return coords.new_tensor([(x_min + x_max) / 2.0, (y_min + y_max) / 2.0])
+    with _native_kernel("bbox_center"):
+        result = _torchfont.tight_bbox(*_arrays(types, coords))
+        if result is None:
+            return coords.new_zeros(2)
+        x_min, y_min, x_max, y_max = result
+        return coords.new_tensor([(x_min + x_max) / 2.0, (y_min + y_max) / 2.0])
 
 
 @bbox_center.register_fake
@@ -309,14 +417,15 @@ def render_bitmap(
     literal string type. The Rust kernel rejects an unknown value, so they are
     passed through rather than validated again here.
     """
-    raw, width, height = _torchfont.render_bitmap(
-        *_arrays(types, coords),
-        size,
-        cast("_BitmapMode", mode),
-        cast("_FillRule", fill_rule),
-        antialias,
-    )
-    return torch.from_numpy(raw).view(height, width)
+    with _native_kernel("render_bitmap"):
+        raw, width, height = _torchfont.render_bitmap(
+            *_arrays(types, coords),
+            size,
+            cast("_BitmapMode", mode),
+            cast("_FillRule", fill_rule),
+            antialias,
+        )
+        return torch.from_numpy(raw).view(height, width)
 
 
 @render_bitmap.register_fake
@@ -338,6 +447,7 @@ def _(
 
 __all__ = [
     "bbox_center",
+    "coords_from_native",
     "cubic_to_quad",
     "merge_curves",
     "normalize_subpath_start_points",
@@ -349,4 +459,5 @@ __all__ = [
     "reverse_closed_subpaths",
     "set_subpath_start_points",
     "split_segments",
+    "tensors_from_native",
 ]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, overload
 
 import torch
+import torch.nn.functional as F  # noqa: N812
 from torch import Tensor
 
 if TYPE_CHECKING:
@@ -38,6 +40,62 @@ class ElementType(IntEnum):
 TYPE_DIM: int = len(ElementType)
 COORD_DIM: int = 6
 
+_TypesDtypeName = Literal["int64", "uint8", "int8"]
+
+# ``uint8`` and ``int8`` hold every element type in one byte. Modules that
+# index with ``types`` convert to ``torch.long`` themselves. Values are the
+# dtype names the native kernels accept.
+_TYPES_DTYPES: dict[torch.dtype, _TypesDtypeName] = {
+    torch.long: "int64",
+    torch.uint8: "uint8",
+    torch.int8: "int8",
+}
+
+
+def _types_dtype_name(dtype: torch.dtype, name: str = "types") -> _TypesDtypeName:
+    """Return the native name of an element type dtype, rejecting others."""
+    dtype_name = _TYPES_DTYPES.get(dtype)
+    if dtype_name is None:
+        msg = (
+            f"{name} must have dtype torch.long, torch.uint8, or torch.int8, "
+            f"got {dtype}"
+        )
+        raise TypeError(msg)
+    return dtype_name
+
+
+def _check_types_dtype(dtype: torch.dtype, name: str = "types") -> None:
+    _types_dtype_name(dtype, name)
+
+
+_CoordsDtypeName = Literal["float32", "float16", "bfloat16"]
+
+# Coordinate dtypes the native kernels read and write without a float32 copy,
+# with the names the kernels accept.
+_NATIVE_COORDS_DTYPES: dict[torch.dtype, _CoordsDtypeName] = {
+    torch.float32: "float32",
+    torch.float16: "float16",
+    torch.bfloat16: "bfloat16",
+}
+
+
+def _native_coords_dtype_name(
+    dtype: torch.dtype, name: str = "coords"
+) -> _CoordsDtypeName:
+    """Return the native name of a coordinate dtype, rejecting others."""
+    dtype_name = _NATIVE_COORDS_DTYPES.get(dtype)
+    if dtype_name is None:
+        msg = (
+            f"{name} must have dtype torch.float32, torch.float16, or "
+            f"torch.bfloat16, got {dtype}"
+        )
+        raise TypeError(msg)
+    return dtype_name
+
+
+def _check_native_coords_dtype(dtype: torch.dtype, name: str = "coords") -> None:
+    _native_coords_dtype_name(dtype, name)
+
 
 @dataclass(frozen=True, eq=False)
 class Outline:
@@ -47,6 +105,8 @@ class Outline:
     ``(*batch, N, 6)`` with rows ``[cx0, cy0, cx1, cy1, x, y]``. Rows correspond
     one-to-one. Coordinates inactive for an element type, including every
     coordinate of ``CLOSE``, ``END``, and ``PAD``, carry no semantic value.
+    ``types`` is ``torch.long`` by default; ``torch.uint8`` and ``torch.int8``
+    are accepted as compact one-byte encodings.
 
     A single glyph has an empty ``batch`` shape; :func:`pad_outlines` stacks
     single glyphs into a batch padded with ``ElementType.PAD``. Most transforms
@@ -86,9 +146,7 @@ class Outline:
                 f"got {tuple(self.types.shape)} and {tuple(self.coords.shape)}"
             )
             raise ValueError(msg)
-        if self.types.dtype is not torch.long:
-            msg = f"types must have dtype torch.long, got {self.types.dtype}"
-            raise TypeError(msg)
+        _check_types_dtype(self.types.dtype)
         if not self.coords.dtype.is_floating_point:
             msg = f"coords must have a floating point dtype, got {self.coords.dtype}"
             raise TypeError(msg)
@@ -145,12 +203,14 @@ class Outline:
         dtype: torch.dtype | None = None,
         *,
         non_blocking: bool = False,
+        types_dtype: torch.dtype | None = None,
     ) -> Outline:
         """Move or cast the outline, following :meth:`torch.Tensor.to`.
 
         As with tensors, a dtype may be passed as the only positional argument.
-        A dtype applies to ``coords`` only and must be floating point, because
-        ``types`` is always ``torch.long``.
+        A dtype applies to ``coords`` only and must be floating point.
+        ``types_dtype`` casts ``types`` to ``torch.long``, ``torch.uint8``, or
+        ``torch.int8``.
         """
         if isinstance(device, torch.dtype):
             if dtype is not None:
@@ -160,8 +220,10 @@ class Outline:
         if dtype is not None and not dtype.is_floating_point:
             msg = f"dtype must be floating point, got {dtype}"
             raise TypeError(msg)
+        if types_dtype is not None:
+            _check_types_dtype(types_dtype, "types_dtype")
         return self._wrap(
-            self.types.to(device=device, non_blocking=non_blocking),
+            self.types.to(device=device, dtype=types_dtype, non_blocking=non_blocking),
             self.coords.to(device=device, dtype=dtype, non_blocking=non_blocking),
         )
 
@@ -192,15 +254,6 @@ class Outline:
             raise ValueError(msg)
         return tuple(self[index] for index in range(self.types.shape[0]))
 
-    def _strip_padding(self) -> Outline:
-        """Drop trailing ``PAD`` elements along the last dimension."""
-        if self.is_batched:
-            msg = "padding can only be stripped from a single outline"
-            raise ValueError(msg)
-        kept = (self.types != ElementType.PAD.value).nonzero()
-        length = 0 if kept.numel() == 0 else int(kept[-1]) + 1
-        return self._wrap(self.types[:length], self.coords[:length])
-
     def __repr__(self) -> str:
         """Summarise shape, dtype, and device instead of dumping both tensors."""
         return (
@@ -209,44 +262,294 @@ class Outline:
         )
 
 
-def pad_outlines(outlines: Sequence[Outline]) -> Outline:
+@overload
+def pad_outlines(
+    outlines: Sequence[Outline], *, return_lengths: Literal[False] = False
+) -> Outline: ...
+
+
+@overload
+def pad_outlines(
+    outlines: Sequence[Outline], *, return_lengths: Literal[True]
+) -> tuple[Outline, Tensor]: ...
+
+
+def pad_outlines(
+    outlines: Sequence[Outline], *, return_lengths: bool = False
+) -> Outline | tuple[Outline, Tensor]:
     """Stack single outlines into one batch padded with ``ElementType.PAD``.
 
-    Every input must be a single glyph on a common device with a common
-    ``coords`` dtype. Shorter outlines are padded to the longest length with
-    ``PAD`` element types and zero coordinates.
+    Every input must be a single glyph on a common device with common
+    ``types`` and ``coords`` dtypes. Shorter outlines are padded to the longest
+    length with ``PAD`` element types and zero coordinates.
+
+    The inputs are concatenated once and scattered into the padded tensors, so
+    the cost does not grow with a Python loop over the batch. With
+    ``return_lengths=True`` the per-outline element counts are also returned as
+    a ``torch.long`` tensor on the outline device; pass them to
+    :func:`unpad_outlines` to skip recounting.
 
     Use :attr:`Outline.padding_mask` on the result to recover which elements are
-    padding, and :meth:`Outline.unbind` to undo the padding.
+    padding, and :func:`unpad_outlines` to undo the padding.
     """
     if len(outlines) == 0:
         msg = "outlines must not be empty"
         raise ValueError(msg)
     first = outlines[0]
-    # Only the dtype is checked: a mismatched shape or device makes the copy
-    # below raise, while a mismatched dtype would silently cast the coordinates.
+    # Only dtypes are checked: a mismatched shape or device makes the scatter
+    # below raise, while a mismatched dtype would silently cast.
     if any(outline.dtype != first.dtype for outline in outlines):
         msg = "all outlines must share one coords dtype"
         raise ValueError(msg)
-    length = max(outline.num_elements for outline in outlines)
-    types = first.types.new_full((len(outlines), length), ElementType.PAD.value)
-    coords = first.coords.new_zeros((len(outlines), length, COORD_DIM))
-    for index, outline in enumerate(outlines):
-        end = outline.num_elements
-        types[index, :end] = outline.types
-        coords[index, :end] = outline.coords
-    return Outline._wrap(types, coords)  # noqa: SLF001
-
-
-def unpad_outlines(outline: Outline) -> tuple[Outline, ...]:
-    """Split a padded one-dimensional batch and remove trailing padding."""
+    if any(outline.types.dtype != first.types.dtype for outline in outlines):
+        msg = "all outlines must share one types dtype"
+        raise ValueError(msg)
+    counts = [outline.num_elements for outline in outlines]
+    lengths = torch.tensor(counts, dtype=torch.long, device=first.device)
+    batch = _scatter_padded(
+        torch.cat([outline.types for outline in outlines]),
+        torch.cat([outline.coords for outline in outlines]),
+        lengths,
+        total=sum(counts),
+        length=max(counts),
+    )
+    if return_lengths:
+        return batch, lengths
+    return batch
+
+
+def _scatter_padded(
+    types: Tensor, coords: Tensor, lengths: Tensor, *, total: int, length: int
+) -> Outline:
+    """Scatter concatenated elements into a batch padded to ``length``."""
+    starts = lengths.cumsum(0) - lengths
+    # Row and column of every concatenated element inside the padded batch.
+    rows = torch.arange(len(lengths), device=lengths.device).repeat_interleave(
+        lengths, output_size=total
+    )
+    columns = torch.arange(total, device=lengths.device) - starts.repeat_interleave(
+        lengths, output_size=total
+    )
+    padded_types = types.new_full((len(lengths), length), ElementType.PAD.value)
+    padded_coords = coords.new_zeros((len(lengths), length, COORD_DIM))
+    padded_types[rows, columns] = types
+    padded_coords[rows, columns] = coords
+    return Outline._wrap(padded_types, padded_coords)  # noqa: SLF001
+
+
+def _pad_elements(
+    types: Tensor, coords: Tensor, max_elements: int
+) -> tuple[Tensor, Tensor]:
+    """Pad ``(..., N)`` outlines with ``PAD`` rows to ``max_elements``.
+
+    A result that does not fit raises rather than losing geometry.
+    """
+    length = types.size(-1)
+    if length > max_elements:
+        msg = f"the result has {length} elements, more than max_elements={max_elements}"
+        raise ValueError(msg)
+    padding = max_elements - length
+    return F.pad(types, (0, padding)), F.pad(coords, (0, 0, 0, padding))
+
+
+def unpad_outlines(
+    outline: Outline, lengths: Tensor | Sequence[int] | None = None
+) -> tuple[Outline, ...]:
+    """Split a padded one-dimensional batch and remove trailing padding.
+
+    ``lengths`` gives the number of elements to keep in each row, as returned by
+    ``pad_outlines(..., return_lengths=True)``. Without it, the lengths are
+    counted as the non-``PAD`` elements of each row in one pass. Either way the
+    lengths are read back to the host at most once, and each result is a view
+    into the batch.
+    """
     if len(outline.batch_shape) != 1:
         msg = (
             "unpad_outlines requires exactly one batch dimension, got "
             f"{tuple(outline.batch_shape)}"
         )
         raise ValueError(msg)
-    return tuple(part._strip_padding() for part in outline.unbind())  # noqa: SLF001
+    if lengths is None:
+        lengths = (outline.types != ElementType.PAD.value).sum(-1)
+    counts = lengths.tolist() if isinstance(lengths, Tensor) else list(lengths)
+    if len(counts) != len(outline):
+        msg = (
+            f"lengths must have one entry per outline, got {len(counts)} "
+            f"for a batch of {len(outline)}"
+        )
+        raise ValueError(msg)
+    return tuple(
+        Outline._wrap(outline.types[row, :count], outline.coords[row, :count])  # noqa: SLF001
+        for row, count in enumerate(counts)
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class RaggedOutline:
+    """A variable-length batch of outlines stored without padding.
+
+    ``values`` is a single :class:`Outline` holding every glyph back to back,
+    and ``offsets`` is a ``(B + 1,)`` ``torch.long`` tensor on the same device
+    whose entries ``offsets[i]:offsets[i + 1]`` select glyph ``i``. Offsets
+    start at ``0``, never decrease, and end at ``values.num_elements``; only
+    their shape, dtype, and device are checked, to avoid a device sync.
+
+    A period and a CJK glyph in the same batch cost their own lengths rather
+    than the longest one. ``OutlineEmbedding`` and the losses in
+    ``torchfont.nn`` accept a ``RaggedOutline`` directly and work on the flat
+    ``(T, ...)`` elements.
+    """
+
+    values: Outline
+    offsets: Tensor
+
+    def __post_init__(self) -> None:
+        """Reject inconsistent values and offsets at construction."""
+        if self.values.is_batched:
+            msg = "values must be a single outline holding every element"
+            raise ValueError(msg)
+        if self.offsets.ndim != 1 or self.offsets.numel() == 0:
+            msg = f"offsets must have shape (B + 1,), got {tuple(self.offsets.shape)}"
+            raise ValueError(msg)
+        if self.offsets.dtype is not torch.long:
+            msg = f"offsets must have dtype torch.long, got {self.offsets.dtype}"
+            raise TypeError(msg)
+        if self.offsets.device != self.values.device:
+            msg = "values and offsets must be on the same device"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_outlines(cls, outlines: Sequence[Outline]) -> RaggedOutline:
+        """Concatenate single outlines without padding them."""
+        if len(outlines) == 0:
+            msg = "outlines must not be empty"
+            raise ValueError(msg)
+        first = outlines[0]
+        if any(outline.is_batched for outline in outlines):
+            msg = "from_outlines requires single outlines"
+            raise ValueError(msg)
+        if any(outline.dtype != first.dtype for outline in outlines):
+            msg = "all outlines must share one coords dtype"
+            raise ValueError(msg)
+        if any(outline.types.dtype != first.types.dtype for outline in outlines):
+            msg = "all outlines must share one types dtype"
+            raise ValueError(msg)
+        counts = [0, *(outline.num_elements for outline in outlines)]
+        offsets = torch.tensor(counts, dtype=torch.long, device=first.device)
+        values = Outline._wrap(  # noqa: SLF001
+            torch.cat([outline.types for outline in outlines]),
+            torch.cat([outline.coords for outline in outlines]),
+        )
+        return cls(values, offsets.cumsum(0))
+
+    @classmethod
+    def from_padded(
+        cls, outline: Outline, lengths: Tensor | None = None
+    ) -> RaggedOutline:
+        """Drop the padding of a one-dimensional batch.
+
+        ``lengths`` defaults to the number of non-``PAD`` elements per row, as
+        in :func:`unpad_outlines`.
+        """
+        if len(outline.batch_shape) != 1:
+            msg = (
+                "from_padded requires exactly one batch dimension, got "
+                f"{tuple(outline.batch_shape)}"
+            )
+            raise ValueError(msg)
+        if lengths is None:
+            lengths = (outline.types != ElementType.PAD.value).sum(-1)
+        lengths = lengths.to(device=outline.device, dtype=torch.long)
+        positions = torch.arange(outline.num_elements, device=outline.device)
+        keep = positions < lengths.unsqueeze(-1)
+        values = Outline._wrap(outline.types[keep], outline.coords[keep])  # noqa: SLF001
+        return cls(values, torch.cat([lengths.new_zeros(1), lengths.cumsum(0)]))
+
+    @property
+    def types(self) -> Tensor:
+        """Flat ``(T,)`` element types of every glyph."""
+        return self.values.types
+
+    @property
+    def coords(self) -> Tensor:
+        """Flat ``(T, 6)`` coordinates of every glyph."""
+        return self.values.coords
+
+    @property
+    def lengths(self) -> Tensor:
+        """Number of elements in each glyph, shape ``(B,)``."""
+        return self.offsets.diff()
+
+    @property
+    def batch_index(self) -> Tensor:
+        """Glyph index of every flat element, shape ``(T,)``.
+
+        Use it with :meth:`torch.Tensor.index_add_` or ``scatter_reduce`` for
+        per-glyph reductions over flat features.
+        """
+        return torch.arange(len(self), device=self.device).repeat_interleave(
+            self.lengths, output_size=self.values.num_elements
+        )
+
+    @property
+    def dtype(self) -> torch.dtype:
+        """Floating point dtype of ``coords``."""
+        return self.values.dtype
+
+    @property
+    def device(self) -> torch.device:
+        """Device shared by ``values`` and ``offsets``."""
+        return self.values.device
+
+    def __len__(self) -> int:
+        """Return the number of glyphs in the batch."""
+        return self.offsets.shape[0] - 1
+
+    def to(
+        self,
+        device: torch.device | str | int | torch.dtype | None = None,
+        dtype: torch.dtype | None = None,
+        *,
+        non_blocking: bool = False,
+        types_dtype: torch.dtype | None = None,
+    ) -> RaggedOutline:
+        """Move or cast the batch, following :meth:`Outline.to`."""
+        values = self.values.to(
+            device, dtype, non_blocking=non_blocking, types_dtype=types_dtype
+        )
+        offsets = self.offsets.to(device=values.device, non_blocking=non_blocking)
+        return RaggedOutline(values, offsets)
+
+    def pin_memory(self) -> RaggedOutline:
+        """Return this batch with every tensor in pinned memory."""
+        return RaggedOutline(self.values.pin_memory(), self.offsets.pin_memory())
+
+    def to_padded(self) -> Outline:
+        """Return the equivalent batch padded with ``ElementType.PAD``."""
+        lengths = self.lengths
+        length = int(lengths.max()) if len(self) > 0 else 0
+        return _scatter_padded(
+            self.types,
+            self.coords,
+            lengths,
+            total=self.values.num_elements,
+            length=length,
+        )
+
+    def unbind(self) -> tuple[Outline, ...]:
+        """Split into single outlines that are views into ``values``."""
+        bounds = self.offsets.tolist()
+        return tuple(
+            self.values[start:end] for start, end in itertools.pairwise(bounds)
+        )
+
+    def __repr__(self) -> str:
+        """Summarise the batch instead of dumping its tensors."""
+        return (
+            f"RaggedOutline(batch_size={len(self)}, "
+            f"num_elements={self.values.num_elements}, dtype={self.dtype}, "
+            f"device={self.device})"
+        )
 
 
 __all__ = [
@@ -254,6 +557,7 @@ __all__ = [
     "TYPE_DIM",
     "ElementType",
     "Outline",
+    "RaggedOutline",
     "pad_outlines",
     "unpad_outlines",
 ]
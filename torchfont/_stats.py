@@ -0,0 +1,110 @@
+"""Process-wide counters for font-file I/O and glyph drawing."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import TypedDict
+
+from torchfont import _torchfont
+
+
+class IOStats(TypedDict):
+    """Counters accumulated since the last :func:`reset_stats`.
+
+    Page-fault counts come from ``getrusage`` and are ``None`` on platforms
+    without it.
+    """
+
+    files_mapped: int
+    bytes_mapped: int
+    files_read: int
+    bytes_read: int
+    map_failures: int
+    cache_hits: int
+    cache_misses: int
+    files_prefetched: int
+    bytes_prefetched: int
+    glyph_draws: int
+    glyph_draw_seconds: float
+    elapsed_seconds: float
+    minor_page_faults: int | None
+    major_page_faults: int | None
+
+
+def _page_faults() -> tuple[int, int] | tuple[None, None]:
+    if sys.platform == "win32":
+        return None, None
+    import resource  # noqa: PLC0415
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_minflt, usage.ru_majflt
+
+
+class _Baseline:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.time = time.perf_counter()
+        self.minor_faults, self.major_faults = _page_faults()
+
+
+_BASELINE = _Baseline()
+
+
+def _stats(native: dict[str, int], baseline: _Baseline) -> IOStats:
+    minor, major = _page_faults()
+    return {
+        "files_mapped": native["files_mapped"],
+        "bytes_mapped": native["bytes_mapped"],
+        "files_read": native["files_read"],
+        "bytes_read": native["bytes_read"],
+        "map_failures": native["map_failures"],
+        "cache_hits": native["cache_hits"],
+        "cache_misses": native["cache_misses"],
+        "files_prefetched": native["files_prefetched"],
+        "bytes_prefetched": native["bytes_prefetched"],
+        "glyph_draws": native["glyph_draws"],
+        "glyph_draw_seconds": native["glyph_draw_nanos"] / 1e9,
+        "elapsed_seconds": time.perf_counter() - baseline.time,
+        "minor_page_faults": (
+            None
+            if minor is None or baseline.minor_faults is None
+            else minor - baseline.minor_faults
+        ),
+        "major_page_faults": (
+            None
+            if major is None or baseline.major_faults is None
+            else major - baseline.major_faults
+        ),
+    }
+
+
+def stats() -> IOStats:
+    """Return the font I/O counters of this process since the last reset.
+
+    The counters cover opening font files, by memory-mapping them or by reading
+    small ones onto the heap, and drawing glyph outlines in the native
+    extension. They are kept per process: every ``DataLoader`` worker
+    starts from zero, so call this inside the worker to see its own I/O.
+    """
+    return _stats(_torchfont.io_stats(), _BASELINE)
+
+
+def reset_stats() -> IOStats:
+    """Zero the font I/O counters, for example once per epoch.
+
+    Returns the values the counters held before the reset.
+    """
+    previous = _stats(_torchfont.reset_io_stats(), _BASELINE)
+    _BASELINE.reset()
+    return previous
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_stats)
+
+
+__all__ = ["IOStats", "reset_stats", "stats"]
@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from os import PathLike
 from pathlib import Path
 from typing import Literal, TypeAlias
 
@@ -6,6 +7,7 @@ import numpy as np
 
 _BitmapMode: TypeAlias = Literal["fixed", "bbox", "bbox_square"]
 _FillRule: TypeAlias = Literal["winding", "even_odd"]
+_Access: TypeAlias = Literal["normal", "random", "sequential"]
 
 def cubic_to_quad(
     types: np.ndarray, coords: np.ndarray
@@ -42,10 +44,13 @@ def reverse_closed_subpaths(
     types: np.ndarray, coords: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray]: ...
 def remove_overlaps(
-    types: np.ndarray, coords: np.ndarray
+    types: np.ndarray, coords: np.ndarray, parallel_threshold: int
 ) -> tuple[np.ndarray, np.ndarray]: ...
 def random_remove_overlaps(
-    types: np.ndarray, coords: np.ndarray, random_values: np.ndarray
+    types: np.ndarray,
+    coords: np.ndarray,
+    random_values: np.ndarray,
+    parallel_threshold: int,
 ) -> tuple[np.ndarray, np.ndarray]: ...
 def quad_to_cubic(
     types: np.ndarray, coords: np.ndarray, merge_curves: bool
@@ -56,6 +61,19 @@ def tight_bbox(
 
 class GlyphIndex:
     sample_count: int
+    def __init__(
+        self,
+        fonts: Sequence[tuple[str, int, Sequence[int], Sequence[int]]],
+        source: tuple[
+            str,
+            Sequence[str] | None,
+            Sequence[int] | None,
+            bool | None,
+            Sequence[str],
+        ]
+        | None = None,
+        character_codepoints: Sequence[int] | None = None,
+    ) -> None: ...
     @classmethod
     def from_root(
         cls,
@@ -65,15 +83,42 @@ class GlyphIndex:
     ) -> GlyphIndex: ...
     def font_refs(self) -> list[tuple[Path, int]]: ...
     def character_codepoints(self) -> list[int]: ...
-    def locate(self, idx: int) -> tuple[Path, int, int, int, int]: ...
+    @classmethod
+    def from_root_glyphs(
+        cls,
+        root: str,
+        patterns: Sequence[str] | None,
+        encoded: bool,
+    ) -> GlyphIndex: ...
+    def update(
+        self, added: Sequence[str], removed: Sequence[str], stable: bool
+    ) -> GlyphIndex: ...
+    def refresh(self, stable: bool) -> GlyphIndex: ...
+    def locate(
+        self, idx: int
+    ) -> tuple[Path, int, int, int | None, int | None, int]: ...
     def font_targets(self) -> np.ndarray: ...
     def character_targets(self) -> np.ndarray: ...
+    def element_counts(self) -> np.ndarray: ...
+    def outline_hashes(self) -> np.ndarray: ...
+    def __getstate__(self) -> tuple[np.ndarray, np.ndarray] | None: ...
+    def __setstate__(self, state: tuple[np.ndarray, np.ndarray]) -> None: ...
 
 def load_glyph(
     path: str,
     ttc_index: int,
     codepoint: int,
-    location: dict[str, float] | None = ...,
+    location: dict[str, float] | None = None,
+    types_dtype: Literal["int64", "uint8", "int8"] = "int64",
+    coords_dtype: Literal["float32", "float16", "bfloat16"] = "float32",
+) -> tuple[np.ndarray, np.ndarray]: ...
+def load_glyph_id(
+    path: str,
+    ttc_index: int,
+    glyph_id: int,
+    location: dict[str, float] | None = None,
+    types_dtype: Literal["int64", "uint8", "int8"] = "int64",
+    coords_dtype: Literal["float32", "float16", "bfloat16"] = "float32",
 ) -> tuple[np.ndarray, np.ndarray]: ...
 def variation_axes(
     path: str,
@@ -95,3 +140,19 @@ LATIN_CORE: list[int]
 LATIN_KERNEL: list[int]
 
 def get_glyphset_codepoints(glyphset_name: str) -> list[int]: ...
+def io_stats() -> dict[str, int]: ...
+def reset_io_stats() -> dict[str, int]: ...
+def font_io_options() -> tuple[_Access, bool, int]: ...
+def set_font_io_options(
+    access: _Access,
+    will_need_outlines: bool,
+    eager_read_max_bytes: int,
+) -> tuple[_Access, bool, int]: ...
+
+class FontPrefetcher:
+    ahead_bytes: int
+    pending: int
+    def __init__(self, budget_bytes: int) -> None: ...
+    def submit(self, paths: Sequence[str | PathLike[str]]) -> int: ...
+    def advance(self, seq: int) -> None: ...
+    def close(self) -> None: ...
@@ -1,5 +1,15 @@
 """Map-style datasets for local font collections."""
 
 from torchfont.datasets._glyph import GlyphDataset
+from torchfont.datasets._glyph_id import GlyphIdDataset
+from torchfont.datasets._prefetch import FontPrefetchSampler
+from torchfont.datasets._sampler import BucketBySequenceLengthSampler
+from torchfont.datasets._vocabulary import ClassVocabulary
 
-__all__ = ["GlyphDataset"]
+__all__ = [
+    "BucketBySequenceLengthSampler",
+    "ClassVocabulary",
+    "FontPrefetchSampler",
+    "GlyphDataset",
+    "GlyphIdDataset",
+]
@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
 import torch
 from torch import Tensor
 from torch.utils.data import Dataset
 
 from torchfont._font import FontRef
+from torchfont._glyph import GlyphRef, GlyphSample
 from torchfont.datasets._utils import normalize_codepoints, normalize_patterns
+from torchfont.datasets._vocabulary import ClassVocabulary, font_key, parse_font_key
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
@@ -26,6 +28,7 @@ class _BaseGlyphDataset(Dataset[T], Generic[T]):
     """Common configuration and targets for map-style glyph datasets."""
 
     _index: _torchfont.GlyphIndex
+    _class_maps: tuple[_torchfont.GlyphIndex, list[int], list[int]] | None = None
 
     def __init__(
         self,
@@ -34,18 +37,33 @@ class _BaseGlyphDataset(Dataset[T], Generic[T]):
         codepoints: Sequence[SupportsIndex] | None,
         patterns: str | Sequence[str] | None,
         transform: Callable[[object], T] | None,
+        vocabulary: ClassVocabulary | Path | str | None = None,
     ) -> None:
         self.root = Path(root).expanduser().resolve()
         self.transform = transform
         self.patterns = normalize_patterns(patterns)
         self.codepoints = normalize_codepoints(codepoints)
+        self.vocabulary = (
+            vocabulary
+            if vocabulary is None or isinstance(vocabulary, ClassVocabulary)
+            else ClassVocabulary.load(vocabulary)
+        )
 
     def __len__(self) -> int:
         return int(self._index.sample_count)
 
     @property
     def font_classes(self) -> list[FontRef]:
-        """Font references sorted by dataset-local font index."""
+        """Font references sorted by font index.
+
+        With a vocabulary, these are its fonts under ``root``, whether or not
+        they were found, and the unknown bucket has no entry.
+        """
+        if self.vocabulary is not None:
+            return [
+                FontRef(self.root / path, ttc_index)
+                for path, ttc_index in map(parse_font_key, self.vocabulary.fonts)
+            ]
         return [
             FontRef(path=os.fspath(path), ttc_index=ttc_index)
             for path, ttc_index in self._index.font_refs()
@@ -53,20 +71,189 @@ class _BaseGlyphDataset(Dataset[T], Generic[T]):
 
     @property
     def character_classes(self) -> list[str]:
-        """Unicode characters sorted by dataset-local character index."""
-        return [chr(codepoint) for codepoint in self._index.character_codepoints()]
+        """Unicode characters sorted by character index.
+
+        With a vocabulary, these are its characters, and the unknown bucket has
+        no entry.
+        """
+        codepoints = (
+            self.vocabulary.codepoints
+            if self.vocabulary is not None
+            else self._index.character_codepoints()
+        )
+        return [chr(codepoint) for codepoint in codepoints]
 
     @property
     def character_class_to_idx(self) -> dict[str, int]:
-        """Map Unicode characters to dataset-local class indices."""
+        """Map Unicode characters to character class indices."""
         return {char: idx for idx, char in enumerate(self.character_classes)}
 
     @property
     def font_targets(self) -> Tensor:
         """LongTensor of font target indices for each sample."""
-        return torch.from_numpy(self._index.font_targets())
+        targets = torch.from_numpy(self._index.font_targets())
+        maps = self._vocabulary_maps()
+        return targets if maps is None else torch.tensor(maps[0])[targets]
 
     @property
     def character_targets(self) -> Tensor:
         """LongTensor of character target indices for each sample."""
+        targets = self._local_character_targets()
+        maps = self._vocabulary_maps()
+        return targets if maps is None else torch.tensor(maps[1])[targets]
+
+    def _local_character_targets(self) -> Tensor:
         return torch.from_numpy(self._index.character_targets())
+
+    def _vocabulary_maps(self) -> tuple[list[int], list[int]] | None:
+        # Dataset-local font and character classes mapped to vocabulary
+        # classes, rebuilt whenever update() or refresh() replaced the index.
+        vocabulary = self.vocabulary
+        if vocabulary is None:
+            return None
+        if self._class_maps is None or self._class_maps[0] is not self._index:
+            fonts = {key: idx for idx, key in enumerate(vocabulary.fonts)}
+            characters = {
+                codepoint: idx for idx, codepoint in enumerate(vocabulary.codepoints)
+            }
+            font_map = [
+                fonts.get(
+                    font_key(path, ttc_index, self.root), vocabulary.unknown_font_idx
+                )
+                for path, ttc_index in self._index.font_refs()
+            ]
+            # The trailing -1 keeps unencoded glyphs, whose local class is -1,
+            # without a class.
+            character_map = [
+                *(
+                    characters.get(codepoint, vocabulary.unknown_character_idx)
+                    for codepoint in self._index.character_codepoints()
+                ),
+                -1,
+            ]
+            self._class_maps = (self._index, font_map, character_map)
+        return self._class_maps[1], self._class_maps[2]
+
+    @property
+    def element_counts(self) -> Tensor:
+        """LongTensor of outline lengths at the default location for each sample.
+
+        Lengths count encoded rows, including ``END``, exactly as returned by
+        ``LoadGlyph()``. Outlines are drawn on first access and the result is
+        cached per font, so ``update()`` keeps it for unchanged fonts.
+        """
+        return torch.from_numpy(self._index.element_counts())
+
+    @property
+    def outline_hashes(self) -> Tensor:
+        """LongTensor of outline hashes at the default location for each sample.
+
+        Two samples hash equal when ``LoadGlyph()`` returns equal tensors for
+        them. Hashes are computed in the same pass as ``element_counts``, are
+        cached by the index, and are kept when the dataset is pickled.
+        """
+        return torch.from_numpy(self._index.outline_hashes())
+
+    def _duplicate_groups(self) -> tuple[Tensor, Tensor]:
+        keys = torch.stack(
+            (self._local_character_targets(), self.outline_hashes), dim=1
+        )
+        _, groups, counts = torch.unique(
+            keys, dim=0, return_inverse=True, return_counts=True
+        )
+        return groups, counts
+
+    def unique_mask(self) -> Tensor:
+        """BoolTensor selecting one sample of each set of exact duplicates.
+
+        Samples are duplicates when they share a character class and an outline
+        hash, as with families that fork or subset another family. The first
+        sample of each set is kept. Select the kept samples with
+        ``Subset(dataset, mask.nonzero().squeeze(1).tolist())``.
+        """
+        groups, counts = self._duplicate_groups()
+        first = torch.full((len(counts),), len(self), dtype=torch.long)
+        first.scatter_reduce_(0, groups, torch.arange(len(self)), reduce="amin")
+        mask = torch.zeros(len(self), dtype=torch.bool)
+        mask[first] = True
+        return mask
+
+    def duplicate_weights(self) -> Tensor:
+        """FloatTensor weighting each sample by one over its duplicate count.
+
+        A set of exact duplicates, defined as for ``unique_mask()``, carries
+        the same total weight as one unique sample. Pass the weights to
+        ``WeightedRandomSampler`` to down-weight duplicates instead of dropping
+        them.
+        """
+        groups, counts = self._duplicate_groups()
+        return counts.reciprocal()[groups].to(torch.float32)
+
+    def update(
+        self,
+        added: Sequence[Path | str] = (),
+        removed: Sequence[Path | str] = (),
+        *,
+        stable: bool = False,
+    ) -> None:
+        """Scan ``added`` font files and drop ``removed`` ones in place.
+
+        Relative paths are resolved against ``root``. Passing a file the
+        dataset already covers in ``added`` rescans it, as after the file was
+        modified. Every other font keeps its parsed entry, so only the given
+        files are read.
+
+        By default fonts and characters are renumbered exactly as a fresh
+        dataset over the same files would number them. With ``stable=True``,
+        existing font and character indices never change: removed fonts keep
+        their index with no samples, and new fonts and characters are numbered
+        after the existing ones. Sample indices may change in both modes.
+        """
+        self._index = self._index.update(
+            [self._resolve(path) for path in added],
+            [self._resolve(path) for path in removed],
+            stable,
+        )
+
+    def refresh(self, *, stable: bool = False) -> None:
+        """Rescan ``root`` for added and removed font files in place.
+
+        Only files that appeared since the dataset was built or last updated
+        are read. Modified files are not detected; pass them to ``update()``.
+        ``stable`` has the same meaning as for ``update()``.
+        """
+        self._index = self._index.refresh(stable)
+
+    def _resolve(self, path: Path | str) -> str:
+        return os.path.normpath(self.root / Path(path).expanduser())
+
+    def _prepare_sample(
+        self,
+        located: tuple[Path, int, int, int | None, int | None, int],
+    ) -> T:
+        (
+            path,
+            ttc_index,
+            font_idx,
+            codepoint,
+            character_idx,
+            glyph_id,
+        ) = located
+        maps = self._vocabulary_maps()
+        if maps is not None:
+            font_idx = maps[0][font_idx]
+            if character_idx is not None:
+                character_idx = maps[1][character_idx]
+        # Glyphs no character maps to have neither a codepoint nor a class.
+        sample = GlyphSample(
+            ref=GlyphRef(
+                FontRef(os.fspath(path), ttc_index),
+                -1 if codepoint is None else codepoint,
+            ),
+            font_idx=font_idx,
+            character_idx=-1 if character_idx is None else character_idx,
+            glyph_id=glyph_id,
+        )
+        return (
+            self.transform(sample) if self.transform is not None else cast("T", sample)
+        )
@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING, Generic, SupportsIndex, TypeVar, cast, overload
 
 from torchfont import _torchfont
-from torchfont._font import FontRef
-from torchfont._glyph import GlyphRef, GlyphSample
 from torchfont.datasets._base import _BaseGlyphDataset
 from torchfont.datasets._utils import normalize_index
 
@@ -15,6 +12,9 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
     from pathlib import Path
 
+    from torchfont._glyph import GlyphSample
+    from torchfont.datasets._vocabulary import ClassVocabulary
+
 T = TypeVar("T")
 
 
@@ -30,16 +30,18 @@ class GlyphDataset(_BaseGlyphDataset[T], Generic[T]):
         *,
         codepoints: Sequence[SupportsIndex] | None = None,
         patterns: str | Sequence[str] | None = None,
+        vocabulary: ClassVocabulary | Path | str | None = None,
         transform: None = None,
     ) -> None: ...
 
     @overload
     def __init__(
-        self: GlyphDataset[T],
+        self,
         root: Path | str,
         *,
         codepoints: Sequence[SupportsIndex] | None = None,
         patterns: str | Sequence[str] | None = None,
+        vocabulary: ClassVocabulary | Path | str | None = None,
         transform: Callable[[GlyphSample], T],
     ) -> None: ...
 
@@ -49,6 +51,7 @@ class GlyphDataset(_BaseGlyphDataset[T], Generic[T]):
         *,
         codepoints: Sequence[SupportsIndex] | None = None,
         patterns: str | Sequence[str] | None = None,
+        vocabulary: ClassVocabulary | Path | str | None = None,
         transform: Callable[[GlyphSample], T] | None = None,
     ) -> None:
         super().__init__(
@@ -56,6 +59,7 @@ class GlyphDataset(_BaseGlyphDataset[T], Generic[T]):
             codepoints=codepoints,
             patterns=patterns,
             transform=cast("Callable[[object], T] | None", transform),
+            vocabulary=vocabulary,
         )
         self._index = _torchfont.GlyphIndex.from_root(
             str(self.root), self.codepoints, self.patterns
@@ -79,25 +83,5 @@ class GlyphDataset(_BaseGlyphDataset[T], Generic[T]):
     def __getitem__(self, idx: SupportsIndex) -> T:
         return self._prepare_sample(self._index.locate(normalize_index(idx, len(self))))
 
-    def _prepare_sample(
-        self,
-        located: tuple[Path, int, int, int, int],
-    ) -> T:
-        (
-            path,
-            ttc_index,
-            font_idx,
-            codepoint,
-            character_idx,
-        ) = located
-        sample = GlyphSample(
-            ref=GlyphRef(FontRef(os.fspath(path), ttc_index), codepoint),
-            font_idx=font_idx,
-            character_idx=character_idx,
-        )
-        return (
-            self.transform(sample) if self.transform is not None else cast("T", sample)
-        )
-
 
 __all__ = ["GlyphDataset"]
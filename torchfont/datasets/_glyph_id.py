@@ -0,0 +1,101 @@
+"""Glyph-id dataset covering unencoded glyphs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, SupportsIndex, TypeVar, cast, overload
+
+from torchfont import _torchfont
+from torchfont.datasets._base import _BaseGlyphDataset
+from torchfont.datasets._utils import normalize_index
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from torchfont._glyph import GlyphSample
+    from torchfont.datasets._vocabulary import ClassVocabulary
+
+T = TypeVar("T")
+
+
+class GlyphIdDataset(_BaseGlyphDataset[T], Generic[T]):
+    """Map-style dataset yielding one sample per outline glyph of each face.
+
+    Glyphs are indexed by glyph id, so alternates, ligatures, and other glyphs
+    that no character maps to are included. ``.notdef`` is skipped. A glyph
+    reached through the character map keeps its smallest codepoint and
+    character class. An unencoded glyph has ``ref.codepoint == -1`` and
+    ``character_idx == -1`` and loads only by ``glyph_id``, as ``LoadGlyph``
+    does.
+
+    With ``encoded=False``, glyphs reached through the character map are left
+    out, so the dataset complements a ``GlyphDataset`` over the same faces
+    without repeating its samples.
+    """
+
+    _index: _torchfont.GlyphIndex
+
+    @overload
+    def __init__(
+        self: GlyphIdDataset[GlyphSample],
+        root: Path | str,
+        *,
+        patterns: str | Sequence[str] | None = None,
+        encoded: bool = True,
+        vocabulary: ClassVocabulary | Path | str | None = None,
+        transform: None = None,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        patterns: str | Sequence[str] | None = None,
+        encoded: bool = True,
+        vocabulary: ClassVocabulary | Path | str | None = None,
+        transform: Callable[[GlyphSample], T],
+    ) -> None: ...
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        patterns: str | Sequence[str] | None = None,
+        encoded: bool = True,
+        vocabulary: ClassVocabulary | Path | str | None = None,
+        transform: Callable[[GlyphSample], T] | None = None,
+    ) -> None:
+        super().__init__(
+            root,
+            codepoints=None,
+            patterns=patterns,
+            transform=cast("Callable[[object], T] | None", transform),
+            vocabulary=vocabulary,
+        )
+        self.encoded = encoded
+        self._index = _torchfont.GlyphIndex.from_root_glyphs(
+            str(self.root), self.patterns, encoded
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(root={str(self.root)!r}, samples={len(self)}, "
+            f"font_classes={len(self.font_classes)}, "
+            f"character_classes={len(self.character_classes)}, "
+            f"encoded={self.encoded})"
+        )
+
+    @overload
+    def __getitem__(
+        self: GlyphIdDataset[GlyphSample], idx: SupportsIndex
+    ) -> GlyphSample: ...
+
+    @overload
+    def __getitem__(self, idx: SupportsIndex) -> T: ...
+
+    def __getitem__(self, idx: SupportsIndex) -> T:
+        return self._prepare_sample(self._index.locate(normalize_index(idx, len(self))))
+
+
+__all__ = ["GlyphIdDataset"]
@@ -0,0 +1,109 @@
+"""Font-file prefetching in sampler order."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from operator import index
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from torch.utils.data import Sampler
+
+from torchfont import _torchfont
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from torchfont.datasets._base import _BaseGlyphDataset
+
+T = TypeVar("T", int, list[int])
+
+
+class FontPrefetchSampler(Sampler[T]):
+    """Sampler wrapper that warms the font files of upcoming samples.
+
+    Yields exactly what ``sampler`` yields: sample indices from a sampler, or
+    lists of indices from a batch sampler. While iterating, it reads up to
+    ``lookahead`` items ahead, looks up the font file behind each sample in
+    ``dataset``, and hands the files to a background thread in the native
+    extension. That thread maps each file and touches every page, so the first
+    glyph load from a cold file no longer waits on storage.
+
+    The thread stops once the files it warmed past the current item add up to
+    ``budget_bytes`` and resumes as iteration moves on, so the page cache is
+    not flooded with fonts that are still far away. A single file larger than
+    the budget is warmed on its own. Consecutive samples from the same file
+    submit it once, which makes this a good fit for samplers that keep samples
+    of one font together.
+
+    ``DataLoader`` iterates its sampler in the main process, so the warmed
+    pages land in the page cache shared with every worker. Wrap the sampler
+    passed as ``sampler=`` or ``batch_sampler=`` to match.
+    """
+
+    def __init__(
+        self,
+        sampler: Iterable[T],
+        dataset: _BaseGlyphDataset[Any],
+        *,
+        budget_bytes: int = 256 << 20,
+        lookahead: int = 64,
+    ) -> None:
+        if budget_bytes <= 0:
+            msg = "budget_bytes must be positive"
+            raise ValueError(msg)
+        if lookahead <= 0:
+            msg = "lookahead must be positive"
+            raise ValueError(msg)
+        self.sampler = sampler
+        self.budget_bytes = budget_bytes
+        self.lookahead = lookahead
+        # Dataset-local fonts and targets: with a vocabulary, font_classes and
+        # font_targets use vocabulary classes, which need not name found files.
+        index_ = dataset._index  # noqa: SLF001
+        self._font_paths = [os.fspath(path) for path, _ in index_.font_refs()]
+        self._font_targets: list[int] = index_.font_targets().tolist()
+
+    def __len__(self) -> int:
+        return len(self.sampler)  # ty: ignore[invalid-argument-type]
+
+    def _paths(self, item: T, last: str | None) -> list[str]:
+        indices: list[int] = (
+            cast("list[int]", item) if isinstance(item, list) else [cast("int", item)]
+        )
+        paths: list[str] = []
+        for idx in indices:
+            path = self._font_paths[self._font_targets[index(idx)]]
+            if path != last:
+                paths.append(path)
+                last = path
+        return paths
+
+    def __iter__(self) -> Iterator[T]:
+        prefetcher = _torchfont.FontPrefetcher(self.budget_bytes)
+        items = iter(self.sampler)
+        # Items read ahead, each with the sequence number of its first file.
+        window: deque[tuple[T, int]] = deque()
+        seq = 0
+        last: str | None = None
+        try:
+            while True:
+                while len(window) < self.lookahead:
+                    item = next(items, None)
+                    if item is None:
+                        break
+                    paths = self._paths(item, last)
+                    window.append((item, seq))
+                    if paths:
+                        seq = prefetcher.submit(paths)
+                        last = paths[-1]
+                if not window:
+                    return
+                item, start = window.popleft()
+                prefetcher.advance(start)
+                yield item
+        finally:
+            prefetcher.close()
+
+
+__all__ = ["FontPrefetchSampler"]
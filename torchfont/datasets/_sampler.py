@@ -0,0 +1,110 @@
+"""Length-bucketed batch sampling."""
+
+from __future__ import annotations
+
+from operator import index
+from typing import TYPE_CHECKING
+
+import torch
+from torch import Tensor
+from torch.utils.data import Sampler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from typing import SupportsIndex
+
+
+class BucketBySequenceLengthSampler(Sampler[list[int]]):
+    """Batch sampler that groups samples of similar outline length.
+
+    Samples are ordered by ``lengths`` so every batch holds neighbouring
+    lengths, which keeps the padding added by ``pad_outlines`` small. A batch
+    grows until it would exceed ``batch_size`` samples or ``max_tokens`` padded
+    elements, where the padded size of a batch is its sample count times its
+    longest length. A single sample longer than ``max_tokens`` forms its own
+    batch.
+
+    With ``shuffle=True``, samples of equal length and the order of batches are
+    reshuffled every epoch. Batch boundaries depend only on the sorted lengths,
+    so ``len(sampler)`` is the same in every epoch.
+
+    Pass the result to ``DataLoader(batch_sampler=...)``. For a
+    ``GlyphDataset``, ``dataset.element_counts`` gives the lengths at the
+    default location.
+    """
+
+    def __init__(
+        self,
+        lengths: Tensor | Sequence[SupportsIndex],
+        *,
+        batch_size: int | None = None,
+        max_tokens: int | None = None,
+        shuffle: bool = True,
+        generator: torch.Generator | None = None,
+    ) -> None:
+        if batch_size is None and max_tokens is None:
+            msg = "at least one of batch_size and max_tokens must be given"
+            raise ValueError(msg)
+        if batch_size is not None and batch_size <= 0:
+            msg = "batch_size must be positive"
+            raise ValueError(msg)
+        if max_tokens is not None and max_tokens <= 0:
+            msg = "max_tokens must be positive"
+            raise ValueError(msg)
+        lengths = (
+            lengths.detach().to(device="cpu", dtype=torch.long)
+            if isinstance(lengths, Tensor)
+            else torch.tensor([index(length) for length in lengths], dtype=torch.long)
+        )
+        if lengths.ndim != 1:
+            msg = f"lengths must be 1-D, got shape {tuple(lengths.shape)}"
+            raise ValueError(msg)
+        if (lengths < 0).any():
+            msg = "lengths must be non-negative"
+            raise ValueError(msg)
+        self.lengths = lengths
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens
+        self.shuffle = shuffle
+        self.generator = generator
+        self._batch_sizes = self._plan(lengths.sort().values.tolist())
+
+    def _plan(self, sorted_lengths: list[int]) -> list[int]:
+        sizes: list[int] = []
+        count = 0
+        for length in sorted_lengths:
+            # Lengths ascend, so the sample being added is the longest so far.
+            full = self.batch_size is not None and count == self.batch_size
+            over = (
+                self.max_tokens is not None and (count + 1) * length > self.max_tokens
+            )
+            if count and (full or over):
+                sizes.append(count)
+                count = 0
+            count += 1
+        if count:
+            sizes.append(count)
+        return sizes
+
+    def __len__(self) -> int:
+        """Return the number of batches per epoch."""
+        return len(self._batch_sizes)
+
+    def __iter__(self) -> Iterator[list[int]]:
+        """Yield one list of dataset indices per batch."""
+        if not self.shuffle:
+            order = self.lengths.argsort(stable=True)
+            yield from (batch.tolist() for batch in order.split(self._batch_sizes))
+            return
+        generator = self.generator
+        if generator is None:
+            generator = torch.Generator()
+            generator.manual_seed(int(torch.empty((), dtype=torch.int64).random_()))
+        order = torch.randperm(len(self.lengths), generator=generator)
+        order = order[self.lengths[order].argsort(stable=True)]
+        batches = order.split(self._batch_sizes)
+        for batch_idx in torch.randperm(len(batches), generator=generator).tolist():
+            yield batches[batch_idx].tolist()
+
+
+__all__ = ["BucketBySequenceLengthSampler"]
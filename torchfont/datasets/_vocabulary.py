@@ -0,0 +1,101 @@
+"""Fixed class vocabularies shared across font corpora."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from operator import index
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from os import PathLike
+    from typing import SupportsIndex
+
+    from torchfont.datasets._base import _BaseGlyphDataset
+
+
+@dataclass(frozen=True)
+class ClassVocabulary:
+    """Fixed character and font classes for datasets over growing corpora.
+
+    Character classes are codepoints. Font classes are font keys: the face's
+    path relative to the dataset root in POSIX form, followed by ``#`` and the
+    collection index for faces other than the first. Entry ``i`` of each list
+    is class ``i``, and the index one past the last entry is the unknown
+    bucket for characters and fonts the vocabulary does not list.
+    """
+
+    codepoints: tuple[int, ...]
+    fonts: tuple[str, ...]
+
+    def __init__(
+        self,
+        codepoints: Sequence[SupportsIndex] = (),
+        fonts: Sequence[str] = (),
+    ) -> None:
+        resolved = tuple(index(codepoint) for codepoint in codepoints)
+        keys = tuple(str(key) for key in fonts)
+        for name, values in (("codepoints", resolved), ("fonts", keys)):
+            if len(set(values)) != len(values):
+                msg = f"vocabulary {name} must be unique"
+                raise ValueError(msg)
+        object.__setattr__(self, "codepoints", resolved)
+        object.__setattr__(self, "fonts", keys)
+
+    @property
+    def unknown_character_idx(self) -> int:
+        """Class index of characters missing from ``codepoints``."""
+        return len(self.codepoints)
+
+    @property
+    def unknown_font_idx(self) -> int:
+        """Class index of fonts missing from ``fonts``."""
+        return len(self.fonts)
+
+    @classmethod
+    def from_dataset(cls, dataset: _BaseGlyphDataset[Any]) -> ClassVocabulary:
+        """Vocabulary listing the current classes of ``dataset`` in order.
+
+        Fonts outside the dataset root have no key and are left out.
+        """
+        keys = (
+            font_key(font.path, font.ttc_index, dataset.root)
+            for font in dataset.font_classes
+        )
+        return cls(
+            [ord(char) for char in dataset.character_classes],
+            [key for key in keys if key is not None],
+        )
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> ClassVocabulary:
+        """Read a vocabulary file written by ``save()``."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data.get("codepoints", ()), data.get("fonts", ()))
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the vocabulary as JSON with ``codepoints`` and ``fonts`` lists."""
+        data = {"codepoints": list(self.codepoints), "fonts": list(self.fonts)}
+        Path(path).write_text(json.dumps(data, indent=1) + "\n", encoding="utf-8")
+
+
+def font_key(path: str | PathLike[str], ttc_index: int, root: Path) -> str | None:
+    """Vocabulary key of a face, or ``None`` when it lies outside ``root``."""
+    try:
+        relative = Path(path).relative_to(root).as_posix()
+    except ValueError:
+        return None
+    return f"{relative}#{ttc_index}" if ttc_index else relative
+
+
+def parse_font_key(key: str) -> tuple[str, int]:
+    """Relative path and collection index of a vocabulary font key."""
+    path, sep, ttc_index = key.rpartition("#")
+    if sep and ttc_index.isdigit():
+        return path, int(ttc_index)
+    return key, 0
+
+
+__all__ = ["ClassVocabulary"]
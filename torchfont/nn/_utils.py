@@ -5,7 +5,14 @@ from __future__ import annotations
 import torch
 from torch import Tensor
 
-from torchfont._outline import ElementType
+from torchfont._outline import ElementType, Outline, RaggedOutline
+
+
+def _flat_outline(outline: Outline | RaggedOutline) -> Outline:
+    """Return the outline whose elements a module or loss operates on."""
+    if isinstance(outline, RaggedOutline):
+        return outline.values
+    return outline
 
 
 def _active_coordinate_mask(types: Tensor) -> Tensor:
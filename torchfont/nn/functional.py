@@ -8,27 +8,30 @@ import torch
 from torch.nn import functional as _functional
 
 from torchfont._outline import TYPE_DIM, ElementType
-from torchfont.nn._utils import _active_coordinate_mask
+from torchfont.nn._utils import _active_coordinate_mask, _flat_outline
 
 if TYPE_CHECKING:
     from torch import Tensor
 
-    from torchfont._outline import Outline
+    from torchfont._outline import Outline, RaggedOutline
 
 _Reduction = Literal["none", "mean", "sum"]
 
 
 def coordinate_loss(
     prediction: Tensor,
-    target: Outline,
+    target: Outline | RaggedOutline,
     reduction: _Reduction = "mean",
 ) -> Tensor:
     """Compute squared error over coordinates active for each target type.
 
     ``prediction`` has shape ``(..., N, 6)`` and ``target`` is the outline it is
     compared against. Inactive control points and coordinates belonging to
-    ``CLOSE``, ``END``, or ``PAD`` do not contribute.
+    ``CLOSE``, ``END``, or ``PAD`` do not contribute. For a
+    :class:`~torchfont.RaggedOutline` target, ``prediction`` has the flat shape
+    ``(T, 6)``.
     """
+    target = _flat_outline(target)
     if prediction.shape != target.coords.shape:
         msg = (
             "prediction must have the same shape as the target coordinates, "
@@ -52,7 +55,7 @@ def coordinate_loss(
 def outline_loss(
     type_logits: Tensor,
     coordinate_prediction: Tensor,
-    target: Outline,
+    target: Outline | RaggedOutline,
     *,
     type_weight: float = 1.0,
     coordinate_weight: float = 100.0,
@@ -62,7 +65,10 @@ def outline_loss(
     Type loss is averaged over non-padding elements. Coordinate loss is
     averaged independently over coordinate scalars active for the target
     element types, then the two means are combined using the given weights.
+    A :class:`~torchfont.RaggedOutline` target takes flat ``(T, ...)``
+    predictions.
     """
+    target = _flat_outline(target)
     if type_logits.shape[:-1] != target.types.shape:
         msg = (
             "type_logits shape without its last dimension must match the target "
@@ -76,7 +82,8 @@ def outline_loss(
 
     type_loss = _functional.cross_entropy(
         type_logits.reshape(-1, TYPE_DIM),
-        target.types.reshape(-1),
+        # cross_entropy requires class indices as torch.long.
+        target.types.reshape(-1).long(),
         ignore_index=ElementType.PAD.value,
         reduction="sum",
     )
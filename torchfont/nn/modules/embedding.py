@@ -7,8 +7,8 @@ import math
 import torch
 from torch import Tensor, nn
 
-from torchfont._outline import COORD_DIM, TYPE_DIM, ElementType, Outline
-from torchfont.nn._utils import _active_coordinate_mask
+from torchfont._outline import COORD_DIM, TYPE_DIM, ElementType, Outline, RaggedOutline
+from torchfont.nn._utils import _active_coordinate_mask, _flat_outline
 
 
 class OutlineEmbedding(nn.Module):
@@ -16,7 +16,10 @@ class OutlineEmbedding(nn.Module):
 
     Accepts an :class:`~torchfont.Outline`, single or batched. Its shape is
     ``(..., N)``, so the output has shape ``(..., N, embedding_dim)``. Padding
-    tokens produce zero vectors.
+    tokens produce zero vectors. Compact ``torch.uint8`` and ``torch.int8``
+    element types are widened only for the embedding lookup. A
+    :class:`~torchfont.RaggedOutline` produces flat ``(T, embedding_dim)``
+    features with no padding tokens.
     """
 
     def __init__(
@@ -53,11 +56,15 @@ class OutlineEmbedding(nn.Module):
         with torch.no_grad():
             self.type_embedding.weight[ElementType.PAD.value].zero_()
 
-    def forward(self, outline: Outline) -> Tensor:
+    def forward(self, outline: Outline | RaggedOutline) -> Tensor:
         """Return the sum of element-type and coordinate embeddings."""
+        outline = _flat_outline(outline)
         types, coords = outline.types, outline.coords
         active_coords = torch.where(_active_coordinate_mask(types), coords, 0)
-        embedded = self.type_embedding(types) + self.coord_projection(active_coords)
+        # nn.Embedding indexes with torch.long; compact one-byte types are
+        # widened here and nowhere earlier.
+        type_features = self.type_embedding(types.long())
+        embedded = type_features + self.coord_projection(active_coords)
         return torch.where((types != ElementType.PAD.value).unsqueeze(-1), embedded, 0)
 
     def extra_repr(self) -> str:
@@ -11,7 +11,7 @@ from torchfont.nn import functional
 if TYPE_CHECKING:
     from torch import Tensor
 
-    from torchfont._outline import Outline
+    from torchfont._outline import Outline, RaggedOutline
 
 
 class OutlineLoss(nn.Module):
@@ -36,7 +36,7 @@ class OutlineLoss(nn.Module):
         self,
         type_logits: Tensor,
         coordinate_prediction: Tensor,
-        target: Outline,
+        target: Outline | RaggedOutline,
     ) -> Tensor:
         """Return the weighted mean outline loss."""
         return functional.outline_loss(
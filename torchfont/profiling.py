@@ -0,0 +1,315 @@
+"""Opt-in timing of transform pipelines and native kernels.
+
+Profiling is off by default. Enable it for a block of code with
+:func:`profile`, or for a whole process tree by setting ``TORCHFONT_PROFILE``
+to a directory. While it is on, every stage of a
+:class:`~torchfont.transforms.Compose` records its wall time, call count, and
+the number of path elements it received and produced, and every native kernel
+splits its time into converting tensors to NumPy arrays, the Rust call, and
+converting its output back to tensors.
+
+With the environment variable, each process that records anything, including
+every ``DataLoader`` worker, writes its counters to
+``torchfont-profile-<pid>.json`` in that directory when it exits.
+:meth:`Profile.load` merges the files back into one :class:`Profile`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from multiprocessing import util as _mp_util
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+import torch
+from torch.utils._pytree import tree_flatten
+
+from torchfont._outline import Outline
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from contextlib import AbstractContextManager
+    from types import TracebackType
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+ENV_VAR = "TORCHFONT_PROFILE"
+_FILE_PREFIX = "torchfont-profile-"
+
+
+@dataclass
+class StageStats:
+    """Accumulated counters for one pipeline stage.
+
+    Element counts are path elements summed over every outline in the stage's
+    input or output, including the padding rows of padded batches.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    elements_in: int = 0
+    elements_out: int = 0
+
+    def merge(self, other: StageStats) -> None:
+        """Add the counters of ``other`` to this one."""
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.elements_in += other.elements_in
+        self.elements_out += other.elements_out
+
+
+@dataclass
+class KernelStats:
+    """Accumulated counters for one native kernel.
+
+    ``to_numpy_seconds`` covers viewing tensors as the arrays passed to Rust,
+    ``compute_seconds`` the Rust call itself, and ``to_tensor_seconds``
+    wrapping its output as tensors. Rust decodes the arrays into paths and
+    encodes the result inside the call, so that work is part of
+    ``compute_seconds``.
+    """
+
+    calls: int = 0
+    to_numpy_seconds: float = 0.0
+    compute_seconds: float = 0.0
+    to_tensor_seconds: float = 0.0
+
+    def merge(self, other: KernelStats) -> None:
+        """Add the counters of ``other`` to this one."""
+        self.calls += other.calls
+        self.to_numpy_seconds += other.to_numpy_seconds
+        self.compute_seconds += other.compute_seconds
+        self.to_tensor_seconds += other.to_tensor_seconds
+
+
+@dataclass
+class Profile:
+    """Counters recorded while profiling, keyed by stage and kernel name.
+
+    Stages are named after the class of the transform, so repeated transforms
+    of one class share an entry. The ``pytree`` stage covers flattening inputs
+    into leaves and rebuilding them.
+    """
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    kernels: dict[str, KernelStats] = field(default_factory=dict)
+
+    def merge(self, other: Profile) -> Profile:
+        """Add the counters of ``other``, for example from a worker, in place."""
+        for name, stats in other.stages.items():
+            self.stages.setdefault(name, StageStats()).merge(stats)
+        for name, stats in other.kernels.items():
+            self.kernels.setdefault(name, KernelStats()).merge(stats)
+        return self
+
+    def clear(self) -> None:
+        """Drop all counters."""
+        self.stages.clear()
+        self.kernels.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters as plain JSON-compatible dictionaries."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Profile:
+        """Rebuild a profile from :meth:`to_dict` output."""
+        return cls(
+            stages={
+                name: StageStats(**stats)
+                for name, stats in data.get("stages", {}).items()
+            },
+            kernels={
+                name: KernelStats(**stats)
+                for name, stats in data.get("kernels", {}).items()
+            },
+        )
+
+    def to_json(self) -> str:
+        """Serialize the counters as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+
+    def save(self, path: Path | str) -> None:
+        """Write :meth:`to_json` output to ``path``."""
+        Path(path).write_text(self.to_json() + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path | str) -> Profile:
+        """Read one saved profile, or merge every per-process file in a directory."""
+        path = Path(path)
+        files = sorted(path.glob(f"{_FILE_PREFIX}*.json")) if path.is_dir() else [path]
+        merged = cls()
+        for file in files:
+            merged.merge(cls.from_dict(json.loads(file.read_text(encoding="utf-8"))))
+        return merged
+
+
+class _State:
+    def __init__(self) -> None:
+        self.profiles: tuple[Profile, ...] = ()
+        self.record_function = False
+        self.environment: Profile | None = None
+        self.dump_pid: int | None = None
+
+
+_STATE = _State()
+_PHASES = threading.local()
+
+
+@contextmanager
+def profile(*, record_function: bool = False) -> Generator[Profile, None, None]:
+    """Record pipeline stages and native kernels run inside the block.
+
+    Yields the :class:`Profile` that collects the counters. Profiles nest, and
+    every active profile records each event. With ``record_function=True``,
+    stages and kernel phases also appear as :func:`torch.profiler.record_function`
+    ranges named ``torchfont.<name>`` in a :mod:`torch.profiler` trace.
+
+    DataLoader workers are separate processes, so stages they run are not
+    recorded here; set ``TORCHFONT_PROFILE`` to profile them.
+    """
+    result = Profile()
+    previous = _STATE.profiles, _STATE.record_function
+    _STATE.profiles = (*previous[0], result)
+    _STATE.record_function = previous[1] or record_function
+    try:
+        yield result
+    finally:
+        _STATE.profiles, _STATE.record_function = previous
+
+
+def _range(name: str) -> AbstractContextManager[object]:
+    if _STATE.record_function:
+        return torch.profiler.record_function(f"torchfont.{name}")
+    return nullcontext()
+
+
+def _elements(inpt: object) -> int:
+    leaves, _ = tree_flatten(inpt)
+    return sum(leaf.types.numel() for leaf in leaves if isinstance(leaf, Outline))
+
+
+def _run_stage(name: str, fn: Callable[..., R], *args: object) -> R:
+    """Call one pipeline stage, recording it when profiling is on."""
+    profiles = _STATE.profiles
+    if not profiles:
+        return fn(*args)
+    elements_in = _elements(args)
+    with _range(name):
+        start = time.perf_counter()
+        output = fn(*args)
+        seconds = time.perf_counter() - start
+    stats = StageStats(1, seconds, elements_in, _elements(output))
+    _prepare_dump()
+    for active in profiles:
+        active.stages.setdefault(name, StageStats()).merge(stats)
+    return output
+
+
+class _KernelTimer:
+    """Record the phases of one native kernel call.
+
+    The kernel's array conversion helpers are wrapped with
+    :func:`_kernel_phase`; the remaining time is attributed to the Rust call.
+    """
+
+    def __init__(self, name: str, profiles: tuple[Profile, ...]) -> None:
+        self.name = name
+        self.profiles = profiles
+        self.phases = {"to_numpy": 0.0, "to_tensor": 0.0}
+        self.range = _range(name)
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.range.__enter__()
+        _PHASES.seconds = self.phases
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        seconds = time.perf_counter() - self.start
+        _PHASES.seconds = None
+        self.range.__exit__(exc_type, exc, tb)
+        to_numpy, to_tensor = self.phases["to_numpy"], self.phases["to_tensor"]
+        stats = KernelStats(1, to_numpy, seconds - to_numpy - to_tensor, to_tensor)
+        _prepare_dump()
+        for active in self.profiles:
+            active.kernels.setdefault(self.name, KernelStats()).merge(stats)
+
+
+_NOT_PROFILING = nullcontext()
+
+
+def _native_kernel(name: str) -> AbstractContextManager[None]:
+    """Time the native kernel ``name`` run inside the block when profiling is on."""
+    profiles = _STATE.profiles
+    return _KernelTimer(name, profiles) if profiles else _NOT_PROFILING
+
+
+def _kernel_phase(phase: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Attribute the time of a kernel helper to ``phase`` of the running kernel."""
+
+    def decorate(fn: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            phases = getattr(_PHASES, "seconds", None)
+            if phases is None:
+                return fn(*args, **kwargs)
+            with _range(phase):
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    phases[phase] += time.perf_counter() - start
+
+        return wrapper
+
+    return decorate
+
+
+def _dump() -> None:
+    directory, environment = os.environ.get(ENV_VAR), _STATE.environment
+    if not directory or environment is None or _STATE.dump_pid != os.getpid():
+        return
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    environment.save(Path(directory) / f"{_FILE_PREFIX}{os.getpid()}.json")
+
+
+def _prepare_dump() -> None:
+    # Worker processes exit through multiprocessing, which skips atexit but runs
+    # its own finalizers. Those are reset when a worker starts, so register
+    # lazily from the first event each process records.
+    if _STATE.environment is None or _STATE.dump_pid == os.getpid():
+        return
+    _STATE.dump_pid = os.getpid()
+    atexit.register(_dump)
+    _mp_util.Finalize(None, _dump, exitpriority=0)
+
+
+def _clear_after_fork() -> None:
+    # A forked child inherits the parent's counters; start it from zero so
+    # merged per-process files count every event once.
+    for active in _STATE.profiles:
+        active.clear()
+
+
+if os.environ.get(ENV_VAR):
+    _STATE.environment = Profile()
+    _STATE.profiles = (_STATE.environment,)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clear_after_fork)
+
+
+__all__ = ["ENV_VAR", "KernelStats", "Profile", "StageStats", "profile"]
@@ -19,7 +19,12 @@ from torchfont.transforms._geometry import (
     VerticalFlip,
 )
 from torchfont.transforms._glyph import LoadGlyph
-from torchfont.transforms._outline import RandomRemoveOverlaps, RemoveOverlaps
+from torchfont.transforms._outline import (
+    ChunkOutline,
+    RandomRemoveOverlaps,
+    RemoveOverlaps,
+    TruncateOutline,
+)
 from torchfont.transforms._subpath import (
     NormalizeSubpathStartPoints,
     RandomizeSubpathOrder,
@@ -29,6 +34,7 @@ from torchfont.transforms._transform import Transform
 
 __all__ = [
     "Affine",
+    "ChunkOutline",
     "Compose",
     "CubicToQuad",
     "HorizontalFlip",
@@ -48,6 +54,7 @@ __all__ = [
     "RemoveOverlaps",
     "RenderBitmap",
     "Transform",
+    "TruncateOutline",
     "VerticalFlip",
     "functional",
 ]
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import torch
 from torch import nn
 
+from torchfont.profiling import _run_stage
+from torchfont.transforms._transform import Transform, _flatten
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Sequence
 
 
 def _module_list(
@@ -21,6 +24,15 @@ def _module_list(
     )
 
 
+def _batched(module: nn.Module, samples: Sequence[object]) -> list[object]:
+    """Apply ``module`` to independent samples, batching where it can."""
+    if isinstance(module, (Compose, RandomApply)) or (
+        isinstance(module, Transform) and module._runs_on_leaves()  # noqa: SLF001
+    ):
+        return module.batched(samples)
+    return [module(sample) for sample in samples]
+
+
 class Compose(nn.Module):
     """Apply a sequence of transforms in order."""
 
@@ -32,17 +44,59 @@ class Compose(nn.Module):
         self.transforms = _module_list(transforms)
 
     def forward(self, *inputs: object) -> object:
-        """Apply all configured transforms to the inputs."""
+        """Apply all configured transforms to the inputs.
+
+        Consecutive :class:`Transform` stages share one flattened view of the
+        input: it is flattened before the first stage and rebuilt after the
+        last, instead of once per stage.
+
+        While :mod:`torchfont.profiling` is on, each stage and the flattening
+        are recorded.
+        """
         unpack = len(inputs) > 1
         output: object = inputs if unpack else inputs[0]
+        flat_inputs: list[Any] | None = None
+        unflatten: Callable[[list[Any]], object] | None = None
         for transform in self.transforms:
-            output = transform(*inputs)
-            inputs = cast("tuple[object, ...]", output) if unpack else (output,)
+            name = type(transform).__name__
+            if isinstance(transform, Transform) and transform._runs_on_leaves():  # noqa: SLF001
+                if flat_inputs is None:
+                    flat_inputs, unflatten = _run_stage("pytree", _flatten, output)
+                flat_inputs = _run_stage(
+                    name,
+                    transform._transform_flat,  # noqa: SLF001
+                    flat_inputs,
+                )
+                continue
+            if flat_inputs is not None and unflatten is not None:
+                output, flat_inputs = _run_stage("pytree", unflatten, flat_inputs), None
+            output = (
+                _run_stage(name, transform, *cast("tuple[object, ...]", output))
+                if unpack
+                else _run_stage(name, transform, output)
+            )
+        if flat_inputs is not None and unflatten is not None:
+            output = _run_stage("pytree", unflatten, flat_inputs)
         return output
 
+    def batched(self, samples: Sequence[object]) -> list[object]:
+        """Apply all transforms to independent samples, one stage at a time.
+
+        Each stage that supports it draws parameters for every sample at once;
+        other modules are called once per sample.
+        """
+        outputs = list(samples)
+        for transform in self.transforms:
+            outputs = _run_stage(type(transform).__name__, _batched, transform, outputs)
+        return outputs
+
 
 class RandomApply(nn.Module):
-    """Apply one transform with probability ``p``."""
+    """Apply one transform with probability ``p``.
+
+    A call decides once for all its inputs, including every row of a padded
+    outline. :meth:`batched` decides for each sample independently.
+    """
 
     def __init__(
         self,
@@ -66,6 +120,24 @@ class RandomApply(nn.Module):
             return inputs if unpack else inputs[0]
         return self.transform(*inputs)
 
+    def batched(self, samples: Sequence[object]) -> list[object]:
+        """Decide for every sample with one RNG call and batch the selected ones."""
+        applied = (torch.rand(len(samples)) < self.p).tolist()
+        outputs = iter(
+            _batched(
+                self.transform,
+                [
+                    sample
+                    for sample, apply in zip(samples, applied, strict=True)
+                    if apply
+                ],
+            )
+        )
+        return [
+            next(outputs) if apply else sample
+            for sample, apply in zip(samples, applied, strict=True)
+        ]
+
     def extra_repr(self) -> str:
         return f"p={self.p}"
 
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, ClassVar
 import torch
 
 from torchfont.transforms import functional as _functional
-from torchfont.transforms._transform import Transform
+from torchfont.transforms._transform import Transform, _max_length
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -49,7 +49,11 @@ class MergeCurves(_SimpleCurveTransform):
 
 
 class RandomSplitSegments(Transform):
-    """Randomly split line and Bezier segments without changing their shape."""
+    """Randomly split line and Bezier segments without changing their shape.
+
+    Outlines of one sample share the split choices and positions, while rows
+    of a padded outline and samples passed to :meth:`batched` draw their own.
+    """
 
     def __init__(
         self,
@@ -75,6 +79,12 @@ class RandomSplitSegments(Transform):
         length = max((inpt.types.size(0) for inpt in flat_inputs), default=0)
         return {"values": torch.rand((2, length))}
 
+    def make_batch_params(
+        self, flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        values = torch.rand((batch_size, 2, _max_length(flat_inputs)))
+        return [{"values": sample_values} for sample_values in values.unbind()]
+
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
         values = params["values"]
         return _functional.split_segments(
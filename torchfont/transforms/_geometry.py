@@ -6,12 +6,14 @@ import math
 from typing import TYPE_CHECKING, Any
 
 import torch
+from torch import Tensor
 
+from torchfont._outline import Outline
 from torchfont.transforms import functional as _functional
-from torchfont.transforms._transform import Transform
+from torchfont.transforms._transform import Transform, _max_length
 
 if TYPE_CHECKING:
-    from torchfont._outline import Outline
+    from collections.abc import Sequence
 
 
 class HorizontalFlip(Transform):
@@ -25,6 +27,13 @@ class HorizontalFlip(Transform):
         del params
         return _functional.horizontal_flip(inpt, preserve_winding=self.preserve_winding)
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        """Flip every row of a padded batch in one vectorized call."""
+        del params
+        return self.transform(inpt, {})
+
 
 class VerticalFlip(Transform):
     """Flip outlines vertically."""
@@ -37,9 +46,33 @@ class VerticalFlip(Transform):
         del params
         return _functional.vertical_flip(inpt, preserve_winding=self.preserve_winding)
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        """Flip every row of a padded batch in one vectorized call."""
+        del params
+        return self.transform(inpt, {})
+
+
+def _select_rows(
+    inpt: Outline, params: list[dict[str, Any]], transformed: Outline
+) -> Outline:
+    """Keep ``transformed`` rows whose params apply and ``inpt`` rows otherwise."""
+    apply = torch.tensor([row["apply"] for row in params], device=inpt.types.device)
+    mask = apply.view(-1, *(1,) * (inpt.types.ndim - 1))
+    return Outline._wrap(  # noqa: SLF001
+        torch.where(mask, transformed.types, inpt.types),
+        torch.where(mask.unsqueeze(-1), transformed.coords, inpt.coords),
+    )
+
 
 class RandomHorizontalFlip(HorizontalFlip):
-    """Flip outlines with probability ``p`` using one shared decision."""
+    """Flip outlines with probability ``p``.
+
+    The outlines of one sample share the decision. Each row of a padded
+    ``(B, N)`` outline and each sample passed to :meth:`batched` is decided
+    independently.
+    """
 
     def __init__(self, p: float = 0.5, *, preserve_winding: bool = True) -> None:
         super().__init__(preserve_winding=preserve_winding)
@@ -51,12 +84,29 @@ class RandomHorizontalFlip(HorizontalFlip):
     def make_params(self, _flat_inputs: list[Any]) -> dict[str, Any]:
         return {"apply": torch.rand(()).item() < self.p}
 
+    def make_batch_params(
+        self, _flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        return [
+            {"apply": apply} for apply in (torch.rand(batch_size) < self.p).tolist()
+        ]
+
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
         return super().transform(inpt, params) if params["apply"] else inpt
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        return _select_rows(inpt, params, super().transform(inpt, {}))
+
 
 class RandomVerticalFlip(VerticalFlip):
-    """Flip outlines with probability ``p`` using one shared decision."""
+    """Flip outlines with probability ``p``.
+
+    The outlines of one sample share the decision. Each row of a padded
+    ``(B, N)`` outline and each sample passed to :meth:`batched` is decided
+    independently.
+    """
 
     def __init__(self, p: float = 0.5, *, preserve_winding: bool = True) -> None:
         super().__init__(preserve_winding=preserve_winding)
@@ -68,9 +118,21 @@ class RandomVerticalFlip(VerticalFlip):
     def make_params(self, _flat_inputs: list[Any]) -> dict[str, Any]:
         return {"apply": torch.rand(()).item() < self.p}
 
+    def make_batch_params(
+        self, _flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        return [
+            {"apply": apply} for apply in (torch.rand(batch_size) < self.p).tolist()
+        ]
+
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
         return super().transform(inpt, params) if params["apply"] else inpt
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        return _select_rows(inpt, params, super().transform(inpt, {}))
+
 
 class Affine(Transform):
     """Apply a fixed affine transformation."""
@@ -99,6 +161,13 @@ class Affine(Transform):
             shear=self.shear,
         )
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        """Apply the fixed matrix to a whole padded batch at once."""
+        del params
+        return self.transform(inpt, {})
+
 
 def _symmetric_range(value: float | tuple[float, float]) -> tuple[float, float]:
     if isinstance(value, (float, int)):
@@ -113,7 +182,12 @@ def _symmetric_range(value: float | tuple[float, float]) -> tuple[float, float]:
 
 
 class RandomAffine(Transform):
-    """Apply one affine parameter sample to all outlines in the input."""
+    """Apply a random rotation, translation, scale, and shear.
+
+    The outlines of one sample share one parameter draw, while each row of a
+    padded ``(B, N)`` outline and each sample passed to :meth:`batched` get
+    their own.
+    """
 
     def __init__(
         self,
@@ -145,10 +219,31 @@ class RandomAffine(Transform):
         self.shear = _symmetric_range(shear)
 
     def make_params(self, _flat_inputs: list[Any]) -> dict[str, Any]:
-        values = torch.rand(5)
-
-        def uniform(bounds: tuple[float, float], index: int) -> float:
-            return bounds[0] + (bounds[1] - bounds[0]) * values[index].item()
+        return self._params(torch.rand(5).tolist())
+
+    def make_batch_params(
+        self, _flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        params = self._params(torch.rand(batch_size, 5).unbind(-1))
+        params["translate"] = torch.stack(params["translate"], -1)
+        # Each sample gets views into the batch tensors; transform_batch stacks
+        # them back without a round trip through Python floats.
+        return [
+            {
+                key: value[row] if isinstance(value, Tensor) else value
+                for key, value in params.items()
+            }
+            for row in range(batch_size)
+        ]
+
+    def _params(self, values: Sequence[float] | Sequence[Tensor]) -> dict[str, Any]:
+        """Map five uniform ``[0, 1)`` samples onto the configured ranges.
+
+        ``values`` holds five floats, or five tensors with one sample per row.
+        """
+
+        def uniform(bounds: tuple[float, float], index: int) -> float | Tensor:
+            return bounds[0] + (bounds[1] - bounds[0]) * values[index]
 
         translate = self.translate or (0.0, 0.0)
         return {
@@ -164,9 +259,30 @@ class RandomAffine(Transform):
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
         return _functional.affine(inpt, **params)
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        """Apply one matrix per row with a single batched matmul."""
+        if not params:
+            return inpt
+        return _functional.affine(
+            inpt,
+            **{
+                key: torch.stack([row[key] for row in params])
+                if isinstance(params[0][key], Tensor)
+                else params[0][key]
+                for key in ("angle", "translate", "scale", "shear")
+            },
+        )
+
 
 class RandomCoordJitter(Transform):
-    """Add Gaussian coordinate noise to active outline elements."""
+    """Add Gaussian coordinate noise to active outline elements.
+
+    Outlines of one sample receive the same noise by element position. Rows
+    of a padded ``(B, N)`` outline and samples passed to :meth:`batched` get
+    independent noise.
+    """
 
     def __init__(self, std: float) -> None:
         super().__init__()
@@ -179,9 +295,23 @@ class RandomCoordJitter(Transform):
         length = max((inpt.coords.size(0) for inpt in flat_inputs), default=0)
         return {"noise": torch.randn((length, 3, 2)) * self.std}
 
+    def make_batch_params(
+        self, flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        length = _max_length(flat_inputs)
+        noise = torch.randn((batch_size, length, 3, 2)) * self.std
+        return [{"noise": sample_noise} for sample_noise in noise.unbind()]
+
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
         return _functional.coord_jitter(inpt, params["noise"])
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        return _functional.coord_jitter(
+            inpt, torch.stack([row["noise"] for row in params])
+        )
+
 
 __all__ = [
     "Affine",
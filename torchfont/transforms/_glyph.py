@@ -14,6 +14,7 @@ from torchfont._glyph import (
     GlyphSample,
     _glyph_data_targets,
 )
+from torchfont._outline import _check_native_coords_dtype, _check_types_dtype
 from torchfont.transforms import functional as _functional
 
 if TYPE_CHECKING:
@@ -23,12 +24,22 @@ if TYPE_CHECKING:
 class LoadGlyph(nn.Module):
     """Load one glyph at the default or a randomly sampled variation location."""
 
-    def __init__(self, location: Literal["default", "random"] = "default") -> None:
+    def __init__(
+        self,
+        location: Literal["default", "random"] = "default",
+        *,
+        types_dtype: torch.dtype = torch.long,
+        coords_dtype: torch.dtype = torch.float32,
+    ) -> None:
         super().__init__()
         if location not in ("default", "random"):
             msg = "location must be 'default' or 'random'"
             raise ValueError(msg)
+        _check_types_dtype(types_dtype, "types_dtype")
+        _check_native_coords_dtype(coords_dtype, "coords_dtype")
         self.location = location
+        self.types_dtype = types_dtype
+        self.coords_dtype = coords_dtype
 
     def forward(self, inpt: GlyphSample | GlyphRef) -> GlyphData | Outline:
         """Load the referenced glyph."""
@@ -38,7 +49,13 @@ class LoadGlyph(nn.Module):
             if self.location == "default"
             else _random_location(ref)
         )
-        outline = _functional.load_glyph(ref, location)
+        outline = _functional.load_glyph(
+            ref,
+            location,
+            glyph_id=inpt.glyph_id if isinstance(inpt, GlyphSample) else None,
+            types_dtype=self.types_dtype,
+            coords_dtype=self.coords_dtype,
+        )
         if not isinstance(inpt, GlyphSample):
             return outline
         metrics = _torchfont.glyph_targets(ref.font.path, ref.font.ttc_index, location)
@@ -54,7 +71,12 @@ class LoadGlyph(nn.Module):
         )
 
     def extra_repr(self) -> str:
-        return f"location={self.location}"
+        parts = [f"location={self.location}"]
+        if self.types_dtype is not torch.long:
+            parts.append(f"types_dtype={self.types_dtype}")
+        if self.coords_dtype is not torch.float32:
+            parts.append(f"coords_dtype={self.coords_dtype}")
+        return ", ".join(parts)
 
 
 def _random_location(ref: GlyphRef) -> dict[str, float]:
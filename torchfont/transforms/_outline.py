@@ -7,29 +7,110 @@ from typing import TYPE_CHECKING, Any
 import torch
 
 from torchfont.transforms import functional as _functional
-from torchfont.transforms._transform import Transform
+from torchfont.transforms._transform import Transform, _max_length
+from torchfont.transforms.functional._outline import (
+    _PARALLEL_THRESHOLD,
+    _check_max_length,
+    _check_parallel_threshold,
+)
 
 if TYPE_CHECKING:
+    from torch import Tensor
+
     from torchfont._outline import Outline
 
 
 class RemoveOverlaps(Transform):
-    """Merge overlapping subpaths."""
+    """Merge overlapping subpaths.
+
+    Overlap groups holding at least ``parallel_threshold`` path elements
+    together are simplified concurrently.
+    """
+
+    def __init__(self, *, parallel_threshold: int = _PARALLEL_THRESHOLD) -> None:
+        super().__init__()
+        self.parallel_threshold = _check_parallel_threshold(parallel_threshold)
 
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
         del params
-        return _functional.remove_overlaps(inpt)
+        return _functional.remove_overlaps(
+            inpt, parallel_threshold=self.parallel_threshold
+        )
 
 
 class RandomRemoveOverlaps(Transform):
-    """Randomly simplify bbox-connected overlap groups."""
+    """Randomly simplify bbox-connected overlap groups.
+
+    Outlines of one sample share the random values that select groups, while
+    rows of a padded outline and samples passed to :meth:`batched` draw their
+    own. Selected groups holding at least ``parallel_threshold`` path elements
+    together are simplified concurrently.
+    """
+
+    def __init__(self, *, parallel_threshold: int = _PARALLEL_THRESHOLD) -> None:
+        super().__init__()
+        self.parallel_threshold = _check_parallel_threshold(parallel_threshold)
 
     def make_params(self, flat_inputs: list[Any]) -> dict[str, Any]:
         length = max((inpt.types.size(0) for inpt in flat_inputs), default=0)
         return {"values": torch.rand(length)}
 
+    def make_batch_params(
+        self, flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        values = torch.rand((batch_size, _max_length(flat_inputs)))
+        return [{"values": sample_values} for sample_values in values.unbind()]
+
+    def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
+        return _functional.remove_overlap_groups(
+            inpt, params["values"], parallel_threshold=self.parallel_threshold
+        )
+
+
+class TruncateOutline(Transform):
+    """Cut outlines to at most ``max_length`` elements at a subpath boundary.
+
+    Padded batches are truncated in one tensor pass; see
+    :func:`~torchfont.transforms.functional.truncate_outline`.
+    """
+
+    def __init__(self, max_length: int) -> None:
+        super().__init__()
+        self.max_length = _check_max_length(max_length)
+
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
-        return _functional.remove_overlap_groups(inpt, params["values"])
+        del params
+        return _functional.truncate_outline(inpt, self.max_length)
+
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        """Truncate the whole padded batch in one tensor pass."""
+        del params
+        return _functional.truncate_outline(inpt, self.max_length)
+
+
+class ChunkOutline(Transform):
+    """Split one outline into a padded batch of subpath-aligned chunks."""
+
+    def __init__(self, max_length: int) -> None:
+        super().__init__()
+        self.max_length = _check_max_length(max_length)
+
+    def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
+        del params
+        return _functional.chunk_outline(inpt, self.max_length)
+
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        """Reject padded batches, whose rows would split into ragged chunks."""
+        del params
+        msg = (
+            "ChunkOutline expects a single outline, got a padded batch of shape "
+            f"{tuple(inpt.batch_shape)}; chunk each outline before batching"
+        )
+        raise ValueError(msg)
 
 
-__all__ = ["RandomRemoveOverlaps", "RemoveOverlaps"]
+__all__ = ["ChunkOutline", "RandomRemoveOverlaps", "RemoveOverlaps", "TruncateOutline"]
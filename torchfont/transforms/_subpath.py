@@ -7,11 +7,13 @@ from typing import TYPE_CHECKING, Any, ClassVar
 import torch
 
 from torchfont.transforms import functional as _functional
-from torchfont.transforms._transform import Transform
+from torchfont.transforms._transform import Transform, _max_length
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from torch import Tensor
+
     from torchfont._outline import Outline
 
 
@@ -30,18 +32,37 @@ class _RandomSubpathTransform(Transform):
         length = max((inpt.types.size(0) for inpt in flat_inputs), default=0)
         return {"values": torch.rand(length)}
 
+    def make_batch_params(
+        self, flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        values = torch.rand((batch_size, _max_length(flat_inputs)))
+        return [{"values": sample_values} for sample_values in values.unbind()]
+
     def transform(self, inpt: Outline, params: dict[str, Any]) -> Outline:
         return self.function(inpt, params["values"])
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | Tensor:
+        return self.function(inpt, torch.stack([row["values"] for row in params]))
+
 
 class RandomizeSubpathStartPoints(_RandomSubpathTransform):
-    """Choose a random start point for every closed subpath."""
+    """Choose a random start point for every closed subpath.
+
+    Outlines of one sample share the random values; rows of a padded outline
+    and samples passed to :meth:`batched` draw their own.
+    """
 
     function = staticmethod(_functional.set_subpath_start_points)
 
 
 class RandomizeSubpathOrder(_RandomSubpathTransform):
-    """Randomly permute whole subpaths."""
+    """Randomly permute whole subpaths.
+
+    Outlines of one sample share the random values; rows of a padded outline
+    and samples passed to :meth:`batched` draw their own.
+    """
 
     function = staticmethod(_functional.reorder_subpaths)
 
@@ -3,16 +3,88 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
+import torch
 from torch import nn
+from torch.nn.modules import module as _module
 from torch.utils._pytree import tree_flatten, tree_unflatten
 
-from torchfont._outline import Outline
+from torchfont._glyph import GlyphData, _flatten_glyph_data, _unflatten_glyph_data
+from torchfont._outline import Outline, pad_outlines, unpad_outlines
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_MODULE_HOOKS = (
+    "_forward_hooks",
+    "_forward_pre_hooks",
+    "_backward_hooks",
+    "_backward_pre_hooks",
+)
+_GLOBAL_HOOKS = (
+    "_global_forward_hooks",
+    "_global_forward_pre_hooks",
+    "_global_backward_hooks",
+    "_global_backward_pre_hooks",
+)
+
+
+def _flatten(inpt: object) -> tuple[list[Any], Callable[[list[Any]], object]]:
+    """Flatten an input into pytree leaves and a function that rebuilds it.
+
+    A bare ``Outline`` and a ``GlyphData`` whose payload is an ``Outline`` are
+    the common per-sample inputs. Their leaves are known without building a
+    ``TreeSpec``, and they match what :func:`tree_flatten` returns.
+    """
+    if isinstance(inpt, Outline):
+        return [inpt], _first_leaf
+    if type(inpt) is GlyphData and isinstance(inpt.data, Outline):
+        children, context = _flatten_glyph_data(inpt)
+        return children, lambda leaves: _unflatten_glyph_data(leaves, context)
+    flat_inputs, tree_spec = tree_flatten(inpt)
+    return flat_inputs, lambda leaves: tree_unflatten(leaves, tree_spec)
+
+
+def _first_leaf(leaves: list[Any]) -> object:
+    return leaves[0]
+
+
+def _max_length(flat_inputs: list[Any]) -> int:
+    """Return the longest element count among single or padded outlines."""
+    return max((inpt.types.size(-1) for inpt in flat_inputs), default=0)
+
+
+def _padded_batch_size(selected: list[Any]) -> int | None:
+    """Return the batch size when the selected leaves are padded outlines.
+
+    Padded outlines in one call must share a single batch dimension, and may
+    not be mixed with single outlines, because their rows are paired by index.
+    """
+    batched = [isinstance(item, Outline) and item.is_batched for item in selected]
+    if not any(batched):
+        return None
+    shapes = {item.batch_shape for item in selected if isinstance(item, Outline)}
+    if not all(batched) or len(shapes) != 1 or len(next(iter(shapes))) != 1:
+        msg = (
+            "padded outlines in one transform call must all share one batch "
+            f"dimension, got batch shapes {sorted(map(tuple, shapes))}"
+        )
+        raise ValueError(msg)
+    return next(iter(shapes))[0]
 
 
 class Transform(nn.Module):
-    """Base class for type-directed transforms over nested pytree inputs."""
+    """Base class for type-directed transforms over nested pytree inputs.
+
+    ``transform`` maps one leaf to one leaf, so a :class:`Compose` of
+    transforms can flatten its input once and rebuild it once.
+
+    Selected leaves in one call share one parameter sample. Independent
+    samples get independent parameters either as the rows of a padded
+    ``Outline`` or through :meth:`batched`; both draw the parameters of the
+    whole batch with :meth:`make_batch_params`.
+    """
 
     _transformed_types: ClassVar[tuple[type[Any], ...]] = (Outline,)
 
@@ -23,14 +95,89 @@ class Transform(nn.Module):
         """Create parameters for selected inputs in one sampling group."""
         return {}
 
+    def make_batch_params(
+        self, flat_inputs: list[Any], batch_size: int
+    ) -> list[dict[str, Any]]:
+        """Create independent parameters for each of ``batch_size`` samples.
+
+        ``flat_inputs`` holds the selected leaves of the whole batch. Random
+        transforms override this to draw every sample's parameters in one RNG
+        call; the default calls ``make_params`` once per sample.
+        """
+        return [self.make_params(flat_inputs) for _ in range(batch_size)]
+
     def transform(self, inpt: object, params: dict[str, Any]) -> object:
         """Transform one selected input using parameters from ``make_params``."""
         raise NotImplementedError
 
+    def transform_batch(
+        self, inpt: Outline, params: list[dict[str, Any]]
+    ) -> Outline | torch.Tensor:
+        """Transform each row of a padded ``(B, N)`` outline with its parameters.
+
+        The default applies :meth:`transform` to every unpadded row and pads the
+        results again, or stacks them when they are tensors. Transforms whose
+        kernels accept padded batches override it to run in one pass.
+        """
+        outputs = [
+            self.transform(row, row_params)
+            for row, row_params in zip(unpad_outlines(inpt), params, strict=True)
+        ]
+        outlines = [output for output in outputs if isinstance(output, Outline)]
+        if len(outlines) == len(outputs):
+            return pad_outlines(outlines)
+        tensors = [output for output in outputs if isinstance(output, torch.Tensor)]
+        if len(tensors) == len(outputs):
+            return torch.stack(tensors)
+        msg = (
+            f"{type(self).__name__}.transform must return outlines or tensors "
+            "to transform a padded batch row by row"
+        )
+        raise TypeError(msg)
+
     def forward(self, *inputs: object) -> object:
         """Transform semantic leaves and preserve the enclosing pytree."""
         inpt = inputs if len(inputs) > 1 else inputs[0]
-        flat_inputs, tree_spec = tree_flatten(inpt)
+        flat_inputs, unflatten = _flatten(inpt)
+        return unflatten(self._transform_flat(flat_inputs))
+
+    def batched(self, samples: Sequence[object]) -> list[object]:
+        """Transform independent samples, such as a list of ``GlyphData``.
+
+        Unlike passing the list to the transform, which shares one parameter
+        sample across it, every sample gets its own parameters. They are drawn
+        for the whole batch at once by :meth:`make_batch_params`.
+        """
+        flattened = [_flatten(sample) for sample in samples]
+        selections = []
+        for flat_inputs, _unflatten in flattened:
+            self.check_inputs(flat_inputs)
+            selections.append(self._needs_transform_list(flat_inputs))
+        selected = [
+            item
+            for (flat_inputs, _unflatten), needs_transform in zip(
+                flattened, selections, strict=True
+            )
+            for item, selected in zip(flat_inputs, needs_transform, strict=True)
+            if selected
+        ]
+        if not selected:
+            return list(samples)
+        params = self.make_batch_params(selected, len(samples))
+        return [
+            unflatten(
+                [
+                    self.transform(item, sample_params) if selected else item
+                    for item, selected in zip(flat_inputs, needs_transform, strict=True)
+                ]
+            )
+            for (flat_inputs, unflatten), needs_transform, sample_params in zip(
+                flattened, selections, params, strict=True
+            )
+        ]
+
+    def _transform_flat(self, flat_inputs: list[Any]) -> list[Any]:
+        """Transform the selected leaves of an already flattened input."""
         self.check_inputs(flat_inputs)
         needs_transform = self._needs_transform_list(flat_inputs)
         selected = [
@@ -38,14 +185,31 @@ class Transform(nn.Module):
             for item, selected in zip(flat_inputs, needs_transform, strict=True)
             if selected
         ]
-        params = self.make_params(selected) if selected else {}
-        flat_outputs = []
-        for item, selected in zip(flat_inputs, needs_transform, strict=True):
-            if not selected:
-                flat_outputs.append(item)
-                continue
-            flat_outputs.append(self.transform(item, params))
-        return tree_unflatten(flat_outputs, tree_spec)
+        if not selected:
+            return flat_inputs
+        batch_size = _padded_batch_size(selected)
+        if batch_size is not None:
+            batch_params = self.make_batch_params(selected, batch_size)
+            return [
+                self.transform_batch(item, batch_params) if selected else item
+                for item, selected in zip(flat_inputs, needs_transform, strict=True)
+            ]
+        params = self.make_params(selected)
+        return [
+            self.transform(item, params) if selected else item
+            for item, selected in zip(flat_inputs, needs_transform, strict=True)
+        ]
+
+    def _runs_on_leaves(self) -> bool:
+        """Whether calling ``_transform_flat`` directly matches ``__call__``.
+
+        That holds unless ``forward`` is overridden or a module hook would run.
+        """
+        return (
+            type(self).forward is Transform.forward
+            and not any(getattr(self, name) for name in _MODULE_HOOKS)
+            and not any(getattr(_module, name) for name in _GLOBAL_HOOKS)
+        )
 
     def _needs_transform_list(self, flat_inputs: list[Any]) -> list[bool]:
         """Select semantic leaves while passing all other inputs through."""
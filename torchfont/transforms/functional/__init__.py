@@ -15,8 +15,10 @@ from torchfont.transforms.functional._geometry import (
 )
 from torchfont.transforms.functional._glyph import load_glyph
 from torchfont.transforms.functional._outline import (
+    chunk_outline,
     remove_overlap_groups,
     remove_overlaps,
+    truncate_outline,
 )
 from torchfont.transforms.functional._subpath import (
     normalize_subpath_start_points,
@@ -26,6 +28,7 @@ from torchfont.transforms.functional._subpath import (
 
 __all__ = [
     "affine",
+    "chunk_outline",
     "coord_jitter",
     "cubic_to_quad",
     "horizontal_flip",
@@ -39,5 +42,6 @@ __all__ = [
     "reorder_subpaths",
     "set_subpath_start_points",
     "split_segments",
+    "truncate_outline",
     "vertical_flip",
 ]
@@ -1,7 +1,9 @@
 """Functional curve conversion and segment kernels.
 
 Every kernel here re-encodes path elements in Rust and may change the number of
-elements, so none of them define a gradient.
+elements, so none of them define a gradient. Each takes an optional
+``max_elements`` capacity that pads the result to a fixed length with ``PAD``
+rows, which keeps shapes static under :func:`torch.compile`.
 """
 
 from __future__ import annotations
@@ -17,7 +19,9 @@ if TYPE_CHECKING:
     from torchfont._outline import Outline
 
 
-def quad_to_cubic(inpt: Outline, *, merge_curves: bool = False) -> Outline:
+def quad_to_cubic(
+    inpt: Outline, *, merge_curves: bool = False, max_elements: int | None = None
+) -> Outline:
     """Convert ``QUAD_TO`` elements to ``CURVE_TO`` elements.
 
     Each quadratic segment maps exactly onto one cubic segment, so the output
@@ -28,6 +32,8 @@ def quad_to_cubic(inpt: Outline, *, merge_curves: bool = False) -> Outline:
         merge_curves: Merge adjacent mergeable curves and lines in the same Rust
             call after conversion. The output length may then differ from the
             input.
+        max_elements: Pad the result with ``PAD`` rows to exactly this many
+            elements. A result that does not fit raises ``ValueError``.
 
     """
     return _native_outline(
@@ -35,10 +41,11 @@ def quad_to_cubic(inpt: Outline, *, merge_curves: bool = False) -> Outline:
         _ops.quad_to_cubic,
         merge_curves,
         name="quad_to_cubic",
+        max_elements=max_elements,
     )
 
 
-def cubic_to_quad(inpt: Outline) -> Outline:
+def cubic_to_quad(inpt: Outline, *, max_elements: int | None = None) -> Outline:
     """Convert ``CURVE_TO`` elements to sequences of ``QUAD_TO`` elements.
 
     Each cubic Bezier segment is replaced by the minimum number of quadratic
@@ -48,12 +55,15 @@ def cubic_to_quad(inpt: Outline) -> Outline:
     adjacent off-curve control points, as TrueType splines do.
 
     Unlike :func:`quad_to_cubic`, the output length may differ from the input
-    because one cubic can expand into several quadratics.
+    because one cubic can expand into several quadratics; ``max_elements`` pads
+    it to a fixed length instead.
     """
-    return _native_outline(inpt, _ops.cubic_to_quad, name="cubic_to_quad")
+    return _native_outline(
+        inpt, _ops.cubic_to_quad, name="cubic_to_quad", max_elements=max_elements
+    )
 
 
-def merge_curves(inpt: Outline) -> Outline:
+def merge_curves(inpt: Outline, *, max_elements: int | None = None) -> Outline:
     """Merge adjacent pieces of the same parent curve or line.
 
     Adjacent cubic and quadratic Bezier segments are merged when they are pieces
@@ -65,7 +75,9 @@ def merge_curves(inpt: Outline) -> Outline:
     The comparison tolerance is ~1e-3 em units, roughly one font unit in a
     1000-UPM font, matching the precision fontTools typically uses.
     """
-    return _native_outline(inpt, _ops.merge_curves, name="merge_curves")
+    return _native_outline(
+        inpt, _ops.merge_curves, name="merge_curves", max_elements=max_elements
+    )
 
 
 def split_segments(
@@ -75,6 +87,7 @@ def split_segments(
     *,
     split_probability: float,
     split_range: tuple[float, float],
+    max_elements: int | None = None,
 ) -> Outline:
     """Split segments according to explicit selection and position values."""
     return _native_outline(
@@ -85,6 +98,7 @@ def split_segments(
         split_probability,
         list(split_range),
         name="split_segments",
+        max_elements=max_elements,
     )
 
 
@@ -23,12 +23,9 @@ import torch
 from torch import Tensor
 
 from torchfont import _ops
-from torchfont._outline import ElementType, Outline
-from torchfont.transforms.functional._utils import (
-    _require_no_grad,
-    _require_single,
-    _same_types,
-)
+from torchfont._outline import _NATIVE_COORDS_DTYPES, ElementType, Outline
+from torchfont.transforms.functional._subpath import _reverse_closed_subpaths
+from torchfont.transforms.functional._utils import _same_types
 
 
 def _is_nan(value: float) -> bool:
@@ -62,11 +59,26 @@ def _active_pairs(types: Tensor) -> tuple[Tensor, Tensor, Tensor]:
     return pair0, pair1, pair2
 
 
+def _uses_native(types: Tensor, coords: Tensor) -> bool:
+    """Whether the Rust operators serve this outline.
+
+    They handle one glyph with CPU coordinates in a native dtype. Padded
+    batches, other devices, and other floating point dtypes use the tensor
+    implementations, which agree with the operators.
+    """
+    return (
+        types.ndim == 1
+        and coords.device.type == "cpu"
+        and coords.dtype in _NATIVE_COORDS_DTYPES
+    )
+
+
 def _bbox_center(types: Tensor, coords: Tensor) -> Tensor:
-    """Return the tight bounding-box centre as a ``(2,)`` tensor.
+    """Return the tight bounding-box centre as a ``(..., 2)`` tensor.
 
-    Delegates to the ``torchfont::bbox_center`` operator, which evaluates true
-    curve extrema for QUAD_TO and CURVE_TO segments rather than bounding the
+    A single CPU glyph delegates to the ``torchfont::bbox_center`` operator, and
+    anything else to :func:`_tight_bbox_center`. Both evaluate true curve
+    extrema for QUAD_TO and CURVE_TO segments rather than bounding the
     control-point hull.
 
     The centre is the reference frame a transform is applied around, not a
@@ -74,7 +86,77 @@ def _bbox_center(types: Tensor, coords: Tensor) -> Tensor:
     therefore flow through the transformed coordinates but not through the choice
     of centre.
     """
-    return _ops.bbox_center(types.detach(), coords.detach())
+    if _uses_native(types, coords):
+        return _ops.bbox_center(types.detach(), coords.detach())
+    return _tight_bbox_center(types.detach(), coords.detach())
+
+
+def _tight_bbox_center(types: Tensor, coords: Tensor) -> Tensor:
+    """Tensor implementation of the tight bounding-box centre of ``(..., N)``.
+
+    Every drawing endpoint is a candidate, as is each interior extremum of a
+    quadratic or cubic segment, solved per axis from the segment's derivative.
+    A segment starts at the endpoint of the element before it. Outlines without
+    any point yield the origin.
+    """
+    work = coords if coords.dtype == torch.float64 else coords.float()
+    points = work.unflatten(-1, (3, 2))
+    ends = points[..., 2, :]
+    starts = torch.cat([ends[..., :1, :], ends[..., :-1, :]], -2)
+    c0, c1 = points[..., 0, :], points[..., 1, :]
+    is_quad = (types == ElementType.QUAD_TO.value).unsqueeze(-1)
+    is_cubic = (types == ElementType.CURVE_TO.value).unsqueeze(-1)
+
+    def interior(t: Tensor, valid: Tensor) -> tuple[Tensor, Tensor]:
+        return t, valid & (t > 0.0) & (t < 1.0)
+
+    def divide(numerator: Tensor, denominator: Tensor) -> tuple[Tensor, Tensor]:
+        nonzero = denominator != 0.0
+        safe = torch.where(nonzero, denominator, torch.ones_like(denominator))
+        return interior(numerator / safe, nonzero)
+
+    # Quadratic: B'(t) = 0 at t = (p0 - p1) / (p0 - 2 p1 + p2).
+    quad_t, quad_valid = divide(starts - c0, starts - 2.0 * c0 + ends)
+    u = 1.0 - quad_t
+    quad = u * u * starts + 2.0 * u * quad_t * c0 + quad_t * quad_t * ends
+
+    # Cubic: B'(t) / 3 = a t^2 + b t + c with a = d0 - 2 d1 + d2, b = 2 (d1 - d0),
+    # c = d0, where d0, d1, d2 are the control polygon's edge vectors.
+    d0, d1, d2 = c0 - starts, c1 - c0, ends - c1
+    a, b, c = d0 - 2.0 * d1 + d2, 2.0 * (d1 - d0), d0
+    root = (b * b - 4.0 * a * c).clamp_min(0.0).sqrt()
+    real = b * b - 4.0 * a * c >= 0.0
+    quadratic = (a != 0.0) & real
+    cubic_roots = [
+        (t, valid & quadratic)
+        for t, valid in (
+            divide(-b + root, 2.0 * a),
+            divide(-b - root, 2.0 * a),
+        )
+    ]
+    linear_t, linear_valid = divide(-c, b)
+    cubic_roots.append((linear_t, linear_valid & (a == 0.0)))
+    drawing = (types >= ElementType.MOVE_TO.value) & (
+        types <= ElementType.CURVE_TO.value
+    )
+    candidates = [ends, quad]
+    masks = [drawing.unsqueeze(-1).expand_as(ends), quad_valid & is_quad]
+    for t, valid in cubic_roots:
+        u = 1.0 - t
+        candidates.append(
+            u * u * u * starts
+            + 3.0 * u * u * t * c0
+            + 3.0 * u * t * t * c1
+            + t * t * t * ends
+        )
+        masks.append(valid & is_cubic)
+    values = torch.stack(candidates, -2)
+    mask = torch.stack(masks, -2)
+    low = torch.where(mask, values, math.inf).amin((-3, -2))
+    high = torch.where(mask, values, -math.inf).amax((-3, -2))
+    found = mask.any(-2).any(-2)
+    center = torch.where(found, (low + high) / 2.0, 0.0)
+    return center.to(coords.dtype)
 
 
 def _apply_matrix(
@@ -82,15 +164,20 @@ def _apply_matrix(
     coords: Tensor,
     matrix: Tensor,
     center: Tensor,
-    translate: tuple[float, float],
+    translate: Tensor,
 ) -> Tensor:
-    """Apply ``p' = (p - center) @ matrix.T + center + translate`` to active pairs."""
-    c = center
-    t = coords.new_tensor(translate)
-    active = torch.stack(list(_active_pairs(types)), dim=1).unsqueeze(-1)
-    pts = coords.reshape(-1, 3, 2)
-    transformed = (pts - c) @ matrix.T + c + t
-    return torch.where(active, transformed, pts).reshape_as(coords)
+    """Apply ``p' = (p - center) @ matrix.T + center + translate`` to active pairs.
+
+    ``matrix`` is ``(..., 2, 2)`` and ``center`` and ``translate`` are ``(..., 2)``
+    for outlines with batch shape ``...``, so a padded batch is transformed with
+    one batched matmul.
+    """
+    c = center[..., None, None, :]
+    t = translate[..., None, None, :]
+    active = torch.stack(list(_active_pairs(types)), dim=-1).unsqueeze(-1)
+    pts = coords.unflatten(-1, (3, 2))
+    transformed = (pts - c) @ matrix.transpose(-1, -2).unsqueeze(-3) + c + t
+    return torch.where(active, transformed, pts).flatten(-2)
 
 
 def _rotation_scale_shear_matrix(
@@ -112,11 +199,55 @@ def _rotation_scale_shear_matrix(
     )
 
 
-def _preserve_closed_subpath_winding(
+def _affine_matrix(angle: Tensor, scale: Tensor, shear: Tensor) -> Tensor:
+    """Batched :func:`_rotation_scale_shear_matrix` for per-sample parameters."""
+    angle, scale, shear = torch.broadcast_tensors(angle, scale, shear)
+    a, s = torch.deg2rad(angle), torch.deg2rad(shear)
+    cos_a, sin_a, tan_s = a.cos(), a.sin(), s.tan()
+    rows = [
+        torch.stack([cos_a + sin_a * tan_s, -sin_a + cos_a * tan_s], -1),
+        torch.stack([sin_a, cos_a], -1),
+    ]
+    return torch.stack(rows, -2) * scale[..., None, None]
+
+
+def _check_affine_tensors(
+    angle: Tensor, translate: Tensor, scale: Tensor, shear: Tensor
+) -> None:
+    """Validate per-sample affine parameters with a single host sync."""
+    invalid = torch.stack(
+        [
+            ~(torch.isfinite(scale) & (scale > 0)).all(),
+            angle.isnan().any(),
+            shear.isnan().any(),
+            ~torch.isfinite(translate).all(),
+        ]
+    ).tolist()
+    messages = (
+        "scale must be positive and finite",
+        "angle must be finite",
+        "shear must be finite",
+        "translate values must be finite",
+    )
+    for failed, msg in zip(invalid, messages, strict=True):
+        if failed:
+            raise ValueError(msg)
+
+
+def _flip(
     types: Tensor,
     coords: Tensor,
+    matrix: list[list[float]],
+    *,
+    preserve_winding: bool,
 ) -> tuple[Tensor, Tensor]:
-    return _ops.reverse_closed_subpaths(types.detach(), coords.detach())
+    center = _bbox_center(types, coords)
+    out_coords = _apply_matrix(
+        types, coords, coords.new_tensor(matrix), center, coords.new_zeros(2)
+    )
+    if preserve_winding:
+        return _reverse_closed_subpaths(types, out_coords)
+    return types, out_coords
 
 
 def _horizontal_flip(
@@ -125,14 +256,14 @@ def _horizontal_flip(
     *,
     preserve_winding: bool = True,
 ) -> tuple[Tensor, Tensor]:
-    """Flip a glyph outline horizontally around the bounding-box centre.
+    """Flip glyph outlines horizontally around their bounding-box centres.
 
     Both on-curve endpoints and off-curve control points are transformed.
     Zero-coordinate element types (CLOSE, END, PAD) are left unchanged.
 
     Args:
-        types: 1-D ``torch.int64`` tensor of element types.
-        coords: 2-D floating point tensor of shape ``(N, 6)``.
+        types: Integer tensor of element types, shape ``(..., N)``.
+        coords: Floating point tensor of shape ``(..., N, 6)``.
         preserve_winding: Reverse closed subpaths after reflection so their
             winding direction matches the input. Default: ``True``.
 
@@ -142,12 +273,9 @@ def _horizontal_flip(
         ``preserve_winding`` is enabled.
 
     """
-    matrix = coords.new_tensor([[-1.0, 0.0], [0.0, 1.0]])
-    center = _bbox_center(types, coords)
-    out_coords = _apply_matrix(types, coords, matrix, center, (0.0, 0.0))
-    if preserve_winding:
-        return _preserve_closed_subpath_winding(types, out_coords)
-    return types, out_coords
+    return _flip(
+        types, coords, [[-1.0, 0.0], [0.0, 1.0]], preserve_winding=preserve_winding
+    )
 
 
 def _vertical_flip(
@@ -156,11 +284,11 @@ def _vertical_flip(
     *,
     preserve_winding: bool = True,
 ) -> tuple[Tensor, Tensor]:
-    """Flip a glyph outline vertically around the bounding-box centre.
+    """Flip glyph outlines vertically around their bounding-box centres.
 
     Args:
-        types: 1-D ``torch.int64`` tensor of element types.
-        coords: 2-D floating point tensor of shape ``(N, 6)``.
+        types: Integer tensor of element types, shape ``(..., N)``.
+        coords: Floating point tensor of shape ``(..., N, 6)``.
         preserve_winding: Reverse closed subpaths after reflection so their
             winding direction matches the input. Default: ``True``.
 
@@ -170,24 +298,21 @@ def _vertical_flip(
         ``preserve_winding`` is enabled.
 
     """
-    matrix = coords.new_tensor([[1.0, 0.0], [0.0, -1.0]])
-    center = _bbox_center(types, coords)
-    out_coords = _apply_matrix(types, coords, matrix, center, (0.0, 0.0))
-    if preserve_winding:
-        return _preserve_closed_subpath_winding(types, out_coords)
-    return types, out_coords
+    return _flip(
+        types, coords, [[1.0, 0.0], [0.0, -1.0]], preserve_winding=preserve_winding
+    )
 
 
 def _affine(
     types: Tensor,
     coords: Tensor,
     *,
-    angle: float = 0.0,
-    translate: tuple[float, float] = (0.0, 0.0),
-    scale: float = 1.0,
-    shear: float = 0.0,
+    angle: float | Tensor = 0.0,
+    translate: tuple[float, float] | Tensor = (0.0, 0.0),
+    scale: float | Tensor = 1.0,
+    shear: float | Tensor = 0.0,
 ) -> tuple[Tensor, Tensor]:
-    """Apply a deterministic affine transformation to a glyph outline.
+    """Apply a deterministic affine transformation to glyph outlines.
 
     The transform composes **uniform scale**, **x-shear**, and **rotation**
     around the bounding-box centre, then applies ``translate``. Control points
@@ -195,45 +320,59 @@ def _affine(
     types (CLOSE, END, PAD) are not modified.
 
     Args:
-        types: 1-D ``torch.int64`` tensor of element types.
-        coords: 2-D floating point tensor of shape ``(N, 6)``.
+        types: Integer tensor of element types, shape ``(..., N)``.
+        coords: Floating point tensor of shape ``(..., N, 6)``.
         angle: Counter-clockwise rotation in degrees.
         translate: Translation ``(tx, ty)`` in em units applied
             after rotation and scaling. Values must be finite.
         scale: Uniform scale factor (must be positive and finite).
         shear: x-shear angle in degrees.
 
+    Any parameter may instead be a tensor broadcastable to the batch shape
+    (``(..., 2)`` for ``translate``), giving each outline its own transform.
+
     Returns:
         A new ``(types, coords)`` pair with the affine transform applied.
         ``types`` is returned unchanged (same object).
 
     """
-    if _is_nan(scale) or _is_infinite(scale) or scale <= 0:
-        msg = "scale must be positive and finite"
-        raise ValueError(msg)
-    if _is_nan(angle):
-        msg = "angle must be finite"
-        raise ValueError(msg)
-    if _is_nan(shear):
-        msg = "shear must be finite"
-        raise ValueError(msg)
-    if any(_is_nan(value) or _is_infinite(value) for value in translate):
-        msg = "translate values must be finite"
-        raise ValueError(msg)
-    matrix = _rotation_scale_shear_matrix(angle, scale, shear, like=coords)
+    params = (angle, translate, scale, shear)
+    if any(isinstance(param, Tensor) for param in params):
+        dtype = torch.float64 if coords.dtype == torch.float64 else torch.float32
+        angle_t, translate_t, scale_t, shear_t = (
+            torch.as_tensor(param, dtype=dtype, device=coords.device)
+            for param in params
+        )
+        _check_affine_tensors(angle_t, translate_t, scale_t, shear_t)
+        matrix = _affine_matrix(angle_t, scale_t, shear_t).to(coords.dtype)
+        offset = translate_t.to(coords.dtype)
+    else:
+        scale, angle, shear = float(scale), float(angle), float(shear)
+        if _is_nan(scale) or _is_infinite(scale) or scale <= 0:
+            msg = "scale must be positive and finite"
+            raise ValueError(msg)
+        if _is_nan(angle):
+            msg = "angle must be finite"
+            raise ValueError(msg)
+        if _is_nan(shear):
+            msg = "shear must be finite"
+            raise ValueError(msg)
+        if any(_is_nan(value) or _is_infinite(value) for value in translate):
+            msg = "translate values must be finite"
+            raise ValueError(msg)
+        matrix = _rotation_scale_shear_matrix(angle, scale, shear, like=coords)
+        offset = coords.new_tensor(translate)
     center = _bbox_center(types, coords)
-    return types, _apply_matrix(types, coords, matrix, center, translate)
+    return types, _apply_matrix(types, coords, matrix, center, offset)
 
 
 def horizontal_flip(inpt: Outline, *, preserve_winding: bool = True) -> Outline:
     """Flip an outline horizontally around its tight bounding-box centre.
 
-    Differentiable only when ``preserve_winding`` is ``False``; reversing
-    subpaths reorders elements in Rust and defines no gradient.
+    Accepts a padded ``(..., N)`` batch and flips every outline around its own
+    centre. Closed subpaths are reversed with a gather, so the flip is
+    differentiable with respect to ``coords``.
     """
-    _require_single(inpt, "horizontal_flip")
-    if preserve_winding:
-        _require_no_grad(inpt, "horizontal_flip(preserve_winding=True)")
     out_types, out_coords = _horizontal_flip(
         inpt.types, inpt.coords, preserve_winding=preserve_winding
     )
@@ -243,12 +382,8 @@ def horizontal_flip(inpt: Outline, *, preserve_winding: bool = True) -> Outline:
 def vertical_flip(inpt: Outline, *, preserve_winding: bool = True) -> Outline:
     """Flip an outline vertically around its tight bounding-box centre.
 
-    Differentiable only when ``preserve_winding`` is ``False``; reversing
-    subpaths reorders elements in Rust and defines no gradient.
+    Batches, devices, and gradients are handled as in :func:`horizontal_flip`.
     """
-    _require_single(inpt, "vertical_flip")
-    if preserve_winding:
-        _require_no_grad(inpt, "vertical_flip(preserve_winding=True)")
     out_types, out_coords = _vertical_flip(
         inpt.types, inpt.coords, preserve_winding=preserve_winding
     )
@@ -258,17 +393,20 @@ def vertical_flip(inpt: Outline, *, preserve_winding: bool = True) -> Outline:
 def affine(
     inpt: Outline,
     *,
-    angle: float = 0.0,
-    translate: tuple[float, float] = (0.0, 0.0),
-    scale: float = 1.0,
-    shear: float = 0.0,
+    angle: float | Tensor = 0.0,
+    translate: tuple[float, float] | Tensor = (0.0, 0.0),
+    scale: float | Tensor = 1.0,
+    shear: float | Tensor = 0.0,
 ) -> Outline:
     """Apply a deterministic affine transformation.
 
     Differentiable with respect to ``coords``. The bounding-box centre the
     transform pivots around is treated as a constant reference frame.
+
+    Accepts a padded ``(..., N)`` batch on any device. Parameters may then be
+    tensors of the batch shape (``(..., 2)`` for ``translate``), so each outline
+    gets its own matrix and the whole batch is transformed with one matmul.
     """
-    _require_single(inpt, "affine")
     return _same_types(
         inpt,
         _affine(
@@ -285,26 +423,30 @@ def affine(
 def coord_jitter(inpt: Outline, noise: Tensor) -> Outline:
     """Add caller-provided noise to active coordinate pairs.
 
-    Differentiable with respect to both ``coords`` and ``noise``.
+    Differentiable with respect to both ``coords`` and ``noise``. ``noise`` has
+    shape ``(*batch_shape, M, 3, 2)`` with ``M`` at least the outline length, so
+    a padded batch takes one noise tensor with a row block per outline.
     """
-    _require_single(inpt, "coord_jitter")
     types, coords = inpt.types, inpt.coords
+    batch_shape = tuple(inpt.batch_shape)
     noise_tail_shape = (3, 2)
     if (
-        noise.ndim != len(noise_tail_shape) + 1
-        or tuple(noise.shape[1:]) != noise_tail_shape
+        noise.ndim != len(batch_shape) + len(noise_tail_shape) + 1
+        or tuple(noise.shape[: len(batch_shape)]) != batch_shape
+        or tuple(noise.shape[-2:]) != noise_tail_shape
     ):
-        msg = f"noise must have shape (N, 3, 2), got {tuple(noise.shape)}"
+        expected = ", ".join([*map(str, batch_shape), "N", "3", "2"])
+        msg = f"noise must have shape ({expected}), got {tuple(noise.shape)}"
         raise ValueError(msg)
-    if noise.shape[0] < types.shape[0]:
+    if noise.shape[-3] < types.shape[-1]:
         msg = "noise must have at least as many rows as the outline"
         raise ValueError(msg)
-    active = torch.stack(_active_pairs(types), dim=1).unsqueeze(-1)
-    points = coords.reshape(-1, 3, 2)
-    noise = noise[: types.size(0)].to(device=coords.device, dtype=coords.dtype)
-    return _same_types(
-        inpt, torch.where(active, points + noise, points).reshape_as(coords)
+    active = torch.stack(_active_pairs(types), dim=-1).unsqueeze(-1)
+    points = coords.unflatten(-1, (3, 2))
+    noise = noise[..., : types.size(-1), :, :].to(
+        device=coords.device, dtype=coords.dtype
     )
+    return _same_types(inpt, torch.where(active, points + noise, points).flatten(-2))
 
 
 __all__ = ["affine", "coord_jitter", "horizontal_flip", "vertical_flip"]
@@ -7,7 +7,13 @@ from typing import TYPE_CHECKING
 import torch
 
 from torchfont import _torchfont
-from torchfont._outline import COORD_DIM, Outline
+from torchfont._ops import tensors_from_native
+from torchfont._outline import (
+    Outline,
+    _native_coords_dtype_name,
+    _types_dtype_name,
+)
+from torchfont.profiling import _native_kernel
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -18,23 +24,60 @@ if TYPE_CHECKING:
 def load_glyph(
     ref: GlyphRef,
     location: Mapping[str, float] | None = None,
+    *,
+    glyph_id: int | None = None,
+    types_dtype: torch.dtype = torch.long,
+    coords_dtype: torch.dtype = torch.float32,
 ) -> Outline:
-    """Load one glyph outline at an explicit or default location."""
+    """Load one glyph outline at an explicit or default location.
+
+    ``glyph_id`` draws that glyph of the face directly and skips the character
+    map lookup of ``ref.codepoint``. Pass ``GlyphSample.glyph_id`` to reuse the
+    glyph resolved by the dataset index. An unencoded glyph, whose
+    ``ref.codepoint`` is ``-1``, can only be drawn by ``glyph_id``; without one
+    it raises ``ValueError``.
+
+    ``types_dtype`` selects the element type dtype, one of ``torch.long``,
+    ``torch.uint8``, or ``torch.int8``. ``coords_dtype`` selects
+    ``torch.float32``, ``torch.float16``, or ``torch.bfloat16`` coordinates.
+    The native loader writes both dtypes directly instead of converting
+    afterwards.
+    """
+    if glyph_id is None and ref.codepoint < 0:
+        msg = (
+            f"{ref} has no codepoint; pass the glyph_id of the unencoded glyph, "
+            "such as GlyphSample.glyph_id"
+        )
+        raise ValueError(msg)
+    types_name = _types_dtype_name(types_dtype, "types_dtype")
+    coords_name = _native_coords_dtype_name(coords_dtype, "coords_dtype")
     normalized_location = (
         None
         if location is None
         else {str(tag): float(value) for tag, value in location.items()}
     )
-    raw_types, raw_coords = _torchfont.load_glyph(
-        ref.font.path,
-        ref.font.ttc_index,
-        ref.codepoint,
-        normalized_location,
-    )
-    return Outline._wrap(  # noqa: SLF001
-        torch.from_numpy(raw_types),
-        torch.from_numpy(raw_coords).view(-1, COORD_DIM),
-    )
+    with _native_kernel("load_glyph"):
+        if glyph_id is None:
+            raw_types, raw_coords = _torchfont.load_glyph(
+                ref.font.path,
+                ref.font.ttc_index,
+                ref.codepoint,
+                normalized_location,
+                types_name,
+                coords_name,
+            )
+        else:
+            raw_types, raw_coords = _torchfont.load_glyph_id(
+                ref.font.path,
+                ref.font.ttc_index,
+                glyph_id,
+                normalized_location,
+                types_name,
+                coords_name,
+            )
+        return Outline._wrap(  # noqa: SLF001
+            *tensors_from_native(raw_types, raw_coords)
+        )
 
 
 __all__ = ["load_glyph"]
@@ -2,34 +2,194 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import itertools
+from typing import TYPE_CHECKING, Literal, overload
+
+import torch
 
 from torchfont import _ops
-from torchfont.transforms.functional._utils import _native_outline
+from torchfont._outline import ElementType, Outline, pad_outlines
+from torchfont.transforms.functional._utils import _native_outline, _require_single
 
 if TYPE_CHECKING:
     from torch import Tensor
 
-    from torchfont._outline import Outline
+# Default element count from which overlap groups are simplified on native
+# threads.
+_PARALLEL_THRESHOLD = 512
+
 
+def _check_parallel_threshold(parallel_threshold: int) -> int:
+    if parallel_threshold < 0:
+        msg = "parallel_threshold must be non-negative"
+        raise ValueError(msg)
+    return parallel_threshold
 
-def remove_overlaps(inpt: Outline) -> Outline:
+
+def remove_overlaps(
+    inpt: Outline,
+    *,
+    parallel_threshold: int = _PARALLEL_THRESHOLD,
+    max_elements: int | None = None,
+) -> Outline:
     """Merge overlapping subpaths using Skia PathOps winding simplification.
 
-    If PathOps cannot simplify an otherwise valid outline, the original outline
-    is returned unchanged.
+    Subpaths whose bounding boxes overlap or touch form one group. Groups are
+    simplified independently and reassembled in the order their first subpaths
+    appear. Once the groups hold at least ``parallel_threshold`` path elements
+    together, they are simplified concurrently on native threads; the result
+    does not depend on the threshold, which must be non-negative.
+
+    If PathOps cannot simplify an otherwise valid outline, or every contour
+    cancels out, the original outline is returned unchanged.
+
+    With ``max_elements``, the result is padded with ``PAD`` rows to exactly that
+    many elements, so its shape no longer depends on the glyph; a result that
+    does not fit raises ``ValueError``.
     """
-    return _native_outline(inpt, _ops.remove_overlaps, name="remove_overlaps")
+    return _native_outline(
+        inpt,
+        _ops.remove_overlaps,
+        _check_parallel_threshold(parallel_threshold),
+        name="remove_overlaps",
+        max_elements=max_elements,
+    )
+
 
+def remove_overlap_groups(
+    inpt: Outline,
+    selection_values: Tensor,
+    *,
+    parallel_threshold: int = _PARALLEL_THRESHOLD,
+    max_elements: int | None = None,
+) -> Outline:
+    """Simplify overlap groups according to explicit selection values.
 
-def remove_overlap_groups(inpt: Outline, selection_values: Tensor) -> Outline:
-    """Simplify overlap groups according to explicit selection values."""
+    Selected groups are simplified concurrently once they hold at least
+    ``parallel_threshold`` path elements together, and ``max_elements`` pads
+    the result, as in :func:`remove_overlaps`.
+    """
     return _native_outline(
         inpt,
         _ops.remove_overlap_groups,
         selection_values,
+        _check_parallel_threshold(parallel_threshold),
         name="remove_overlap_groups",
+        max_elements=max_elements,
+    )
+
+
+def _check_max_length(max_length: int) -> int:
+    if max_length <= 0:
+        msg = f"max_length must be positive, got {max_length}"
+        raise ValueError(msg)
+    return max_length
+
+
+@overload
+def truncate_outline(
+    inpt: Outline, max_length: int, *, return_dropped: Literal[False] = False
+) -> Outline: ...
+
+
+@overload
+def truncate_outline(
+    inpt: Outline, max_length: int, *, return_dropped: Literal[True]
+) -> tuple[Outline, Tensor]: ...
+
+
+def truncate_outline(
+    inpt: Outline, max_length: int, *, return_dropped: bool = False
+) -> Outline | tuple[Outline, Tensor]:
+    """Cut outlines to at most ``max_length`` elements at a subpath boundary.
+
+    Whole subpaths are kept while they fit together with the closing ``END``
+    row, so the result is always a valid encoding. A first subpath that is
+    already too long leaves only ``END``. Outlines that fit are unchanged, and
+    so are all-``PAD`` rows of a batch.
+
+    A padded batch ``(..., N)`` is truncated in one tensor pass and keeps its
+    batch shape with ``min(N, max_length)`` elements per row. A single outline
+    is sliced to its new length, which reads that length back to the host.
+
+    With ``return_dropped=True``, also returns a ``torch.long`` tensor of shape
+    ``batch_shape`` counting the elements removed from each outline; nonzero
+    entries mark truncated samples.
+    """
+    _check_max_length(max_length)
+    types, coords = inpt.types, inpt.coords
+    length = min(types.size(-1), max_length)
+    types, coords = types[..., :length], coords[..., :length, :]
+    positions = torch.arange(length, device=types.device)
+    # Every subpath start is a valid cut, and so is the END of an outline that
+    # fits. Row 0 is always one of them, so the maximum is well defined.
+    boundary = (types == ElementType.MOVE_TO.value) | (types == ElementType.END.value)
+    cut = torch.where(boundary, positions, 0).amax(-1, keepdim=True)
+    # Rows without any element, such as all-PAD batch entries, gain no END.
+    empty = (types == ElementType.PAD.value).all(-1, keepdim=True)
+    end = torch.where(empty, ElementType.PAD.value, ElementType.END.value)
+    out_types = torch.where(
+        positions < cut,
+        types,
+        torch.where(positions == cut, end, ElementType.PAD.value),
+    ).to(types.dtype)
+    out_coords = torch.where((positions < cut).unsqueeze(-1), coords, 0)
+    if not inpt.is_batched:
+        new_length = int(cut.item()) + 1
+        out_types, out_coords = out_types[:new_length], out_coords[:new_length]
+    outline = Outline._wrap(out_types, out_coords)  # noqa: SLF001
+    if not return_dropped:
+        return outline
+    kept = torch.where(empty, 0, cut + 1).squeeze(-1)
+    dropped = (inpt.types != ElementType.PAD.value).sum(-1) - kept
+    return outline, dropped
+
+
+def chunk_outline(inpt: Outline, max_length: int) -> Outline:
+    """Split one outline into chunks of at most ``max_length`` elements.
+
+    Subpaths are packed greedily, in order, into chunks that each end with
+    ``END``. The chunks are returned as a padded ``(C, L)`` batch with ``L`` the
+    longest chunk, so no subpath is split and no element is dropped. A subpath
+    that cannot fit in ``max_length`` elements together with ``END`` raises
+    :class:`ValueError`.
+    """
+    _require_single(inpt, "chunk_outline")
+    _check_max_length(max_length)
+    boundary = (inpt.types == ElementType.MOVE_TO.value) | (
+        inpt.types == ElementType.END.value
+    )
+    # Subpath starts followed by the END row, read back to the host once.
+    bounds = boundary.nonzero().squeeze(-1).tolist()
+    chunks: list[tuple[int, int]] = []
+    start = 0
+    for first, last in itertools.pairwise(bounds):
+        if last - first + 1 > max_length:
+            msg = (
+                f"a subpath of {last - first} elements does not fit in "
+                f"max_length={max_length} with END"
+            )
+            raise ValueError(msg)
+        if last - start + 1 > max_length:
+            chunks.append((start, first))
+            start = first
+    chunks.append((start, bounds[-1]))
+    end_row = inpt.types.new_full((1,), ElementType.END.value)
+    zero_row = inpt.coords.new_zeros((1, inpt.coords.size(-1)))
+    return pad_outlines(
+        [
+            Outline._wrap(  # noqa: SLF001
+                torch.cat([inpt.types[first:last], end_row]),
+                torch.cat([inpt.coords[first:last], zero_row]),
+            )
+            for first, last in chunks
+        ]
     )
 
 
-__all__ = ["remove_overlap_groups", "remove_overlaps"]
+__all__ = [
+    "chunk_outline",
+    "remove_overlap_groups",
+    "remove_overlaps",
+    "truncate_outline",
+]
@@ -1,55 +1,240 @@
 """Functional subpath kernels.
 
-Every kernel here reorders or re-encodes path elements in Rust, so none of them
-define a gradient. Subpath boundaries are derived from the ``CLOSE`` and ``END``
-element types rather than stored alongside the outline.
+Reversing, reordering, and rotating subpaths move whole elements, adding at
+most the implicit closing edge of a rotated subpath, so those run as gathers and
+scatters over the element dimension on any device and batch shape, and carry
+gradients. Only start-point normalisation re-encodes the path in Rust. Subpath
+boundaries are derived from the ``MOVE_TO``, ``CLOSE``, and ``END`` element
+types rather than stored alongside the outline.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import torch
+
 from torchfont import _ops
-from torchfont.transforms.functional._utils import _native_outline
+from torchfont._outline import ElementType, Outline, _pad_elements
+from torchfont.transforms.functional._utils import (
+    _check_max_elements,
+    _native_outline,
+)
 
 if TYPE_CHECKING:
     from torch import Tensor
 
-    from torchfont._outline import Outline
+# Largest float32 below one, the upper clamp Rust applies to selection values.
+_BELOW_ONE = 1.0 - torch.finfo(torch.float32).eps
+
+
+def _subpath_rows(types: Tensor) -> tuple[Tensor, Tensor, Tensor]:
+    """Locate the subpath of every element of ``(..., N)`` types.
+
+    Returns the row of each element's ``MOVE_TO``, the last row of its subpath,
+    and whether the element belongs to a subpath at all (``END`` and ``PAD`` do
+    not). The last row of a closed subpath is its ``CLOSE``.
+    """
+    length = types.size(-1)
+    positions = torch.arange(length, device=types.device).expand_as(types)
+    is_move = types == ElementType.MOVE_TO.value
+    outside = (types == ElementType.END.value) | (types == ElementType.PAD.value)
+    start = torch.where(is_move, positions, 0).cummax(-1).values
+    # The first subpath boundary strictly after each row, or N.
+    marked = torch.where(is_move | outside, positions, length)
+    following = marked.flip(-1).cummin(-1).values.flip(-1)
+    following = torch.cat(
+        [following[..., 1:], following.new_full((*types.shape[:-1], 1), length)], -1
+    )
+    return start, following - 1, ~outside
+
+
+def _reverse_closed_subpaths(types: Tensor, coords: Tensor) -> tuple[Tensor, Tensor]:
+    """Reverse every closed subpath of ``(..., N)`` outlines with tensor indexing.
+
+    Matches the Rust ``reverse_closed_subpaths`` operator on any device and
+    batch shape. A closed subpath ``MOVE_TO p0, e1 .. ek, CLOSE`` becomes
+    ``MOVE_TO pk`` followed by ``ek .. e1``, each ending at the endpoint of the
+    element before it and with cubic control points swapped; the element count
+    is unchanged, so the reversal is a permutation gather.
+    """
+    positions = torch.arange(types.size(-1), device=types.device).expand_as(types)
+    start, last, in_subpath = _subpath_rows(types)
+    closed = in_subpath & (types.gather(-1, last) == ElementType.CLOSE.value)
+    interior = closed & (positions > start) & (positions < last)
+    mirror = start + last - positions
+    element_rows = torch.where(interior, mirror, positions)
+    end_rows = torch.where(
+        interior,
+        mirror - 1,
+        torch.where(closed & (positions == start), last - 1, positions),
+    )
+    out_types = types.gather(-1, element_rows)
+    points = coords.unflatten(-1, (3, 2))
+    controls = points[..., :2, :].gather(
+        -3, element_rows[..., None, None].expand(*element_rows.shape, 2, 2)
+    )
+    swap = interior & (out_types == ElementType.CURVE_TO.value)
+    controls = torch.where(swap[..., None, None], controls.flip(-2), controls)
+    ends = points[..., 2, :].gather(-2, end_rows[..., None].expand(*end_rows.shape, 2))
+    out_points = torch.cat([controls, ends.unsqueeze(-2)], -2)
+    return out_types, out_points.flatten(-2)
+
+
+def _gather_rows(coords: Tensor, rows: Tensor) -> Tensor:
+    return coords.gather(-2, rows.unsqueeze(-1).expand(*rows.shape, coords.size(-1)))
+
+
+def _subpath_values(inpt: Outline, values: Tensor, name: str) -> Tensor:
+    """Validate per-element selection values and pick each subpath's value.
+
+    ``values`` has shape ``(*batch_shape, M)`` with ``M`` at least the outline
+    length; a subpath uses the value at its ``MOVE_TO`` row, as in Rust.
+    """
+    if values.dtype is not torch.float32:
+        msg = f"selection values must have dtype torch.float32, got {values.dtype}"
+        raise TypeError(msg)
+    batch_shape = tuple(inpt.batch_shape)
+    if values.ndim != len(batch_shape) + 1 or tuple(values.shape[:-1]) != batch_shape:
+        msg = (
+            f"{name} values must have shape {(*batch_shape, 'N')}, "
+            f"got {tuple(values.shape)}"
+        )
+        raise ValueError(msg)
+    if values.size(-1) < inpt.types.size(-1):
+        msg = "random_values length must be at least types length"
+        raise ValueError(msg)
+    return values.to(inpt.types.device)
+
 
+def _reorder_subpaths(
+    types: Tensor, coords: Tensor, keys: Tensor
+) -> tuple[Tensor, Tensor]:
+    """Stably sort whole subpaths by the key at their ``MOVE_TO`` row.
 
-def normalize_subpath_start_points(inpt: Outline) -> Outline:
+    Keys compare with IEEE total order, like Rust's ``f32::total_cmp``: the bit
+    pattern is mapped to an integer that sorts the same way. ``END`` and
+    ``PAD`` rows sort after every subpath, so the result is a gather.
+    """
+    start, _, in_subpath = _subpath_rows(types)
+    bits = keys.gather(-1, start).view(torch.int32)
+    ordered = (bits ^ ((bits >> 31) & 0x7FFF_FFFF)).long()
+    rank = torch.where(in_subpath, ordered, torch.iinfo(torch.int64).max)
+    rows = rank.sort(stable=True).indices
+    return types.gather(-1, rows), _gather_rows(coords, rows)
+
+
+def _rotate_closed_subpaths(
+    types: Tensor, coords: Tensor, values: Tensor
+) -> tuple[Tensor, Tensor]:
+    """Rotate closed-subpath start points with tensor indexing.
+
+    Matches Rust ``randomize_subpath_start_points``: a closed subpath with ``k``
+    drawing elements has ``k`` nodes, plus one when its last element does not
+    end at the start point, and starts at node ``floor(value * nodes)``.
+    Rotating such an implicitly closed subpath materialises its closing edge
+    as a ``LINE_TO`` before the old first element, so every row is scattered
+    to its new position and the batch grows by the most edges any row gains.
+    """
+    positions = torch.arange(types.size(-1), device=types.device).expand_as(types)
+    start, last, in_subpath = _subpath_rows(types)
+    closed = in_subpath & (types.gather(-1, last) == ElementType.CLOSE.value)
+    count = last - start - 1
+    ends = coords[..., 4:]
+    start_point = _gather_rows(ends, start)
+    last_point = _gather_rows(ends, (last - 1).clamp_min(0))
+    implicit = (last_point != start_point).any(-1) | (count == 0)
+    value = values.gather(-1, start).nan_to_num(0.0).clamp(0.0, _BELOW_ONE)
+    offset = (value * (count + implicit.long()).to(torch.float32)).long()
+    rotate = closed & (offset > 0)
+    grow = rotate & implicit
+    relative = positions - start
+    drawing = rotate & (relative >= 1) & (relative <= count)
+    # A growing subpath counts its inserted edge at its CLOSE row, so rows of
+    # later subpaths shift by the edges inserted before them.
+    inserted = grow & (positions == last)
+    shift = inserted.long().cumsum(-1) - inserted.long()
+    cycled = 1 + (relative - 1 - offset) % count.clamp_min(1)
+    moved = torch.where(
+        drawing,
+        cycled + (grow & (relative <= offset)).long(),
+        relative + inserted.long(),
+    )
+    rows = start + shift + moved
+    # The new MOVE_TO starts where the element before the new first one ends.
+    move = rotate & (relative == 0)
+    move_point = _gather_rows(ends, start + offset)
+    move_coords = torch.cat([torch.zeros_like(coords[..., :4]), move_point], -1)
+    coords = torch.where(move.unsqueeze(-1), move_coords, coords)
+    width = types.size(-1)
+    if inserted.numel() > 0:
+        width += int(inserted.sum(-1).amax())
+    # Closing edges are scattered from the CLOSE rows; other rows write to a
+    # spare column that is cut off afterwards.
+    edge_rows = torch.where(inserted, start + shift + count - offset + 1, width)
+    edge_types = torch.full_like(types, ElementType.LINE_TO.value)
+    edge_coords = torch.cat([torch.zeros_like(coords[..., :4]), start_point], -1)
+    index = torch.cat([rows, edge_rows], -1)
+    batch_shape = types.shape[:-1]
+    out_types = types.new_full((*batch_shape, width + 1), ElementType.PAD.value)
+    out_types = out_types.scatter(-1, index, torch.cat([types, edge_types], -1))
+    out_coords = coords.new_zeros((*batch_shape, width + 1, coords.size(-1)))
+    out_coords = out_coords.scatter(
+        -2,
+        index.unsqueeze(-1).expand(*index.shape, coords.size(-1)),
+        torch.cat([coords, edge_coords], -2),
+    )
+    return out_types[..., :width], out_coords[..., :width, :]
+
+
+def normalize_subpath_start_points(
+    inpt: Outline, *, max_elements: int | None = None
+) -> Outline:
     """Choose a deterministic start point for each closed subpath.
 
     Each subpath start moves to its lexicographically smallest ``(x, y)``
     endpoint. Open subpaths, ``END``, and ``PAD`` elements are unchanged. When
     rotation crosses the old closing edge, that implicit edge is materialised as
-    ``LINE_TO`` so the represented geometry is preserved.
+    ``LINE_TO`` so the represented geometry is preserved. Because that changes
+    the element count, ``max_elements`` can pad the result to a fixed length.
     """
     return _native_outline(
         inpt,
         _ops.normalize_subpath_start_points,
         name="normalize_subpath_start_points",
+        max_elements=max_elements,
     )
 
 
-def set_subpath_start_points(inpt: Outline, selection_values: Tensor) -> Outline:
-    """Set closed-subpath start points from explicit unit-interval values."""
-    return _native_outline(
-        inpt,
-        _ops.set_subpath_start_points,
-        selection_values,
-        name="set_subpath_start_points",
-    )
+def set_subpath_start_points(
+    inpt: Outline, selection_values: Tensor, *, max_elements: int | None = None
+) -> Outline:
+    """Set closed-subpath start points from explicit unit-interval values.
+
+    Accepts a padded ``(..., N)`` batch with ``(..., M)`` values, ``M >= N``, on
+    any device, and is differentiable. A rotation that has to materialise an
+    implicit closing edge adds a ``LINE_TO``, and a batch then grows by the
+    most edges any of its rows gains, which reads that count back to the host.
+    ``max_elements`` pads the result to that many elements.
+    """
+    _check_max_elements(max_elements)
+    values = _subpath_values(inpt, selection_values, "set_subpath_start_points")
+    out = _rotate_closed_subpaths(inpt.types, inpt.coords, values)
+    if max_elements is not None:
+        out = _pad_elements(*out, max_elements)
+    return Outline._wrap(*out)  # noqa: SLF001
 
 
 def reorder_subpaths(inpt: Outline, keys: Tensor) -> Outline:
-    """Order subpaths by explicit sort keys."""
-    return _native_outline(
-        inpt,
-        _ops.reorder_subpaths,
-        keys,
-        name="reorder_subpaths",
+    """Order subpaths by explicit sort keys.
+
+    Each subpath sorts by the key at its ``MOVE_TO`` row, ties keeping their
+    order. Accepts a padded ``(..., N)`` batch with ``(..., M)`` keys,
+    ``M >= N``, on any device, and is differentiable.
+    """
+    keys = _subpath_values(inpt, keys, "reorder_subpaths")
+    return Outline._wrap(  # noqa: SLF001
+        *_reorder_subpaths(inpt.types, inpt.coords, keys)
     )
 
 
@@ -37,20 +37,29 @@ def _require_no_grad(inpt: Outline, name: str) -> None:
         raise RuntimeError(msg)
 
 
+def _check_max_elements(max_elements: int | None) -> None:
+    if max_elements is not None and max_elements <= 0:
+        msg = f"max_elements must be positive, got {max_elements}"
+        raise ValueError(msg)
+
+
 def _native_outline(
     inpt: Outline,
     operation: Callable[..., tuple[Tensor, Tensor]],
     *args: object,
     name: str,
+    max_elements: int | None = None,
 ) -> Outline:
     """Run a Rust outline operator, checking preconditions once at the boundary.
 
     ``operation`` is a :mod:`torchfont._ops` custom operator, so the Rust call is
-    one opaque node that :func:`torch.compile` can capture.
+    one opaque node that :func:`torch.compile` can capture. A ``max_elements``
+    capacity is forwarded as the operator's last argument.
     """
     _require_single(inpt, name)
     _require_no_grad(inpt, name)
-    out_types, out_coords = operation(inpt.types, inpt.coords, *args)
+    _check_max_elements(max_elements)
+    out_types, out_coords = operation(inpt.types, inpt.coords, *args, max_elements)
     return Outline._wrap(out_types, out_coords)  # noqa: SLF001
 
 